@@ -0,0 +1,6 @@
+"""
+Package untuk benchmark performa aplikasi Manajemen Limbah.
+
+Setiap modul dapat dijalankan langsung, contoh:
+    python -m benchmarks.bench_repository_lookup
+"""
@@ -0,0 +1,85 @@
+"""
+Benchmark AntrianRisiko dibanding mengurutkan seluruh limbah per keputusan.
+
+Repository in-memory diisi 10k-200k limbah "Terdaftar". Untuk setiap
+ukuran diukur waktu membangun antrian, rata-rata peek_top_k(10), dan
+rata-rata satu siklus keputusan (ubah volume lalu ambil 10 teratas)
+dibanding sorted() atas find_by_status("Terdaftar").
+
+Jalankan:
+    python -m benchmarks.bench_antrian_risiko
+"""
+
+import random
+import time
+
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from services.antrian_risiko import AntrianRisiko
+
+UKURAN = (10_000, 50_000, 200_000)
+PUTARAN = 200
+K = 10
+
+
+def isi_repository(jumlah: int) -> InMemoryLimbahRepository:
+    """
+    Membuat repository berisi limbah campuran dengan volume acak.
+
+    Args:
+        jumlah (int): Jumlah limbah.
+
+    Returns:
+        InMemoryLimbahRepository: Repository terisi.
+    """
+    acak = random.Random(jumlah)
+    repository = InMemoryLimbahRepository()
+    for i in range(jumlah):
+        volume = acak.uniform(1.0, 500.0)
+        if i % 3 == 0:
+            repository.save(LimbahOrganik(f"L{i:06d}", volume, acak.randint(1, 10)))
+        elif i % 3 == 1:
+            repository.save(LimbahMedis(f"L{i:06d}", volume, acak.randint(1, 10)))
+        else:
+            repository.save(LimbahB3(f"L{i:06d}", volume, "Merkuri"))
+    return repository
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak hasil per ukuran repository.
+    """
+    print(f"{'limbah':>8} | {'bangun s':>8} | {'peek us':>8} | {'heap us':>8} | {'sort us':>9}")
+    for jumlah in UKURAN:
+        repository = isi_repository(jumlah)
+        acak = random.Random(1)
+        ids = [f"L{i:06d}" for i in range(jumlah)]
+
+        mulai = time.perf_counter()
+        antrian = AntrianRisiko(repository)
+        bangun = time.perf_counter() - mulai
+
+        mulai = time.perf_counter()
+        for _ in range(PUTARAN):
+            antrian.peek_top_k(K)
+        peek = (time.perf_counter() - mulai) / PUTARAN
+
+        mulai = time.perf_counter()
+        for _ in range(PUTARAN):
+            repository.get_by_id(acak.choice(ids)).set_volume(acak.uniform(1.0, 500.0))
+            antrian.peek_top_k(K)
+        heap = (time.perf_counter() - mulai) / PUTARAN
+
+        mulai = time.perf_counter()
+        for _ in range(PUTARAN // 20):
+            repository.get_by_id(acak.choice(ids)).set_volume(acak.uniform(1.0, 500.0))
+            sorted(repository.find_by_status("Terdaftar"), key=lambda l: l.hitung_risiko(), reverse=True)[:K]
+        urut = (time.perf_counter() - mulai) / (PUTARAN // 20)
+
+        print(f"{jumlah:>8} | {bangun:>8.3f} | {peek * 1e6:>8.1f} | {heap * 1e6:>8.1f} | {urut * 1e6:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark heuristik bin packing untuk perencanaan trip.
+
+Membandingkan Next Fit, First Fit, dan Best Fit Decreasing pada 10k-100k
+limbah dengan volume acak, lalu menjalankan PerencanaanTripService untuk
+satu kendaraan pada repository berisi 50k limbah campuran. Dicetak waktu,
+jumlah trip, dan batas bawah teoretis (total volume / kapasitas).
+
+Jalankan:
+    python -m benchmarks.bench_bin_packing
+"""
+
+import math
+import random
+import time
+
+from models.kendaraan import Kendaraan
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from services.perencanaan_trip_service import PerencanaanTripService
+from utils.bin_packing import METODE
+
+UKURAN = (10_000, 50_000, 100_000)
+KAPASITAS = 1000.0
+JUMLAH_LIMBAH_RENCANA = 50_000
+
+
+def ukur_heuristik() -> None:
+    """
+    Mengukur setiap heuristik pada daftar volume acak.
+    """
+    acak = random.Random(42)
+    print(f"{'item':>8} | {'metode':>6} | {'trip':>7} | {'batas':>7} | {'detik':>6}")
+    for jumlah in UKURAN:
+        ukuran = [acak.uniform(5.0, 400.0) for _ in range(jumlah)]
+        batas_bawah = math.ceil(sum(ukuran) / KAPASITAS)
+        for nama, kemas in METODE.items():
+            mulai = time.perf_counter()
+            bins = kemas(ukuran, KAPASITAS)
+            detik = time.perf_counter() - mulai
+            print(f"{jumlah:>8} | {nama:>6} | {len(bins):>7} | {batas_bawah:>7} | {detik:>6.3f}")
+
+
+def ukur_rencana() -> None:
+    """
+    Mengukur PerencanaanTripService end-to-end pada repository in-memory.
+    """
+    acak = random.Random(7)
+    repository = InMemoryLimbahRepository()
+    for i in range(JUMLAH_LIMBAH_RENCANA):
+        volume = acak.uniform(5.0, 400.0)
+        if i % 3 == 0:
+            repository.save(LimbahOrganik(f"L{i:06d}", volume, 5))
+        elif i % 3 == 1:
+            repository.save(LimbahMedis(f"L{i:06d}", volume, 5))
+        else:
+            repository.save(LimbahB3(f"L{i:06d}", volume, "Merkuri"))
+    kendaraan = Kendaraan("K001", "Truk", KAPASITAS, (LimbahOrganik, LimbahMedis, LimbahB3))
+    service = PerencanaanTripService(repository)
+
+    print(f"\nrencana {JUMLAH_LIMBAH_RENCANA:,} limbah (3 jenis):")
+    for metode in METODE:
+        mulai = time.perf_counter()
+        rencana = service.rencanakan(kendaraan, metode)
+        detik = time.perf_counter() - mulai
+        print(f"{metode:>6} | trip={rencana['jumlah_trip']} batas={rencana['batas_bawah']} | {detik:.3f} s")
+
+
+def main() -> None:
+    """
+    Menjalankan seluruh benchmark bin packing.
+    """
+    ukur_heuristik()
+    ukur_rencana()
+
+
+if __name__ == "__main__":
+    main()
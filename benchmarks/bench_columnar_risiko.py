@@ -0,0 +1,69 @@
+"""
+Benchmark total risiko pada ColumnarLimbahRepository.
+
+Mengisi tabel kolom dengan 10M record campuran (organik, medis, B3)
+per potongan lalu mengukur waktu total_risiko() dan risk_array(). Sebagai
+pembanding, dicetak juga waktu menjumlah hitung_risiko() per objek pada
+sampel 1M objek Limbah.
+
+Jalankan:
+    python -m benchmarks.bench_columnar_risiko
+"""
+
+import time
+
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+from repositories.columnar_limbah_repository import ColumnarLimbahRepository, np
+
+JUMLAH = 10_000_000
+UKURAN_POTONGAN = 100_000
+JUMLAH_SAMPEL_OBJEK = 1_000_000
+
+
+def buat_limbah(i: int):
+    """
+    Membuat satu limbah dengan jenis bergiliran.
+
+    Args:
+        i (int): Nomor urut record.
+
+    Returns:
+        Limbah: Objek limbah.
+    """
+    id = f"L{i:08d}"
+    if i % 3 == 0:
+        return LimbahOrganik(id, 10.0 + i % 7, 1 + i % 10)
+    if i % 3 == 1:
+        return LimbahMedis(id, 5.0 + i % 11, 1 + i % 10)
+    return LimbahB3(id, 20.0 + i % 5, "Merkuri")
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak waktu agregasi.
+    """
+    repository = ColumnarLimbahRepository()
+    mulai = time.perf_counter()
+    for awal in range(0, JUMLAH, UKURAN_POTONGAN):
+        repository.save_many([buat_limbah(i) for i in range(awal, awal + UKURAN_POTONGAN)])
+    print(f"isi {JUMLAH:,} record: {time.perf_counter() - mulai:.1f} s")
+    print(f"backend: {'numpy' if np is not None else 'array (tanpa numpy)'}")
+
+    mulai = time.perf_counter()
+    total = repository.total_risiko()
+    print(f"total_risiko(): {time.perf_counter() - mulai:.3f} s (total={total:,.1f})")
+
+    mulai = time.perf_counter()
+    risiko = repository.risk_array()
+    print(f"risk_array():   {time.perf_counter() - mulai:.3f} s ({len(risiko):,} nilai)")
+
+    sampel = [buat_limbah(i) for i in range(JUMLAH_SAMPEL_OBJEK)]
+    mulai = time.perf_counter()
+    sum(limbah.hitung_risiko() for limbah in sampel)
+    print(f"hitung_risiko() per objek, {JUMLAH_SAMPEL_OBJEK:,} objek: {time.perf_counter() - mulai:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark biaya event bus pada jalur registrasi dan perubahan status.
+
+InMemoryLimbahRepository diisi JUMLAH limbah lalu setiap limbah diubah
+statusnya, dengan konfigurasi pengamat:
+- tanpa pengamat
+- satu pengamat sinkron (no-op)
+- satu pengamat antrian (no-op, diproses thread latar; waktu termasuk
+  menunggu antrian habis)
+
+Juga diukur biaya pemeriksaan `if bus:` pada bus kosong dibanding list
+kosong, yaitu satu-satunya biaya bus ketika tidak ada pengamat.
+
+Jalankan:
+    python -m benchmarks.bench_event_bus
+"""
+
+import time
+import timeit
+
+from models.limbah_medis import LimbahMedis
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from utils.event_bus import EventBus
+
+JUMLAH = 200_000
+
+
+def no_op(limbah, peristiwa, lama, baru) -> None:
+    """
+    Pengamat yang tidak melakukan apa pun.
+    """
+
+
+def jalankan(konfigurasi: str) -> float:
+    """
+    Mengukur registrasi dan perubahan status JUMLAH limbah.
+
+    Args:
+        konfigurasi (str): "kosong", "sinkron", atau "antrian".
+
+    Returns:
+        float: Waktu (detik).
+    """
+    repository = InMemoryLimbahRepository()
+    pelanggan = None
+    if konfigurasi == "sinkron":
+        repository.tambah_pengamat(no_op)
+    elif konfigurasi == "antrian":
+        pelanggan = repository.tambah_pengamat_antrian(no_op)
+    daftar_limbah = [LimbahMedis(f"L{i:07d}", 10.0, 5) for i in range(JUMLAH)]
+
+    mulai = time.perf_counter()
+    for limbah in daftar_limbah:
+        repository.save(limbah)
+    for limbah in daftar_limbah:
+        limbah.set_status("Diangkut")
+    if pelanggan is not None:
+        pelanggan.tunggu()
+    durasi = time.perf_counter() - mulai
+
+    if pelanggan is not None:
+        repository.hapus_pengamat(pelanggan)
+    return durasi
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak hasil.
+    """
+    print(f"{JUMLAH:,} save + {JUMLAH:,} set_status:")
+    acuan = None
+    for konfigurasi in ("kosong", "sinkron", "antrian"):
+        durasi = jalankan(konfigurasi)
+        acuan = acuan or durasi
+        print(f"  {konfigurasi:>8}: {durasi:.3f} s ({durasi / acuan:.2f}x)")
+
+    ulang = 1_000_000
+    bus = EventBus()
+    daftar: list = []
+    waktu_bus = timeit.timeit("if bus: pass", globals={"bus": bus}, number=ulang)
+    waktu_list = timeit.timeit("if daftar: pass", globals={"daftar": daftar}, number=ulang)
+    print(f"Pemeriksaan bus kosong: {waktu_bus / ulang * 1e9:.0f} ns (list kosong: {waktu_list / ulang * 1e9:.0f} ns)")
+
+
+if __name__ == "__main__":
+    main()
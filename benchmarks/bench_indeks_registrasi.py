@@ -0,0 +1,71 @@
+"""
+Benchmark IndeksRegistrasi dibanding pemindaian seluruh limbah.
+
+Repository in-memory diisi 1 juta limbah yang terdaftar merata selama
+30 hari. Dibandingkan rata-rata waktu kueri "kg limbah medis yang masuk"
+untuk jendela 1 jam, 1 hari, dan 7 hari antara IndeksRegistrasi.rentang()
+dan pemindaian iter_all() dengan filter waktu dan jenis.
+
+Jalankan:
+    python -m benchmarks.bench_indeks_registrasi
+"""
+
+import random
+import time
+
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from services.indeks_registrasi import IndeksRegistrasi
+
+JUMLAH = 1_000_000
+RENTANG_DETIK = 30 * 86_400
+AWAL = 1_714_521_600.0  # 2024-05-01 00:00 UTC
+JENDELA = (("1 jam", 3_600), ("1 hari", 86_400), ("7 hari", 7 * 86_400))
+PUTARAN = 200
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak latensi tiap jendela.
+    """
+    acak = random.Random(17)
+    daftar_limbah = []
+    for i in range(JUMLAH):
+        dibuat = AWAL + i * RENTANG_DETIK / JUMLAH
+        volume = acak.uniform(1.0, 500.0)
+        if i % 3 == 0:
+            daftar_limbah.append(LimbahOrganik(f"L{i:07d}", volume, 5, dibuat))
+        elif i % 3 == 1:
+            daftar_limbah.append(LimbahMedis(f"L{i:07d}", volume, 5, dibuat))
+        else:
+            daftar_limbah.append(LimbahB3(f"L{i:07d}", volume, "Merkuri", dibuat))
+    repository = InMemoryLimbahRepository()
+    repository.save_many(daftar_limbah)
+
+    mulai = time.perf_counter()
+    indeks = IndeksRegistrasi(repository)
+    print(f"{JUMLAH:,} limbah, bangun index {time.perf_counter() - mulai:.2f} s")
+    print(f"{'jendela':>8} | {'index us':>9} | {'pindai ms':>9} | {'kg medis':>12}")
+    for label, jendela in JENDELA:
+        akhir = AWAL + RENTANG_DETIK / 2
+
+        mulai = time.perf_counter()
+        for _ in range(PUTARAN):
+            hasil = indeks.rentang(akhir - jendela, akhir, LimbahMedis)
+        cepat = (time.perf_counter() - mulai) / PUTARAN
+
+        mulai = time.perf_counter()
+        volume = sum(
+            limbah.get_volume() for limbah in repository.iter_all()
+            if isinstance(limbah, LimbahMedis) and akhir - jendela <= limbah.get_detik_dibuat() < akhir
+        )
+        pindai = time.perf_counter() - mulai
+        assert abs(volume - hasil["volume"]) < 1e-6 * max(volume, 1.0)
+
+        print(f"{label:>8} | {cepat * 1e6:>9.1f} | {pindai * 1e3:>9.1f} | {hasil['volume']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
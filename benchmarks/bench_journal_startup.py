@@ -0,0 +1,49 @@
+"""
+Benchmark cold start JournalLimbahRepository.
+
+Mengisi repository dengan 1M record, membuat snapshot, menambahkan
+ekor journal kecil, lalu mengukur waktu membuka ulang repository
+(muat snapshot + replay ekor journal).
+
+Jalankan:
+    python -m benchmarks.bench_journal_startup
+"""
+
+import tempfile
+import time
+
+from models.limbah_organik import LimbahOrganik
+from repositories.journal_limbah_repository import JournalLimbahRepository
+
+JUMLAH = 1_000_000
+EKOR_JOURNAL = 10_000
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak durasi tiap tahap.
+    """
+    with tempfile.TemporaryDirectory() as direktori:
+        repository = JournalLimbahRepository(direktori, ukuran_grup=4096, snapshot_setiap=10 * JUMLAH)
+        mulai = time.perf_counter()
+        for i in range(JUMLAH):
+            repository.save(LimbahOrganik(f"L{i:07d}", 10.0, 3))
+        print(f"ingest {JUMLAH} record      : {time.perf_counter() - mulai:.2f} s")
+
+        mulai = time.perf_counter()
+        repository.snapshot()
+        print(f"tulis snapshot             : {time.perf_counter() - mulai:.2f} s")
+
+        for i in range(EKOR_JOURNAL):
+            repository.get_by_id(f"L{i:07d}").set_status("Diangkut")
+        repository.close()
+
+        mulai = time.perf_counter()
+        repository = JournalLimbahRepository(direktori)
+        durasi = time.perf_counter() - mulai
+        print(f"cold start (+{EKOR_JOURNAL} journal): {durasi:.2f} s, {len(repository.get_all())} record")
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark konflik optimistic concurrency pada SqliteLimbahRepository.
+
+Beberapa proses berbagi satu file database (ukuran_batch=1). Setiap proses
+memindai seluruh ID dengan urutan acak miliknya sendiri dan untuk setiap
+limbah membaca record lalu memajukan statusnya dengan compare_and_update():
+Terdaftar -> Diangkut -> Dimusnahkan. Tidak ada kunci yang dipegang
+di antara baca dan tulis; penulisan dengan versi usang ditolak sebagai
+konflik dan langsung dicoba lagi setelah membaca ulang.
+
+Setiap limbah tepat berpindah status dua kali, berapa pun jumlah proses,
+sehingga jumlah penulisan berhasil selalu 2 * JUMLAH_LIMBAH. Yang diukur
+adalah waktu total dan laju konflik = konflik / (berhasil + konflik).
+
+Jalankan:
+    python -m benchmarks.bench_konflik_versi
+"""
+
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from models.limbah_medis import LimbahMedis
+from repositories.limbah_repository import KonflikVersiError
+from repositories.sqlite_limbah_repository import SqliteLimbahRepository
+
+JUMLAH_PROSES = (1, 2, 4, 8)
+JUMLAH_LIMBAH = 2_000
+STATUS_BERIKUTNYA = {"Terdaftar": "Diangkut", "Diangkut": "Dimusnahkan"}
+
+
+def pekerja(path: str, ids: list[str], benih: int) -> tuple[int, int]:
+    """
+    Memajukan status seluruh limbah sampai final dari satu proses.
+
+    Args:
+        path (str): Lokasi file database.
+        ids (list[str]): ID limbah.
+        benih (int): Benih acak urutan pemindaian.
+
+    Returns:
+        tuple[int, int]: (jumlah penulisan berhasil, jumlah konflik).
+    """
+    repository = SqliteLimbahRepository(path, ukuran_batch=1)
+    urutan = list(ids)
+    random.Random(benih).shuffle(urutan)
+    berhasil = konflik = 0
+    for id in urutan:
+        while True:
+            limbah = repository.get_by_id(id)
+            status_baru = STATUS_BERIKUTNYA.get(limbah.get_status())
+            if status_baru is None:
+                break
+            try:
+                repository.compare_and_update(id, limbah.get_versi(), status_baru)
+                berhasil += 1
+            except KonflikVersiError:
+                konflik += 1
+    repository.close()
+    return berhasil, konflik
+
+
+def jalankan(jumlah_proses: int) -> tuple[float, int, int]:
+    """
+    Mengisi database baru lalu menjalankan pekerja secara paralel.
+
+    Args:
+        jumlah_proses (int): Jumlah proses pekerja.
+
+    Returns:
+        tuple[float, int, int]: (waktu detik, penulisan berhasil, konflik).
+    """
+    with tempfile.TemporaryDirectory() as direktori:
+        path = os.path.join(direktori, "limbah.db")
+        repository = SqliteLimbahRepository(path)
+        repository.save_many([LimbahMedis(f"L{i:05d}", 10.0, 5) for i in range(JUMLAH_LIMBAH)])
+        ids = [limbah.get_id() for limbah in repository.get_all()]
+        repository.close()
+
+        with multiprocessing.Pool(jumlah_proses) as pool:
+            mulai = time.perf_counter()
+            hasil = pool.starmap(pekerja, [(path, ids, benih) for benih in range(jumlah_proses)])
+            durasi = time.perf_counter() - mulai
+
+    berhasil = sum(b for b, _ in hasil)
+    konflik = sum(k for _, k in hasil)
+    assert berhasil == 2 * JUMLAH_LIMBAH
+    return durasi, berhasil, konflik
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark untuk setiap jumlah proses dan mencetak hasil.
+    """
+    print(f"{JUMLAH_LIMBAH:,} limbah, {2 * JUMLAH_LIMBAH:,} transisi status:")
+    print(f"{'proses':>6} | {'waktu (s)':>9} | {'transisi/s':>10} | {'konflik':>7} | {'laju konflik':>12}")
+    for jumlah_proses in JUMLAH_PROSES:
+        durasi, berhasil, konflik = jalankan(jumlah_proses)
+        laju = konflik / (berhasil + konflik)
+        print(f"{jumlah_proses:>6} | {durasi:>9.2f} | {berhasil / durasi:>10,.0f} | {konflik:>7,} | {laju:>11.1%}")
+
+
+if __name__ == "__main__":
+    main()
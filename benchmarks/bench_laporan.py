@@ -0,0 +1,84 @@
+"""
+Benchmark LaporanService: materialized view vs hitung ulang penuh.
+
+Repository in-memory diisi 10k-500k limbah di 50 lokasi. Dicetak waktu
+registrasi dengan dan tanpa LaporanService (biaya pemeliharaan view),
+rata-rata baca("status") dan baca_grup("jenis", ...), serta waktu
+hitung ulang group-by penuh dengan mengiterasi seluruh limbah.
+
+Jalankan:
+    python -m benchmarks.bench_laporan
+"""
+
+import random
+import time
+
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from services.laporan_service import LaporanService
+from services.limbah_service import LimbahService
+
+UKURAN = (10_000, 100_000, 500_000)
+PUTARAN = 1000
+
+
+def registrasi(service: LimbahService, jumlah: int) -> float:
+    """
+    Meregistrasi limbah campuran dan mengukur waktunya.
+
+    Args:
+        service (LimbahService): Service tujuan registrasi.
+        jumlah (int): Jumlah limbah.
+
+    Returns:
+        float: Waktu registrasi (detik).
+    """
+    acak = random.Random(jumlah)
+    mulai = time.perf_counter()
+    for i in range(jumlah):
+        volume = acak.uniform(1.0, 500.0)
+        if i % 3 == 0:
+            service.registrasi_limbah_organik(f"L{i:06d}", volume, 5)
+        elif i % 3 == 1:
+            service.registrasi_limbah_medis(f"L{i:06d}", volume, 5)
+        else:
+            service.registrasi_limbah_b3(f"L{i:06d}", volume, "Merkuri")
+    return time.perf_counter() - mulai
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak hasil per ukuran.
+    """
+    print(f"{'limbah':>8} | {'reg s':>6} | {'reg+view s':>10} | {'baca us':>8} | {'grup us':>8} | {'penuh ms':>9}")
+    for jumlah in UKURAN:
+        tanpa_view = registrasi(LimbahService(InMemoryLimbahRepository()), jumlah)
+
+        repository = InMemoryLimbahRepository()
+        laporan = LaporanService(repository, lambda id: f"Posko {int(id[1:]) % 50}")
+        dengan_view = registrasi(LimbahService(repository), jumlah)
+
+        mulai = time.perf_counter()
+        for _ in range(PUTARAN):
+            laporan.baca("status")
+        baca = (time.perf_counter() - mulai) / PUTARAN
+
+        mulai = time.perf_counter()
+        for _ in range(PUTARAN):
+            laporan.baca_grup("jenis", "LimbahMedis")
+        grup = (time.perf_counter() - mulai) / PUTARAN
+
+        mulai = time.perf_counter()
+        per_status: dict[str, list] = {}
+        for limbah in repository.iter_all():
+            nilai = per_status.setdefault(limbah.get_status(), [0, 0.0, 0.0])
+            nilai[0] += 1
+            nilai[1] += limbah.get_volume()
+            nilai[2] += limbah.hitung_risiko()
+        penuh = time.perf_counter() - mulai
+
+        print(f"{jumlah:>8} | {tanpa_view:>6.2f} | {dengan_view:>10.2f} | {baca * 1e6:>8.1f} | "
+              f"{grup * 1e6:>8.1f} | {penuh * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark throughput registrasi limbah dengan berbagai konfigurasi logging.
+
+LimbahService.registrasi_limbah_medis dipanggil JUMLAH kali pada
+InMemoryLimbahRepository dengan konfigurasi:
+- mati: level WARNING, log INFO registrasi tidak diformat sama sekali
+- sinkron: FileHandler langsung di logger root (seperti basicConfig lama)
+- antrian: setup_logging() teks ke file lewat QueueHandler/QueueListener
+- json: setup_logging(json_lines=True) ke file
+
+Untuk konfigurasi antrian dicetak waktu di jalur pemanggil dan waktu
+sampai antrian selesai ditulis. Juga diukur biaya satu log INFO yang
+dimatikan dengan dan tanpa argumen datetime.now().isoformat().
+
+Jalankan:
+    python -m benchmarks.bench_logging
+"""
+
+import logging
+import os
+import tempfile
+import time
+import timeit
+from datetime import datetime
+
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from services.limbah_service import LimbahService
+from utils.logging_config import FORMAT_TEKS, FORMAT_WAKTU, hentikan_logging, setup_logging
+
+JUMLAH = 100_000
+
+
+def registrasi(jumlah: int) -> float:
+    """
+    Meregistrasi limbah medis sebanyak jumlah.
+
+    Args:
+        jumlah (int): Jumlah registrasi.
+
+    Returns:
+        float: Waktu (detik).
+    """
+    service = LimbahService(InMemoryLimbahRepository())
+    mulai = time.perf_counter()
+    for i in range(jumlah):
+        service.registrasi_limbah_medis(f"L{i:07d}", 10.0, 5)
+    return time.perf_counter() - mulai
+
+
+def jalankan(konfigurasi: str, path: str) -> tuple[float, float]:
+    """
+    Mengukur registrasi pada satu konfigurasi logging.
+
+    Args:
+        konfigurasi (str): "mati", "sinkron", "antrian", atau "json".
+        path (str): File tujuan log.
+
+    Returns:
+        tuple[float, float]: (waktu jalur pemanggil, waktu termasuk penulisan log).
+    """
+    root = logging.getLogger()
+    handler = None
+    if konfigurasi == "mati":
+        setup_logging(level=logging.WARNING, path=path)
+    elif konfigurasi == "sinkron":
+        handler = logging.FileHandler(path, encoding="utf-8")
+        handler.setFormatter(logging.Formatter(FORMAT_TEKS, FORMAT_WAKTU))
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+    else:
+        setup_logging(json_lines=konfigurasi == "json", path=path)
+
+    mulai = time.perf_counter()
+    durasi = registrasi(JUMLAH)
+    hentikan_logging()
+    if handler is not None:
+        root.removeHandler(handler)
+        handler.close()
+    return durasi, time.perf_counter() - mulai
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak throughput per konfigurasi.
+    """
+    print(f"{JUMLAH:,} registrasi:")
+    print(f"{'logging':>8} | {'pemanggil (s)':>13} | {'registrasi/s':>12} | {'+ tulis log (s)':>15}")
+    with tempfile.TemporaryDirectory() as direktori:
+        for konfigurasi in ("mati", "sinkron", "antrian", "json"):
+            path = os.path.join(direktori, f"{konfigurasi}.log")
+            durasi, total = jalankan(konfigurasi, path)
+            print(f"{konfigurasi:>8} | {durasi:>13.3f} | {JUMLAH / durasi:>12,.0f} | {total:>15.3f}")
+
+    ulang = 1_000_000
+    logger = logging.getLogger("benchmarks.bench_logging")
+    logger.setLevel(logging.WARNING)
+    dengan_ts = timeit.timeit(
+        lambda: logger.info("Registrasi | id=%s ts=%s", "L001", datetime.now().isoformat()), number=ulang
+    )
+    tanpa_ts = timeit.timeit(lambda: logger.info("Registrasi | id=%s", "L001"), number=ulang)
+    print(f"log INFO mati: {dengan_ts / ulang * 1e9:.0f} ns dengan argumen isoformat(), "
+          f"{tanpa_ts / ulang * 1e9:.0f} ns tanpa")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark penyimpanan manifest pengangkutan pada jutaan catatan.
+
+Untuk InMemoryManifestRepository dan SqliteManifestRepository (file
+sementara) diukur waktu ingest 1 juta catatan selama 100 hari dengan
+50 kendaraan dan 20 tujuan, lalu rata-rata latensi:
+- find_by_limbah (riwayat satu limbah)
+- find(kendaraan, mulai 08:00, sampai 12:00) pada satu hari
+- find(tujuan, satu jam)
+
+Jalankan:
+    python -m benchmarks.bench_manifest
+"""
+
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from repositories.in_memory_manifest_repository import InMemoryManifestRepository
+from repositories.sqlite_manifest_repository import SqliteManifestRepository
+
+JUMLAH = 1_000_000
+JUMLAH_LIMBAH = 300_000
+PUTARAN = 200
+UKURAN_BATCH = 10_000
+
+
+def buat_catatan() -> list[dict]:
+    """
+    Membangkitkan catatan berurutan waktu (rata-rata satu catatan per ~8.6 detik).
+
+    Returns:
+        list[dict]: Daftar catatan manifest.
+    """
+    acak = random.Random(3)
+    awal = datetime(2024, 1, 1)
+    langkah = 100 * 86_400 / JUMLAH
+    return [
+        {
+            "timestamp": (awal + timedelta(seconds=i * langkah)).isoformat(),
+            "id_limbah": f"L{acak.randrange(JUMLAH_LIMBAH):06d}",
+            "volume": acak.uniform(1.0, 500.0),
+            "status_baru": "Diangkut",
+            "kendaraan": f"Truk {acak.randrange(50):02d}",
+            "tujuan": f"Fasilitas {acak.randrange(20):02d}",
+        }
+        for i in range(JUMLAH)
+    ]
+
+
+def truk_pagi(repository, acak: random.Random) -> list[dict]:
+    """
+    Mencari muatan satu truk acak antara 08:00 dan 12:00 pada hari acak.
+
+    Args:
+        repository: Instance ManifestRepository.
+        acak (random.Random): Pembangkit acak.
+
+    Returns:
+        list[dict]: Catatan hasil pencarian.
+    """
+    hari = datetime(2024, 1, 1) + timedelta(days=acak.randrange(100))
+    return repository.find(
+        kendaraan=f"Truk {acak.randrange(50):02d}",
+        mulai=hari + timedelta(hours=8), sampai=hari + timedelta(hours=12),
+    )
+
+
+def ukur(nama: str, repository, daftar_catatan: list[dict]) -> None:
+    """
+    Mengukur ingest dan query pada satu repository.
+
+    Args:
+        nama (str): Nama repository untuk dicetak.
+        repository: Instance ManifestRepository kosong.
+        daftar_catatan (list[dict]): Catatan yang diingest.
+    """
+    mulai = time.perf_counter()
+    for i in range(0, len(daftar_catatan), UKURAN_BATCH):
+        repository.save_many(daftar_catatan[i:i + UKURAN_BATCH])
+    ingest = time.perf_counter() - mulai
+
+    acak = random.Random(5)
+    hasil = {}
+    kueri = {
+        "limbah": lambda: repository.find_by_limbah(f"L{acak.randrange(JUMLAH_LIMBAH):06d}"),
+        "truk 08-12": lambda: truk_pagi(repository, acak),
+        "tujuan 1 jam": lambda: repository.find(
+            tujuan=f"Fasilitas {acak.randrange(20):02d}",
+            mulai=datetime(2024, 2, 1, 9), sampai=datetime(2024, 2, 1, 10),
+        ),
+    }
+    for label, jalankan in kueri.items():
+        mulai = time.perf_counter()
+        for _ in range(PUTARAN):
+            jalankan()
+        hasil[label] = (time.perf_counter() - mulai) / PUTARAN * 1e6
+
+    print(f"{nama:>8} | ingest {ingest:6.2f} s ({len(daftar_catatan) / ingest:>9,.0f}/s) | "
+          + " | ".join(f"{label} {us:7.1f} us" for label, us in hasil.items()))
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark untuk kedua implementasi.
+    """
+    daftar_catatan = buat_catatan()
+    print(f"{JUMLAH:,} catatan, rata-rata {PUTARAN} query:")
+    ukur("memori", InMemoryManifestRepository(), daftar_catatan)
+    with tempfile.TemporaryDirectory() as direktori:
+        repository = SqliteManifestRepository(os.path.join(direktori, "manifest.db"), UKURAN_BATCH)
+        ukur("sqlite", repository, daftar_catatan)
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
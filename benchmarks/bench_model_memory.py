@@ -0,0 +1,126 @@
+"""
+Benchmark memori per record model limbah dengan tracemalloc.
+
+Membandingkan layout lama berbasis __dict__ per instance dengan layout
+__slots__ yang kini dipakai seluruh model. Kelas pembanding *Dict di
+bawah ini meniru atribut model sebelum memakai __slots__ sehingga kedua
+layout diukur pada Python yang sama.
+
+ID dibuat sebelum pengukuran dimulai agar yang terhitung hanya objek
+model itu sendiri.
+
+Jalankan:
+    python -m benchmarks.bench_model_memory
+"""
+
+import gc
+import time
+import tracemalloc
+
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+from models.petugas import Petugas
+
+JUMLAH = 200_000
+
+
+class LimbahOrganikDict:
+    """
+    Pembanding LimbahOrganik dengan layout __dict__ (sebelum __slots__).
+    """
+
+    def __init__(self, id: str, volume: float, tingkat_pembusukan: int):
+        self.__id = id
+        self.__pengamat = None
+        self.__volume = volume
+        self.__status = "Terdaftar"
+        self.__dibuat_pada = time.time()
+        self.__versi = 0
+        self.__tingkat_pembusukan = tingkat_pembusukan
+
+
+class LimbahMedisDict:
+    """
+    Pembanding LimbahMedis dengan layout __dict__ (sebelum __slots__).
+    """
+
+    def __init__(self, id: str, volume: float, tingkat_infeksi: int):
+        self.__id = id
+        self.__pengamat = None
+        self.__volume = volume
+        self.__status = "Terdaftar"
+        self.__dibuat_pada = time.time()
+        self.__versi = 0
+        self.__tingkat_infeksi = tingkat_infeksi
+
+
+class LimbahB3Dict:
+    """
+    Pembanding LimbahB3 dengan layout __dict__ (sebelum __slots__).
+    """
+
+    def __init__(self, id: str, volume: float, kandungan_kimia: str):
+        self.__id = id
+        self.__pengamat = None
+        self.__volume = volume
+        self.__status = "Terdaftar"
+        self.__dibuat_pada = time.time()
+        self.__versi = 0
+        self.__kandungan_kimia = kandungan_kimia
+
+
+class PetugasDict:
+    """
+    Pembanding Petugas dengan layout __dict__ (sebelum __slots__).
+    """
+
+    def __init__(self, id: str, nama: str, keahlian: str):
+        self.__id = id
+        self.__nama = nama
+        self.__keahlian = keahlian
+
+
+PASANGAN = (
+    ("LimbahOrganik", LimbahOrganikDict, LimbahOrganik, (10.0, 3)),
+    ("LimbahMedis", LimbahMedisDict, LimbahMedis, (10.0, 5)),
+    ("LimbahB3", LimbahB3Dict, LimbahB3, (10.0, "Merkuri")),
+    ("Petugas", PetugasDict, Petugas, ("Budi", "Medis")),
+)
+
+
+def ukur_byte_per_record(kelas: type, argumen: tuple) -> float:
+    """
+    Mengukur rata-rata byte yang dialokasikan per objek.
+
+    Args:
+        kelas (type): Kelas model yang dibuat.
+        argumen (tuple): Argumen konstruktor setelah ID.
+
+    Returns:
+        float: Rata-rata byte per record.
+    """
+    ids = [f"L{i:07d}" for i in range(JUMLAH)]
+    gc.collect()
+    tracemalloc.start()
+    awal, _ = tracemalloc.get_traced_memory()
+    objek = [kelas(id, *argumen) for id in ids]
+    akhir, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # list penampung objek ikut teralokasi; keluarkan dari hitungan
+    return (akhir - awal - objek.__sizeof__()) / JUMLAH
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak byte per record untuk kedua layout.
+    """
+    print(f"{'model':>14} | {'__dict__':>9} | {'__slots__':>9} | {'hemat':>6}")
+    for nama, kelas_dict, kelas_slots, argumen in PASANGAN:
+        sebelum = ukur_byte_per_record(kelas_dict, argumen)
+        sesudah = ukur_byte_per_record(kelas_slots, argumen)
+        print(f"{nama:>14} | {sebelum:>9.1f} | {sesudah:>9.1f} | {1 - sesudah / sebelum:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark PenugasanService.tugaskan_batch dibanding pemilihan petugas dengan scan roster.
+
+Roster berisi petugas berkeahlian Medis, B3, dan Pengangkutan. Untuk setiap
+ukuran roster, satu batch limbah campuran ditugaskan dengan:
+- scan: setiap limbah memindai seluruh roster mencari petugas berbeban
+  terkecil yang keahliannya sesuai, O(n) per limbah
+- heap: PenugasanService.tugaskan_batch, O(log n) per limbah
+
+Kedua cara menghasilkan beban akhir per petugas yang sama.
+
+Jalankan:
+    python -m benchmarks.bench_penugasan
+"""
+
+import time
+
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+from models.petugas import Petugas
+from services.penugasan_service import PenugasanService, keahlian_wajib
+
+UKURAN_ROSTER = (30, 300, 3_000)
+JUMLAH_LIMBAH = 5_000
+KEAHLIAN = ("Medis", "B3", "Pengangkutan")
+
+
+def buat_roster(jumlah: int) -> list[Petugas]:
+    """
+    Membuat roster dengan keahlian bergiliran.
+
+    Args:
+        jumlah (int): Jumlah petugas.
+
+    Returns:
+        list[Petugas]: Daftar petugas.
+    """
+    return [Petugas(f"P{i:05d}", f"Petugas {i}", KEAHLIAN[i % len(KEAHLIAN)]) for i in range(jumlah)]
+
+
+def buat_limbah() -> list:
+    """
+    Membuat batch limbah campuran organik, medis, dan B3.
+
+    Returns:
+        list: Daftar limbah.
+    """
+    daftar_limbah = []
+    for i in range(JUMLAH_LIMBAH):
+        if i % 3 == 0:
+            daftar_limbah.append(LimbahOrganik(f"L{i:05d}", 10.0, 5))
+        elif i % 3 == 1:
+            daftar_limbah.append(LimbahMedis(f"L{i:05d}", 10.0, 5))
+        else:
+            daftar_limbah.append(LimbahB3(f"L{i:05d}", 10.0, "Merkuri"))
+    return daftar_limbah
+
+
+def tugaskan_scan(roster: list[Petugas], daftar_limbah: list) -> dict[str, int]:
+    """
+    Menugaskan limbah dengan memindai roster untuk setiap limbah.
+
+    Args:
+        roster (list[Petugas]): Daftar petugas.
+        daftar_limbah (list): Limbah yang ditugaskan.
+
+    Returns:
+        dict[str, int]: ID petugas -> jumlah tugas.
+    """
+    beban = {petugas.get_id(): 0 for petugas in roster}
+    for limbah in daftar_limbah:
+        keahlian = keahlian_wajib(limbah)
+        kandidat = [
+            petugas.get_id() for petugas in roster
+            if keahlian is None or petugas.get_keahlian().lower() == keahlian
+        ]
+        terpilih = min(kandidat, key=beban.__getitem__)
+        beban[terpilih] += 1
+    return beban
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak waktu tiap ukuran roster.
+    """
+    daftar_limbah = buat_limbah()
+    print(f"{JUMLAH_LIMBAH:,} limbah per batch (milidetik):")
+    print(f"{'petugas':>8} | {'scan':>10} | {'heap':>8}")
+    for jumlah in UKURAN_ROSTER:
+        roster = buat_roster(jumlah)
+
+        mulai = time.perf_counter()
+        beban_scan = tugaskan_scan(roster, daftar_limbah)
+        scan = time.perf_counter() - mulai
+
+        service = PenugasanService(roster)
+        mulai = time.perf_counter()
+        hasil = service.tugaskan_batch(daftar_limbah)
+        heap = time.perf_counter() - mulai
+
+        assert not hasil["gagal"]
+        beban_heap = {id: b["jumlah_tugas"] for id, b in service.ringkasan_beban().items()}
+        assert sorted(beban_heap.values()) == sorted(beban_scan.values())
+        print(f"{jumlah:>8,} | {scan * 1000:>10.1f} | {heap * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
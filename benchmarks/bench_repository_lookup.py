@@ -0,0 +1,68 @@
+"""
+Benchmark latensi get_by_id pada InMemoryLimbahRepository.
+
+Mengukur rata-rata waktu pencarian berdasarkan ID untuk ukuran
+repository 1k sampai 1M record. Dengan index primary key, latensi
+diharapkan tetap datar (O(1)) seiring bertambahnya jumlah data.
+
+Jalankan:
+    python -m benchmarks.bench_repository_lookup
+"""
+
+import random
+import time
+
+from models.limbah_organik import LimbahOrganik
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+
+UKURAN = (1_000, 10_000, 100_000, 1_000_000)
+JUMLAH_LOOKUP = 100_000
+
+
+def isi_repository(jumlah: int) -> InMemoryLimbahRepository:
+    """
+    Membuat repository berisi sejumlah limbah organik.
+
+    Args:
+        jumlah (int): Jumlah record yang dibuat.
+
+    Returns:
+        InMemoryLimbahRepository: Repository yang sudah terisi.
+    """
+    repository = InMemoryLimbahRepository()
+    for i in range(jumlah):
+        repository.save(LimbahOrganik(f"L{i:07d}", 10.0, 3))
+    return repository
+
+
+def ukur_lookup(repository: InMemoryLimbahRepository, jumlah: int) -> float:
+    """
+    Mengukur rata-rata latensi get_by_id dalam nanodetik.
+
+    Args:
+        repository (InMemoryLimbahRepository): Repository yang diukur.
+        jumlah (int): Jumlah record di repository.
+
+    Returns:
+        float: Rata-rata latensi per lookup (ns).
+    """
+    ids = [f"L{random.randrange(jumlah):07d}" for _ in range(JUMLAH_LOOKUP)]
+    get_by_id = repository.get_by_id
+    mulai = time.perf_counter_ns()
+    for id in ids:
+        get_by_id(id)
+    return (time.perf_counter_ns() - mulai) / JUMLAH_LOOKUP
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak hasil per ukuran repository.
+    """
+    print(f"{'record':>10} | {'ns/lookup':>10}")
+    for jumlah in UKURAN:
+        repository = isi_repository(jumlah)
+        print(f"{jumlah:>10} | {ukur_lookup(repository, jumlah):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
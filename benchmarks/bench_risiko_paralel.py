@@ -0,0 +1,100 @@
+"""
+Benchmark skala hitung_agregat_paralel() terhadap jumlah proses pekerja.
+
+Mengisi ColumnarLimbahRepository dengan JUMLAH record campuran lalu
+menghitung risiko, volume, dan jumlah per jenis dengan 1, 2, 4, dan 8
+pekerja (1 = di proses ini tanpa pool). Dicetak juga ukuran pickle satu
+partisi kolom dibanding daftar objek Limbah berisi baris yang sama, yaitu
+biaya kirim ke pekerja yang dihemat format ringkas.
+
+Bagian kedua memakai InMemoryLimbahRepository (berbasis objek) dengan
+JUMLAH_OBJEK record. Repository ini tidak punya partisi kolom langsung,
+sehingga hitung_agregat_paralel() menjumlahkan objeknya di proses ini
+berapa pun jumlah_pekerja; waktunya dibandingkan dengan loop
+hitung_risiko() biasa.
+
+Percepatan dibatasi jumlah core yang tersedia (os.cpu_count()).
+
+Jalankan:
+    python -m benchmarks.bench_risiko_paralel
+"""
+
+import math
+import os
+import pickle
+import time
+
+from benchmarks.bench_columnar_risiko import buat_limbah
+from repositories.columnar_limbah_repository import ColumnarLimbahRepository
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from repositories.limbah_repository import LimbahRepository
+from services.risiko_paralel import hitung_agregat_paralel
+
+JUMLAH = 2_000_000
+JUMLAH_OBJEK = 500_000
+UKURAN_POTONGAN = 100_000
+UKURAN_PARTISI = 100_000
+JUMLAH_PEKERJA = (1, 2, 4, 8)
+
+
+def isi(repository: LimbahRepository, jumlah: int) -> LimbahRepository:
+    """
+    Mengisi repository dengan limbah campuran per potongan.
+
+    Args:
+        repository (LimbahRepository): Repository tujuan.
+        jumlah (int): Jumlah record.
+
+    Returns:
+        LimbahRepository: Repository yang sama.
+    """
+    for awal in range(0, jumlah, UKURAN_POTONGAN):
+        repository.save_many([buat_limbah(i) for i in range(awal, min(awal + UKURAN_POTONGAN, jumlah))])
+    return repository
+
+
+def ukur_pekerja(repository: LimbahRepository, jumlah: int) -> None:
+    """
+    Mencetak waktu hitung_agregat_paralel() untuk setiap jumlah pekerja.
+
+    Args:
+        repository (LimbahRepository): Repository sumber data.
+        jumlah (int): Jumlah record di repository.
+    """
+    print(f"{'pekerja':>7} | {'waktu (s)':>9} | {'percepatan':>10}")
+    acuan = None
+    total_acuan = None
+    for jumlah_pekerja in JUMLAH_PEKERJA:
+        mulai = time.perf_counter()
+        hasil = hitung_agregat_paralel(repository, jumlah_pekerja, UKURAN_PARTISI)
+        durasi = time.perf_counter() - mulai
+        acuan = acuan or durasi
+        total_acuan = total_acuan or hasil["total"]
+        assert hasil["jumlah"] == jumlah and math.isclose(hasil["total"], total_acuan)
+        print(f"{jumlah_pekerja:>7} | {durasi:>9.3f} | {acuan / durasi:>9.2f}x")
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak waktu per jumlah pekerja.
+    """
+    repository = isi(ColumnarLimbahRepository(), JUMLAH)
+
+    partisi = next(repository.partisi_kolom(UKURAN_PARTISI))
+    ukuran_kolom = len(pickle.dumps(partisi))
+    ukuran_objek = len(pickle.dumps([buat_limbah(i) for i in range(UKURAN_PARTISI)]))
+    print(f"pickle {UKURAN_PARTISI:,} baris: kolom {ukuran_kolom / 1e6:.1f} MB, objek {ukuran_objek / 1e6:.1f} MB")
+
+    print(f"ColumnarLimbahRepository, {JUMLAH:,} record, {os.cpu_count()} CPU:")
+    ukur_pekerja(repository, JUMLAH)
+
+    repository = isi(InMemoryLimbahRepository(), JUMLAH_OBJEK)
+    mulai = time.perf_counter()
+    sum(limbah.hitung_risiko() for limbah in repository.iter_all())
+    serial = time.perf_counter() - mulai
+    print(f"InMemoryLimbahRepository, {JUMLAH_OBJEK:,} record (loop hitung_risiko(): {serial:.3f} s):")
+    ukur_pekerja(repository, JUMLAH_OBJEK)
+
+
+if __name__ == "__main__":
+    main()
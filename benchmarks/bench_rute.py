@@ -0,0 +1,62 @@
+"""
+Benchmark RuteService untuk 100 sampai 5000 titik penjemputan.
+
+Lokasi dibangkitkan acak di sekitar satu wilayah bencana (~55 x 55 km).
+Dicetak panjang rute nearest neighbor, panjang setelah 2-opt/Or-opt,
+persentase perbaikan, dan waktu total. Sebagai pembanding dicetak
+perkiraan panjang rute optimal acak seragam 0.7124 * sqrt(n * luas).
+
+Jalankan:
+    python -m benchmarks.bench_rute
+"""
+
+import math
+import random
+
+from models.lokasi import Lokasi
+from services.rute_service import RuteService
+from utils.rute import proyeksi_km
+
+UKURAN = (100, 500, 1_000, 2_000, 5_000)
+BATAS_WAKTU = 2.0
+
+
+def buat_lokasi(jumlah: int, seed: int) -> list[Lokasi]:
+    """
+    Membuat lokasi acak dengan koordinat di sekitar Jakarta.
+
+    Args:
+        jumlah (int): Jumlah lokasi.
+        seed (int): Seed pembangkit acak.
+
+    Returns:
+        list[Lokasi]: Daftar lokasi berkoordinat.
+    """
+    acak = random.Random(seed)
+    return [
+        Lokasi(f"LOK{i:05d}", f"Posko {i}", "Banjir",
+               -6.45 + acak.uniform(0.0, 0.5), 106.6 + acak.uniform(0.0, 0.5))
+        for i in range(jumlah)
+    ]
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak hasil per jumlah titik.
+    """
+    service = RuteService(batas_waktu=BATAS_WAKTU)
+    print(f"{'titik':>6} | {'NN km':>9} | {'akhir km':>9} | {'perbaikan':>9} | {'perkiraan':>9} | {'detik':>6}")
+    for jumlah in UKURAN:
+        daftar_lokasi = buat_lokasi(jumlah, jumlah)
+        titik = proyeksi_km([lokasi.get_koordinat() for lokasi in daftar_lokasi])
+        xs = [x for x, _ in titik]
+        ys = [y for _, y in titik]
+        luas = (max(xs) - min(xs)) * (max(ys) - min(ys))
+        hasil = service.rencanakan_rute(daftar_lokasi)
+        perbaikan = 1 - hasil["panjang_km"] / hasil["panjang_awal_km"]
+        print(f"{jumlah:>6} | {hasil['panjang_awal_km']:>9.1f} | {hasil['panjang_km']:>9.1f} | "
+              f"{perbaikan:>9.1%} | {0.7124 * math.sqrt(jumlah * luas):>9.1f} | {hasil['waktu_detik']:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
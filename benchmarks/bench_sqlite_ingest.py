@@ -0,0 +1,74 @@
+"""
+Benchmark ingest SqliteLimbahRepository.
+
+Mengukur waktu penyimpanan 100k record campuran (Organik, Medis, B3)
+ke file SQLite dengan berbagai ukuran batch commit.
+
+Jalankan:
+    python -m benchmarks.bench_sqlite_ingest
+"""
+
+import os
+import tempfile
+import time
+
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+from repositories.sqlite_limbah_repository import SqliteLimbahRepository
+
+JUMLAH = 100_000
+UKURAN_BATCH = (100, 1_000, 10_000)
+
+
+def buat_limbah(i: int):
+    """
+    Membuat limbah contoh secara bergiliran per jenis.
+
+    Args:
+        i (int): Nomor urut record.
+
+    Returns:
+        Limbah: Objek limbah contoh.
+    """
+    id = f"L{i:07d}"
+    if i % 3 == 0:
+        return LimbahOrganik(id, 10.0, 3)
+    if i % 3 == 1:
+        return LimbahMedis(id, 5.0, 7)
+    return LimbahB3(id, 2.0, "Merkuri")
+
+
+def ukur_ingest(path: str, ukuran_batch: int) -> float:
+    """
+    Mengukur waktu ingest JUMLAH record ke database baru.
+
+    Args:
+        path (str): Lokasi file database.
+        ukuran_batch (int): Ukuran batch commit.
+
+    Returns:
+        float: Durasi dalam detik.
+    """
+    daftar = [buat_limbah(i) for i in range(JUMLAH)]
+    repository = SqliteLimbahRepository(path, ukuran_batch=ukuran_batch)
+    mulai = time.perf_counter()
+    for limbah in daftar:
+        repository.save(limbah)
+    repository.close()
+    return time.perf_counter() - mulai
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak hasil per ukuran batch.
+    """
+    print(f"{'batch':>8} | {'detik':>8} | {'record/s':>10}")
+    for ukuran_batch in UKURAN_BATCH:
+        with tempfile.TemporaryDirectory() as direktori:
+            durasi = ukur_ingest(os.path.join(direktori, "limbah.db"), ukuran_batch)
+        print(f"{ukuran_batch:>8} | {durasi:>8.2f} | {JUMLAH / durasi:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark LimbahService.top_k_risiko dibanding sort penuh pada 1 juta limbah.
+
+Repository in-memory diisi 1 juta limbah campuran (sepertiga di antaranya
+sudah diangkut). Untuk k = 20 dan k = 1000 dibandingkan:
+- sorted(get_all(), key=hitung_risiko, reverse=True)[:k]
+- top_k_risiko(k) tanpa filter, dengan status "Terdaftar", dan dengan jenis
+
+Jalankan:
+    python -m benchmarks.bench_top_k
+"""
+
+import random
+import time
+
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from services.limbah_service import LimbahService
+
+JUMLAH = 1_000_000
+DAFTAR_K = (20, 1_000)
+PUTARAN = 3
+
+
+def isi_repository() -> InMemoryLimbahRepository:
+    """
+    Membuat repository berisi JUMLAH limbah dengan volume dan tingkat acak.
+
+    Returns:
+        InMemoryLimbahRepository: Repository terisi.
+    """
+    acak = random.Random(11)
+    daftar_limbah = []
+    for i in range(JUMLAH):
+        volume = acak.uniform(1.0, 500.0)
+        if i % 3 == 0:
+            daftar_limbah.append(LimbahOrganik(f"L{i:07d}", volume, acak.randint(1, 10)))
+        elif i % 3 == 1:
+            daftar_limbah.append(LimbahMedis(f"L{i:07d}", volume, acak.randint(1, 10)))
+        else:
+            daftar_limbah.append(LimbahB3(f"L{i:07d}", volume, "Merkuri"))
+    repository = InMemoryLimbahRepository()
+    repository.save_many(daftar_limbah)
+    for limbah in daftar_limbah[::3]:
+        limbah.set_status("Diangkut")
+    return repository
+
+
+def ukur(jalankan) -> float:
+    """
+    Mengukur waktu terbaik dari beberapa putaran.
+
+    Args:
+        jalankan: Fungsi tanpa argumen yang diukur.
+
+    Returns:
+        float: Waktu terbaik (detik).
+    """
+    terbaik = float("inf")
+    for _ in range(PUTARAN):
+        mulai = time.perf_counter()
+        jalankan()
+        terbaik = min(terbaik, time.perf_counter() - mulai)
+    return terbaik
+
+
+def main() -> None:
+    """
+    Menjalankan benchmark dan mencetak waktu tiap varian.
+    """
+    repository = isi_repository()
+    service = LimbahService(repository)
+    print(f"{JUMLAH:,} limbah, waktu terbaik dari {PUTARAN} putaran (detik):")
+    print(f"{'k':>6} | {'sorted penuh':>12} | {'top_k':>8} | {'Terdaftar':>9} | {'LimbahMedis':>11}")
+    for k in DAFTAR_K:
+        acuan = sorted(repository.get_all(), key=lambda l: l.hitung_risiko(), reverse=True)[:k]
+        assert [l.get_id() for l in service.top_k_risiko(k)] == [l.get_id() for l in acuan]
+        penuh = ukur(lambda: sorted(repository.get_all(), key=lambda l: l.hitung_risiko(), reverse=True)[:k])
+        semua = ukur(lambda: service.top_k_risiko(k))
+        terdaftar = ukur(lambda: service.top_k_risiko(k, status="Terdaftar"))
+        medis = ukur(lambda: service.top_k_risiko(k, jenis=LimbahMedis))
+        print(f"{k:>6} | {penuh:>12.3f} | {semua:>8.3f} | {terdaftar:>9.3f} | {medis:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,22 @@ untuk:
 - Menambahkan data limbah (Organik, Medis, B3)
 - Melihat seluruh data limbah
 - Melakukan proses pengangkutan limbah
+- Melacak riwayat pengangkutan limbah
+- Menugaskan petugas sesuai keahlian dan melihat beban kerja petugas
 
-Penyimpanan data menggunakan InMemory Repository
-(sementara, selama program berjalan).
+Penyimpanan data limbah menggunakan InMemory Repository
+(sementara, selama program berjalan). Catatan pengangkutan disimpan
+permanen di file SQLite manifest.db.
 """
 
 import logging
 from utils.logging_config import setup_logging
 
 from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from repositories.sqlite_manifest_repository import SqliteManifestRepository
 from services.limbah_service import LimbahService
 from services.pengangkutan_service import PengangkutanService
+from services.penugasan_service import PenugasanService
 from models.petugas import Petugas
 from models.lokasi import Lokasi
 
@@ -42,8 +47,10 @@ def main():
 
     # Inisialisasi repository dan service
     limbah_repository = InMemoryLimbahRepository()
+    manifest_repository = SqliteManifestRepository("manifest.db", ukuran_batch=1)
     limbah_service = LimbahService(limbah_repository)
-    pengangkutan_service = PengangkutanService(limbah_repository)
+    penugasan_service = PenugasanService()
+    pengangkutan_service = PengangkutanService(limbah_repository, manifest_repository, penugasan_service)
     logger.info("Repository dan service berhasil diinisialisasi")
 
     # Loop utama menu
@@ -54,6 +61,8 @@ def main():
         print("3. Tambah Limbah B3")
         print("4. Lihat Semua Limbah")
         print("5. Angkut Limbah")
+        print("6. Lacak Pengangkutan Limbah")
+        print("7. Lihat Beban Petugas")
         print("0. Keluar")
 
         pilihan = input("Pilih menu: ")
@@ -123,48 +132,83 @@ def main():
             # Lihat Semua Limbah
             elif pilihan == "4":
                 logger.info("User memilih menu: Lihat Semua Limbah")
-                semua_limbah = limbah_service.get_semua_limbah()
-                if not semua_limbah:
+                ada_data = False
+                for l in limbah_service.iter_semua_limbah():
+                    if not ada_data:
+                        print("\n--- DAFTAR LIMBAH ---")
+                        ada_data = True
+                    print(l)
+                if not ada_data:
                     print("Belum ada data limbah.")
-                else:
-                    print("\n--- DAFTAR LIMBAH ---")
-                    for l in semua_limbah:
-                        print(l)
 
             # Angkut Limbah
             elif pilihan == "5":
                 logger.info("User memilih menu: Angkut Limbah")
                 id_limbah = input("ID limbah yang akan diangkut: ")
 
-                id_petugas = input("ID petugas: ")
-                nama_petugas = input("Nama petugas: ")
-                keahlian = input("Keahlian petugas: ")
-
-                petugas = Petugas(id_petugas, nama_petugas, keahlian)
-                logger.info("Petugas dibuat: %s", petugas)
+                # ID kosong: petugas dipilih otomatis dari roster; jika tidak
+                # ada petugas yang sesuai, limbah diangkut tanpa petugas
+                id_petugas = input("ID petugas (kosongkan untuk otomatis): ").strip() or None
+                petugas_baru = id_petugas is not None and penugasan_service.get_petugas(id_petugas) is None
+                if petugas_baru:
+                    nama_petugas = input("Nama petugas: ")
+                    keahlian = input("Keahlian petugas (Medis/B3/lainnya): ")
+                    penugasan_service.tambah_petugas(Petugas(id_petugas, nama_petugas, keahlian))
 
                 kendaraan = input("Nama/jenis kendaraan: ")
                 tujuan = input("Tujuan pengangkutan: ")
 
-                catatan = pengangkutan_service.angkut_limbah(
-                    id_limbah=id_limbah,
-                    kendaraan=kendaraan,
-                    tujuan=tujuan
-                )
+                try:
+                    catatan = pengangkutan_service.angkut_limbah(
+                        id_limbah=id_limbah,
+                        kendaraan=kendaraan,
+                        tujuan=tujuan,
+                        id_petugas=id_petugas
+                    )
+                except (ValueError, LookupError):
+                    # Petugas baru tidak disimpan jika pengangkutannya ditolak
+                    if petugas_baru:
+                        penugasan_service.hapus_petugas(id_petugas)
+                    raise
 
                 print("Pengangkutan berhasil.")
                 logger.info("Pengangkutan limbah berhasil: %s", id_limbah)
-                print("Petugas bertanggung jawab:")
-                for k, v in petugas.get_info().items():
-                    print(f"  {k}: {v}")
+                petugas = penugasan_service.get_petugas(catatan["id_petugas"])
+                if petugas is not None:
+                    print("Petugas bertanggung jawab:")
+                    for k, v in petugas.get_info().items():
+                        print(f"  {k}: {v}")
 
                 print("Catatan pengangkutan:")
                 for k, v in catatan.items():
                     print(f"  {k}: {v}")
 
+            # Lacak Pengangkutan Limbah
+            elif pilihan == "6":
+                logger.info("User memilih menu: Lacak Pengangkutan Limbah")
+                id_limbah = input("ID limbah: ")
+                riwayat = pengangkutan_service.lacak_limbah(id_limbah)
+                if not riwayat:
+                    print("Belum ada catatan pengangkutan untuk limbah ini.")
+                for catatan in riwayat:
+                    print(
+                        f"  {catatan['timestamp']} | {catatan['kendaraan']} -> {catatan['tujuan']}"
+                        f" | petugas: {catatan['id_petugas'] or '-'}"
+                    )
+
+            # Lihat Beban Petugas
+            elif pilihan == "7":
+                logger.info("User memilih menu: Lihat Beban Petugas")
+                beban = penugasan_service.ringkasan_beban()
+                if not beban:
+                    print("Belum ada petugas terdaftar.")
+                for id_petugas, b in beban.items():
+                    print(f"  {id_petugas} ({b['keahlian']}): {b['jumlah_tugas']} tugas, {b['volume']:.2f} kg")
+
             # Keluar Program
             elif pilihan == "0":
                 print("Program dihentikan.")
+                manifest_repository.close()
                 logger.info("Aplikasi dihentikan oleh user")
                 break
 
@@ -0,0 +1,110 @@
+from models.limbah import Limbah
+
+
+class Kendaraan:
+    """
+    Kelas Kendaraan.
+
+    Merepresentasikan kendaraan pengangkut limbah beserta kapasitas
+    muatan dan jenis limbah yang boleh dibawanya.
+
+    Attributes:
+        __id (str): ID unik kendaraan.
+        __nama (str): Nama/jenis kendaraan.
+        __kapasitas_kg (float): Kapasitas muatan dalam kg.
+        __jenis_diizinkan (tuple[type, ...]): Kelas limbah yang boleh diangkut.
+    """
+
+    __slots__ = ("__id", "__nama", "__kapasitas_kg", "__jenis_diizinkan")
+
+    def __init__(self, id: str, nama: str, kapasitas_kg: float, jenis_diizinkan: tuple[type, ...]):
+        """
+        Inisialisasi kendaraan.
+
+        Args:
+            id (str): ID kendaraan.
+            nama (str): Nama/jenis kendaraan.
+            kapasitas_kg (float): Kapasitas muatan dalam kg.
+            jenis_diizinkan (tuple[type, ...]): Kelas limbah yang boleh diangkut,
+                misal (LimbahMedis, LimbahB3).
+
+        Raises:
+            ValueError: Jika id atau nama kosong, kapasitas <= 0, atau
+                jenis_diizinkan kosong/bukan kelas limbah.
+        """
+        if not id or not id.strip():
+            raise ValueError("ID kendaraan tidak boleh kosong")
+        if not nama or not nama.strip():
+            raise ValueError("Nama kendaraan tidak boleh kosong")
+        if kapasitas_kg <= 0:
+            raise ValueError("Kapasitas kendaraan harus lebih dari 0")
+        jenis_diizinkan = tuple(jenis_diizinkan)
+        if not jenis_diizinkan or not all(
+            isinstance(jenis, type) and issubclass(jenis, Limbah) for jenis in jenis_diizinkan
+        ):
+            raise ValueError("Jenis limbah yang diizinkan wajib berisi kelas limbah")
+
+        self.__id = id.strip()
+        self.__nama = nama.strip()
+        self.__kapasitas_kg = float(kapasitas_kg)
+        self.__jenis_diizinkan = jenis_diizinkan
+
+    def get_id(self) -> str:
+        """
+        Mengambil ID kendaraan.
+
+        Returns:
+            str: ID kendaraan.
+        """
+        return self.__id
+
+    def get_nama(self) -> str:
+        """
+        Mengambil nama kendaraan.
+
+        Returns:
+            str: Nama kendaraan.
+        """
+        return self.__nama
+
+    def get_kapasitas_kg(self) -> float:
+        """
+        Mengambil kapasitas muatan kendaraan.
+
+        Returns:
+            float: Kapasitas dalam kg.
+        """
+        return self.__kapasitas_kg
+
+    def get_jenis_diizinkan(self) -> tuple[type, ...]:
+        """
+        Mengambil kelas limbah yang boleh diangkut.
+
+        Returns:
+            tuple[type, ...]: Kelas limbah yang diizinkan.
+        """
+        return self.__jenis_diizinkan
+
+    def bisa_membawa(self, limbah: Limbah) -> bool:
+        """
+        Memeriksa apakah jenis limbah boleh diangkut kendaraan ini.
+
+        Kapasitas tidak diperiksa di sini; lihat get_kapasitas_kg().
+
+        Args:
+            limbah (Limbah): Limbah yang akan diangkut.
+
+        Returns:
+            bool: True jika jenis limbah diizinkan.
+        """
+        return isinstance(limbah, self.__jenis_diizinkan)
+
+    def __str__(self) -> str:
+        """
+        Representasi string dari objek Kendaraan.
+
+        Returns:
+            str: Deskripsi kendaraan dalam format yang mudah dibaca.
+        """
+        jenis = ", ".join(kelas.__name__ for kelas in self.__jenis_diizinkan)
+        return f"Kendaraan(ID: {self.__id}, Nama: {self.__nama}, Kapasitas: {self.__kapasitas_kg} kg, Jenis: {jenis})"
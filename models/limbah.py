@@ -1,4 +1,9 @@
+import time
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Union
+
+from models.status_limbah import LABEL_STATUS, StatusLimbah
 
 class Limbah(ABC):
     """
@@ -11,20 +16,39 @@ class Limbah(ABC):
     Attributes:
         __id (str): ID unik limbah.
         __volume (float): Volume limbah.
-        __status (str): Status penanganan limbah.
+        __status (StatusLimbah): Kode status penanganan limbah.
+        __dibuat_pada (float): Waktu registrasi (detik epoch Unix).
+        __versi (int): Nomor versi record; naik satu setiap status atau volume berubah.
+        __pengamat (list | None): Callback yang dipanggil saat atribut berubah.
+
+    Subclass menetapkan STATUS_PENGOLAHAN (status hasil proses_pengolahan)
+    dan keterangan_pengolahan().
     """
 
-    def __init__(self, id: str, volume: float):
+    __slots__ = ("__id", "__volume", "__status", "__dibuat_pada", "__versi", "__pengamat")
+
+    STATUS_PENGOLAHAN: StatusLimbah
+
+    def __init__(self, id: str, volume: float, dibuat_pada: Union[float, datetime, None] = None):
         """
         Inisialisasi objek Limbah.
 
         Args:
             id (str): ID limbah.
             volume (float): Volume limbah.
+            dibuat_pada (float | datetime | None): Waktu registrasi sebagai detik
+                epoch atau datetime; default waktu saat ini.
         """
         self.__id = id
+        self.__pengamat = None
+        self.__versi = 0
         self.volume = volume
-        self.__status = "Terdaftar"
+        self.__status = StatusLimbah.TERDAFTAR
+        if dibuat_pada is None:
+            dibuat_pada = time.time()
+        elif isinstance(dibuat_pada, datetime):
+            dibuat_pada = dibuat_pada.timestamp()
+        self.__dibuat_pada = float(dibuat_pada)
 
     def get_id(self):
         """
@@ -49,10 +73,55 @@ class Limbah(ABC):
         Mengambil status limbah.
 
         Returns:
-            str: Status limbah.
+            str: Label status limbah, misal "Terdaftar".
+        """
+        return LABEL_STATUS[self.__status]
+
+    def get_kode_status(self) -> StatusLimbah:
+        """
+        Mengambil kode status limbah.
+
+        Returns:
+            StatusLimbah: Kode status limbah.
         """
         return self.__status
 
+    def get_dibuat_pada(self) -> datetime:
+        """
+        Mengambil waktu registrasi limbah.
+
+        Returns:
+            datetime: Waktu registrasi (waktu lokal).
+        """
+        return datetime.fromtimestamp(self.__dibuat_pada)
+
+    def get_detik_dibuat(self) -> float:
+        """
+        Mengambil waktu registrasi limbah sebagai detik epoch Unix.
+
+        Returns:
+            float: Detik sejak epoch.
+        """
+        return self.__dibuat_pada
+
+    def get_versi(self) -> int:
+        """
+        Mengambil nomor versi record untuk optimistic concurrency.
+
+        Returns:
+            int: Versi saat ini; limbah baru bernilai 1.
+        """
+        return self.__versi
+
+    def _pulihkan_versi(self, versi: int) -> None:
+        """
+        Mengembalikan nomor versi tersimpan saat repository memuat record.
+
+        Args:
+            versi (int): Versi yang tersimpan.
+        """
+        self.__versi = versi
+
     def set_volume(self, volume: float):
         """
         Mengatur volume limbah dengan validasi.
@@ -65,16 +134,70 @@ class Limbah(ABC):
         """
         if volume <= 0:
             raise ValueError("Volume limbah harus lebih dari 0")
-        self.__volume = volume
+        self.__versi += 1
+        if self.__pengamat:
+            lama = self.__volume
+            self.__volume = volume
+            self.__beritahu("volume", lama, volume)
+        else:
+            self.__volume = volume
 
-    def set_status(self, status: str):
+    def set_status(self, status: Union[str, StatusLimbah]):
         """
-        Mengatur status limbah.
+        Mengatur status limbah dengan validasi transisi.
+
+        Pengamat menerima label status lama dan baru.
+
+        Args:
+            status (str | StatusLimbah): Label status atau kode status baru.
+
+        Raises:
+            ValueError: Jika status tidak dikenal atau transisi tidak diizinkan.
+        """
+        lama = self.__status
+        baru = StatusLimbah.dari(status)
+        lama.validasi_transisi(baru)
+        self.__status = baru
+        self.__versi += 1
+        if self.__pengamat:
+            self.__beritahu("status", LABEL_STATUS[lama], LABEL_STATUS[baru])
+
+    def tambah_pengamat(self, callback: Callable[["Limbah", str, Any, Any], None]) -> None:
+        """
+        Mendaftarkan callback yang dipanggil setiap status atau volume berubah.
+
+        Callback menerima argumen (limbah, atribut, nilai_lama, nilai_baru),
+        dengan atribut bernilai "status" atau "volume". Digunakan oleh
+        repository untuk menjaga index tetap konsisten.
+
+        Args:
+            callback (Callable): Fungsi pengamat perubahan.
+        """
+        if self.__pengamat is None:
+            self.__pengamat = []
+        self.__pengamat.append(callback)
+
+    def hapus_pengamat(self, callback: Callable[["Limbah", str, Any, Any], None]) -> None:
+        """
+        Menghapus callback pengamat yang sebelumnya didaftarkan.
 
         Args:
-            status (str): Status baru limbah.
+            callback (Callable): Fungsi pengamat perubahan.
         """
-        self.__status = status
+        if self.__pengamat and callback in self.__pengamat:
+            self.__pengamat.remove(callback)
+
+    def __beritahu(self, atribut: str, lama: Any, baru: Any) -> None:
+        """
+        Memanggil seluruh pengamat dengan informasi perubahan atribut.
+
+        Args:
+            atribut (str): Nama atribut yang berubah.
+            lama (Any): Nilai sebelum perubahan.
+            baru (Any): Nilai setelah perubahan.
+        """
+        for callback in tuple(self.__pengamat):
+            callback(self, atribut, lama, baru)
 
     volume = property(get_volume, set_volume)
 
@@ -85,7 +208,7 @@ class Limbah(ABC):
         Returns:
             str: Deskripsi limbah dalam format yang mudah dibaca.
         """
-        return f"{self.__class__.__name__}(ID: {self.__id}, Volume: {self.__volume} kg, Status: {self.__status})"
+        return f"{self.__class__.__name__}(ID: {self.__id}, Volume: {self.__volume} kg, Status: {LABEL_STATUS[self.__status]})"
 
     @abstractmethod
     def hitung_risiko(self) -> float:
@@ -98,8 +221,24 @@ class Limbah(ABC):
         pass
 
     @abstractmethod
-    def proses_pengolahan(self):
+    def keterangan_pengolahan(self) -> str:
         """
-        Melakukan proses pengolahan limbah sesuai jenisnya.
+        Menjelaskan proses pengolahan limbah sesuai jenisnya.
+
+        Returns:
+            str: Informasi proses pengolahan.
         """
         pass
+
+    def proses_pengolahan(self) -> str:
+        """
+        Melakukan proses pengolahan limbah: status menjadi STATUS_PENGOLAHAN.
+
+        Returns:
+            str: Informasi proses pengolahan.
+
+        Raises:
+            ValueError: Jika limbah sudah diproses.
+        """
+        self.set_status(self.STATUS_PENGOLAHAN)
+        return self.keterangan_pengolahan()
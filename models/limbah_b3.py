@@ -1,4 +1,8 @@
+from datetime import datetime
+from typing import Union
+
 from models.limbah import Limbah
+from models.status_limbah import StatusLimbah
 
 class LimbahB3(Limbah):
     """
@@ -8,7 +12,13 @@ class LimbahB3(Limbah):
     yang membutuhkan penanganan khusus.
     """
 
-    def __init__(self, id: str, volume: float, kandungan_kimia: str):
+    __slots__ = ("__kandungan_kimia",)
+
+    STATUS_PENGOLAHAN = StatusLimbah.DIPROSES_KHUSUS
+
+    def __init__(
+        self, id: str, volume: float, kandungan_kimia: str, dibuat_pada: Union[float, datetime, None] = None
+    ):
         """
         Inisialisasi Limbah B3.
 
@@ -16,8 +26,9 @@ class LimbahB3(Limbah):
             id (str): ID limbah.
             volume (float): Volume limbah.
             kandungan_kimia (str): Jenis kandungan kimia.
+            dibuat_pada (float | datetime | None): Waktu registrasi; default waktu saat ini.
         """
-        super().__init__(id, volume)
+        super().__init__(id, volume, dibuat_pada)
         self.__kandungan_kimia = kandungan_kimia
 
     def get_kandungan_kimia(self) -> str:
@@ -49,12 +60,11 @@ class LimbahB3(Limbah):
         """
         return self.volume * 2.0
 
-    def proses_pengolahan(self):
+    def keterangan_pengolahan(self) -> str:
         """
         Proses pengolahan limbah B3 secara khusus.
 
         Returns:
             str: Informasi proses pengolahan.
         """
-        self.set_status("Diproses Khusus")
         return f"Limbah B3 dengan kandungan {self.__kandungan_kimia} diproses secara khusus"
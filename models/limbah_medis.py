@@ -1,4 +1,8 @@
+from datetime import datetime
+from typing import Union
+
 from models.limbah import Limbah
+from models.status_limbah import StatusLimbah
 
 class LimbahMedis(Limbah):
     """
@@ -8,7 +12,13 @@ class LimbahMedis(Limbah):
     tingkat risiko tinggi akibat infeksi.
     """
 
-    def __init__(self, id: str, volume: float, tingkat_infeksi: int):
+    __slots__ = ("__tingkat_infeksi",)
+
+    STATUS_PENGOLAHAN = StatusLimbah.DIMUSNAHKAN
+
+    def __init__(
+        self, id: str, volume: float, tingkat_infeksi: int, dibuat_pada: Union[float, datetime, None] = None
+    ):
         """
         Inisialisasi Limbah Medis.
 
@@ -16,8 +26,9 @@ class LimbahMedis(Limbah):
             id (str): ID limbah.
             volume (float): Volume limbah.
             tingkat_infeksi (int): Tingkat infeksi limbah.
+            dibuat_pada (float | datetime | None): Waktu registrasi; default waktu saat ini.
         """
-        super().__init__(id, volume)
+        super().__init__(id, volume, dibuat_pada)
         self.__tingkat_infeksi = tingkat_infeksi
 
     def get_tingkat_infeksi(self) -> int:
@@ -49,12 +60,11 @@ class LimbahMedis(Limbah):
         """
         return self.volume * self.__tingkat_infeksi * 1.5
 
-    def proses_pengolahan(self):
+    def keterangan_pengolahan(self) -> str:
         """
         Proses pengolahan limbah medis dengan metode pemusnahan.
 
         Returns:
             str: Informasi proses pengolahan.
         """
-        self.set_status("Dimusnahkan")
         return "Limbah medis dimusnahkan dengan insinerator"
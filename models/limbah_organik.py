@@ -1,4 +1,8 @@
+from datetime import datetime
+from typing import Union
+
 from models.limbah import Limbah
+from models.status_limbah import StatusLimbah
 
 class LimbahOrganik(Limbah):
     """
@@ -8,7 +12,13 @@ class LimbahOrganik(Limbah):
     dan berpotensi untuk didaur ulang.
     """
 
-    def __init__(self, id: str, volume: float, tingkat_pembusukan: int):
+    __slots__ = ("__tingkat_pembusukan",)
+
+    STATUS_PENGOLAHAN = StatusLimbah.DIDAUR_ULANG
+
+    def __init__(
+        self, id: str, volume: float, tingkat_pembusukan: int, dibuat_pada: Union[float, datetime, None] = None
+    ):
         """
         Inisialisasi Limbah Organik.
 
@@ -16,8 +26,9 @@ class LimbahOrganik(Limbah):
             id (str): ID limbah.
             volume (float): Volume limbah.
             tingkat_pembusukan (int): Tingkat pembusukan limbah.
+            dibuat_pada (float | datetime | None): Waktu registrasi; default waktu saat ini.
         """
-        super().__init__(id, volume)
+        super().__init__(id, volume, dibuat_pada)
         self.__tingkat_pembusukan = tingkat_pembusukan
 
     def get_tingkat_pembusukan(self) -> int:
@@ -49,12 +60,11 @@ class LimbahOrganik(Limbah):
         """
         return self.volume * self.__tingkat_pembusukan * 0.8
 
-    def proses_pengolahan(self):
+    def keterangan_pengolahan(self) -> str:
         """
         Proses pengolahan limbah organik dengan daur ulang.
 
         Returns:
             str: Informasi proses pengolahan.
         """
-        self.set_status("Didaur Ulang")
         return "Limbah organik diproses menjadi kompos"
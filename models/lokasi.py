@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class Lokasi:
     """
     Kelas Lokasi.
@@ -8,9 +11,16 @@ class Lokasi:
         __id (str): ID unik lokasi.
         __nama (str): Nama lokasi.
         __jenis_bencana (str): Jenis bencana yang terjadi.
+        __lintang (float | None): Lintang dalam derajat (opsional).
+        __bujur (float | None): Bujur dalam derajat (opsional).
     """
 
-    def __init__(self, id: str, nama: str, jenis_bencana: str):
+    __slots__ = ("__id", "__nama", "__jenis_bencana", "__lintang", "__bujur")
+
+    def __init__(
+        self, id: str, nama: str, jenis_bencana: str,
+        lintang: Optional[float] = None, bujur: Optional[float] = None,
+    ):
         """
         Inisialisasi lokasi bencana.
 
@@ -18,9 +28,11 @@ class Lokasi:
             id (str): ID lokasi.
             nama (str): Nama lokasi.
             jenis_bencana (str): Jenis bencana.
+            lintang (Optional[float]): Lintang dalam derajat (-90 s.d. 90).
+            bujur (Optional[float]): Bujur dalam derajat (-180 s.d. 180).
 
         Raises:
-            ValueError: Jika id, nama, atau jenis_bencana kosong.
+            ValueError: Jika id, nama, atau jenis_bencana kosong, atau koordinat tidak valid.
         """
         if not id or not id.strip():
             raise ValueError("ID lokasi tidak boleh kosong")
@@ -32,6 +44,10 @@ class Lokasi:
         self.__id = id.strip()
         self.__nama = nama.strip()
         self.__jenis_bencana = jenis_bencana.strip()
+        self.__lintang = None
+        self.__bujur = None
+        if lintang is not None or bujur is not None:
+            self.set_koordinat(lintang, bujur)
 
     def get_id(self) -> str:
         """
@@ -88,6 +104,37 @@ class Lokasi:
             raise ValueError("Jenis bencana tidak boleh kosong")
         self.__jenis_bencana = jenis_bencana.strip()
 
+    def get_koordinat(self) -> Optional[tuple[float, float]]:
+        """
+        Mengambil koordinat lokasi.
+
+        Returns:
+            Optional[tuple[float, float]]: (lintang, bujur), atau None jika belum diatur.
+        """
+        if self.__lintang is None:
+            return None
+        return (self.__lintang, self.__bujur)
+
+    def set_koordinat(self, lintang: float, bujur: float) -> None:
+        """
+        Mengatur koordinat lokasi.
+
+        Args:
+            lintang (float): Lintang dalam derajat (-90 s.d. 90).
+            bujur (float): Bujur dalam derajat (-180 s.d. 180).
+
+        Raises:
+            ValueError: Jika salah satu koordinat kosong atau di luar rentang.
+        """
+        if lintang is None or bujur is None:
+            raise ValueError("Lintang dan bujur wajib diisi bersamaan")
+        if not -90.0 <= lintang <= 90.0:
+            raise ValueError("Lintang harus di antara -90 dan 90")
+        if not -180.0 <= bujur <= 180.0:
+            raise ValueError("Bujur harus di antara -180 dan 180")
+        self.__lintang = float(lintang)
+        self.__bujur = float(bujur)
+
     def get_info(self) -> dict:
         """
         Mengambil informasi lokasi.
@@ -98,7 +145,9 @@ class Lokasi:
         return {
             "id": self.__id,
             "nama": self.__nama,
-            "jenis_bencana": self.__jenis_bencana
+            "jenis_bencana": self.__jenis_bencana,
+            "lintang": self.__lintang,
+            "bujur": self.__bujur,
         }
 
     def __str__(self) -> str:
@@ -10,6 +10,8 @@ class Petugas:
         __keahlian (str): Keahlian petugas.
     """
 
+    __slots__ = ("__id", "__nama", "__keahlian")
+
     def __init__(self, id: str, nama: str, keahlian: str):
         """
         Inisialisasi petugas.
@@ -0,0 +1,117 @@
+from enum import IntEnum
+from typing import Union
+
+
+class StatusLimbah(IntEnum):
+    """
+    Status penanganan limbah dengan kode integer ringkas.
+
+    Transisi yang diizinkan:
+    - Terdaftar -> Diangkut
+    - Terdaftar / Diangkut -> Dimusnahkan, Didaur Ulang, Diproses Khusus
+    Ketiga status hasil pengolahan bersifat final.
+
+    Tabel transisi dihitung sekali saat modul dimuat sehingga validasi
+    setiap perubahan status berjalan O(1).
+    """
+
+    TERDAFTAR = 0
+    DIANGKUT = 1
+    DIMUSNAHKAN = 2
+    DIDAUR_ULANG = 3
+    DIPROSES_KHUSUS = 4
+
+    @property
+    def label(self) -> str:
+        """
+        Mengambil label status yang ditampilkan dan disimpan.
+
+        Returns:
+            str: Label status, misal "Terdaftar".
+        """
+        return LABEL_STATUS[self]
+
+    @property
+    def sudah_diproses(self) -> bool:
+        """
+        Menandai status hasil pengolahan (final).
+
+        Returns:
+            bool: True jika limbah sudah diproses.
+        """
+        return self >= StatusLimbah.DIMUSNAHKAN
+
+    @classmethod
+    def dari(cls, status: Union[str, "StatusLimbah"]) -> "StatusLimbah":
+        """
+        Mengubah label status atau anggota enum menjadi StatusLimbah.
+
+        Args:
+            status (str | StatusLimbah): Label status atau anggota enum.
+
+        Returns:
+            StatusLimbah: Status yang sesuai.
+
+        Raises:
+            ValueError: Jika status tidak dikenal.
+        """
+        if isinstance(status, StatusLimbah):
+            return status
+        kode = KODE_STATUS.get(status)
+        if kode is None:
+            raise ValueError(f"Status '{status}' tidak valid.")
+        return kode
+
+    def bisa_menjadi(self, tujuan: "StatusLimbah") -> bool:
+        """
+        Memeriksa apakah transisi ke status tujuan diizinkan.
+
+        Args:
+            tujuan (StatusLimbah): Status tujuan.
+
+        Returns:
+            bool: True jika transisi diizinkan.
+        """
+        return _TRANSISI[self][tujuan]
+
+    def validasi_transisi(self, tujuan: "StatusLimbah") -> None:
+        """
+        Memastikan transisi ke status tujuan diizinkan.
+
+        Args:
+            tujuan (StatusLimbah): Status tujuan.
+
+        Raises:
+            ValueError: Jika transisi tidak diizinkan.
+        """
+        if not _TRANSISI[self][tujuan]:
+            raise ValueError(f"Transisi status '{LABEL_STATUS[self]}' -> '{LABEL_STATUS[tujuan]}' tidak diizinkan")
+
+
+LABEL_STATUS: tuple[str, ...] = (
+    "Terdaftar",
+    "Diangkut",
+    "Dimusnahkan",
+    "Didaur Ulang",
+    "Diproses Khusus",
+)
+KODE_STATUS: dict[str, StatusLimbah] = {label: StatusLimbah(kode) for kode, label in enumerate(LABEL_STATUS)}
+
+_TUJUAN_SAH: dict[StatusLimbah, tuple[StatusLimbah, ...]] = {
+    StatusLimbah.TERDAFTAR: (
+        StatusLimbah.DIANGKUT,
+        StatusLimbah.DIMUSNAHKAN,
+        StatusLimbah.DIDAUR_ULANG,
+        StatusLimbah.DIPROSES_KHUSUS,
+    ),
+    StatusLimbah.DIANGKUT: (
+        StatusLimbah.DIMUSNAHKAN,
+        StatusLimbah.DIDAUR_ULANG,
+        StatusLimbah.DIPROSES_KHUSUS,
+    ),
+}
+# _TRANSISI[asal][tujuan] -> bool
+_TRANSISI: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(tujuan in _TUJUAN_SAH.get(asal, ()) for tujuan in StatusLimbah)
+    for asal in StatusLimbah
+)
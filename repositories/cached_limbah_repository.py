@@ -0,0 +1,321 @@
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, ContextManager, Iterator, Optional
+
+from models.limbah import Limbah
+from repositories.limbah_repository import KonflikVersiError, LimbahRepository
+
+
+class CachedLimbahRepository(LimbahRepository):
+    """
+    Decorator read-through LRU untuk LimbahRepository apa pun.
+
+    get_by_id dilayani dari cache berukuran tetap; jika tidak ada, record
+    dibaca dari repository di bawahnya lalu disimpan ke cache. save dan
+    save_many bersifat write-through: data ditulis ke repository di
+    bawahnya terlebih dahulu, baru dimasukkan ke cache.
+
+    Cache tetap koheren dengan memantau peristiwa repository di bawahnya:
+    jika status/volume suatu ID berubah melalui objek lain (misal
+    compare_and_set_status pada SQLite yang hanya mengubah baris tabel),
+    entri cache untuk ID tersebut dibuang.
+
+    Operasi lain (get_all, iter_all, page, find_by_*, lock, pengamat)
+    diteruskan apa adanya sehingga service tidak melihat perbedaan.
+    """
+
+    def __init__(self, limbah_repository: LimbahRepository, kapasitas: int = 1024):
+        """
+        Inisialisasi cache di atas repository tertentu.
+
+        Args:
+            limbah_repository (LimbahRepository): Repository yang dibungkus.
+            kapasitas (int): Jumlah maksimum record di cache.
+
+        Raises:
+            ValueError: Jika kapasitas < 1.
+        """
+        if kapasitas < 1:
+            raise ValueError("Kapasitas cache minimal 1")
+        super().__init__()
+        self.__repository = limbah_repository
+        self.__kapasitas = kapasitas
+        self.__cache: OrderedDict[str, Limbah] = OrderedDict()
+        self.__kunci = threading.Lock()
+        self.__hit = 0
+        self.__miss = 0
+        self.__eviksi = 0
+        limbah_repository.tambah_pengamat(self.__on_peristiwa)
+
+    def save(self, limbah: Limbah) -> None:
+        """
+        Menyimpan limbah ke repository di bawahnya lalu ke cache.
+
+        Args:
+            limbah (Limbah): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ID limbah sudah tersimpan sebelumnya.
+        """
+        self.__repository.save(limbah)
+        with self.__kunci:
+            self.__masukkan(limbah)
+
+    def save_many(self, daftar_limbah: list[Limbah]) -> None:
+        """
+        Menyimpan banyak limbah ke repository di bawahnya lalu ke cache.
+
+        Args:
+            daftar_limbah (list[Limbah]): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ada ID limbah yang ganda atau sudah tersimpan.
+        """
+        daftar_limbah = list(daftar_limbah)
+        self.__repository.save_many(daftar_limbah)
+        with self.__kunci:
+            for limbah in daftar_limbah:
+                self.__masukkan(limbah)
+
+    def get_all(self) -> list[Limbah]:
+        """
+        Mengambil semua data limbah dari repository di bawahnya.
+
+        Returns:
+            list[Limbah]: Daftar semua limbah yang tersimpan.
+        """
+        return self.__repository.get_all()
+
+    def iter_all(self, ukuran_halaman: int = 1000) -> Iterator[Limbah]:
+        """
+        Mengiterasi semua limbah dari repository di bawahnya.
+
+        Args:
+            ukuran_halaman (int): Jumlah record yang diambil per halaman.
+
+        Returns:
+            Iterator[Limbah]: Iterator limbah.
+        """
+        return self.__repository.iter_all(ukuran_halaman)
+
+    def page(self, after_id: Optional[str] = None, limit: int = 100) -> list[Limbah]:
+        """
+        Mengambil satu halaman limbah dari repository di bawahnya.
+
+        Args:
+            after_id (Optional[str]): ID limbah terakhir dari halaman sebelumnya.
+            limit (int): Jumlah maksimum limbah per halaman.
+
+        Returns:
+            list[Limbah]: Limbah pada halaman tersebut.
+        """
+        return self.__repository.page(after_id, limit)
+
+    def get_by_id(self, id: str) -> Optional[Limbah]:
+        """
+        Mencari limbah berdasarkan ID, dari cache jika tersedia.
+
+        Args:
+            id (str): ID limbah yang dicari.
+
+        Returns:
+            Optional[Limbah]: Objek limbah jika ditemukan, None jika tidak.
+        """
+        with self.__kunci:
+            limbah = self.__cache.get(id)
+            if limbah is not None:
+                self.__cache.move_to_end(id)
+                self.__hit += 1
+                return limbah
+            self.__miss += 1
+        limbah = self.__repository.get_by_id(id)
+        if limbah is not None:
+            with self.__kunci:
+                self.__masukkan(limbah)
+        return limbah
+
+    def find_by_status(self, status: str, jenis: Optional[type] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan status melalui repository di bawahnya.
+
+        Args:
+            status (str): Status limbah yang dicari.
+            jenis (Optional[type]): Kelas limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return self.__repository.find_by_status(status, jenis)
+
+    def find_by_jenis(self, jenis: type, status: Optional[str] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan jenis melalui repository di bawahnya.
+
+        Args:
+            jenis (type): Kelas limbah, misal LimbahMedis.
+            status (Optional[str]): Status limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return self.__repository.find_by_jenis(jenis, status)
+
+    def partisi_kolom(self, ukuran_partisi: int = 100_000) -> Iterator[tuple[array, array, array]]:
+        """
+        Mengambil partisi kolom dari repository di bawahnya tanpa melewati cache.
+
+        Args:
+            ukuran_partisi (int): Jumlah baris maksimum per partisi.
+
+        Returns:
+            Iterator[tuple[array, array, array]]: (jenis, volume, bobot) per partisi.
+        """
+        return self.__repository.partisi_kolom(ukuran_partisi)
+
+    def partisi_kolom_langsung(self) -> bool:
+        """
+        Mengikuti repository di bawahnya.
+
+        Returns:
+            bool: Nilai partisi_kolom_langsung() repository di bawahnya.
+        """
+        return self.__repository.partisi_kolom_langsung()
+
+    def lock(self, id: str) -> ContextManager:
+        """
+        Mengambil kunci per record dari repository di bawahnya.
+
+        Args:
+            id (str): ID limbah.
+
+        Returns:
+            ContextManager: Kunci yang dapat dipakai dengan pernyataan with.
+        """
+        return self.__repository.lock(id)
+
+    def compare_and_set_status(self, id: str, status_lama: str, status_baru: str) -> bool:
+        """
+        Mengubah status secara atomik melalui repository di bawahnya.
+
+        Entri cache yang menjadi usang dibuang melalui peristiwa status.
+
+        Args:
+            id (str): ID limbah.
+            status_lama (str): Status yang diharapkan saat ini.
+            status_baru (str): Status tujuan.
+
+        Returns:
+            bool: True jika status berhasil diubah, False jika status saat ini berbeda.
+
+        Raises:
+            ValueError: Jika transisi status tidak diizinkan.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        return self.__repository.compare_and_set_status(id, status_lama, status_baru)
+
+    def compare_and_update(self, id: str, versi_diharapkan: int, status_baru: str) -> int:
+        """
+        Mengubah status bersyarat versi melalui repository di bawahnya.
+
+        Saat konflik, entri cache ID tersebut dibuang karena kemungkinan
+        sudah usang (misal diubah proses lain), sehingga pembacaan ulang
+        oleh pemanggil mengambil versi terbaru.
+
+        Args:
+            id (str): ID limbah.
+            versi_diharapkan (int): Versi record saat dibaca.
+            status_baru (str): Status tujuan.
+
+        Returns:
+            int: Versi record setelah perubahan.
+
+        Raises:
+            KonflikVersiError: Jika versi record sudah berbeda.
+            ValueError: Jika transisi status tidak diizinkan.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        try:
+            return self.__repository.compare_and_update(id, versi_diharapkan, status_baru)
+        except KonflikVersiError:
+            self.invalidasi(id)
+            raise
+
+    def tambah_pengamat(self, callback: Callable[[Limbah, str, Any, Any], None]) -> None:
+        """
+        Mendaftarkan pengamat peristiwa pada repository di bawahnya.
+
+        Args:
+            callback (Callable): Fungsi (limbah, peristiwa, lama, baru).
+        """
+        self.__repository.tambah_pengamat(callback)
+
+    def hapus_pengamat(self, callback: Callable[[Limbah, str, Any, Any], None]) -> None:
+        """
+        Menghapus pengamat peristiwa dari repository di bawahnya.
+
+        Args:
+            callback (Callable): Fungsi pengamat yang sebelumnya didaftarkan.
+        """
+        self.__repository.hapus_pengamat(callback)
+
+    def statistik(self) -> dict:
+        """
+        Mengambil penghitung cache.
+
+        Returns:
+            dict: {"hit", "miss", "eviksi", "ukuran", "kapasitas"}.
+        """
+        with self.__kunci:
+            return {
+                "hit": self.__hit,
+                "miss": self.__miss,
+                "eviksi": self.__eviksi,
+                "ukuran": len(self.__cache),
+                "kapasitas": self.__kapasitas,
+            }
+
+    def invalidasi(self, id: Optional[str] = None) -> None:
+        """
+        Membuang satu entri cache, atau seluruh cache jika id None.
+
+        Args:
+            id (Optional[str]): ID limbah, atau None untuk mengosongkan cache.
+        """
+        with self.__kunci:
+            if id is None:
+                self.__cache.clear()
+            else:
+                self.__cache.pop(id, None)
+
+    def __masukkan(self, limbah: Limbah) -> None:
+        """
+        Memasukkan limbah ke cache dan membuang entri terlama jika penuh.
+
+        Pemanggil wajib memegang kunci cache.
+
+        Args:
+            limbah (Limbah): Objek limbah.
+        """
+        self.__cache[limbah.get_id()] = limbah
+        self.__cache.move_to_end(limbah.get_id())
+        if len(self.__cache) > self.__kapasitas:
+            self.__cache.popitem(last=False)
+            self.__eviksi += 1
+
+    def __on_peristiwa(self, limbah: Limbah, peristiwa: str, lama: Any, baru: Any) -> None:
+        """
+        Membuang entri cache yang usang karena perubahan melalui objek lain.
+
+        Args:
+            limbah (Limbah): Limbah yang terkait peristiwa.
+            peristiwa (str): "simpan", "status", atau "volume".
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+        """
+        if peristiwa == self.PERISTIWA_SIMPAN:
+            return
+        with self.__kunci:
+            tersimpan = self.__cache.get(limbah.get_id())
+            if tersimpan is not None and tersimpan is not limbah:
+                del self.__cache[limbah.get_id()]
@@ -0,0 +1,471 @@
+import operator
+import threading
+from array import array
+from typing import Any, Iterator, Optional
+
+from models.limbah import Limbah
+from models.status_limbah import KODE_STATUS, LABEL_STATUS, StatusLimbah
+from repositories.limbah_mapper import JENIS_PER_KODE, KODE_JENIS, dari_baris, kode_jenis, kode_jenis_untuk
+from repositories.limbah_repository import VERSI_USANG, KonflikVersiError, LimbahRepository
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - bergantung lingkungan
+    np = None
+
+# Koefisien risiko per kode jenis, sama dengan rumus hitung_risiko():
+# organik = volume * tingkat_pembusukan * 0.8
+# medis   = volume * tingkat_infeksi * 1.5
+# b3      = volume * 2.0 (faktor B3 selalu 1.0)
+KOEFISIEN_RISIKO: tuple[float, ...] = (0.8, 1.5, 2.0)
+
+
+class ColumnarLimbahRepository(LimbahRepository):
+    """
+    Repository limbah berbasis kolom (LimbahTable) untuk kebutuhan analitik.
+
+    Data tidak disimpan sebagai objek Limbah, melainkan sebagai kolom
+    bertipe (array):
+    - volume (float64)
+    - jenis (int8, lihat KODE_JENIS)
+    - status (int8, kode StatusLimbah)
+    - faktor (float64): tingkat_pembusukan, tingkat_infeksi, atau 1.0 untuk B3
+    - bobot (float64): faktor * koefisien jenis, sehingga risiko = volume * bobot
+    - dibuat_pada (float64): waktu registrasi dalam detik epoch
+    - versi (int64): nomor versi record untuk compare_and_update()
+
+    ID disimpan dalam list beserta index ID -> posisi, dan kandungan kimia
+    hanya disimpan untuk baris B3.
+
+    risk_array() dan total_risiko() menghitung risiko seluruh tabel dalam
+    satu ekspresi vektor jika NumPy tersedia. Tanpa NumPy perhitungan tidak
+    tervektorisasi: map() di atas array bawaan tetap memproses satu elemen
+    per langkah (membuat objek float sementara per baris), hanya tanpa
+    membangun objek Limbah maupun list perantara.
+
+    Objek Limbah yang dikembalikan repository dibangun dari kolom dan
+    diamati; perubahan status/volume ditulis kembali ke kolom dengan syarat
+    kolom versi masih sama dengan versi objek sebelum perubahan. Setter pada
+    objek usang ditolak dengan KonflikVersiError.
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi repository dengan kolom kosong.
+        """
+        super().__init__()
+        self.__kunci = threading.RLock()
+        self.__ids: list[str] = []
+        self.__index: dict[str, int] = {}
+        self.__volume = array("d")
+        self.__jenis = array("b")
+        self.__status = array("b")
+        self.__faktor = array("d")
+        self.__bobot = array("d")
+        self.__dibuat_pada = array("d")
+        self.__versi = array("q")
+        self.__kandungan_kimia: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        """
+        Mengambil jumlah baris tabel.
+
+        Returns:
+            int: Jumlah limbah yang tersimpan.
+        """
+        return len(self.__ids)
+
+    def save(self, limbah: Limbah) -> None:
+        """
+        Menyimpan objek limbah sebagai satu baris kolom.
+
+        Args:
+            limbah (Limbah): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ID limbah sudah tersimpan sebelumnya.
+        """
+        self.save_many([limbah])
+
+    def save_many(self, daftar_limbah: list[Limbah]) -> None:
+        """
+        Menyimpan banyak objek limbah sekaligus.
+
+        Seluruh ID diperiksa terlebih dahulu; jika ada yang ganda (di dalam
+        daftar maupun terhadap data tersimpan) tidak ada yang disimpan.
+
+        Args:
+            daftar_limbah (list[Limbah]): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ada ID limbah yang ganda atau sudah tersimpan.
+        """
+        daftar_limbah = list(daftar_limbah)
+        with self.__kunci:
+            terlihat = set()
+            for limbah in daftar_limbah:
+                id = limbah.get_id()
+                if id in self.__index or id in terlihat:
+                    raise ValueError(f"Limbah dengan id '{id}' sudah terdaftar")
+                terlihat.add(id)
+            for limbah in daftar_limbah:
+                self.__tambah_baris(limbah)
+        for limbah in daftar_limbah:
+            limbah.tambah_pengamat(self.__on_perubahan)
+            if self._pengamat:
+                self._beritahu(limbah, self.PERISTIWA_SIMPAN, None, limbah)
+
+    def get_all(self) -> list[Limbah]:
+        """
+        Mengambil semua data limbah sesuai urutan penyimpanan.
+
+        Returns:
+            list[Limbah]: Daftar semua limbah yang tersimpan.
+        """
+        with self.__kunci:
+            return [self.__ke_objek(posisi) for posisi in range(len(self.__ids))]
+
+    def iter_all(self, ukuran_halaman: int = 1000) -> Iterator[Limbah]:
+        """
+        Mengiterasi semua limbah per halaman sesuai urutan penyimpanan.
+
+        Args:
+            ukuran_halaman (int): Jumlah baris yang dibangun menjadi objek per halaman.
+
+        Returns:
+            Iterator[Limbah]: Iterator limbah.
+        """
+        posisi = 0
+        while True:
+            with self.__kunci:
+                akhir = min(posisi + ukuran_halaman, len(self.__ids))
+                halaman = [self.__ke_objek(i) for i in range(posisi, akhir)]
+            yield from halaman
+            if len(halaman) < ukuran_halaman:
+                return
+            posisi = akhir
+
+    def page(self, after_id: Optional[str] = None, limit: int = 100) -> list[Limbah]:
+        """
+        Mengambil satu halaman limbah setelah cursor tertentu.
+
+        Args:
+            after_id (Optional[str]): ID limbah terakhir dari halaman sebelumnya,
+                atau None untuk halaman pertama.
+            limit (int): Jumlah maksimum limbah per halaman.
+
+        Returns:
+            list[Limbah]: Limbah pada halaman tersebut.
+
+        Raises:
+            ValueError: Jika limit < 1.
+            LookupError: Jika after_id tidak ditemukan.
+        """
+        if limit < 1:
+            raise ValueError("Limit halaman minimal 1")
+        with self.__kunci:
+            mulai = 0
+            if after_id is not None:
+                if after_id not in self.__index:
+                    raise LookupError(f"Cursor limbah '{after_id}' tidak ditemukan")
+                mulai = self.__index[after_id] + 1
+            akhir = min(mulai + limit, len(self.__ids))
+            return [self.__ke_objek(posisi) for posisi in range(mulai, akhir)]
+
+    def get_by_id(self, id: str) -> Optional[Limbah]:
+        """
+        Mencari limbah berdasarkan ID melalui index posisi.
+
+        Args:
+            id (str): ID limbah yang dicari.
+
+        Returns:
+            Optional[Limbah]: Objek limbah jika ditemukan, None jika tidak.
+        """
+        with self.__kunci:
+            posisi = self.__index.get(id)
+            return None if posisi is None else self.__ke_objek(posisi)
+
+    def find_by_status(self, status: str, jenis: Optional[type] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan status dengan memindai kolom status.
+
+        Args:
+            status (str): Status limbah yang dicari.
+            jenis (Optional[type]): Kelas limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return self.__cari(status, jenis)
+
+    def find_by_jenis(self, jenis: type, status: Optional[str] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan jenis dengan memindai kolom jenis.
+
+        Args:
+            jenis (type): Kelas limbah, misal LimbahMedis.
+            status (Optional[str]): Status limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return self.__cari(status, jenis)
+
+    def compare_and_set_status(self, id: str, status_lama: str, status_baru: str) -> bool:
+        """
+        Mengubah status secara atomik pada kolom status.
+
+        Args:
+            id (str): ID limbah.
+            status_lama (str): Status yang diharapkan saat ini.
+            status_baru (str): Status tujuan.
+
+        Returns:
+            bool: True jika status berhasil diubah, False jika status saat ini berbeda.
+
+        Raises:
+            ValueError: Jika status tidak dikenal atau transisi tidak diizinkan.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        kode_lama = StatusLimbah.dari(status_lama)
+        kode_baru = StatusLimbah.dari(status_baru)
+        kode_lama.validasi_transisi(kode_baru)
+        with self.__kunci:
+            posisi = self.__index.get(id)
+            if posisi is None:
+                raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
+            if self.__status[posisi] != kode_lama:
+                return False
+            self.__status[posisi] = kode_baru
+            self.__versi[posisi] += 1
+        if self._pengamat:
+            self._beritahu(self.get_by_id(id), "status", status_lama, status_baru)
+        return True
+
+    def compare_and_update(self, id: str, versi_diharapkan: int, status_baru: str) -> int:
+        """
+        Mengubah kolom status hanya jika kolom versi masih versi_diharapkan.
+
+        Args:
+            id (str): ID limbah.
+            versi_diharapkan (int): Versi record saat dibaca.
+            status_baru (str): Status tujuan.
+
+        Returns:
+            int: Versi record setelah perubahan.
+
+        Raises:
+            KonflikVersiError: Jika versi record sudah berbeda.
+            ValueError: Jika status tidak dikenal atau transisi tidak diizinkan.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        kode_baru = StatusLimbah.dari(status_baru)
+        with self.__kunci:
+            posisi = self.__index.get(id)
+            if posisi is None:
+                raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
+            if self.__versi[posisi] != versi_diharapkan:
+                raise KonflikVersiError(id, versi_diharapkan, self.__versi[posisi])
+            kode_lama = StatusLimbah(self.__status[posisi])
+            kode_lama.validasi_transisi(kode_baru)
+            self.__status[posisi] = kode_baru
+            self.__versi[posisi] += 1
+            versi = self.__versi[posisi]
+        if self._pengamat:
+            self._beritahu(self.get_by_id(id), "status", kode_lama.label, kode_baru.label)
+        return versi
+
+    def partisi_kolom(self, ukuran_partisi: int = 100_000) -> Iterator[tuple[array, array, array]]:
+        """
+        Mengiterasi potongan kolom jenis, volume, dan bobot secara langsung.
+
+        Setiap partisi adalah salinan potongan array (memcpy) yang diambil di
+        bawah kunci, tanpa membangun objek Limbah.
+
+        Args:
+            ukuran_partisi (int): Jumlah baris maksimum per partisi.
+
+        Returns:
+            Iterator[tuple[array, array, array]]: (jenis, volume, bobot) per partisi.
+
+        Raises:
+            ValueError: Jika ukuran_partisi < 1.
+        """
+        if ukuran_partisi < 1:
+            raise ValueError("Ukuran partisi minimal 1")
+        return self.__potong_kolom(ukuran_partisi)
+
+    def partisi_kolom_langsung(self) -> bool:
+        """
+        Partisi kolom disalin langsung dari array penyimpanan.
+
+        Returns:
+            bool: Selalu True.
+        """
+        return True
+
+    def __potong_kolom(self, ukuran_partisi: int) -> Iterator[tuple[array, array, array]]:
+        """
+        Menyalin kolom per potongan; kunci dilepas di antara partisi.
+
+        Args:
+            ukuran_partisi (int): Jumlah baris maksimum per partisi.
+
+        Returns:
+            Iterator[tuple[array, array, array]]: (jenis, volume, bobot) per partisi.
+        """
+        mulai = 0
+        while True:
+            with self.__kunci:
+                akhir = min(mulai + ukuran_partisi, len(self.__ids))
+                if mulai >= akhir:
+                    return
+                partisi = (self.__jenis[mulai:akhir], self.__volume[mulai:akhir], self.__bobot[mulai:akhir])
+            yield partisi
+            mulai = akhir
+
+    def risk_array(self):
+        """
+        Menghitung risiko setiap baris dalam satu ekspresi vektor.
+
+        Tanpa NumPy, array hasil diisi langsung dari map() per elemen (tidak
+        tervektorisasi, tetapi tanpa list perantara).
+
+        Returns:
+            numpy.ndarray | array: Risiko per baris sesuai urutan penyimpanan;
+            ndarray float64 jika NumPy tersedia, array("d") jika tidak.
+        """
+        with self.__kunci:
+            if np is not None:
+                koefisien = np.array(KOEFISIEN_RISIKO)
+                return (np.frombuffer(self.__volume, dtype=np.float64)
+                        * np.frombuffer(self.__faktor, dtype=np.float64)
+                        * koefisien[np.frombuffer(self.__jenis, dtype=np.int8)])
+            return array("d", map(operator.mul, self.__volume, self.__bobot))
+
+    def total_risiko(self) -> float:
+        """
+        Menghitung total risiko seluruh tabel tanpa membangun objek Limbah.
+
+        Returns:
+            float: Total risiko.
+        """
+        with self.__kunci:
+            if np is not None:
+                return float(np.dot(np.frombuffer(self.__volume, dtype=np.float64),
+                                    np.frombuffer(self.__bobot, dtype=np.float64)))
+            return sum(map(operator.mul, self.__volume, self.__bobot))
+
+    def __tambah_baris(self, limbah: Limbah) -> None:
+        """
+        Menambahkan satu baris ke seluruh kolom. Pemanggil memegang kunci.
+
+        Args:
+            limbah (Limbah): Objek limbah.
+        """
+        jenis = kode_jenis(limbah)
+        if jenis == "organik":
+            faktor = limbah.get_tingkat_pembusukan()
+        elif jenis == "medis":
+            faktor = limbah.get_tingkat_infeksi()
+        else:
+            faktor = 1.0
+            self.__kandungan_kimia[len(self.__ids)] = limbah.get_kandungan_kimia()
+        kode = KODE_JENIS[jenis]
+        self.__index[limbah.get_id()] = len(self.__ids)
+        self.__ids.append(limbah.get_id())
+        self.__volume.append(limbah.get_volume())
+        self.__jenis.append(kode)
+        self.__status.append(limbah.get_kode_status())
+        self.__faktor.append(faktor)
+        self.__bobot.append(faktor * KOEFISIEN_RISIKO[kode])
+        self.__dibuat_pada.append(limbah.get_detik_dibuat())
+        self.__versi.append(limbah.get_versi())
+
+    def __ke_objek(self, posisi: int) -> Limbah:
+        """
+        Membangun objek limbah dari satu baris kolom. Pemanggil memegang kunci.
+
+        Args:
+            posisi (int): Posisi baris.
+
+        Returns:
+            Limbah: Objek limbah yang diamati repository.
+        """
+        jenis = JENIS_PER_KODE[self.__jenis[posisi]]
+        faktor = self.__faktor[posisi]
+        if faktor.is_integer():
+            faktor = int(faktor)
+        limbah = dari_baris((
+            self.__ids[posisi], jenis, self.__volume[posisi],
+            LABEL_STATUS[self.__status[posisi]],
+            faktor if jenis == "organik" else None,
+            faktor if jenis == "medis" else None,
+            self.__kandungan_kimia.get(posisi),
+            self.__dibuat_pada[posisi],
+            self.__versi[posisi],
+        ))
+        limbah.tambah_pengamat(self.__on_perubahan)
+        return limbah
+
+    def __cari(self, status: Optional[str], jenis: Optional[type]) -> list[Limbah]:
+        """
+        Memindai kolom status dan jenis lalu membangun objek untuk baris yang cocok.
+
+        Args:
+            status (Optional[str]): Status limbah, atau None untuk semua status.
+            jenis (Optional[type]): Kelas limbah, atau None untuk semua jenis.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        with self.__kunci:
+            kode_status = None
+            if status is not None:
+                kode_status = KODE_STATUS.get(status)
+                if kode_status is None:
+                    return []
+            kode_jenis = None
+            if jenis is not None:
+                kode_jenis = {KODE_JENIS[kode] for kode in kode_jenis_untuk(jenis)}
+                if not kode_jenis:
+                    return []
+            return [
+                self.__ke_objek(posisi) for posisi in range(len(self.__ids))
+                if (kode_status is None or self.__status[posisi] == kode_status)
+                and (kode_jenis is None or self.__jenis[posisi] in kode_jenis)
+            ]
+
+    def __on_perubahan(self, limbah: Limbah, atribut: str, lama: Any, baru: Any) -> None:
+        """
+        Menulis perubahan status/volume objek limbah ke kolom lalu
+        meneruskannya ke pengamat repository.
+
+        Args:
+            limbah (Limbah): Objek limbah yang berubah.
+            atribut (str): Nama atribut yang berubah.
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+
+        Raises:
+            KonflikVersiError: Jika baris sudah diubah lewat objek lain;
+                kolom tidak diubah dan objek harus dibaca ulang.
+        """
+        with self.__kunci:
+            posisi = self.__index.get(limbah.get_id())
+            if posisi is None:
+                return
+            versi_dibaca = limbah.get_versi() - 1
+            if self.__versi[posisi] != versi_dibaca:
+                limbah._pulihkan_versi(VERSI_USANG)
+                raise KonflikVersiError(limbah.get_id(), versi_dibaca, self.__versi[posisi])
+            if atribut == "status":
+                self.__status[posisi] = KODE_STATUS[baru]
+            elif atribut == "volume":
+                self.__volume[posisi] = baru
+            else:
+                return
+            self.__versi[posisi] += 1
+        if self._pengamat:
+            self._beritahu(limbah, atribut, lama, baru)
@@ -1,42 +1,137 @@
-from typing import Optional
+import threading
+from typing import Any, Iterator, Optional
 from repositories.limbah_repository import LimbahRepository
 from models.limbah import Limbah
+from models.status_limbah import KODE_STATUS, StatusLimbah
 
 class InMemoryLimbahRepository(LimbahRepository):
     """
     Repository penyimpanan limbah berbasis list in-memory.
 
     Implementasi konkret dari LimbahRepository untuk penyimpanan
-    sementara di memori (runtime).
+    sementara di memori (runtime). Selain list yang menjaga urutan
+    penyimpanan, repository memelihara index primary key (dict ID -> posisi
+    di list) sehingga pencarian berdasarkan ID dan cursor page() berjalan
+    O(1), serta index sekunder berdasarkan kode status (StatusLimbah) dan
+    jenis limbah.
+
+    Index status diperbarui otomatis melalui pengamat pada objek Limbah,
+    sehingga tetap konsisten ketika set_status dipanggil dari luar
+    repository (misal proses_pengolahan atau PengangkutanService).
+
+    Aman dipakai dari banyak thread: penyimpanan dan perubahan index
+    dilindungi kunci index yang hanya dipegang selama operasi dict,
+    pembacaan berdasarkan ID tidak memakai kunci, dan transisi status
+    memakai kunci bergaris per record dari LimbahRepository.lock().
     """
 
     def __init__(self):
         """
-        Inisialisasi repository dengan list kosong.
+        Inisialisasi repository dengan list dan index kosong.
         """
+        super().__init__()
         self.__data: list[Limbah] = []
+        self.__index: dict[str, int] = {}
+        self.__index_status: dict[StatusLimbah, dict[str, Limbah]] = {}
+        self.__index_jenis: dict[type, dict[str, Limbah]] = {}
+        self.__kunci_index = threading.Lock()
 
     def save(self, limbah: Limbah) -> None:
         """
-        Menyimpan objek limbah ke list.
+        Menyimpan objek limbah ke list dan seluruh index.
 
         Args:
             limbah (Limbah): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ID limbah sudah tersimpan sebelumnya.
         """
-        self.__data.append(limbah)
+        id = limbah.get_id()
+        with self.__kunci_index:
+            if id in self.__index:
+                raise ValueError(f"Limbah dengan id '{id}' sudah terdaftar")
+            self.__simpan(id, limbah)
+        if self._pengamat:
+            self._beritahu(limbah, self.PERISTIWA_SIMPAN, None, limbah)
+
+    def save_many(self, daftar_limbah: list[Limbah]) -> None:
+        """
+        Menyimpan banyak objek limbah sekaligus.
+
+        Seluruh ID diperiksa terlebih dahulu; jika ada yang ganda (di dalam
+        daftar maupun terhadap data tersimpan) tidak ada yang disimpan.
+
+        Args:
+            daftar_limbah (list[Limbah]): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ada ID limbah yang ganda atau sudah tersimpan.
+        """
+        daftar_limbah = list(daftar_limbah)
+        ids = [limbah.get_id() for limbah in daftar_limbah]
+        with self.__kunci_index:
+            if len(set(ids)) != len(ids) or not self.__index.keys().isdisjoint(ids):
+                terlihat = set()
+                for id in ids:
+                    if id in self.__index or id in terlihat:
+                        raise ValueError(f"Limbah dengan id '{id}' sudah terdaftar")
+                    terlihat.add(id)
+            simpan = self.__simpan
+            for id, limbah in zip(ids, daftar_limbah):
+                simpan(id, limbah)
+        if self._pengamat:
+            for limbah in daftar_limbah:
+                self._beritahu(limbah, self.PERISTIWA_SIMPAN, None, limbah)
 
     def get_all(self) -> list[Limbah]:
         """
-        Mengambil semua data limbah.
+        Mengambil salinan daftar semua data limbah.
 
         Returns:
             list[Limbah]: Daftar semua limbah yang tersimpan.
         """
-        return self.__data
+        return list(self.__data)
+
+    def iter_all(self, ukuran_halaman: int = 1000) -> Iterator[Limbah]:
+        """
+        Mengiterasi semua limbah sesuai urutan penyimpanan tanpa menyalin list.
+
+        Args:
+            ukuran_halaman (int): Tidak digunakan; data sudah berada di memori.
+
+        Returns:
+            Iterator[Limbah]: Iterator limbah.
+        """
+        return iter(self.__data)
+
+    def page(self, after_id: Optional[str] = None, limit: int = 100) -> list[Limbah]:
+        """
+        Mengambil satu halaman limbah setelah cursor tertentu.
+
+        Args:
+            after_id (Optional[str]): ID limbah terakhir dari halaman sebelumnya,
+                atau None untuk halaman pertama.
+            limit (int): Jumlah maksimum limbah per halaman.
+
+        Returns:
+            list[Limbah]: Limbah pada halaman tersebut.
+
+        Raises:
+            ValueError: Jika limit < 1.
+            LookupError: Jika after_id tidak ditemukan.
+        """
+        if limit < 1:
+            raise ValueError("Limit halaman minimal 1")
+        mulai = 0
+        if after_id is not None:
+            if after_id not in self.__index:
+                raise LookupError(f"Cursor limbah '{after_id}' tidak ditemukan")
+            mulai = self.__index[after_id] + 1
+        return self.__data[mulai:mulai + limit]
 
     def get_by_id(self, id: str) -> Optional[Limbah]:
         """
-        Mencari limbah berdasarkan ID.
+        Mencari limbah berdasarkan ID melalui index primary key.
 
         Args:
             id (str): ID limbah yang dicari.
@@ -44,7 +139,147 @@ class InMemoryLimbahRepository(LimbahRepository):
         Returns:
             Optional[Limbah]: Objek limbah jika ditemukan, None jika tidak.
         """
-        for limbah in self.__data:
-            if limbah.get_id() == id:
-                return limbah
-        return None
+        posisi = self.__index.get(id)
+        return None if posisi is None else self.__data[posisi]
+
+    def find_by_status(self, status: str, jenis: Optional[type] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan status melalui index status.
+
+        Biaya sebanding dengan ukuran hasil, bukan jumlah seluruh data.
+
+        Args:
+            status (str): Status limbah yang dicari.
+            jenis (Optional[type]): Kelas limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        kode = KODE_STATUS.get(status)
+        if kode is None:
+            return []
+        with self.__kunci_index:
+            if jenis is None:
+                return list(self.__index_status.get(kode, {}).values())
+            return self.__irisan(kode, jenis)
+
+    def find_by_jenis(self, jenis: type, status: Optional[str] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan jenis melalui index jenis.
+
+        Jenis yang diminta juga mencakup subclass-nya, sehingga
+        find_by_jenis(Limbah) mengembalikan semua limbah.
+
+        Args:
+            jenis (type): Kelas limbah, misal LimbahMedis.
+            status (Optional[str]): Status limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        if status is not None:
+            return self.find_by_status(status, jenis)
+        with self.__kunci_index:
+            hasil = []
+            for bucket in self.__bucket_jenis(jenis):
+                hasil.extend(bucket.values())
+            return hasil
+
+    def __simpan(self, id: str, limbah: Limbah) -> None:
+        """
+        Memasukkan limbah ke list dan seluruh index tanpa pemeriksaan ID.
+
+        Pemanggil wajib memegang kunci index.
+
+        Args:
+            id (str): ID limbah.
+            limbah (Limbah): Objek limbah.
+        """
+        self.__data.append(limbah)
+        self.__index[id] = len(self.__data) - 1
+        self.__bucket(self.__index_status, limbah.get_kode_status())[id] = limbah
+        self.__bucket(self.__index_jenis, type(limbah))[id] = limbah
+        limbah.tambah_pengamat(self.__on_perubahan)
+
+    @staticmethod
+    def __bucket(index: dict, kunci: Any) -> dict[str, Limbah]:
+        """
+        Mengambil bucket index untuk kunci tertentu, membuatnya jika belum ada.
+
+        Args:
+            index (dict): Index status atau jenis.
+            kunci (Any): Kunci bucket.
+
+        Returns:
+            dict[str, Limbah]: Bucket index.
+        """
+        bucket = index.get(kunci)
+        if bucket is None:
+            bucket = index[kunci] = {}
+        return bucket
+
+    def __bucket_jenis(self, jenis: type) -> list[dict[str, Limbah]]:
+        """
+        Mengambil bucket index jenis untuk kelas dan seluruh subclass-nya.
+
+        Args:
+            jenis (type): Kelas limbah.
+
+        Returns:
+            list[dict[str, Limbah]]: Bucket index yang relevan.
+        """
+        return [
+            bucket for kelas, bucket in self.__index_jenis.items()
+            if issubclass(kelas, jenis)
+        ]
+
+    def __irisan(self, kode: StatusLimbah, jenis: type) -> list[Limbah]:
+        """
+        Menghitung irisan index status dan index jenis.
+
+        Iterasi dilakukan pada bucket yang lebih kecil lalu dicocokkan
+        ke bucket lainnya.
+
+        Args:
+            kode (StatusLimbah): Kode status limbah.
+            jenis (type): Kelas limbah.
+
+        Returns:
+            list[Limbah]: Limbah dengan status dan jenis yang sesuai.
+        """
+        bucket_status = self.__index_status.get(kode, {})
+        bucket_jenis = self.__bucket_jenis(jenis)
+        if sum(len(bucket) for bucket in bucket_jenis) < len(bucket_status):
+            return [
+                limbah for bucket in bucket_jenis
+                for id, limbah in bucket.items() if id in bucket_status
+            ]
+        return [limbah for limbah in bucket_status.values() if isinstance(limbah, jenis)]
+
+    def __on_perubahan(self, limbah: Limbah, atribut: str, lama: Any, baru: Any) -> None:
+        """
+        Memperbarui index status ketika status limbah berubah, lalu
+        meneruskan perubahan ke pengamat repository.
+
+        Args:
+            limbah (Limbah): Objek limbah yang berubah.
+            atribut (str): Nama atribut yang berubah.
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+        """
+        if lama == baru:
+            return
+        id = limbah.get_id()
+        if self.get_by_id(id) is not limbah:
+            return
+        if atribut == "status":
+            kode_lama = KODE_STATUS[lama]
+            with self.__kunci_index:
+                bucket_lama = self.__index_status.get(kode_lama)
+                if bucket_lama is not None:
+                    bucket_lama.pop(id, None)
+                    if not bucket_lama:
+                        del self.__index_status[kode_lama]
+                self.__bucket(self.__index_status, KODE_STATUS[baru])[id] = limbah
+        if self._pengamat:
+            self._beritahu(limbah, atribut, lama, baru)
@@ -0,0 +1,191 @@
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+from repositories.manifest_repository import ManifestRepository, Waktu
+from utils.date_helper import ke_iso
+
+
+class _IndeksWaktu:
+    """
+    Daftar posisi catatan yang terurut berdasarkan timestamp.
+
+    Catatan umumnya datang berurutan waktu sehingga penambahan cukup
+    append; catatan yang datang terlambat disisipkan dengan bisect.
+    """
+
+    __slots__ = ("kunci", "posisi")
+
+    def __init__(self):
+        """
+        Membuat index kosong.
+        """
+        self.kunci: list[tuple[str, int]] = []
+        self.posisi: list[int] = []
+
+    def __len__(self) -> int:
+        """
+        Mengambil jumlah posisi di index.
+        """
+        return len(self.posisi)
+
+    def tambah(self, timestamp: str, posisi: int) -> None:
+        """
+        Menambahkan posisi catatan dengan timestamp tertentu.
+        """
+        kunci = (timestamp, posisi)
+        if not self.kunci or kunci >= self.kunci[-1]:
+            self.kunci.append(kunci)
+            self.posisi.append(posisi)
+            return
+        i = bisect_right(self.kunci, kunci)
+        self.kunci.insert(i, kunci)
+        self.posisi.insert(i, posisi)
+
+    def rentang(self, mulai: Optional[str], sampai: Optional[str]) -> list[int]:
+        """
+        Mengambil posisi catatan dengan mulai <= timestamp <= sampai.
+        """
+        awal = 0 if mulai is None else bisect_left(self.kunci, (mulai,))
+        akhir = len(self.kunci) if sampai is None else bisect_right(self.kunci, (sampai, float("inf")))
+        return self.posisi[awal:akhir]
+
+
+class InMemoryManifestRepository(ManifestRepository):
+    """
+    Implementasi ManifestRepository berbasis list (in-memory).
+
+    Catatan disimpan sebagai tuple dalam list append-only. Index:
+    - id_limbah -> daftar posisi catatan
+    - kendaraan, tujuan, dan keseluruhan -> posisi terurut timestamp,
+      sehingga rentang waktu dicari dengan bisect O(log n + hasil)
+
+    Data hilang saat program berhenti; gunakan SqliteManifestRepository
+    untuk penyimpanan persisten.
+    """
+
+    def __init__(self):
+        """
+        Inisialisasi penyimpanan dan index kosong.
+        """
+        self.__kunci = threading.Lock()
+        self.__catatan: list[tuple] = []
+        self.__per_limbah: dict[str, list[int]] = {}
+        self.__per_kendaraan: dict[str, _IndeksWaktu] = {}
+        self.__per_tujuan: dict[str, _IndeksWaktu] = {}
+        self.__semua = _IndeksWaktu()
+
+    def __len__(self) -> int:
+        """
+        Mengambil jumlah catatan tersimpan.
+
+        Returns:
+            int: Jumlah catatan.
+        """
+        return len(self.__catatan)
+
+    def save(self, catatan: dict) -> None:
+        """
+        Menambahkan satu catatan pengangkutan dan memperbarui index.
+
+        Args:
+            catatan (dict): Catatan dengan kunci sesuai KOLOM.
+
+        Raises:
+            ValueError: Jika ada kunci yang hilang atau timestamp tidak valid.
+        """
+        baris = self._validasi(catatan)
+        with self.__kunci:
+            self.__tambah(baris)
+
+    def save_many(self, daftar_catatan: list[dict]) -> None:
+        """
+        Menambahkan banyak catatan; tidak ada yang tersimpan jika salah satunya tidak valid.
+
+        Args:
+            daftar_catatan (list[dict]): Catatan yang akan ditambahkan.
+
+        Raises:
+            ValueError: Jika ada catatan yang tidak valid.
+        """
+        daftar_baris = [self._validasi(catatan) for catatan in daftar_catatan]
+        with self.__kunci:
+            for baris in daftar_baris:
+                self.__tambah(baris)
+
+    def find_by_limbah(self, id_limbah: str) -> list[dict]:
+        """
+        Mengambil riwayat pengangkutan satu limbah melalui index id_limbah.
+
+        Args:
+            id_limbah (str): ID limbah.
+
+        Returns:
+            list[dict]: Catatan terurut berdasarkan timestamp.
+        """
+        with self.__kunci:
+            daftar_baris = [self.__catatan[i] for i in self.__per_limbah.get(id_limbah, ())]
+        return [self.__ke_dict(baris) for baris in sorted(daftar_baris, key=lambda baris: baris[0])]
+
+    def find(
+        self,
+        kendaraan: Optional[str] = None,
+        tujuan: Optional[str] = None,
+        mulai: Waktu = None,
+        sampai: Waktu = None,
+    ) -> list[dict]:
+        """
+        Mencari catatan memakai index terkecil yang sesuai filter.
+
+        Args:
+            kendaraan (Optional[str]): Nama kendaraan.
+            tujuan (Optional[str]): Tujuan pengangkutan.
+            mulai (str | datetime | None): Batas awal timestamp.
+            sampai (str | datetime | None): Batas akhir timestamp.
+
+        Returns:
+            list[dict]: Catatan terurut berdasarkan timestamp.
+
+        Raises:
+            ValueError: Jika batas waktu bukan format ISO yang valid.
+        """
+        mulai, sampai = ke_iso(mulai), ke_iso(sampai)
+        with self.__kunci:
+            kandidat = [self.__semua]
+            if kendaraan is not None:
+                kandidat.append(self.__per_kendaraan.get(kendaraan, _IndeksWaktu()))
+            if tujuan is not None:
+                kandidat.append(self.__per_tujuan.get(tujuan, _IndeksWaktu()))
+            indeks = min(kandidat, key=len)
+            daftar_baris = [self.__catatan[i] for i in indeks.rentang(mulai, sampai)]
+        return [
+            self.__ke_dict(baris) for baris in daftar_baris
+            if (kendaraan is None or baris[4] == kendaraan) and (tujuan is None or baris[5] == tujuan)
+        ]
+
+    def __tambah(self, baris: tuple) -> None:
+        """
+        Menambahkan baris tervalidasi ke list dan seluruh index. Pemanggil memegang kunci.
+
+        Args:
+            baris (tuple): Nilai catatan sesuai KOLOM.
+        """
+        posisi = len(self.__catatan)
+        self.__catatan.append(baris)
+        timestamp, id_limbah, _, _, kendaraan, tujuan, _ = baris
+        self.__per_limbah.setdefault(id_limbah, []).append(posisi)
+        self.__per_kendaraan.setdefault(kendaraan, _IndeksWaktu()).tambah(timestamp, posisi)
+        self.__per_tujuan.setdefault(tujuan, _IndeksWaktu()).tambah(timestamp, posisi)
+        self.__semua.tambah(timestamp, posisi)
+
+    def __ke_dict(self, baris: tuple) -> dict:
+        """
+        Mengubah baris menjadi dict catatan baru.
+
+        Args:
+            baris (tuple): Nilai catatan sesuai KOLOM.
+
+        Returns:
+            dict: Salinan catatan.
+        """
+        return dict(zip(self.KOLOM, baris))
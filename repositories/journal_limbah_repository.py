@@ -0,0 +1,361 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Iterator, Optional
+
+from models.limbah import Limbah
+from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from repositories.limbah_mapper import dari_baris, ke_baris
+from repositories.limbah_repository import LimbahRepository
+
+_OP_SIMPAN = "s"
+_OP_STATUS = "st"
+_OP_VOLUME = "v"
+
+
+class JournalLimbahRepository(LimbahRepository):
+    """
+    Repository limbah berbasis file: journal append-only dan snapshot ringkas.
+
+    Ditujukan untuk deployment lapangan tanpa database. Struktur direktori:
+    - journal.log: satu baris JSON per operasi (save, perubahan status/volume),
+      masing-masing dengan nomor urut (seq)
+    - snapshot.json: seluruh data dalam bentuk kolom (satu list per kolom
+      ke_baris) beserta seq terakhir yang sudah tercakup; format kolom
+      jauh lebih cepat di-parse dibanding list baris
+
+    Saat dibuka, snapshot terakhir dimuat lalu hanya ekor journal (seq lebih
+    besar dari snapshot) yang di-replay. Penulisan journal memakai group
+    commit: fsync dilakukan sekali per ukuran_grup operasi atau saat commit().
+    Snapshot dibuat otomatis setiap snapshot_setiap operasi, lalu journal
+    dikosongkan.
+
+    Data aktif disimpan di InMemoryLimbahRepository internal sehingga
+    pembacaan dan index mengikuti perilaku repository in-memory. Penulisan
+    ke journal dan snapshot diserialisasi oleh kunci journal karena
+    keduanya berbagi satu file.
+    """
+
+    NAMA_JOURNAL = "journal.log"
+    NAMA_SNAPSHOT = "snapshot.json"
+
+    def __init__(self, direktori: str, ukuran_grup: int = 256, snapshot_setiap: int = 100_000):
+        """
+        Membuka (atau membuat) repository pada direktori tertentu.
+
+        Args:
+            direktori (str): Direktori penyimpanan journal dan snapshot.
+            ukuran_grup (int): Jumlah operasi per fsync (group commit).
+            snapshot_setiap (int): Jumlah operasi journal sebelum snapshot otomatis.
+
+        Raises:
+            ValueError: Jika ukuran_grup atau snapshot_setiap < 1.
+        """
+        if ukuran_grup < 1:
+            raise ValueError("Ukuran grup minimal 1")
+        if snapshot_setiap < 1:
+            raise ValueError("Interval snapshot minimal 1")
+        super().__init__()
+        os.makedirs(direktori, exist_ok=True)
+        self.__path_journal = os.path.join(direktori, self.NAMA_JOURNAL)
+        self.__path_snapshot = os.path.join(direktori, self.NAMA_SNAPSHOT)
+        self.__ukuran_grup = ukuran_grup
+        self.__snapshot_setiap = snapshot_setiap
+        self.__data = InMemoryLimbahRepository()
+        self.__seq = 0
+        self.__belum_fsync = 0
+        self.__sejak_snapshot = 0
+        self.__memulihkan = True
+        self.__kunci = threading.RLock()
+
+        self.__muat_snapshot()
+        self.__replay_journal()
+        self.__memulihkan = False
+        self.__journal = open(self.__path_journal, "a", encoding="utf-8")
+
+    def save(self, limbah: Limbah) -> None:
+        """
+        Menyimpan objek limbah dan mencatatnya di journal.
+
+        Args:
+            limbah (Limbah): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ID limbah sudah tersimpan sebelumnya.
+        """
+        with self.__kunci:
+            self.__data.save(limbah)
+            limbah.tambah_pengamat(self.__on_perubahan)
+            self.__tulis(_OP_SIMPAN, *ke_baris(limbah))
+
+    def save_many(self, daftar_limbah: list[Limbah]) -> None:
+        """
+        Menyimpan banyak objek limbah dan mencatatnya sebagai satu grup journal.
+
+        Seluruh entri grup ditulis terlebih dahulu; snapshot otomatis baru
+        diperiksa setelahnya, sehingga snapshot tidak pernah memuat baris
+        yang entri journal-nya ditulis belakangan dengan seq lebih besar.
+
+        Args:
+            daftar_limbah (list[Limbah]): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ada ID limbah yang ganda atau sudah tersimpan.
+        """
+        daftar_limbah = list(daftar_limbah)
+        with self.__kunci:
+            self.__data.save_many(daftar_limbah)
+            for limbah in daftar_limbah:
+                limbah.tambah_pengamat(self.__on_perubahan)
+                self.__tulis(_OP_SIMPAN, *ke_baris(limbah), grup=True)
+            if self.__sejak_snapshot >= self.__snapshot_setiap:
+                self.snapshot()
+            else:
+                self.commit()
+
+    def get_all(self) -> list[Limbah]:
+        """
+        Mengambil semua data limbah.
+
+        Returns:
+            list[Limbah]: Daftar semua limbah yang tersimpan.
+        """
+        return self.__data.get_all()
+
+    def iter_all(self, ukuran_halaman: int = 1000) -> Iterator[Limbah]:
+        """
+        Mengiterasi semua limbah sesuai urutan penyimpanan.
+
+        Args:
+            ukuran_halaman (int): Tidak digunakan; data aktif berada di memori.
+
+        Returns:
+            Iterator[Limbah]: Iterator limbah.
+        """
+        return self.__data.iter_all()
+
+    def page(self, after_id: Optional[str] = None, limit: int = 100) -> list[Limbah]:
+        """
+        Mengambil satu halaman limbah setelah cursor tertentu.
+
+        Args:
+            after_id (Optional[str]): ID limbah terakhir dari halaman sebelumnya,
+                atau None untuk halaman pertama.
+            limit (int): Jumlah maksimum limbah per halaman.
+
+        Returns:
+            list[Limbah]: Limbah pada halaman tersebut.
+
+        Raises:
+            ValueError: Jika limit < 1.
+            LookupError: Jika after_id tidak ditemukan.
+        """
+        return self.__data.page(after_id, limit)
+
+    def get_by_id(self, id: str) -> Optional[Limbah]:
+        """
+        Mencari limbah berdasarkan ID.
+
+        Args:
+            id (str): ID limbah yang dicari.
+
+        Returns:
+            Optional[Limbah]: Objek limbah jika ditemukan, None jika tidak.
+        """
+        return self.__data.get_by_id(id)
+
+    def find_by_status(self, status: str, jenis: Optional[type] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan status melalui index in-memory.
+
+        Args:
+            status (str): Status limbah yang dicari.
+            jenis (Optional[type]): Kelas limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return self.__data.find_by_status(status, jenis)
+
+    def find_by_jenis(self, jenis: type, status: Optional[str] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan jenis melalui index in-memory.
+
+        Args:
+            jenis (type): Kelas limbah, misal LimbahMedis.
+            status (Optional[str]): Status limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return self.__data.find_by_jenis(jenis, status)
+
+    def tambah_pengamat(self, callback: Callable[[Limbah, str, Any, Any], None]) -> None:
+        """
+        Mendaftarkan pengamat peristiwa pada penyimpanan in-memory internal.
+
+        Args:
+            callback (Callable): Fungsi (limbah, peristiwa, lama, baru).
+        """
+        self.__data.tambah_pengamat(callback)
+
+    def hapus_pengamat(self, callback: Callable[[Limbah, str, Any, Any], None]) -> None:
+        """
+        Menghapus pengamat peristiwa dari penyimpanan in-memory internal.
+
+        Args:
+            callback (Callable): Fungsi pengamat yang sebelumnya didaftarkan.
+        """
+        self.__data.hapus_pengamat(callback)
+
+    def commit(self) -> None:
+        """
+        Menulis buffer journal ke disk dan melakukan fsync.
+        """
+        with self.__kunci:
+            self.__journal.flush()
+            os.fsync(self.__journal.fileno())
+            self.__belum_fsync = 0
+
+    def snapshot(self) -> None:
+        """
+        Menulis snapshot seluruh data lalu mengosongkan journal.
+
+        Snapshot ditulis ke file sementara, di-fsync, lalu di-rename secara
+        atomik. Jika proses berhenti sebelum journal dikosongkan, entri
+        journal yang sudah tercakup akan dilewati saat replay karena seq-nya
+        tidak lebih besar dari seq snapshot.
+        """
+        with self.__kunci:
+            self.commit()
+            kolom = [list(nilai) for nilai in zip(*map(ke_baris, self.__data.iter_all()))]
+            isi = {"seq": self.__seq, "kolom": kolom}
+            path_sementara = self.__path_snapshot + ".tmp"
+            with open(path_sementara, "w", encoding="utf-8") as f:
+                json.dump(isi, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(path_sementara, self.__path_snapshot)
+
+            self.__journal.close()
+            self.__journal = open(self.__path_journal, "w", encoding="utf-8")
+            self.__sejak_snapshot = 0
+
+    def close(self) -> None:
+        """
+        Melakukan commit terakhir lalu menutup file journal.
+        """
+        with self.__kunci:
+            self.commit()
+            self.__journal.close()
+
+    def __muat_snapshot(self) -> None:
+        """
+        Memuat snapshot terakhir (jika ada) ke penyimpanan in-memory.
+        """
+        if not os.path.exists(self.__path_snapshot):
+            return
+        with open(self.__path_snapshot, encoding="utf-8") as f:
+            isi = json.load(f)
+        daftar_limbah = [dari_baris(baris) for baris in zip(*isi["kolom"])]
+        self.__data.save_many(daftar_limbah)
+        for limbah in daftar_limbah:
+            limbah.tambah_pengamat(self.__on_perubahan)
+        self.__seq = isi["seq"]
+
+    def __replay_journal(self) -> None:
+        """
+        Menerapkan ekor journal yang belum tercakup snapshot.
+
+        Baris terakhir yang terpotong (misal akibat crash saat menulis)
+        diabaikan dan dipangkas dari file.
+        """
+        if not os.path.exists(self.__path_journal):
+            return
+        seq_snapshot = self.__seq
+        posisi_valid = 0
+        with open(self.__path_journal, "rb") as f:
+            for baris in f:
+                try:
+                    entri = json.loads(baris)
+                except ValueError:
+                    break
+                posisi_valid += len(baris)
+                seq = entri[0]
+                if seq > seq_snapshot:
+                    self.__terapkan(entri[1], entri[2:])
+                    self.__seq = seq
+                    self.__sejak_snapshot += 1
+        if posisi_valid < os.path.getsize(self.__path_journal):
+            with open(self.__path_journal, "r+b") as f:
+                f.truncate(posisi_valid)
+
+    def __terapkan(self, op: str, argumen: list) -> None:
+        """
+        Menerapkan satu entri journal ke penyimpanan in-memory.
+
+        Args:
+            op (str): Kode operasi journal.
+            argumen (list): Argumen operasi.
+        """
+        if op == _OP_SIMPAN:
+            self.__pulihkan(argumen)
+        elif op == _OP_STATUS:
+            self.__data.get_by_id(argumen[0]).set_status(argumen[1])
+        elif op == _OP_VOLUME:
+            self.__data.get_by_id(argumen[0]).volume = argumen[1]
+
+    def __pulihkan(self, baris) -> None:
+        """
+        Membangun objek limbah dari baris data lalu menyimpannya tanpa journal.
+
+        Args:
+            baris: Baris data limbah (tuple atau list).
+        """
+        limbah = dari_baris(baris)
+        self.__data.save(limbah)
+        limbah.tambah_pengamat(self.__on_perubahan)
+
+    def __tulis(self, op: str, *argumen: Any, grup: bool = False) -> None:
+        """
+        Menambahkan satu entri ke journal dengan group commit.
+
+        Args:
+            op (str): Kode operasi journal.
+            *argumen (Any): Argumen operasi.
+            grup (bool): True untuk menunda fsync dan snapshot otomatis ke
+                pemanggil, yang memeriksanya sekali setelah seluruh grup ditulis.
+
+        Pemanggil wajib memegang kunci journal.
+        """
+        self.__seq += 1
+        self.__journal.write(json.dumps([self.__seq, op, *argumen], separators=(",", ":")) + "\n")
+        self.__belum_fsync += 1
+        self.__sejak_snapshot += 1
+        if grup:
+            return
+        if self.__sejak_snapshot >= self.__snapshot_setiap:
+            self.snapshot()
+        elif self.__belum_fsync >= self.__ukuran_grup:
+            self.commit()
+
+    def __on_perubahan(self, limbah: Limbah, atribut: str, lama: Any, baru: Any) -> None:
+        """
+        Mencatat perubahan status/volume objek limbah ke journal.
+
+        Args:
+            limbah (Limbah): Objek limbah yang berubah.
+            atribut (str): Nama atribut yang berubah.
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+        """
+        if self.__memulihkan:
+            return
+        if atribut == "status":
+            op = _OP_STATUS
+        elif atribut == "volume":
+            op = _OP_VOLUME
+        else:
+            return
+        with self.__kunci:
+            self.__tulis(op, limbah.get_id(), baru)
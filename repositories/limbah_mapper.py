@@ -0,0 +1,116 @@
+from typing import Optional
+
+from models.limbah import Limbah
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.limbah_organik import LimbahOrganik
+
+# Kode jenis yang disimpan pada media persisten, dipetakan ke kelasnya.
+KELAS_PER_JENIS: dict[str, type] = {
+    "organik": LimbahOrganik,
+    "medis": LimbahMedis,
+    "b3": LimbahB3,
+}
+JENIS_PER_KELAS: dict[type, str] = {kelas: jenis for jenis, kelas in KELAS_PER_JENIS.items()}
+
+# Kode jenis numerik untuk penyimpanan kolom, sesuai urutan KELAS_PER_JENIS.
+KODE_JENIS: dict[str, int] = {jenis: kode for kode, jenis in enumerate(KELAS_PER_JENIS)}
+JENIS_PER_KODE: tuple[str, ...] = tuple(KELAS_PER_JENIS)
+
+
+def kode_jenis(limbah: Limbah) -> str:
+    """
+    Mengambil kode jenis persisten dari objek limbah.
+
+    Args:
+        limbah (Limbah): Objek limbah.
+
+    Returns:
+        str: Kode jenis ("organik", "medis", atau "b3").
+
+    Raises:
+        ValueError: Jika kelas limbah tidak dikenal.
+    """
+    for kelas in type(limbah).__mro__:
+        if kelas in JENIS_PER_KELAS:
+            return JENIS_PER_KELAS[kelas]
+    raise ValueError(f"Jenis limbah tidak dikenal: {type(limbah).__name__}")
+
+
+def kode_jenis_untuk(jenis: type) -> list[str]:
+    """
+    Mengambil seluruh kode jenis yang termasuk kelas tertentu (beserta subclass-nya).
+
+    Args:
+        jenis (type): Kelas limbah, misal LimbahMedis atau Limbah.
+
+    Returns:
+        list[str]: Daftar kode jenis yang sesuai.
+    """
+    return [kode for kode, kelas in KELAS_PER_JENIS.items() if issubclass(kelas, jenis)]
+
+
+def ke_baris(limbah: Limbah) -> tuple:
+    """
+    Mengubah objek limbah menjadi baris datar untuk disimpan.
+
+    Urutan kolom: (id, jenis, volume, status, tingkat_pembusukan,
+    tingkat_infeksi, kandungan_kimia, dibuat_pada, versi). Kolom yang
+    tidak relevan untuk jenis tersebut bernilai None; dibuat_pada berupa
+    detik epoch Unix.
+
+    Args:
+        limbah (Limbah): Objek limbah.
+
+    Returns:
+        tuple: Baris data limbah.
+    """
+    jenis = kode_jenis(limbah)
+    tingkat_pembusukan: Optional[int] = None
+    tingkat_infeksi: Optional[int] = None
+    kandungan_kimia: Optional[str] = None
+    if jenis == "organik":
+        tingkat_pembusukan = limbah.get_tingkat_pembusukan()
+    elif jenis == "medis":
+        tingkat_infeksi = limbah.get_tingkat_infeksi()
+    else:
+        kandungan_kimia = limbah.get_kandungan_kimia()
+    return (
+        limbah.get_id(), jenis, limbah.get_volume(), limbah.get_status(),
+        tingkat_pembusukan, tingkat_infeksi, kandungan_kimia, limbah.get_detik_dibuat(),
+        limbah.get_versi(),
+    )
+
+
+def dari_baris(baris: tuple) -> Limbah:
+    """
+    Membangun kembali objek limbah dari baris hasil ke_baris().
+
+    Baris format lama tanpa kolom dibuat_pada (7 kolom) atau versi
+    (8 kolom) tetap diterima; waktu registrasinya diisi waktu saat baris
+    dimuat dan versinya mengikuti jumlah perubahan saat dibangun.
+
+    Args:
+        baris (tuple): Baris data limbah (list juga diterima).
+
+    Returns:
+        Limbah: Objek limbah sesuai jenisnya.
+
+    Raises:
+        ValueError: Jika kode jenis tidak dikenal.
+    """
+    id, jenis, volume, status, tingkat_pembusukan, tingkat_infeksi, kandungan_kimia = baris[:7]
+    dibuat_pada = baris[7] if len(baris) > 7 else None
+    if jenis == "organik":
+        limbah = LimbahOrganik(id, volume, tingkat_pembusukan, dibuat_pada)
+    elif jenis == "medis":
+        limbah = LimbahMedis(id, volume, tingkat_infeksi, dibuat_pada)
+    elif jenis == "b3":
+        limbah = LimbahB3(id, volume, kandungan_kimia, dibuat_pada)
+    else:
+        raise ValueError(f"Kode jenis limbah tidak dikenal: {jenis!r}")
+    if status != limbah.get_status():
+        limbah.set_status(status)
+    if len(baris) > 8:
+        limbah._pulihkan_versi(baris[8])
+    return limbah
@@ -1,6 +1,49 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from array import array
+from typing import Any, Callable, ContextManager, Iterator, Optional
 from models.limbah import Limbah
+from utils.event_bus import EventBus, PelangganAntrian
+
+# Kunci bergaris (striped lock) default: ID limbah dipetakan ke salah satu
+# kunci sehingga record berbeda umumnya tidak saling menunggu.
+_JUMLAH_KUNCI = 64
+_KUNCI_BERGARIS = tuple(threading.RLock() for _ in range(_JUMLAH_KUNCI))
+
+# Versi yang dipasang pada objek limbah yang penulisannya ditolak karena
+# usang; versi record tidak pernah negatif sehingga objek itu tidak akan
+# cocok lagi dan harus dibaca ulang.
+VERSI_USANG = -(2 ** 62)
+
+class KonflikVersiError(ValueError):
+    """
+    Dilempar compare_and_update() jika versi record sudah berubah sejak dibaca.
+
+    Konflik bersifat dapat diulang: pemanggil membaca ulang record,
+    memeriksa ulang syaratnya, lalu mencoba lagi dengan versi terbaru.
+
+    Attributes:
+        id (str): ID limbah.
+        versi_diharapkan (int): Versi yang dibaca pemanggil.
+        versi_sekarang (int): Versi record saat ini.
+    """
+
+    def __init__(self, id: str, versi_diharapkan: int, versi_sekarang: int):
+        """
+        Inisialisasi error konflik versi.
+
+        Args:
+            id (str): ID limbah.
+            versi_diharapkan (int): Versi yang dibaca pemanggil.
+            versi_sekarang (int): Versi record saat ini.
+        """
+        super().__init__(
+            f"Limbah '{id}' sudah berubah (versi {versi_diharapkan} -> {versi_sekarang}); "
+            "baca ulang lalu coba lagi"
+        )
+        self.id = id
+        self.versi_diharapkan = versi_diharapkan
+        self.versi_sekarang = versi_sekarang
 
 class LimbahRepository(ABC):
     """
@@ -8,8 +51,80 @@ class LimbahRepository(ABC):
 
     Mendefinisikan kontrak untuk operasi penyimpanan dan pengambilan
     data limbah (Dependency Inversion Principle).
+
+    Repository juga menjadi sumber peristiwa bagi struktur inkremental
+    (agregat, index, cache): pengamat repository dipanggil dengan argumen
+    (limbah, peristiwa, lama, baru), di mana peristiwa bernilai "simpan"
+    saat limbah disimpan, atau "status"/"volume" saat atribut record yang
+    tersimpan berubah. Implementasi wajib memanggil super().__init__().
+
+    Peristiwa diterbitkan lewat EventBus `_pengamat`: pengamat sinkron
+    (tambah_pengamat) untuk index dan agregat, pengamat antrian
+    (tambah_pengamat_antrian) untuk konsumen lambat. Implementasi cukup
+    menulis `if self._pengamat: self._beritahu(...)` agar tanpa pengamat
+    tidak ada biaya tambahan.
     """
 
+    PERISTIWA_SIMPAN = "simpan"
+
+    def __init__(self):
+        """
+        Inisialisasi event bus pengamat repository.
+        """
+        self._pengamat = EventBus()
+
+    def tambah_pengamat(self, callback: Callable[[Limbah, str, Any, Any], None]) -> None:
+        """
+        Mendaftarkan pengamat sinkron peristiwa repository.
+
+        Args:
+            callback (Callable): Fungsi (limbah, peristiwa, lama, baru).
+        """
+        self._pengamat.langganan(callback)
+
+    def tambah_pengamat_antrian(
+        self, callback: Callable[[Limbah, str, Any, Any], None], ukuran_antrian: int = 10_000
+    ) -> PelangganAntrian:
+        """
+        Mendaftarkan pengamat asinkron yang memproses peristiwa di thread latar.
+
+        Didaftarkan lewat tambah_pengamat() sehingga repository pembungkus
+        yang meneruskan pengamat ke repository dalam ikut mendukungnya.
+
+        Args:
+            callback (Callable): Fungsi (limbah, peristiwa, lama, baru).
+            ukuran_antrian (int): Kapasitas antrian peristiwa.
+
+        Returns:
+            PelangganAntrian: Pengamat terdaftar; tunggu() menunggu antrian
+            habis, hapus_pengamat() menghentikannya.
+        """
+        pelanggan = PelangganAntrian(callback, ukuran_antrian)
+        self.tambah_pengamat(pelanggan)
+        return pelanggan
+
+    def hapus_pengamat(self, callback: Callable[[Limbah, str, Any, Any], None]) -> None:
+        """
+        Menghapus pengamat peristiwa repository; pengamat antrian dihentikan
+        setelah sisa antriannya diproses.
+
+        Args:
+            callback (Callable): Fungsi pengamat yang sebelumnya didaftarkan.
+        """
+        self._pengamat.berhenti_langganan(callback)
+
+    def _beritahu(self, limbah: Limbah, peristiwa: str, lama: Any, baru: Any) -> None:
+        """
+        Memanggil seluruh pengamat repository.
+
+        Args:
+            limbah (Limbah): Limbah yang terkait peristiwa.
+            peristiwa (str): "simpan", "status", atau "volume".
+            lama (Any): Nilai sebelum perubahan (None untuk "simpan").
+            baru (Any): Nilai setelah perubahan.
+        """
+        self._pengamat.terbitkan(limbah, peristiwa, lama, baru)
+
     @abstractmethod
     def save(self, limbah: Limbah) -> None:
         """
@@ -17,9 +132,29 @@ class LimbahRepository(ABC):
 
         Args:
             limbah (Limbah): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ID limbah sudah tersimpan sebelumnya.
         """
         pass
 
+    def save_many(self, daftar_limbah: list[Limbah]) -> None:
+        """
+        Menyimpan banyak objek limbah dalam satu operasi repository.
+
+        Implementasi default memanggil save() satu per satu. Implementasi
+        konkret sebaiknya meng-override agar validasi ID ganda dilakukan
+        di awal dan penulisan berlangsung sekaligus.
+
+        Args:
+            daftar_limbah (list[Limbah]): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ada ID limbah yang ganda atau sudah tersimpan.
+        """
+        for limbah in daftar_limbah:
+            self.save(limbah)
+
     @abstractmethod
     def get_all(self) -> list[Limbah]:
         """
@@ -30,6 +165,95 @@ class LimbahRepository(ABC):
         """
         pass
 
+    def iter_all(self, ukuran_halaman: int = 1000) -> Iterator[Limbah]:
+        """
+        Mengiterasi semua limbah secara streaming sesuai urutan penyimpanan.
+
+        Implementasi default mengiterasi get_all(). Backend yang datanya
+        tidak berada di memori sebaiknya meng-override agar hanya satu
+        halaman (ukuran_halaman) yang dimaterialisasi pada satu waktu.
+
+        Args:
+            ukuran_halaman (int): Jumlah limbah yang dibaca per halaman.
+
+        Returns:
+            Iterator[Limbah]: Iterator limbah.
+        """
+        return iter(self.get_all())
+
+    def page(self, after_id: Optional[str] = None, limit: int = 100) -> list[Limbah]:
+        """
+        Mengambil satu halaman limbah setelah cursor (ID) tertentu.
+
+        Halaman mengikuti urutan penyimpanan. Implementasi default memotong
+        hasil get_all(); backend sebaiknya meng-override dengan query
+        berbasis cursor.
+
+        Args:
+            after_id (Optional[str]): ID limbah terakhir dari halaman sebelumnya,
+                atau None untuk halaman pertama.
+            limit (int): Jumlah maksimum limbah per halaman.
+
+        Returns:
+            list[Limbah]: Limbah pada halaman tersebut.
+
+        Raises:
+            ValueError: Jika limit < 1.
+            LookupError: Jika after_id tidak ditemukan.
+        """
+        if limit < 1:
+            raise ValueError("Limit halaman minimal 1")
+        data = self.get_all()
+        mulai = 0
+        if after_id is not None:
+            for posisi, limbah in enumerate(data):
+                if limbah.get_id() == after_id:
+                    mulai = posisi + 1
+                    break
+            else:
+                raise LookupError(f"Cursor limbah '{after_id}' tidak ditemukan")
+        return data[mulai:mulai + limit]
+
+    def partisi_kolom(self, ukuran_partisi: int = 100_000) -> Iterator[tuple[array, array, array]]:
+        """
+        Mengiterasi seluruh limbah sebagai partisi kolom ringkas untuk agregasi.
+
+        Setiap partisi berisi paling banyak ukuran_partisi baris dalam tiga
+        kolom sejajar: kode jenis (array "b", lihat limbah_mapper.KODE_JENIS), volume
+        (array "d"), dan bobot risiko (array "d") sehingga risiko baris =
+        volume * bobot. Array dipickle sebagai buffer byte, jauh lebih kecil
+        dan cepat dikirim ke proses lain dibanding objek Limbah.
+
+        Hanya tersedia di repository yang menyimpan kolom tersebut secara
+        langsung (partisi_kolom_langsung() bernilai True); repository
+        berbasis objek cukup diiterasi lewat iter_all(). Partisi tidak
+        diambil dalam satu snapshot atomik.
+
+        Args:
+            ukuran_partisi (int): Jumlah baris maksimum per partisi.
+
+        Returns:
+            Iterator[tuple[array, array, array]]: (jenis, volume, bobot) per partisi.
+
+        Raises:
+            ValueError: Jika ukuran_partisi < 1 (implementasi berbasis kolom).
+            NotImplementedError: Jika repository tidak menyimpan kolom langsung.
+        """
+        raise NotImplementedError(f"{type(self).__name__} tidak menyediakan partisi kolom")
+
+    def partisi_kolom_langsung(self) -> bool:
+        """
+        Menandai apakah partisi_kolom() menyalin kolom tersimpan langsung.
+
+        Implementasi default bernilai False dan partisi_kolom() tidak
+        tersedia; hitung_agregat_paralel() memakai tanda ini untuk memilih
+        jalur satu proses lewat iter_all().
+
+        Returns:
+            bool: True jika partisi_kolom() tersedia.
+        """
+        return False
+
     @abstractmethod
     def get_by_id(self, id: str) -> Optional[Limbah]:
         """
@@ -42,3 +266,118 @@ class LimbahRepository(ABC):
             Optional[Limbah]: Objek limbah jika ditemukan, None jika tidak.
         """
         pass
+
+    def lock(self, id: str) -> ContextManager:
+        """
+        Mengambil kunci per record untuk urutan baca-periksa-ubah yang atomik.
+
+        Implementasi default memakai kunci bergaris berdasarkan hash ID,
+        sehingga tidak ada satu kunci global yang menserialisasi semua record.
+        Kunci bersifat reentrant.
+
+        Args:
+            id (str): ID limbah.
+
+        Returns:
+            ContextManager: Kunci yang dipakai dengan pernyataan with.
+        """
+        return _KUNCI_BERGARIS[hash(id) % _JUMLAH_KUNCI]
+
+    def compare_and_set_status(self, id: str, status_lama: str, status_baru: str) -> bool:
+        """
+        Mengubah status limbah hanya jika status saat ini sama dengan status_lama.
+
+        Pemeriksaan dan perubahan dilakukan di bawah lock(id) sehingga hanya
+        satu pemanggil yang berhasil untuk transisi yang sama.
+
+        Args:
+            id (str): ID limbah.
+            status_lama (str): Status yang diharapkan saat ini.
+            status_baru (str): Status tujuan.
+
+        Returns:
+            bool: True jika status berhasil diubah, False jika status saat ini berbeda.
+
+        Raises:
+            ValueError: Jika transisi status tidak diizinkan.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        with self.lock(id):
+            limbah = self.get_by_id(id)
+            if limbah is None:
+                raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
+            if limbah.get_status() != status_lama:
+                return False
+            limbah.set_status(status_baru)
+            return True
+
+    def compare_and_update(self, id: str, versi_diharapkan: int, status_baru: str) -> int:
+        """
+        Mengubah status limbah hanya jika versinya masih versi_diharapkan.
+
+        Dasar optimistic concurrency: pemanggil membaca record (dan versinya)
+        tanpa memegang kunci, memutuskan perubahan, lalu menuliskannya lewat
+        method ini. Jika record sudah diubah pihak lain, penulisan ditolak
+        dengan KonflikVersiError sehingga pemanggil dapat membaca ulang dan
+        mencoba lagi. Implementasi default memeriksa dan mengubah di bawah
+        lock(id); backend tahan lama meng-override dengan UPDATE bersyarat.
+
+        Args:
+            id (str): ID limbah.
+            versi_diharapkan (int): Versi record saat dibaca.
+            status_baru (str): Status tujuan.
+
+        Returns:
+            int: Versi record setelah perubahan.
+
+        Raises:
+            KonflikVersiError: Jika versi record sudah berbeda.
+            ValueError: Jika transisi status tidak diizinkan.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        with self.lock(id):
+            limbah = self.get_by_id(id)
+            if limbah is None:
+                raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
+            if limbah.get_versi() != versi_diharapkan:
+                raise KonflikVersiError(id, versi_diharapkan, limbah.get_versi())
+            limbah.set_status(status_baru)
+            return limbah.get_versi()
+
+    def find_by_status(self, status: str, jenis: Optional[type] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan status, opsional dibatasi jenisnya.
+
+        Implementasi default menyaring hasil iter_all(). Implementasi yang
+        memiliki index sebaiknya meng-override method ini.
+
+        Args:
+            status (str): Status limbah yang dicari.
+            jenis (Optional[type]): Kelas limbah (misal LimbahMedis) sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return [
+            limbah for limbah in self.iter_all()
+            if limbah.get_status() == status and (jenis is None or isinstance(limbah, jenis))
+        ]
+
+    def find_by_jenis(self, jenis: type, status: Optional[str] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan jenis (kelas), opsional dibatasi statusnya.
+
+        Implementasi default menyaring hasil iter_all(). Implementasi yang
+        memiliki index sebaiknya meng-override method ini.
+
+        Args:
+            jenis (type): Kelas limbah, misal LimbahMedis.
+            status (Optional[str]): Status limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return [
+            limbah for limbah in self.iter_all()
+            if isinstance(limbah, jenis) and (status is None or limbah.get_status() == status)
+        ]
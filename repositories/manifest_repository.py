@@ -0,0 +1,126 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, Union
+
+from utils.date_helper import ke_iso
+
+Waktu = Union[str, datetime, None]
+
+
+class ManifestRepository(ABC):
+    """
+    Interface (Abstract Base Class) untuk penyimpanan catatan pengangkutan (manifest).
+
+    Setiap catatan mewakili satu limbah yang diangkut dan berisi
+    "timestamp" (string ISO), "id_limbah", "volume", "status_baru",
+    "kendaraan", "tujuan", serta "id_petugas" yang opsional (None jika
+    pengangkutan tidak dicatat petugasnya). Catatan hanya ditambahkan
+    (append-only).
+
+    Implementasi wajib mengindeks id_limbah, kendaraan, tujuan, dan
+    timestamp sehingga pencarian tidak memindai seluruh riwayat.
+
+    Prinsip:
+    - SRP: Repository hanya bertanggung jawab pada penyimpanan manifest
+    - DIP: Service bergantung pada abstraksi, bukan implementasi konkret
+    """
+
+    KOLOM = ("timestamp", "id_limbah", "volume", "status_baru", "kendaraan", "tujuan", "id_petugas")
+    KOLOM_OPSIONAL = ("id_petugas",)
+
+    @abstractmethod
+    def save(self, catatan: dict) -> None:
+        """
+        Menambahkan satu catatan pengangkutan.
+
+        Args:
+            catatan (dict): Catatan dengan kunci sesuai KOLOM.
+
+        Raises:
+            ValueError: Jika ada kunci yang hilang atau timestamp tidak valid.
+        """
+        pass
+
+    def save_many(self, daftar_catatan: list[dict]) -> None:
+        """
+        Menambahkan banyak catatan pengangkutan sekaligus.
+
+        Implementasi default memanggil save() per catatan; backend yang
+        mendukung penulisan batch sebaiknya meng-override method ini.
+
+        Args:
+            daftar_catatan (list[dict]): Catatan yang akan ditambahkan.
+
+        Raises:
+            ValueError: Jika ada catatan yang tidak valid.
+        """
+        for catatan in daftar_catatan:
+            self.save(catatan)
+
+    @abstractmethod
+    def find_by_limbah(self, id_limbah: str) -> list[dict]:
+        """
+        Mengambil riwayat pengangkutan satu limbah.
+
+        Args:
+            id_limbah (str): ID limbah.
+
+        Returns:
+            list[dict]: Catatan terurut berdasarkan timestamp.
+        """
+        pass
+
+    @abstractmethod
+    def find(
+        self,
+        kendaraan: Optional[str] = None,
+        tujuan: Optional[str] = None,
+        mulai: Waktu = None,
+        sampai: Waktu = None,
+    ) -> list[dict]:
+        """
+        Mencari catatan berdasarkan kendaraan, tujuan, dan rentang waktu.
+
+        Semua filter opsional dan digabung dengan AND. Rentang waktu
+        inklusif di kedua ujung.
+
+        Args:
+            kendaraan (Optional[str]): Nama kendaraan.
+            tujuan (Optional[str]): Tujuan pengangkutan.
+            mulai (str | datetime | None): Batas awal timestamp.
+            sampai (str | datetime | None): Batas akhir timestamp.
+
+        Returns:
+            list[dict]: Catatan terurut berdasarkan timestamp.
+
+        Raises:
+            ValueError: Jika batas waktu bukan format ISO yang valid.
+        """
+        pass
+
+    @classmethod
+    def _validasi(cls, catatan: dict) -> tuple:
+        """
+        Memeriksa kelengkapan catatan dan mengubahnya menjadi tuple sesuai KOLOM.
+
+        Kolom di KOLOM_OPSIONAL yang tidak ada diisi None.
+
+        Args:
+            catatan (dict): Catatan pengangkutan.
+
+        Returns:
+            tuple: Nilai catatan berurutan sesuai KOLOM, timestamp diseragamkan.
+
+        Raises:
+            ValueError: Jika ada kunci yang hilang atau timestamp tidak valid.
+        """
+        hilang = [kolom for kolom in cls.KOLOM if kolom not in catatan and kolom not in cls.KOLOM_OPSIONAL]
+        if hilang:
+            raise ValueError(f"Catatan manifest tidak lengkap, kolom hilang: {', '.join(hilang)}")
+        try:
+            timestamp = ke_iso(catatan["timestamp"])
+        except (TypeError, ValueError):
+            timestamp = None
+        if timestamp is None:
+            raise ValueError(f"Timestamp manifest tidak valid: {catatan['timestamp']!r}") from None
+        return (timestamp,) + tuple(catatan.get(kolom) for kolom in cls.KOLOM[1:])
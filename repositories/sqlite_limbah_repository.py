@@ -0,0 +1,449 @@
+import sqlite3
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+from models.limbah import Limbah
+from models.status_limbah import StatusLimbah
+from repositories.limbah_mapper import dari_baris, ke_baris, kode_jenis_untuk
+from repositories.limbah_repository import VERSI_USANG, KonflikVersiError, LimbahRepository
+
+_KOLOM = "id, jenis, volume, status, tingkat_pembusukan, tingkat_infeksi, kandungan_kimia, dibuat_pada, versi"
+
+_SQL_SKEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS limbah (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        id TEXT NOT NULL UNIQUE,
+        jenis TEXT NOT NULL,
+        volume REAL NOT NULL,
+        status TEXT NOT NULL,
+        tingkat_pembusukan INTEGER,
+        tingkat_infeksi INTEGER,
+        kandungan_kimia TEXT,
+        dibuat_pada REAL,
+        versi INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_limbah_status ON limbah (status, jenis)",
+)
+_SQL_INSERT = f"INSERT INTO limbah ({_KOLOM}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_SQL_SELECT_ALL = f"SELECT {_KOLOM} FROM limbah ORDER BY seq"
+_SQL_SELECT_ID = f"SELECT {_KOLOM} FROM limbah WHERE id = ?"
+_SQL_SELECT_HALAMAN = f"SELECT seq, {_KOLOM} FROM limbah WHERE seq > ? ORDER BY seq LIMIT ?"
+_SQL_SELECT_SEQ = "SELECT seq FROM limbah WHERE id = ?"
+_SQL_SELECT_STATUS = f"SELECT {_KOLOM} FROM limbah WHERE status = ? ORDER BY seq"
+_SQL_SELECT_VERSI = "SELECT status, versi FROM limbah WHERE id = ?"
+_SQL_UPDATE_STATUS = "UPDATE limbah SET status = ?, versi = versi + 1 WHERE id = ? AND versi = ?"
+_SQL_UPDATE_VOLUME = "UPDATE limbah SET volume = ?, versi = versi + 1 WHERE id = ? AND versi = ?"
+_SQL_CAS_STATUS = "UPDATE limbah SET status = ?, versi = versi + 1 WHERE id = ? AND status = ?"
+_SQL_CAS_VERSI = "UPDATE limbah SET status = ?, versi = versi + 1 WHERE id = ? AND versi = ?"
+_SQL_MIGRASI_DIBUAT_PADA = (
+    "ALTER TABLE limbah ADD COLUMN dibuat_pada REAL",
+    "UPDATE limbah SET dibuat_pada = ? WHERE dibuat_pada IS NULL",
+)
+_SQL_MIGRASI_VERSI = "ALTER TABLE limbah ADD COLUMN versi INTEGER NOT NULL DEFAULT 0"
+
+
+class SqliteLimbahRepository(LimbahRepository):
+    """
+    Repository limbah persisten berbasis SQLite.
+
+    Menyimpan ketiga jenis limbah (Organik, Medis, B3) dalam satu tabel
+    dengan kolom khusus per jenis. Karakteristik:
+    - journal_mode WAL dan synchronous NORMAL untuk throughput tulis
+    - statement SQL konstan sehingga dipakai ulang dari cache statement sqlite3
+    - index UNIQUE pada ID dan index (status, jenis)
+    - commit dilakukan per batch; pembacaan pada koneksi yang sama tetap
+      melihat data yang belum di-commit
+
+    Perubahan status/volume pada objek yang disimpan atau dikembalikan
+    repository ditulis kembali ke database melalui pengamat Limbah, dengan
+    syarat versi baris masih sama dengan versi objek sebelum perubahan.
+    Setiap get_by_id() mengembalikan objek baru; setter pada salinan yang
+    sudah usang ditolak dengan KonflikVersiError alih-alih menimpa baris
+    yang lebih baru. Objek tersebut harus dibaca ulang.
+    Panggil commit() atau close() untuk memastikan batch terakhir tersimpan.
+
+    Koneksi dipakai bersama oleh banyak thread; setiap akses koneksi
+    dilindungi kunci internal yang hanya dipegang selama satu statement
+    atau satu operasi batch.
+
+    Setiap perubahan menaikkan kolom versi. Beberapa proses dapat berbagi
+    satu file database dengan compare_and_update() (UPDATE bersyarat versi)
+    tanpa kunci lintas proses; gunakan ukuran_batch=1 agar setiap penulisan
+    langsung di-commit dan tidak menahan kunci tulis SQLite.
+    """
+
+    def __init__(self, path: str = ":memory:", ukuran_batch: int = 1000):
+        """
+        Inisialisasi koneksi dan skema database.
+
+        Args:
+            path (str): Lokasi file database SQLite (default in-memory).
+            ukuran_batch (int): Jumlah penulisan sebelum commit otomatis.
+
+        Raises:
+            ValueError: Jika ukuran_batch < 1.
+        """
+        if ukuran_batch < 1:
+            raise ValueError("Ukuran batch minimal 1")
+        super().__init__()
+        self.__ukuran_batch = ukuran_batch
+        self.__tertunda = 0
+        self.__kunci = threading.RLock()
+        self.__conn = sqlite3.connect(path, check_same_thread=False, cached_statements=64)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute("PRAGMA synchronous=NORMAL")
+        for sql in _SQL_SKEMA:
+            self.__conn.execute(sql)
+        self.__migrasi()
+        self.__conn.commit()
+
+    def save(self, limbah: Limbah) -> None:
+        """
+        Menyimpan objek limbah ke tabel.
+
+        Args:
+            limbah (Limbah): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ID limbah sudah tersimpan sebelumnya.
+        """
+        with self.__kunci:
+            try:
+                self.__conn.execute(_SQL_INSERT, ke_baris(limbah))
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Limbah dengan id '{limbah.get_id()}' sudah terdaftar") from None
+            self.__tandai_tulis()
+        limbah.tambah_pengamat(self.__on_perubahan)
+        if self._pengamat:
+            self._beritahu(limbah, self.PERISTIWA_SIMPAN, None, limbah)
+
+    def save_many(self, daftar_limbah: list[Limbah]) -> None:
+        """
+        Menyimpan banyak objek limbah dengan satu executemany.
+
+        Penulisan dibungkus SAVEPOINT sehingga jika ada ID ganda tidak ada
+        baris dari daftar ini yang tersimpan, tanpa membatalkan batch lain
+        yang masih tertunda.
+
+        Args:
+            daftar_limbah (list[Limbah]): Objek limbah yang akan disimpan.
+
+        Raises:
+            ValueError: Jika ada ID limbah yang ganda atau sudah tersimpan.
+        """
+        daftar_limbah = list(daftar_limbah)
+        with self.__kunci:
+            if not self.__conn.in_transaction:
+                self.__conn.execute("BEGIN")
+            self.__conn.execute("SAVEPOINT save_many")
+            try:
+                self.__conn.executemany(_SQL_INSERT, map(ke_baris, daftar_limbah))
+            except sqlite3.IntegrityError as e:
+                self.__conn.execute("ROLLBACK TO save_many")
+                self.__conn.execute("RELEASE save_many")
+                raise ValueError(f"Terdapat ID limbah ganda atau sudah terdaftar: {e}") from None
+            self.__conn.execute("RELEASE save_many")
+            self.__tertunda += len(daftar_limbah)
+            if self.__tertunda >= self.__ukuran_batch:
+                self.commit()
+        for limbah in daftar_limbah:
+            limbah.tambah_pengamat(self.__on_perubahan)
+            if self._pengamat:
+                self._beritahu(limbah, self.PERISTIWA_SIMPAN, None, limbah)
+
+    def get_all(self) -> list[Limbah]:
+        """
+        Mengambil semua data limbah sesuai urutan penyimpanan.
+
+        Returns:
+            list[Limbah]: Daftar semua limbah yang tersimpan.
+        """
+        return self.__ke_objek(self.__jalankan(_SQL_SELECT_ALL))
+
+    def iter_all(self, ukuran_halaman: int = 1000) -> Iterator[Limbah]:
+        """
+        Mengiterasi semua limbah per halaman berdasarkan kolom seq.
+
+        Hanya satu halaman yang dimaterialisasi pada satu waktu.
+
+        Args:
+            ukuran_halaman (int): Jumlah baris yang dibaca per query.
+
+        Returns:
+            Iterator[Limbah]: Iterator limbah sesuai urutan penyimpanan.
+        """
+        seq = 0
+        while True:
+            daftar_baris = self.__jalankan(_SQL_SELECT_HALAMAN, (seq, ukuran_halaman))
+            yield from self.__ke_objek(baris[1:] for baris in daftar_baris)
+            if len(daftar_baris) < ukuran_halaman:
+                return
+            seq = daftar_baris[-1][0]
+
+    def page(self, after_id: Optional[str] = None, limit: int = 100) -> list[Limbah]:
+        """
+        Mengambil satu halaman limbah setelah cursor memakai keyset pagination.
+
+        Args:
+            after_id (Optional[str]): ID limbah terakhir dari halaman sebelumnya,
+                atau None untuk halaman pertama.
+            limit (int): Jumlah maksimum limbah per halaman.
+
+        Returns:
+            list[Limbah]: Limbah pada halaman tersebut.
+
+        Raises:
+            ValueError: Jika limit < 1.
+            LookupError: Jika after_id tidak ditemukan.
+        """
+        if limit < 1:
+            raise ValueError("Limit halaman minimal 1")
+        seq = 0
+        if after_id is not None:
+            hasil = self.__jalankan(_SQL_SELECT_SEQ, (after_id,))
+            if not hasil:
+                raise LookupError(f"Cursor limbah '{after_id}' tidak ditemukan")
+            seq = hasil[0][0]
+        daftar_baris = self.__jalankan(_SQL_SELECT_HALAMAN, (seq, limit))
+        return self.__ke_objek(baris[1:] for baris in daftar_baris)
+
+    def get_by_id(self, id: str) -> Optional[Limbah]:
+        """
+        Mencari limbah berdasarkan ID melalui index UNIQUE.
+
+        Args:
+            id (str): ID limbah yang dicari.
+
+        Returns:
+            Optional[Limbah]: Objek limbah jika ditemukan, None jika tidak.
+        """
+        hasil = self.__ke_objek(self.__jalankan(_SQL_SELECT_ID, (id,)))
+        return hasil[0] if hasil else None
+
+    def find_by_status(self, status: str, jenis: Optional[type] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan status melalui index (status, jenis).
+
+        Args:
+            status (str): Status limbah yang dicari.
+            jenis (Optional[type]): Kelas limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        if jenis is None:
+            return self.__ke_objek(self.__jalankan(_SQL_SELECT_STATUS, (status,)))
+        return self.__cari_jenis(jenis, status)
+
+    def find_by_jenis(self, jenis: type, status: Optional[str] = None) -> list[Limbah]:
+        """
+        Mencari limbah berdasarkan jenis, opsional dibatasi statusnya.
+
+        Args:
+            jenis (type): Kelas limbah, misal LimbahMedis.
+            status (Optional[str]): Status limbah sebagai filter tambahan.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        return self.__cari_jenis(jenis, status)
+
+    def compare_and_set_status(self, id: str, status_lama: str, status_baru: str) -> bool:
+        """
+        Mengubah status secara atomik dengan satu UPDATE bersyarat.
+
+        Args:
+            id (str): ID limbah.
+            status_lama (str): Status yang diharapkan saat ini.
+            status_baru (str): Status tujuan.
+
+        Returns:
+            bool: True jika status berhasil diubah, False jika status saat ini berbeda.
+
+        Raises:
+            ValueError: Jika status tidak dikenal atau transisi tidak diizinkan.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        StatusLimbah.dari(status_lama).validasi_transisi(StatusLimbah.dari(status_baru))
+        with self.__kunci:
+            berubah = self.__conn.execute(_SQL_CAS_STATUS, (status_baru, id, status_lama)).rowcount
+            if not berubah:
+                if not self.__jalankan(_SQL_SELECT_SEQ, (id,)):
+                    raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
+                return False
+            self.__tandai_tulis()
+        if self._pengamat:
+            self._beritahu(self.get_by_id(id), "status", status_lama, status_baru)
+        return True
+
+    def compare_and_update(self, id: str, versi_diharapkan: int, status_baru: str) -> int:
+        """
+        Mengubah status dengan UPDATE bersyarat versi.
+
+        Kondisi versi diperiksa oleh database sehingga tetap benar ketika
+        beberapa proses menulis ke file database yang sama.
+
+        Args:
+            id (str): ID limbah.
+            versi_diharapkan (int): Versi record saat dibaca.
+            status_baru (str): Status tujuan.
+
+        Returns:
+            int: Versi record setelah perubahan.
+
+        Raises:
+            KonflikVersiError: Jika versi record sudah berbeda.
+            ValueError: Jika status tidak dikenal atau transisi tidak diizinkan.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        baru = StatusLimbah.dari(status_baru)
+        with self.__kunci:
+            baris = self.__conn.execute(_SQL_SELECT_VERSI, (id,)).fetchone()
+            if baris is None:
+                raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
+            status_lama, versi = baris
+            if versi != versi_diharapkan:
+                raise KonflikVersiError(id, versi_diharapkan, versi)
+            StatusLimbah.dari(status_lama).validasi_transisi(baru)
+            if not self.__conn.execute(_SQL_CAS_VERSI, (baru.label, id, versi_diharapkan)).rowcount:
+                versi = self.__conn.execute(_SQL_SELECT_VERSI, (id,)).fetchone()[1]
+                raise KonflikVersiError(id, versi_diharapkan, versi)
+            self.__tandai_tulis()
+        if self._pengamat:
+            self._beritahu(self.get_by_id(id), "status", status_lama, baru.label)
+        return versi_diharapkan + 1
+
+    def commit(self) -> None:
+        """
+        Meng-commit seluruh penulisan yang masih tertunda dalam batch.
+        """
+        with self.__kunci:
+            self.__conn.commit()
+            self.__tertunda = 0
+
+    def close(self) -> None:
+        """
+        Meng-commit batch terakhir lalu menutup koneksi database.
+        """
+        with self.__kunci:
+            self.commit()
+            self.__conn.close()
+
+    def __migrasi(self) -> None:
+        """
+        Menambahkan kolom dibuat_pada dan versi pada database format lama.
+
+        Baris lama diberi waktu migrasi sebagai waktu registrasinya agar
+        nilainya tetap stabil setiap kali dimuat, dan versi 0.
+        """
+        kolom = {baris[1] for baris in self.__conn.execute("PRAGMA table_info(limbah)")}
+        if "dibuat_pada" not in kolom:
+            alter, isi = _SQL_MIGRASI_DIBUAT_PADA
+            self.__conn.execute(alter)
+            self.__conn.execute(isi, (time.time(),))
+        if "versi" not in kolom:
+            self.__conn.execute(_SQL_MIGRASI_VERSI)
+
+    def __cari_jenis(self, jenis: type, status: Optional[str]) -> list[Limbah]:
+        """
+        Menjalankan query berdasarkan kode jenis dan status opsional.
+
+        Args:
+            jenis (type): Kelas limbah.
+            status (Optional[str]): Status limbah, atau None.
+
+        Returns:
+            list[Limbah]: Daftar limbah yang sesuai.
+        """
+        kode = kode_jenis_untuk(jenis)
+        if not kode:
+            return []
+        sql = f"SELECT {_KOLOM} FROM limbah WHERE jenis IN ({', '.join('?' * len(kode))})"
+        parameter: list[Any] = list(kode)
+        if status is not None:
+            sql += " AND status = ?"
+            parameter.append(status)
+        return self.__ke_objek(self.__jalankan(sql + " ORDER BY seq", parameter))
+
+    def __jalankan(self, sql: str, parameter=()) -> list[tuple]:
+        """
+        Menjalankan query baca di bawah kunci koneksi dan mengambil seluruh hasilnya.
+
+        Args:
+            sql (str): Statement SQL.
+            parameter: Parameter statement.
+
+        Returns:
+            list[tuple]: Baris hasil query.
+        """
+        with self.__kunci:
+            return self.__conn.execute(sql, parameter).fetchall()
+
+    def __ke_objek(self, daftar_baris) -> list[Limbah]:
+        """
+        Mengubah baris hasil query menjadi objek limbah yang diamati repository.
+
+        Args:
+            daftar_baris: Iterable baris hasil query.
+
+        Returns:
+            list[Limbah]: Daftar objek limbah.
+        """
+        hasil = []
+        for baris in daftar_baris:
+            limbah = dari_baris(baris)
+            limbah.tambah_pengamat(self.__on_perubahan)
+            hasil.append(limbah)
+        return hasil
+
+    def __tandai_tulis(self) -> None:
+        """
+        Menghitung penulisan tertunda dan commit jika batch sudah penuh.
+
+        Pemanggil wajib memegang kunci koneksi.
+        """
+        self.__tertunda += 1
+        if self.__tertunda >= self.__ukuran_batch:
+            self.commit()
+
+    def __on_perubahan(self, limbah: Limbah, atribut: str, lama: Any, baru: Any) -> None:
+        """
+        Menulis perubahan status/volume objek limbah ke database lalu
+        meneruskannya ke pengamat repository.
+
+        Penulisan bersyarat versi: setter sudah menaikkan versi objek,
+        sehingga baris hanya diubah jika versinya masih get_versi() - 1.
+
+        Args:
+            limbah (Limbah): Objek limbah yang berubah.
+            atribut (str): Nama atribut yang berubah.
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+
+        Raises:
+            KonflikVersiError: Jika baris sudah diubah lewat objek atau proses
+                lain; perubahan tidak ditulis dan objek harus dibaca ulang.
+        """
+        if atribut == "status":
+            sql = _SQL_UPDATE_STATUS
+        elif atribut == "volume":
+            sql = _SQL_UPDATE_VOLUME
+        else:
+            return
+        id = limbah.get_id()
+        versi_dibaca = limbah.get_versi() - 1
+        with self.__kunci:
+            if not self.__conn.execute(sql, (baru, id, versi_dibaca)).rowcount:
+                baris = self.__conn.execute(_SQL_SELECT_VERSI, (id,)).fetchone()
+                if baris is None:
+                    raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
+                # Objek ditandai usang agar perubahan berikutnya juga ditolak,
+                # meskipun versinya kebetulan menyusul versi baris.
+                limbah._pulihkan_versi(VERSI_USANG)
+                raise KonflikVersiError(id, versi_dibaca, baris[1])
+            self.__tandai_tulis()
+        if self._pengamat:
+            self._beritahu(limbah, atribut, lama, baru)
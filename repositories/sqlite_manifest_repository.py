@@ -0,0 +1,213 @@
+import sqlite3
+import threading
+from typing import Any, Optional
+
+from repositories.manifest_repository import ManifestRepository, Waktu
+from utils.date_helper import ke_iso
+
+_KOLOM = ", ".join(ManifestRepository.KOLOM)
+
+_SQL_SKEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS manifest (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        id_limbah TEXT NOT NULL,
+        volume REAL NOT NULL,
+        status_baru TEXT NOT NULL,
+        kendaraan TEXT NOT NULL,
+        tujuan TEXT NOT NULL,
+        id_petugas TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_manifest_limbah ON manifest (id_limbah, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_manifest_kendaraan ON manifest (kendaraan, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_manifest_tujuan ON manifest (tujuan, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_manifest_timestamp ON manifest (timestamp)",
+)
+_SQL_MIGRASI_PETUGAS = "ALTER TABLE manifest ADD COLUMN id_petugas TEXT"
+_SQL_INSERT = f"INSERT INTO manifest ({_KOLOM}) VALUES ({', '.join('?' * len(ManifestRepository.KOLOM))})"
+_SQL_SELECT_LIMBAH = f"SELECT {_KOLOM} FROM manifest WHERE id_limbah = ? ORDER BY timestamp, seq"
+_SQL_COUNT = "SELECT COUNT(*) FROM manifest"
+
+
+class SqliteManifestRepository(ManifestRepository):
+    """
+    Repository manifest pengangkutan persisten berbasis SQLite.
+
+    Satu baris per limbah yang diangkut. Index (id_limbah, timestamp),
+    (kendaraan, timestamp), (tujuan, timestamp), dan (timestamp) membuat
+    pencarian riwayat limbah dan rentang waktu per kendaraan/tujuan
+    berjalan lewat index tanpa memindai seluruh tabel, termasuk pada
+    jutaan catatan. Timestamp disimpan sebagai string ISO sehingga urutan
+    teks sama dengan urutan waktu.
+
+    Seperti SqliteLimbahRepository: journal_mode WAL, commit per batch,
+    dan koneksi dipakai bersama banyak thread di bawah kunci internal.
+    Panggil commit() atau close() untuk memastikan batch terakhir tersimpan.
+    """
+
+    def __init__(self, path: str = ":memory:", ukuran_batch: int = 1000):
+        """
+        Inisialisasi koneksi dan skema database.
+
+        Args:
+            path (str): Lokasi file database SQLite (default in-memory).
+            ukuran_batch (int): Jumlah catatan sebelum commit otomatis.
+
+        Raises:
+            ValueError: Jika ukuran_batch < 1.
+        """
+        if ukuran_batch < 1:
+            raise ValueError("Ukuran batch minimal 1")
+        self.__ukuran_batch = ukuran_batch
+        self.__tertunda = 0
+        self.__kunci = threading.RLock()
+        self.__conn = sqlite3.connect(path, check_same_thread=False, cached_statements=64)
+        self.__conn.execute("PRAGMA journal_mode=WAL")
+        self.__conn.execute("PRAGMA synchronous=NORMAL")
+        for sql in _SQL_SKEMA:
+            self.__conn.execute(sql)
+        self.__migrasi()
+        self.__conn.commit()
+
+    def __len__(self) -> int:
+        """
+        Mengambil jumlah catatan tersimpan.
+
+        Returns:
+            int: Jumlah catatan.
+        """
+        return self.__jalankan(_SQL_COUNT)[0][0]
+
+    def save(self, catatan: dict) -> None:
+        """
+        Menambahkan satu catatan pengangkutan.
+
+        Args:
+            catatan (dict): Catatan dengan kunci sesuai KOLOM.
+
+        Raises:
+            ValueError: Jika ada kunci yang hilang atau timestamp tidak valid.
+        """
+        self.save_many([catatan])
+
+    def save_many(self, daftar_catatan: list[dict]) -> None:
+        """
+        Menambahkan banyak catatan dengan satu executemany.
+
+        Semua catatan divalidasi lebih dulu sehingga tidak ada yang tersimpan
+        jika salah satunya tidak valid.
+
+        Args:
+            daftar_catatan (list[dict]): Catatan yang akan ditambahkan.
+
+        Raises:
+            ValueError: Jika ada catatan yang tidak valid.
+        """
+        daftar_baris = [self._validasi(catatan) for catatan in daftar_catatan]
+        with self.__kunci:
+            self.__conn.executemany(_SQL_INSERT, daftar_baris)
+            self.__tertunda += len(daftar_baris)
+            if self.__tertunda >= self.__ukuran_batch:
+                self.commit()
+
+    def find_by_limbah(self, id_limbah: str) -> list[dict]:
+        """
+        Mengambil riwayat pengangkutan satu limbah melalui index (id_limbah, timestamp).
+
+        Args:
+            id_limbah (str): ID limbah.
+
+        Returns:
+            list[dict]: Catatan terurut berdasarkan timestamp.
+        """
+        return self.__ke_dict(self.__jalankan(_SQL_SELECT_LIMBAH, (id_limbah,)))
+
+    def find(
+        self,
+        kendaraan: Optional[str] = None,
+        tujuan: Optional[str] = None,
+        mulai: Waktu = None,
+        sampai: Waktu = None,
+    ) -> list[dict]:
+        """
+        Mencari catatan dengan satu query berindex sesuai filter yang diberikan.
+
+        Args:
+            kendaraan (Optional[str]): Nama kendaraan.
+            tujuan (Optional[str]): Tujuan pengangkutan.
+            mulai (str | datetime | None): Batas awal timestamp.
+            sampai (str | datetime | None): Batas akhir timestamp.
+
+        Returns:
+            list[dict]: Catatan terurut berdasarkan timestamp.
+
+        Raises:
+            ValueError: Jika batas waktu bukan format ISO yang valid.
+        """
+        syarat = []
+        parameter: list[Any] = []
+        for kolom, operator, nilai in (
+            ("kendaraan", "=", kendaraan),
+            ("tujuan", "=", tujuan),
+            ("timestamp", ">=", ke_iso(mulai)),
+            ("timestamp", "<=", ke_iso(sampai)),
+        ):
+            if nilai is not None:
+                syarat.append(f"{kolom} {operator} ?")
+                parameter.append(nilai)
+        sql = f"SELECT {_KOLOM} FROM manifest"
+        if syarat:
+            sql += " WHERE " + " AND ".join(syarat)
+        return self.__ke_dict(self.__jalankan(sql + " ORDER BY timestamp, seq", parameter))
+
+    def commit(self) -> None:
+        """
+        Meng-commit seluruh catatan yang masih tertunda dalam batch.
+        """
+        with self.__kunci:
+            self.__conn.commit()
+            self.__tertunda = 0
+
+    def close(self) -> None:
+        """
+        Meng-commit batch terakhir lalu menutup koneksi database.
+        """
+        with self.__kunci:
+            self.commit()
+            self.__conn.close()
+
+    def __migrasi(self) -> None:
+        """
+        Menambahkan kolom id_petugas pada database format lama; catatan lama bernilai NULL.
+        """
+        kolom = {baris[1] for baris in self.__conn.execute("PRAGMA table_info(manifest)")}
+        if "id_petugas" not in kolom:
+            self.__conn.execute(_SQL_MIGRASI_PETUGAS)
+
+    def __jalankan(self, sql: str, parameter=()) -> list[tuple]:
+        """
+        Menjalankan query baca di bawah kunci koneksi dan mengambil seluruh hasilnya.
+
+        Args:
+            sql (str): Statement SQL.
+            parameter: Parameter statement.
+
+        Returns:
+            list[tuple]: Baris hasil query.
+        """
+        with self.__kunci:
+            return self.__conn.execute(sql, parameter).fetchall()
+
+    def __ke_dict(self, daftar_baris: list[tuple]) -> list[dict]:
+        """
+        Mengubah baris hasil query menjadi dict catatan.
+
+        Args:
+            daftar_baris (list[tuple]): Baris hasil query.
+
+        Returns:
+            list[dict]: Daftar catatan.
+        """
+        return [dict(zip(self.KOLOM, baris)) for baris in daftar_baris]
@@ -0,0 +1,148 @@
+import heapq
+import itertools
+import threading
+from typing import Any, Optional
+
+from models.limbah import Limbah
+from models.status_limbah import StatusLimbah
+from repositories.limbah_repository import LimbahRepository
+
+
+class AntrianRisiko:
+    """
+    Antrian prioritas limbah yang menunggu diangkut, diurutkan dari risiko tertinggi.
+
+    Hanya limbah berstatus "Terdaftar" yang berada di antrian. Antrian
+    dipelihara dari peristiwa repository:
+    - "simpan": limbah baru dimasukkan
+    - "volume": prioritas diperbarui sesuai risiko baru
+    - "status": limbah keluar dari antrian ketika diangkut atau diproses
+
+    Disimpan sebagai binary heap dengan penghapusan malas: pembaruan
+    menambah entri baru dan entri lama ditandai usang lewat nomor versi.
+    Heap dipadatkan ulang jika entri usang lebih banyak dari entri aktif.
+    pop_berikut() O(log n), peek_top_k(k) O(k log n).
+    """
+
+    def __init__(self, limbah_repository: LimbahRepository):
+        """
+        Inisialisasi antrian, berlangganan peristiwa repository, lalu
+        memuat limbah "Terdaftar" yang sudah tersimpan.
+
+        Args:
+            limbah_repository (LimbahRepository): repository sumber peristiwa.
+        """
+        self.__kunci = threading.Lock()
+        self.__heap: list[tuple[float, int, str]] = []
+        self.__versi: dict[str, int] = {}
+        self.__nomor = itertools.count()
+        with self.__kunci:
+            limbah_repository.tambah_pengamat(self.__on_peristiwa)
+            for limbah in limbah_repository.find_by_status(StatusLimbah.TERDAFTAR.label):
+                self.__masukkan(limbah.get_id(), limbah.hitung_risiko())
+
+    def __len__(self) -> int:
+        """
+        Mengambil jumlah limbah di antrian.
+
+        Returns:
+            int: Jumlah limbah yang menunggu diangkut.
+        """
+        return len(self.__versi)
+
+    def pop_berikut(self) -> Optional[tuple[str, float]]:
+        """
+        Mengeluarkan limbah dengan risiko tertinggi dari antrian.
+
+        Status limbah tidak diubah. Limbah yang dikeluarkan dianggap sedang
+        ditangani pemanggil dan tidak kembali ke antrian, termasuk jika
+        volumenya berubah; peristiwa "volume" hanya memperbarui limbah yang
+        masih di antrian.
+
+        Returns:
+            Optional[tuple[str, float]]: (ID limbah, risiko), atau None jika antrian kosong.
+        """
+        with self.__kunci:
+            while self.__heap:
+                negatif_risiko, nomor, id = heapq.heappop(self.__heap)
+                if self.__versi.get(id) == nomor:
+                    del self.__versi[id]
+                    return id, -negatif_risiko
+            return None
+
+    def peek_top_k(self, k: int) -> list[tuple[str, float]]:
+        """
+        Melihat k limbah dengan risiko tertinggi tanpa mengeluarkannya.
+
+        Menelusuri heap secara best-first dari akar memakai heap bantu,
+        sehingga biaya O(k log n) tanpa mengurutkan seluruh antrian.
+
+        Args:
+            k (int): Jumlah limbah yang diambil.
+
+        Returns:
+            list[tuple[str, float]]: (ID limbah, risiko) terurut dari risiko tertinggi.
+
+        Raises:
+            ValueError: Jika k < 0.
+        """
+        if k < 0:
+            raise ValueError("Jumlah k tidak boleh negatif")
+        hasil = []
+        with self.__kunci:
+            heap = self.__heap
+            if not heap:
+                return hasil
+            calon = [(heap[0], 0)]
+            while calon and len(hasil) < k:
+                (negatif_risiko, nomor, id), posisi = heapq.heappop(calon)
+                if self.__versi.get(id) == nomor:
+                    hasil.append((id, -negatif_risiko))
+                for anak in (2 * posisi + 1, 2 * posisi + 2):
+                    if anak < len(heap):
+                        heapq.heappush(calon, (heap[anak], anak))
+        return hasil
+
+    def __masukkan(self, id: str, risiko: float) -> None:
+        """
+        Memasukkan atau memperbarui prioritas limbah. Pemanggil memegang kunci.
+
+        Args:
+            id (str): ID limbah.
+            risiko (float): Risiko limbah.
+        """
+        nomor = next(self.__nomor)
+        self.__versi[id] = nomor
+        heapq.heappush(self.__heap, (-risiko, nomor, id))
+        self.__padatkan_jika_perlu()
+
+    def __padatkan_jika_perlu(self) -> None:
+        """
+        Membuang entri usang jika jumlahnya melebihi entri aktif. Pemanggil memegang kunci.
+        """
+        if len(self.__heap) > 2 * len(self.__versi) + 64:
+            self.__heap = [entri for entri in self.__heap if self.__versi.get(entri[2]) == entri[1]]
+            heapq.heapify(self.__heap)
+
+    def __on_peristiwa(self, limbah: Limbah, peristiwa: str, lama: Any, baru: Any) -> None:
+        """
+        Memperbarui antrian berdasarkan peristiwa repository.
+
+        Args:
+            limbah (Limbah): Limbah yang terkait peristiwa.
+            peristiwa (str): "simpan", "status", atau "volume".
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+        """
+        id = limbah.get_id()
+        menunggu = limbah.get_kode_status() == StatusLimbah.TERDAFTAR
+        with self.__kunci:
+            if peristiwa == LimbahRepository.PERISTIWA_SIMPAN:
+                if menunggu:
+                    self.__masukkan(id, limbah.hitung_risiko())
+            elif peristiwa == "volume":
+                if id in self.__versi:
+                    self.__masukkan(id, limbah.hitung_risiko())
+            elif peristiwa == "status" and not menunggu:
+                if self.__versi.pop(id, None) is not None:
+                    self.__padatkan_jika_perlu()
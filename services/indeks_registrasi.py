@@ -0,0 +1,337 @@
+import logging
+import math
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Optional, Union
+
+from models.limbah import Limbah
+from repositories.limbah_repository import LimbahRepository
+from services.pengisian_awal import PengisianAwal
+
+logger = logging.getLogger(__name__)
+
+Waktu = Union[float, datetime]
+
+
+class IndeksRegistrasi:
+    """
+    Index waktu registrasi limbah dalam bucket per menit dan per jam.
+
+    Setiap bucket menyimpan jumlah, total volume, dan total risiko per
+    jenis (kelas) limbah berdasarkan get_detik_dibuat(). Index diperbarui
+    dari peristiwa repository:
+    - "simpan": limbah ditambahkan ke bucket waktu registrasinya
+    - "volume": selisih volume dan risiko ditambahkan; risiko lama dihitung
+      dari risiko baru dikali volume_lama / volume_baru karena seluruh
+      rumus hitung_risiko() linear terhadap volume
+    - "status": tidak memengaruhi index
+
+    Kueri rentang memakai bucket jam untuk jam penuh di tengah rentang dan
+    bucket menit di kedua ujungnya, sehingga biayanya sebanding dengan
+    jumlah bucket terisi di rentang tersebut, bukan jumlah limbah.
+    Resolusi kueri adalah satu menit: batas rentang dibulatkan keluar ke
+    menit penuh.
+
+    Seperti AgregatRisiko, peristiwa selama pengisian dari iter_all()
+    disaring PengisianAwal agar tidak dihitung dua kali.
+    """
+
+    MENIT = 60
+    JAM = 3600
+
+    def __init__(self, limbah_repository: LimbahRepository):
+        """
+        Inisialisasi index, berlangganan peristiwa repository, lalu
+        memuat limbah yang sudah tersimpan.
+
+        Args:
+            limbah_repository (LimbahRepository): repository sumber peristiwa.
+        """
+        self.__limbah_repository = limbah_repository
+        self.__kunci = threading.Lock()
+        self.__bucket: dict[int, dict[int, dict[type, list]]] = {}
+        self.__urutan: dict[int, list[int]] = {}
+        self.__pengisian = PengisianAwal(self.__terapkan)
+        self.__pengisian.mulai()
+        limbah_repository.tambah_pengamat(self.__on_peristiwa)
+        self.__isi_ulang()
+
+    def rentang(self, mulai: Waktu, sampai: Waktu, jenis: Optional[type] = None) -> dict:
+        """
+        Menghitung registrasi dalam rentang waktu [mulai, sampai).
+
+        Args:
+            mulai (float | datetime): Awal rentang (detik epoch atau datetime).
+            sampai (float | datetime): Akhir rentang (eksklusif).
+            jenis (Optional[type]): Kelas limbah sebagai filter, misal LimbahMedis.
+
+        Returns:
+            dict: {"jumlah", "volume", "risiko"}.
+
+        Raises:
+            ValueError: Jika sampai lebih awal dari mulai.
+        """
+        awal, akhir = self.__ke_detik(mulai), self.__ke_detik(sampai)
+        if akhir < awal:
+            raise ValueError("Akhir rentang tidak boleh lebih awal dari awal rentang")
+        menit_awal = math.floor(awal / self.MENIT)
+        menit_akhir = math.ceil(akhir / self.MENIT)
+        per_jam = self.JAM // self.MENIT
+        jam_awal = -(-menit_awal // per_jam)
+        jam_akhir = menit_akhir // per_jam
+
+        total = [0, 0.0, 0.0]
+        with self.__kunci:
+            if jam_awal < jam_akhir:
+                self.__jumlahkan(total, self.MENIT, menit_awal, jam_awal * per_jam, jenis)
+                self.__jumlahkan(total, self.JAM, jam_awal, jam_akhir, jenis)
+                self.__jumlahkan(total, self.MENIT, jam_akhir * per_jam, menit_akhir, jenis)
+            else:
+                self.__jumlahkan(total, self.MENIT, menit_awal, menit_akhir, jenis)
+        return {"jumlah": total[0], "volume": total[1], "risiko": total[2]}
+
+    def laju(self, jendela: float = 3600.0, jenis: Optional[type] = None, sekarang: Optional[Waktu] = None) -> dict:
+        """
+        Menghitung registrasi pada jendela waktu bergulir yang berakhir sekarang.
+
+        Contoh: berapa kg limbah medis masuk satu jam terakhir ->
+        laju(3600, LimbahMedis)["volume"].
+
+        Args:
+            jendela (float): Panjang jendela (detik).
+            jenis (Optional[type]): Kelas limbah sebagai filter.
+            sekarang (float | datetime | None): Akhir jendela; default waktu saat ini.
+
+        Returns:
+            dict: {"jumlah", "volume", "risiko", "kg_per_jam"}.
+
+        Raises:
+            ValueError: Jika jendela <= 0.
+        """
+        if jendela <= 0:
+            raise ValueError("Jendela waktu harus lebih dari 0")
+        akhir = time.time() if sekarang is None else self.__ke_detik(sekarang)
+        hasil = self.rentang(akhir - jendela, akhir, jenis)
+        hasil["kg_per_jam"] = hasil["volume"] * self.JAM / jendela
+        return hasil
+
+    def deret(
+        self, mulai: Waktu, sampai: Waktu, resolusi: int = MENIT, jenis: Optional[type] = None
+    ) -> list[dict]:
+        """
+        Mengambil deret waktu bucket terisi dalam rentang [mulai, sampai).
+
+        Args:
+            mulai (float | datetime): Awal rentang.
+            sampai (float | datetime): Akhir rentang (eksklusif).
+            resolusi (int): IndeksRegistrasi.MENIT atau IndeksRegistrasi.JAM.
+            jenis (Optional[type]): Kelas limbah sebagai filter.
+
+        Returns:
+            list[dict]: [{"waktu": datetime awal bucket, "jumlah", "volume", "risiko"}] terurut waktu.
+
+        Raises:
+            ValueError: Jika resolusi tidak dikenal.
+        """
+        if resolusi not in (self.MENIT, self.JAM):
+            raise ValueError(f"Resolusi harus {self.MENIT} (menit) atau {self.JAM} (jam)")
+        awal = math.floor(self.__ke_detik(mulai) / resolusi)
+        akhir = math.ceil(self.__ke_detik(sampai) / resolusi)
+        hasil = []
+        with self.__kunci:
+            urutan = self.__urutan.get(resolusi, [])
+            bucket = self.__bucket.get(resolusi, {})
+            for i in range(bisect_left(urutan, awal), bisect_left(urutan, akhir)):
+                total = [0, 0.0, 0.0]
+                self.__tambahkan_bucket(total, bucket[urutan[i]], jenis)
+                if total[0]:
+                    hasil.append({
+                        "waktu": datetime.fromtimestamp(urutan[i] * resolusi),
+                        "jumlah": total[0], "volume": total[1], "risiko": total[2],
+                    })
+        return hasil
+
+    def verifikasi(self, toleransi: float = 1e-6) -> bool:
+        """
+        Memeriksa index terhadap pembangunan ulang penuh dari repository.
+
+        Args:
+            toleransi (float): Toleransi relatif dan absolut untuk volume/risiko.
+
+        Returns:
+            bool: True jika seluruh bucket sesuai.
+        """
+        acuan: dict[int, dict[int, dict[type, list]]] = {}
+        for limbah in self.__limbah_repository.iter_all():
+            for resolusi in (self.MENIT, self.JAM):
+                isi = acuan.setdefault(resolusi, {}).setdefault(math.floor(limbah.get_detik_dibuat() / resolusi), {})
+                nilai = isi.setdefault(type(limbah), [0, 0.0, 0.0])
+                nilai[0] += 1
+                nilai[1] += limbah.get_volume()
+                nilai[2] += limbah.hitung_risiko()
+        with self.__kunci:
+            sesuai = self.__bucket_sama(self.__bucket, acuan, toleransi)
+        if not sesuai:
+            logger.warning("Index registrasi tidak konsisten dengan repository")
+        return sesuai
+
+    def bangun_ulang(self) -> None:
+        """
+        Membangun ulang index dari repository (misal untuk koreksi drift float).
+        """
+        self.__pengisian.mulai()
+        self.__isi_ulang()
+
+    def __isi_ulang(self) -> None:
+        """
+        Mengosongkan index lalu mengisinya dari repository. Pemanggil sudah
+        memanggil mulai() pada penyaring pengisian.
+        """
+        with self.__kunci:
+            self.__bucket.clear()
+            self.__urutan.clear()
+            for limbah in self.__limbah_repository.iter_all():
+                self.__pengisian.catat(limbah)
+                self.__tambah(limbah.get_detik_dibuat(), type(limbah), 1, limbah.get_volume(), limbah.hitung_risiko())
+        self.__pengisian.selesai()
+
+    def __tambah(self, detik: float, jenis: type, jumlah: int, volume: float, risiko: float) -> None:
+        """
+        Menambahkan nilai ke bucket menit dan jam yang memuat detik tertentu.
+
+        Args:
+            detik (float): Waktu registrasi (detik epoch).
+            jenis (type): Kelas limbah.
+            jumlah (int): Selisih jumlah limbah.
+            volume (float): Selisih volume.
+            risiko (float): Selisih risiko.
+        """
+        for resolusi in (self.MENIT, self.JAM):
+            kunci = math.floor(detik / resolusi)
+            bucket = self.__bucket.setdefault(resolusi, {})
+            isi = bucket.get(kunci)
+            if isi is None:
+                isi = bucket[kunci] = {}
+                urutan = self.__urutan.setdefault(resolusi, [])
+                if not urutan or kunci > urutan[-1]:
+                    urutan.append(kunci)
+                else:
+                    insort(urutan, kunci)
+            nilai = isi.get(jenis)
+            if nilai is None:
+                nilai = isi[jenis] = [0, 0.0, 0.0]
+            nilai[0] += jumlah
+            nilai[1] += volume
+            nilai[2] += risiko
+
+    def __jumlahkan(self, total: list, resolusi: int, awal: int, akhir: int, jenis: Optional[type]) -> None:
+        """
+        Menjumlahkan bucket terisi dengan kunci awal <= kunci < akhir. Pemanggil memegang kunci.
+
+        Args:
+            total (list): Akumulator [jumlah, volume, risiko].
+            resolusi (int): Resolusi bucket (detik).
+            awal (int): Kunci bucket awal.
+            akhir (int): Kunci bucket akhir (eksklusif).
+            jenis (Optional[type]): Kelas limbah sebagai filter.
+        """
+        urutan = self.__urutan.get(resolusi, [])
+        bucket = self.__bucket.get(resolusi, {})
+        for i in range(bisect_left(urutan, awal), bisect_left(urutan, akhir)):
+            self.__tambahkan_bucket(total, bucket[urutan[i]], jenis)
+
+    @staticmethod
+    def __tambahkan_bucket(total: list, isi: dict[type, list], jenis: Optional[type]) -> None:
+        """
+        Menambahkan isi satu bucket ke akumulator.
+
+        Args:
+            total (list): Akumulator [jumlah, volume, risiko].
+            isi (dict[type, list]): Nilai bucket per kelas limbah.
+            jenis (Optional[type]): Kelas limbah sebagai filter.
+        """
+        for kelas, (jumlah, volume, risiko) in isi.items():
+            if jenis is None or issubclass(kelas, jenis):
+                total[0] += jumlah
+                total[1] += volume
+                total[2] += risiko
+
+    @staticmethod
+    def __ke_detik(waktu: Waktu) -> float:
+        """
+        Mengubah datetime atau detik epoch menjadi detik epoch.
+
+        Args:
+            waktu (float | datetime): Waktu.
+
+        Returns:
+            float: Detik epoch.
+        """
+        return waktu.timestamp() if isinstance(waktu, datetime) else float(waktu)
+
+    @staticmethod
+    def __bucket_sama(a: dict, b: dict, toleransi: float) -> bool:
+        """
+        Membandingkan dua struktur bucket secara rekursif dengan toleransi float.
+
+        Args:
+            a (dict): Bucket pertama.
+            b (dict): Bucket kedua.
+            toleransi (float): Toleransi perbandingan.
+
+        Returns:
+            bool: True jika seluruh bucket sesuai.
+        """
+        for resolusi in set(a) | set(b):
+            per_a, per_b = a.get(resolusi, {}), b.get(resolusi, {})
+            if set(per_a) != set(per_b):
+                return False
+            for kunci, isi_a in per_a.items():
+                isi_b = per_b[kunci]
+                if set(isi_a) != set(isi_b):
+                    return False
+                for kelas, (jumlah, volume, risiko) in isi_a.items():
+                    acuan = isi_b[kelas]
+                    if jumlah != acuan[0]:
+                        return False
+                    if not all(math.isclose(x, y, rel_tol=toleransi, abs_tol=toleransi)
+                               for x, y in ((volume, acuan[1]), (risiko, acuan[2]))):
+                        return False
+        return True
+
+    def __on_peristiwa(self, limbah: Limbah, peristiwa: str, lama: Any, baru: Any) -> None:
+        """
+        Memperbarui index berdasarkan peristiwa repository.
+
+        Args:
+            limbah (Limbah): Limbah yang terkait peristiwa.
+            peristiwa (str): "simpan", "status", atau "volume".
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+        """
+        if peristiwa == LimbahRepository.PERISTIWA_SIMPAN:
+            self.__pengisian.terima(
+                limbah, peristiwa, limbah.get_detik_dibuat(), type(limbah), 1, limbah.get_volume(), limbah.hitung_risiko()
+            )
+        elif peristiwa == "volume":
+            risiko = limbah.hitung_risiko()
+            self.__pengisian.terima(
+                limbah, peristiwa, limbah.get_detik_dibuat(), type(limbah), 0, baru - lama, risiko - risiko * lama / baru
+            )
+
+    def __terapkan(self, peristiwa: str, detik: float, jenis: type, jumlah: int, volume: float, risiko: float) -> None:
+        """
+        Menerapkan satu peristiwa ke index.
+
+        Args:
+            peristiwa (str): "simpan" atau "volume".
+            detik (float): Waktu registrasi limbah (detik epoch).
+            jenis (type): Kelas limbah.
+            jumlah (int): Selisih jumlah limbah.
+            volume (float): Selisih volume.
+            risiko (float): Selisih risiko.
+        """
+        with self.__kunci:
+            self.__tambah(detik, jenis, jumlah, volume, risiko)
@@ -0,0 +1,252 @@
+import logging
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from models.limbah import Limbah
+from repositories.limbah_repository import LimbahRepository
+from services.risiko_agregat import AgregatRisiko
+from services.tampilan_agregat import KunciGrup, TampilanAgregat
+
+logger = logging.getLogger(__name__)
+
+
+class LaporanService:
+    """
+    Service laporan manajemen berbasis materialized view group-by.
+
+    Setiap tampilan berisi jumlah, total volume, dan total risiko per grup
+    dan diperbarui dari peristiwa repository (simpan, perubahan status,
+    perubahan volume), sehingga pembacaan tidak perlu mengiterasi seluruh
+    limbah.
+
+    Tampilan bawaan:
+    - "jenis": nama kelas limbah, dibaca dari AgregatRisiko
+    - "status": label status limbah, dibaca dari AgregatRisiko
+    - "lokasi": nama lokasi bencana, jika fungsi lokasi_limbah diberikan
+
+    Tampilan lain (termasuk "lokasi") memakai TampilanAgregat yang
+    menyimpan kontribusi per limbah karena kuncinya bisa bergantung pada
+    data di luar peristiwa repository.
+
+    Limbah tidak menyimpan lokasinya sendiri, sehingga pengelompokan per
+    lokasi memakai fungsi pemetaan ID limbah -> lokasi dari pemanggil.
+    Jika pemetaan berubah tanpa peristiwa repository, panggil segarkan().
+    """
+
+    TAMPILAN_JENIS = "jenis"
+    TAMPILAN_STATUS = "status"
+    TAMPILAN_LOKASI = "lokasi"
+
+    def __init__(
+        self,
+        limbah_repository: LimbahRepository,
+        lokasi_limbah: Optional[Callable[[str], Optional[str]]] = None,
+        agregat_risiko: Optional[AgregatRisiko] = None,
+    ):
+        """
+        Inisialisasi LaporanService beserta tampilan bawaan.
+
+        Args:
+            limbah_repository (LimbahRepository): repository sumber peristiwa.
+            lokasi_limbah (Optional[Callable[[str], Optional[str]]]): Fungsi
+                ID limbah -> nama lokasi; None jika tidak ada tampilan lokasi.
+            agregat_risiko (Optional[AgregatRisiko]): Agregat atas repository
+                yang sama untuk tampilan "jenis" dan "status", misal dari
+                LimbahService.get_agregat_risiko(); None untuk membuat sendiri.
+        """
+        self.__limbah_repository = limbah_repository
+        self.__agregat_risiko = agregat_risiko if agregat_risiko is not None else AgregatRisiko(limbah_repository)
+        self.__kunci = threading.Lock()
+        self.__bawaan: dict[str, Callable[[], dict]] = {
+            self.TAMPILAN_JENIS: self.__agregat_risiko.grup_jenis,
+            self.TAMPILAN_STATUS: self.__agregat_risiko.grup_status,
+        }
+        self.__tampilan: dict[str, TampilanAgregat] = {}
+        limbah_repository.tambah_pengamat(self.__on_peristiwa)
+        if lokasi_limbah is not None:
+            self.daftarkan_tampilan(self.TAMPILAN_LOKASI, lambda limbah: lokasi_limbah(limbah.get_id()))
+
+    def daftarkan_tampilan(self, nama: str, kunci: KunciGrup) -> None:
+        """
+        Mendaftarkan tampilan group-by baru dan membangunnya dari data yang sudah tersimpan.
+
+        Args:
+            nama (str): Nama tampilan.
+            kunci (Callable[[Limbah], Hashable]): Fungsi pengelompokan limbah.
+
+        Raises:
+            ValueError: Jika nama kosong atau sudah terdaftar.
+        """
+        if not isinstance(nama, str) or not nama.strip():
+            raise ValueError("Nama tampilan wajib string dan tidak boleh kosong")
+        tampilan = TampilanAgregat(nama, kunci)
+        with self.__kunci:
+            if nama in self.__bawaan or nama in self.__tampilan:
+                raise ValueError(f"Tampilan '{nama}' sudah terdaftar")
+            tampilan.isi_ulang(self.__limbah_repository.iter_all())
+            self.__tampilan[nama] = tampilan
+        logger.info("Tampilan laporan didaftarkan | nama=%s", nama)
+
+    def hapus_tampilan(self, nama: str) -> None:
+        """
+        Menghapus tampilan terdaftar.
+
+        Args:
+            nama (str): Nama tampilan.
+
+        Raises:
+            LookupError: Jika tampilan tidak ditemukan.
+        """
+        with self.__kunci:
+            if nama in self.__bawaan:
+                del self.__bawaan[nama]
+                return
+            self.__ambil(nama)
+            del self.__tampilan[nama]
+
+    def daftar_tampilan(self) -> list[str]:
+        """
+        Mengambil nama seluruh tampilan terdaftar.
+
+        Returns:
+            list[str]: Nama tampilan sesuai urutan pendaftaran.
+        """
+        with self.__kunci:
+            return [*self.__bawaan, *self.__tampilan]
+
+    def baca(self, nama: str) -> dict[Hashable, dict]:
+        """
+        Mengambil seluruh grup satu tampilan tanpa mengiterasi limbah.
+
+        Args:
+            nama (str): Nama tampilan.
+
+        Returns:
+            dict: Grup -> {"jumlah", "volume", "risiko"}.
+
+        Raises:
+            LookupError: Jika tampilan tidak ditemukan.
+        """
+        with self.__kunci:
+            bawaan = self.__bawaan.get(nama)
+            if bawaan is None:
+                return self.__ambil(nama).baca()
+        return bawaan()
+
+    def baca_grup(self, nama: str, grup: Hashable) -> dict:
+        """
+        Mengambil nilai satu grup tanpa mengiterasi limbah.
+
+        Args:
+            nama (str): Nama tampilan.
+            grup (Hashable): Kunci grup, misal "LimbahMedis" atau "Terdaftar".
+
+        Returns:
+            dict: {"jumlah", "volume", "risiko"}; bernilai nol jika grup kosong.
+
+        Raises:
+            LookupError: Jika tampilan tidak ditemukan.
+        """
+        with self.__kunci:
+            bawaan = self.__bawaan.get(nama)
+            nilai = self.__ambil(nama).baca_grup(grup) if bawaan is None else None
+        if bawaan is not None:
+            nilai = bawaan().get(grup)
+        return nilai if nilai is not None else {"jumlah": 0, "volume": 0.0, "risiko": 0.0}
+
+    def segarkan(self, id_limbah: str) -> None:
+        """
+        Menghitung ulang kontribusi satu limbah di seluruh tampilan
+        TampilanAgregat ("jenis" dan "status" selalu mengikuti peristiwa).
+
+        Dipakai ketika data di luar repository yang memengaruhi grup
+        (misal pemetaan lokasi) berubah.
+
+        Args:
+            id_limbah (str): ID limbah.
+
+        Raises:
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        limbah = self.__limbah_repository.get_by_id(id_limbah)
+        if limbah is None:
+            raise LookupError(f"Limbah dengan id '{id_limbah}' tidak ditemukan")
+        with self.__kunci:
+            for tampilan in self.__tampilan.values():
+                tampilan.perbarui(limbah)
+
+    def verifikasi(self, toleransi: float = 1e-6) -> bool:
+        """
+        Memeriksa seluruh tampilan terhadap hitung ulang penuh dari repository.
+
+        Args:
+            toleransi (float): Toleransi relatif perbandingan float.
+
+        Returns:
+            bool: True jika seluruh tampilan konsisten.
+        """
+        bawaan = self.__daftar_bawaan()
+        tidak_sesuai = bawaan if bawaan and not self.__agregat_risiko.verifikasi(toleransi) else []
+        with self.__kunci:
+            daftar_limbah = list(self.__limbah_repository.iter_all())
+            tidak_sesuai += [
+                nama for nama, tampilan in self.__tampilan.items()
+                if not tampilan.sama_dengan(tampilan.hitung_ulang(daftar_limbah), toleransi)
+            ]
+        if tidak_sesuai:
+            logger.warning("Tampilan laporan tidak konsisten | tampilan=%s", ", ".join(tidak_sesuai))
+        return not tidak_sesuai
+
+    def bangun_ulang(self) -> None:
+        """
+        Membangun ulang seluruh tampilan dari repository (misal untuk koreksi drift float).
+        """
+        if self.__daftar_bawaan():
+            self.__agregat_risiko.bangun_ulang()
+        with self.__kunci:
+            daftar_limbah = list(self.__limbah_repository.iter_all())
+            for tampilan in self.__tampilan.values():
+                tampilan.isi_ulang(daftar_limbah)
+        logger.info("Tampilan laporan dibangun ulang | jumlah_limbah=%d", len(daftar_limbah))
+
+    def __daftar_bawaan(self) -> list[str]:
+        """
+        Mengambil nama tampilan bawaan yang dibaca dari AgregatRisiko dan masih terdaftar.
+
+        Returns:
+            list[str]: Nama tampilan bawaan.
+        """
+        with self.__kunci:
+            return list(self.__bawaan)
+
+    def __ambil(self, nama: str) -> TampilanAgregat:
+        """
+        Mengambil tampilan berdasarkan nama. Pemanggil memegang kunci.
+
+        Args:
+            nama (str): Nama tampilan.
+
+        Returns:
+            TampilanAgregat: Tampilan yang diminta.
+
+        Raises:
+            LookupError: Jika tampilan tidak ditemukan.
+        """
+        tampilan = self.__tampilan.get(nama)
+        if tampilan is None:
+            raise LookupError(f"Tampilan '{nama}' tidak ditemukan")
+        return tampilan
+
+    def __on_peristiwa(self, limbah: Limbah, peristiwa: str, lama: Any, baru: Any) -> None:
+        """
+        Memperbarui seluruh tampilan TampilanAgregat untuk limbah yang disimpan atau berubah.
+
+        Args:
+            limbah (Limbah): Limbah yang terkait peristiwa.
+            peristiwa (str): "simpan", "status", atau "volume".
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+        """
+        with self.__kunci:
+            for tampilan in self.__tampilan.values():
+                tampilan.perbarui(limbah)
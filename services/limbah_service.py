@@ -1,13 +1,15 @@
+import heapq
 import logging
-from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 from models.limbah import Limbah
 from models.limbah_b3 import LimbahB3
 from models.limbah_medis import LimbahMedis
 from models.limbah_organik import LimbahOrganik
-from repositories.limbah_repository import LimbahRepository
-from utils.validator import validate_volume
+from repositories.limbah_repository import KonflikVersiError, LimbahRepository
+from services.risiko_agregat import AgregatRisiko
+from services.risiko_paralel import hitung_agregat_paralel
+from utils.validator import validate_status, validate_volume
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +21,15 @@ class LimbahService:
     - registrasi limbah berdasarkan jenisnya
     - validasi input sebelum membuat objek limbah
     - pengambilan data limbah dari penyimpanan
-    - perhitungan total risiko
-    - menjalankan proses pengolahan dan memperbarui status limbah
+    - perhitungan total risiko dan pencarian limbah berisiko tertinggi
+    - rekap risiko, volume, dan jumlah per jenis secara paralel (multi-proses)
+    - menjalankan proses pengolahan dan memperbarui status limbah dengan
+      optimistic concurrency (versi record); konflik dicoba ulang hingga
+      PERCOBAAN_KONFLIK kali
     """
 
+    PERCOBAAN_KONFLIK = 3
+
     def __init__(self, limbah_repository: LimbahRepository):
         """
         Inisialisasi LimbahService.
@@ -31,6 +38,7 @@ class LimbahService:
             limbah_repository (LimbahRepository): repository abstrak untuk penyimpanan limbah.
         """
         self.__limbah_repository = limbah_repository
+        self.__agregat_risiko = AgregatRisiko(limbah_repository)
 
     def __validate_id(self, id: str) -> None:
         """
@@ -135,8 +143,9 @@ class LimbahService:
         self.__limbah_repository.save(limbah)
 
         logger.info(
-            "Registrasi LimbahMedis sukses | id=%s volume=%.2f tingkat_infeksi=%d ts=%s",
-            id, volume, tingkat_infeksi, datetime.now().isoformat()
+            "Registrasi LimbahMedis sukses | id=%s volume=%.2f tingkat_infeksi=%d",
+            id, volume, tingkat_infeksi,
+            extra={"id": id, "volume": volume, "status": limbah.get_status()},
         )
         return limbah
 
@@ -163,8 +172,9 @@ class LimbahService:
         self.__limbah_repository.save(limbah)
 
         logger.info(
-            "Registrasi LimbahOrganik sukses | id=%s volume=%.2f tingkat_pembusukan=%d ts=%s",
-            id, volume, tingkat_pembusukan, datetime.now().isoformat()
+            "Registrasi LimbahOrganik sukses | id=%s volume=%.2f tingkat_pembusukan=%d",
+            id, volume, tingkat_pembusukan,
+            extra={"id": id, "volume": volume, "status": limbah.get_status()},
         )
         return limbah
 
@@ -191,28 +201,115 @@ class LimbahService:
         self.__limbah_repository.save(limbah)
 
         logger.info(
-            "Registrasi LimbahB3 sukses | id=%s volume=%.2f kandungan_kimia=%s ts=%s",
-            id, volume, kandungan_kimia, datetime.now().isoformat()
+            "Registrasi LimbahB3 sukses | id=%s volume=%.2f kandungan_kimia=%s",
+            id, volume, kandungan_kimia,
+            extra={"id": id, "volume": volume, "status": limbah.get_status()},
         )
         return limbah
 
-    def get_semua_limbah(self) -> list[Limbah]:
+    def registrasi_batch(self, daftar_baris: list[dict]) -> dict:
         """
-        Mencari limbah berdasarkan ID.
+        Registrasi banyak limbah campuran (Organik/Medis/B3) sekaligus.
+
+        Setiap baris berupa dict dengan kunci "jenis" ("organik", "medis",
+        atau "b3"), "id", "volume", serta kolom khusus jenisnya
+        ("tingkat_pembusukan", "tingkat_infeksi", atau "kandungan_kimia").
+        Seluruh baris divalidasi terlebih dahulu (termasuk ID ganda); baris
+        yang gagal dilaporkan tanpa membatalkan baris lain, lalu baris yang
+        valid disimpan dengan satu operasi save_many.
 
         Args:
-            id (str): ID limbah.
+            daftar_baris (list[dict]): Data limbah yang akan diregistrasi.
 
         Returns:
-            Optional[Limbah]: Objek limbah jika ditemukan, jika tidak maka None.
+            dict: {"berhasil": list[Limbah], "gagal": list[dict]}; setiap entri
+            gagal berisi "indeks", "id", dan "pesan".
+        """
+        berhasil: list[Limbah] = []
+        gagal: list[dict] = []
+        id_terpakai: set[str] = set()
+
+        for indeks, baris in enumerate(daftar_baris):
+            try:
+                limbah = self.__buat_limbah(baris)
+                id = limbah.get_id()
+                if id in id_terpakai or self.__limbah_repository.get_by_id(id) is not None:
+                    raise ValueError(f"Limbah dengan id '{id}' sudah terdaftar")
+            except ValueError as e:
+                id_baris = baris.get("id") if isinstance(baris, dict) else None
+                gagal.append({"indeks": indeks, "id": id_baris, "pesan": str(e)})
+                continue
+            id_terpakai.add(id)
+            berhasil.append(limbah)
+
+        if berhasil:
+            self.__limbah_repository.save_many(berhasil)
+
+        logger.info(
+            "Registrasi batch selesai | total=%d berhasil=%d gagal=%d",
+            len(daftar_baris), len(berhasil), len(gagal)
+        )
+        return {"berhasil": berhasil, "gagal": gagal}
+
+    def __buat_limbah(self, baris: dict) -> Limbah:
+        """
+        Memvalidasi satu baris batch dan membuat objek limbah sesuai jenisnya.
+
+        Args:
+            baris (dict): Data satu limbah.
+
+        Returns:
+            Limbah: Objek limbah yang belum disimpan.
 
         Raises:
-            ValueError: Jika id tidak valid.
+            ValueError: Jika jenis tidak dikenal, kolom wajib hilang, atau validasi gagal.
+        """
+        if not isinstance(baris, dict):
+            raise ValueError("Baris registrasi harus berupa dict")
+        pembuat = {
+            "organik": (LimbahOrganik, "tingkat_pembusukan", self.__validate_tingkat_pembusukan),
+            "medis": (LimbahMedis, "tingkat_infeksi", self.__validate_tingkat_infeksi),
+            "b3": (LimbahB3, "kandungan_kimia", self.__validate_kandungan_kimia),
+        }
+        jenis = baris.get("jenis")
+        if jenis not in pembuat:
+            raise ValueError(f"Jenis limbah tidak dikenal: {jenis!r}")
+        kelas, kolom_khusus, validasi_khusus = pembuat[jenis]
+
+        for kolom in ("id", "volume", kolom_khusus):
+            if kolom not in baris:
+                raise ValueError(f"Kolom '{kolom}' wajib diisi untuk limbah {jenis}")
+
+        self.__validate_id(baris["id"])
+        self.__validate_volume(baris["volume"])
+        validasi_khusus(baris[kolom_khusus])
+        return kelas(baris["id"], baris["volume"], baris[kolom_khusus])
+
+    def get_semua_limbah(self) -> list[Limbah]:
+        """
+        Mengambil salinan daftar seluruh limbah.
+
+        Untuk data besar gunakan iter_semua_limbah() agar memori tetap terbatas.
+
+        Returns:
+            list[Limbah]: Daftar seluruh limbah.
         """
-        data = self.__limbah_repository.get_all()
-        logger.info("Ambil semua limbah | total=%d ts=%s", len(data), datetime.now().isoformat())
+        data = list(self.__limbah_repository.iter_all())
+        logger.info("Ambil semua limbah | total=%d", len(data))
         return data
 
+    def iter_semua_limbah(self, ukuran_halaman: int = 1000) -> Iterator[Limbah]:
+        """
+        Mengiterasi seluruh limbah secara streaming dari repository.
+
+        Args:
+            ukuran_halaman (int): Jumlah limbah yang dibaca per halaman.
+
+        Returns:
+            Iterator[Limbah]: Iterator limbah sesuai urutan penyimpanan.
+        """
+        return self.__limbah_repository.iter_all(ukuran_halaman)
+
     def cari_limbah_by_id(self, id: str) -> Optional[Limbah]:
         """
         Mencari limbah berdasarkan ID menggunakan repository.
@@ -228,26 +325,120 @@ class LimbahService:
         limbah = self.__limbah_repository.get_by_id(id)
 
         if limbah:
-            logger.info("Limbah ditemukan | id=%s ts=%s", id, datetime.now().isoformat())
+            logger.info("Limbah ditemukan | id=%s", id)
         else:
-            logger.warning("Limbah tidak ditemukan | id=%s ts=%s", id, datetime.now().isoformat())
+            logger.warning("Limbah tidak ditemukan | id=%s", id)
 
         return limbah
 
     def hitung_total_risiko(self) -> float:
         """
-        Menghitung total risiko dari seluruh limbah yang tersimpan.
+        Mengambil total risiko dari seluruh limbah yang tersimpan.
+
+        Nilai dipelihara secara inkremental oleh AgregatRisiko sehingga
+        pembacaan berjalan O(1).
 
         Returns:
             float: Total risiko.
         """
-        total = 0.0
-        for item in self.__limbah_repository.get_all():
-            total += item.hitung_risiko()
-
-        logger.info("Hitung total risiko | total=%.2f ts=%s", total, datetime.now().isoformat())
+        total = self.__agregat_risiko.total()
+        logger.info("Hitung total risiko | total=%.2f", total)
         return total
 
+    def ringkasan_risiko(self) -> dict:
+        """
+        Mengambil total risiko beserta subtotal per jenis dan per status.
+
+        Returns:
+            dict: {"total": float, "per_jenis": dict, "per_status": dict}.
+        """
+        return {
+            "total": self.__agregat_risiko.total(),
+            "per_jenis": self.__agregat_risiko.per_jenis(),
+            "per_status": self.__agregat_risiko.per_status(),
+        }
+
+    def get_agregat_risiko(self) -> AgregatRisiko:
+        """
+        Mengambil agregat risiko yang dipelihara service ini, misal untuk
+        dipakai bersama LaporanService.
+
+        Returns:
+            AgregatRisiko: Agregat risiko atas repository service.
+        """
+        return self.__agregat_risiko
+
+    def verifikasi_total_risiko(self) -> bool:
+        """
+        Memeriksa agregat risiko terhadap hitung ulang penuh dari repository.
+
+        Returns:
+            bool: True jika agregat konsisten.
+        """
+        return self.__agregat_risiko.verifikasi()
+
+    def ringkasan_risiko_paralel(self, jumlah_pekerja: Optional[int] = None) -> dict:
+        """
+        Menghitung ulang risiko, volume, dan jumlah per jenis dari seluruh
+        registry memakai banyak proses (misal rekap regional akhir hari).
+
+        Berbeda dengan ringkasan_risiko() yang membaca agregat inkremental,
+        method ini memindai seluruh data; lihat hitung_agregat_paralel().
+
+        Args:
+            jumlah_pekerja (Optional[int]): Jumlah proses pekerja; default jumlah CPU.
+
+        Returns:
+            dict: {"total", "volume", "jumlah", "per_jenis"}.
+
+        Raises:
+            ValueError: Jika jumlah_pekerja < 1.
+        """
+        return hitung_agregat_paralel(self.__limbah_repository, jumlah_pekerja)
+
+    def top_k_risiko(
+        self, k: int, status: Optional[str] = None, jenis: Optional[type] = None
+    ) -> list[Limbah]:
+        """
+        Mengambil k limbah dengan risiko tertinggi, opsional difilter status dan jenis.
+
+        Kandidat diambil lewat index status/jenis repository (atau streaming
+        iter_all() tanpa filter), lalu dipilih dengan heap berukuran k
+        (heapq.nlargest) sehingga biaya O(n log k) dan memori O(k) tanpa
+        mengurutkan seluruh limbah.
+
+        Args:
+            k (int): Jumlah limbah yang diambil.
+            status (Optional[str]): Status limbah, misal "Terdaftar".
+            jenis (Optional[type]): Kelas limbah, misal LimbahMedis.
+
+        Returns:
+            list[Limbah]: Limbah terurut dari risiko tertinggi; seri diurutkan sesuai urutan penyimpanan.
+
+        Raises:
+            ValueError: Jika k negatif, status tidak dikenal, atau jenis bukan kelas Limbah.
+        """
+        if not isinstance(k, int) or k < 0:
+            raise ValueError("Jumlah k wajib bilangan bulat tidak negatif")
+        if status is not None:
+            validate_status(status)
+        if jenis is not None and not (isinstance(jenis, type) and issubclass(jenis, Limbah)):
+            raise ValueError(f"Jenis limbah tidak valid: {jenis!r}")
+
+        if jenis is not None:
+            kandidat = self.__limbah_repository.find_by_jenis(jenis, status)
+        elif status is not None:
+            kandidat = self.__limbah_repository.find_by_status(status)
+        else:
+            kandidat = self.__limbah_repository.iter_all()
+        hasil = heapq.nlargest(k, kandidat, key=lambda limbah: limbah.hitung_risiko())
+
+        logger.info(
+            "Top-k risiko | k=%d status=%s jenis=%s hasil=%d",
+            k, status, getattr(jenis, "__name__", None), len(hasil)
+        )
+        return hasil
+
     def proses_pengolahan_limbah(self, id: str) -> str:
         """
         Menjalankan proses pengolahan untuk limbah tertentu berdasarkan ID.
@@ -259,14 +450,40 @@ class LimbahService:
             str: Informasi hasil proses pengolahan.
 
         Raises:
-            ValueError: Jika id tidak valid.
+            ValueError: Jika id tidak valid atau limbah sudah diproses.
+            KonflikVersiError: Jika limbah terus diubah pihak lain selama
+                PERCOBAAN_KONFLIK percobaan; aman untuk dicoba lagi.
             LookupError: Jika limbah tidak ditemukan.
         """
-        limbah = self.cari_limbah_by_id(id)
-        if limbah is None:
-            logger.error("Proses pengolahan gagal: limbah tidak ditemukan | id=%s", id)
-            raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
-
-        hasil = limbah.proses_pengolahan()
-        logger.info("Proses pengolahan sukses | id=%s status=%s ts=%s", id, limbah.get_status(), datetime.now().isoformat())
-        return hasil
+        self.__validate_id(id)
+        # Optimistic concurrency: limbah dibaca tanpa kunci, lalu status
+        # ditulis dengan syarat versinya belum berubah. Jika ada penulis lain
+        # (thread atau proses lain), record dibaca dan diperiksa ulang.
+        for percobaan in range(1, self.PERCOBAAN_KONFLIK + 1):
+            limbah = self.cari_limbah_by_id(id)
+            if limbah is None:
+                logger.error("Proses pengolahan gagal: limbah tidak ditemukan | id=%s", id)
+                raise LookupError(f"Limbah dengan id '{id}' tidak ditemukan")
+
+            # Versi dibaca sebelum status agar perubahan di antaranya terdeteksi.
+            versi = limbah.get_versi()
+            status = limbah.get_status()
+            if limbah.get_kode_status().sudah_diproses:
+                logger.warning("Proses pengolahan ditolak: limbah sudah diproses | id=%s status=%s", id, status)
+                raise ValueError(f"Limbah id '{id}' sudah diproses (status: {status})")
+
+            try:
+                self.__limbah_repository.compare_and_update(id, versi, limbah.STATUS_PENGOLAHAN.label)
+            except KonflikVersiError:
+                if percobaan == self.PERCOBAAN_KONFLIK:
+                    logger.warning("Proses pengolahan gagal: konflik versi berulang | id=%s", id)
+                    raise
+                logger.info("Konflik versi, mencoba ulang | id=%s percobaan=%d", id, percobaan)
+                continue
+            break
+        logger.info(
+            "Proses pengolahan sukses | id=%s status=%s",
+            id, limbah.STATUS_PENGOLAHAN.label,
+            extra={"id": id, "volume": limbah.get_volume(), "status": limbah.STATUS_PENGOLAHAN.label},
+        )
+        return limbah.keterangan_pengolahan()
@@ -1,9 +1,15 @@
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, Union
 
+from models.kendaraan import Kendaraan
 from models.limbah import Limbah
-from repositories.limbah_repository import LimbahRepository
+from models.status_limbah import StatusLimbah
+from repositories.in_memory_manifest_repository import InMemoryManifestRepository
+from repositories.limbah_repository import KonflikVersiError, LimbahRepository
+from repositories.manifest_repository import ManifestRepository, Waktu
+from services.antrian_risiko import AntrianRisiko
+from services.penugasan_service import PenugasanService
 
 logger = logging.getLogger(__name__)
 
@@ -14,22 +20,44 @@ class PengangkutanService:
     Mengelola alur pengankutan limbah, meliputi:
     - validasi input pengangkutan (ID limbah, kendaraan, tujuan)
     - pengecekan ketersediaan limbah berdasarkan ID
-    - perubahan status limbah menjadi "Diangkut" jika memenuhi syarat
-    - pembuatan catatan pengangkutan dengan timestamp untuk keperluan audit/log
+    - perubahan status limbah menjadi "Diangkut" jika memenuhi syarat, memakai
+      compare_and_update repository (versi record) sehingga aman dipanggil dari
+      banyak thread atau proses; konflik dicoba ulang hingga PERCOBAAN_KONFLIK kali
+    - pembuatan catatan pengangkutan dengan timestamp untuk keperluan audit/log,
+      disimpan ke ManifestRepository satu catatan per limbah
+    - pengangkutan batch satu kendaraan dengan satu manifest gabungan
+    - pengangkutan berdasarkan prioritas risiko dari AntrianRisiko
+    - penugasan petugas sesuai keahlian lewat PenugasanService (jika diberikan);
+      petugas yang ditugaskan dicatat di setiap catatan pengangkutan
     """
 
-    def __init__(self, limbah_repository: LimbahRepository):
+    PERCOBAAN_KONFLIK = 3
+
+    def __init__(
+        self,
+        limbah_repository: LimbahRepository,
+        manifest_repository: Optional[ManifestRepository] = None,
+        penugasan_service: Optional[PenugasanService] = None,
+    ):
         """
         Inisialisasi PengangkutanService.
 
         Args:
             limbah_repository (LimbahRepository): repository limbah (abstrak).
+            manifest_repository (Optional[ManifestRepository]): penyimpanan catatan
+                pengangkutan; default InMemoryManifestRepository.
+            penugasan_service (Optional[PenugasanService]): roster petugas; jika None,
+                pengangkutan tidak menugaskan petugas.
         """
         self.__limbah_repository = limbah_repository
+        if manifest_repository is None:
+            manifest_repository = InMemoryManifestRepository()
+        self.__manifest_repository = manifest_repository
+        self.__penugasan_service = penugasan_service
 
     def __cari_limbah_by_id(self, id: str) -> Optional[Limbah]:
         """
-        Mencari limbah berdasarkan ID pada repository.
+        Mencari limbah berdasarkan ID melalui lookup repository.
 
         Args:
             id (str): ID limbah.
@@ -37,10 +65,7 @@ class PengangkutanService:
         Returns:
             Optional[Limbah]: Objek limbah jika ditemukan, jika tidak maka None.
         """
-        for item in self.__limbah_repository.get_all():
-            if item.get_id() == id:
-                return item
-        return None
+        return self.__limbah_repository.get_by_id(id)
 
     def __validate_kendaraan(self, kendaraan: str) -> None:
         """
@@ -56,59 +81,408 @@ class PengangkutanService:
             logger.error("Validasi gagal: kendaraan tidak valid: %r", kendaraan)
             raise ValueError("Nama/tipe kendaraan wajib string dan tidak boleh kosong")
 
-    def angkut_limbah(self, id_limbah: str, kendaraan: str, tujuan: str) -> dict:
+    def __validate_id_limbah(self, id_limbah: str) -> None:
         """
-        Melakukan proses pengangkutan limbah dan membuat catatan pengangkutan.
+        Validasi input ID limbah.
 
         Args:
-            id_limbah (str): ID limbah yang diangkut.
-            kendaraan (str): Nama/jenis kendaraan.
-            tujuan (str): Tujuan pengangkutan (contoh: TPS, insinerator, fasilitas B3).
-
-        Returns:
-            dict: Data catatan pengangkutan (audit log sederhana).
+            id_limbah (str): ID limbah.
 
         Raises:
-            ValueError: Jika input tidak valid atau limbah tidak memenuhi syarat untuk diangkut.
-            LookupError: Jika limbah tidak ditemukan.
+            ValueError: Jika ID bukan string atau kosong.
         """
         if not isinstance(id_limbah, str) or not id_limbah.strip():
             logger.error("Validasi gagal: id_limbah tidak valid: %r", id_limbah)
             raise ValueError("ID limbah wajib string dan tidak boleh kosong")
 
-        self.__validate_kendaraan(kendaraan)
+    def __validate_tujuan(self, tujuan: str) -> None:
+        """
+        Validasi input tujuan pengangkutan.
+
+        Args:
+            tujuan (str): Tujuan pengangkutan.
 
+        Raises:
+            ValueError: Jika tujuan bukan string atau kosong.
+        """
         if not isinstance(tujuan, str) or not tujuan.strip():
             logger.error("Validasi gagal: tujuan tidak valid: %r", tujuan)
             raise ValueError("Tujuan wajib string dan tidak boleh kosong")
 
-        limbah = self.__cari_limbah_by_id(id_limbah)
-        if limbah is None:
-            logger.error("Pengangkutan gagal: limbah tidak ditemukan | id=%s", id_limbah)
-            raise LookupError(f"Limbah dengan id '{id_limbah}' tidak ditemukan")
+    def __pindahkan_ke_diangkut(
+        self, id_limbah: str, syarat: Optional[Callable[[Limbah], None]] = None
+    ) -> Limbah:
+        """
+        Memeriksa kelayakan limbah lalu mengubah statusnya menjadi "Diangkut".
+
+        Args:
+            id_limbah (str): ID limbah yang diangkut.
+            syarat (Optional[Callable]): Pemeriksaan tambahan sebelum status
+                diubah; melempar ValueError jika limbah tidak boleh diangkut.
+
+        Returns:
+            Limbah: Limbah yang berhasil dipindahkan statusnya.
+
+        Raises:
+            ValueError: Jika ID tidak valid, limbah sudah diproses, atau sudah diangkut.
+            KonflikVersiError: Jika limbah terus diubah pihak lain selama
+                PERCOBAAN_KONFLIK percobaan; aman untuk dicoba lagi.
+            LookupError: Jika limbah tidak ditemukan.
+        """
+        self.__validate_id_limbah(id_limbah)
+
+        # Optimistic concurrency: limbah dibaca tanpa kunci, lalu status
+        # ditulis dengan syarat versinya belum berubah, sehingga limbah tidak
+        # diangkut dua kali. Saat konflik, record dibaca dan diperiksa ulang.
+        diangkut = StatusLimbah.DIANGKUT.label
+        for percobaan in range(1, self.PERCOBAAN_KONFLIK + 1):
+            limbah = self.__cari_limbah_by_id(id_limbah)
+            if limbah is None:
+                logger.error("Pengangkutan gagal: limbah tidak ditemukan | id=%s", id_limbah)
+                raise LookupError(f"Limbah dengan id '{id_limbah}' tidak ditemukan")
+
+            # Versi dibaca sebelum status agar perubahan di antaranya terdeteksi.
+            versi = limbah.get_versi()
+            status = limbah.get_status()
+            if limbah.get_kode_status().sudah_diproses:
+                logger.warning(
+                    "Pengangkutan ditolak: limbah sudah diproses | id=%s status=%s",
+                    id_limbah, status
+                )
+                raise ValueError(f"Limbah id '{id_limbah}' sudah diproses (status: {status}) dan tidak bisa diangkut")
+            if status == diangkut:
+                logger.warning("Pengangkutan ditolak: limbah sudah diangkut | id=%s", id_limbah)
+                raise ValueError(f"Limbah id '{id_limbah}' sudah diangkut dan tidak bisa diangkut lagi")
+            if syarat is not None:
+                syarat(limbah)
+
+            try:
+                self.__limbah_repository.compare_and_update(id_limbah, versi, diangkut)
+            except KonflikVersiError:
+                if percobaan == self.PERCOBAAN_KONFLIK:
+                    logger.warning("Pengangkutan gagal: konflik versi berulang | id=%s", id_limbah)
+                    raise
+                logger.info("Konflik versi, mencoba ulang | id=%s percobaan=%d", id_limbah, percobaan)
+                continue
+            return limbah
+
+    @staticmethod
+    def __periksa_muatan(
+        kendaraan: Kendaraan, limbah: Limbah, jenis_muatan: Optional[type], volume_termuat: float
+    ) -> None:
+        """
+        Memeriksa apakah limbah masih boleh dimuat ke kendaraan.
+
+        Args:
+            kendaraan (Kendaraan): Kendaraan yang dimuat.
+            limbah (Limbah): Limbah yang akan dimuat.
+            jenis_muatan (Optional[type]): Jenis limbah yang sudah dimuat, atau None.
+            volume_termuat (float): Total volume yang sudah dimuat (kg).
+
+        Raises:
+            ValueError: Jika jenis tidak diizinkan, berbeda dari muatan, atau
+                volume melebihi sisa kapasitas.
+        """
+        jenis = type(limbah)
+        if not kendaraan.bisa_membawa(limbah):
+            raise ValueError(f"Jenis {jenis.__name__} tidak diizinkan untuk kendaraan {kendaraan.get_id()}")
+        if jenis_muatan is not None and jenis is not jenis_muatan:
+            raise ValueError(f"Jenis {jenis.__name__} tidak boleh dicampur dengan {jenis_muatan.__name__}")
+        sisa = kendaraan.get_kapasitas_kg() - volume_termuat
+        if limbah.get_volume() > sisa:
+            raise ValueError(f"Volume {limbah.get_volume()} kg melebihi sisa kapasitas {sisa} kg")
+
+    def __tugaskan_petugas(self, limbah: Limbah, id_petugas: Optional[str]) -> Optional[str]:
+        """
+        Menugaskan petugas untuk limbah yang sudah berstatus "Diangkut".
+
+        Petugas pilihan sudah diperiksa sebelum status diubah. Jika tidak ada
+        petugas yang memenuhi syarat (roster kosong, tidak ada keahlian yang
+        sesuai, atau roster berubah di antaranya), pengangkutan tetap
+        tercatat tanpa petugas.
+
+        Args:
+            limbah (Limbah): Limbah yang diangkut.
+            id_petugas (Optional[str]): Petugas pilihan, atau None.
+
+        Returns:
+            Optional[str]: ID petugas yang ditugaskan, atau None.
+        """
+        if self.__penugasan_service is None:
+            return id_petugas
+        try:
+            return self.__penugasan_service.tugaskan(limbah, id_petugas).get_id()
+        except (ValueError, LookupError) as e:
+            if id_petugas is None:
+                logger.info("Pengangkutan tanpa petugas | id=%s pesan=%s", limbah.get_id(), e)
+            else:
+                logger.warning("Penugasan petugas gagal setelah pengangkutan | id=%s pesan=%s", limbah.get_id(), e)
+            return None
+
+    def angkut_limbah(self, id_limbah: str, kendaraan: str, tujuan: str, id_petugas: Optional[str] = None) -> dict:
+        """
+        Melakukan proses pengangkutan limbah dan membuat catatan pengangkutan.
+
+        Jika service memiliki PenugasanService dan id_petugas diberikan,
+        petugas itu diperiksa sebelum status diubah dan harus berkeahlian
+        sesuai limbah. Jika id_petugas None dipilih petugas berbeban terkecil
+        yang memenuhi syarat; tanpa petugas seperti itu limbah tetap diangkut
+        dan dicatat tanpa petugas.
+
+        Args:
+            id_limbah (str): ID limbah yang diangkut.
+            kendaraan (str): Nama/jenis kendaraan.
+            tujuan (str): Tujuan pengangkutan (contoh: TPS, insinerator, fasilitas B3).
+            id_petugas (Optional[str]): Petugas yang bertanggung jawab.
+
+        Returns:
+            dict: Data catatan pengangkutan (audit log sederhana).
+
+        Raises:
+            ValueError: Jika input tidak valid, limbah tidak memenuhi syarat untuk
+                diangkut, atau petugas tidak boleh menangani limbah.
+            LookupError: Jika limbah atau petugas tidak ditemukan.
+        """
+        self.__validate_id_limbah(id_limbah)
 
-        status = limbah.get_status()
-        if status in ("Dimusnahkan", "Didaur Ulang", "Diproses Khusus"):
-            logger.warning(
-                "Pengangkutan ditolak: limbah sudah diproses | id=%s status=%s",
-                id_limbah, status
-            )
-            raise ValueError(f"Limbah id '{id_limbah}' sudah diproses (status: {status}) dan tidak bisa diangkut")
+        self.__validate_kendaraan(kendaraan)
+        self.__validate_tujuan(tujuan)
 
-        limbah.set_status("Diangkut")
+        syarat = None
+        if self.__penugasan_service is not None and id_petugas is not None:
+            syarat = lambda limbah: self.__penugasan_service.periksa(limbah, id_petugas)
+        limbah = self.__pindahkan_ke_diangkut(id_limbah, syarat)
+        id_petugas = self.__tugaskan_petugas(limbah, id_petugas)
         ts = datetime.now().isoformat()
 
         catatan = {
             "timestamp": ts,
             "id_limbah": limbah.get_id(),
             "volume": limbah.get_volume(),
-            "status_baru": limbah.get_status(),
+            "status_baru": StatusLimbah.DIANGKUT.label,
             "kendaraan": kendaraan,
             "tujuan": tujuan,
+            "id_petugas": id_petugas,
         }
+        self.__manifest_repository.save(catatan)
 
         logger.info(
-            "Pengangkutan sukses | id=%s kendaraan=%s tujuan=%s ts=%s",
-            limbah.get_id(), kendaraan, tujuan, ts
+            "Pengangkutan sukses | id=%s kendaraan=%s tujuan=%s petugas=%s",
+            catatan["id_limbah"], kendaraan, tujuan, id_petugas,
+            extra={"id": catatan["id_limbah"], "volume": catatan["volume"],
+                   "status": catatan["status_baru"], "kendaraan": kendaraan},
         )
         return catatan
+
+    def angkut_batch(self, ids: list[str], kendaraan: Union[str, Kendaraan], tujuan: str) -> dict:
+        """
+        Mengangkut banyak limbah dalam satu pemanggilan dan membuat satu manifest.
+
+        Kendaraan dan tujuan divalidasi sekali. Setiap ID diperiksa dan
+        dipindahkan ke status "Diangkut" dalam satu lintasan; ID yang tidak
+        memenuhi syarat (tidak valid, tidak ditemukan, sudah diproses, sudah
+        diangkut, atau ganda dalam daftar) dicatat beserta alasannya tanpa
+        menggagalkan ID lainnya.
+
+        Jika kendaraan berupa objek Kendaraan, muatan juga dibatasi kapasitas
+        dan jenis limbah yang diizinkan, dan satu batch hanya membawa satu
+        jenis limbah (jenis limbah pertama yang diterima).
+
+        Jika service memiliki PenugasanService, setiap limbah ditugaskan ke
+        petugas berbeban terkecil yang keahliannya sesuai; limbah tanpa
+        petugas yang memenuhi syarat tetap diangkut dengan id_petugas None.
+
+        Args:
+            ids (list[str]): Daftar ID limbah yang dimuat ke kendaraan.
+            kendaraan (str | Kendaraan): Nama/jenis kendaraan atau objek Kendaraan.
+            tujuan (str): Tujuan pengangkutan.
+
+        Returns:
+            dict: Manifest {"timestamp", "kendaraan", "tujuan", "status_baru",
+            "diangkut": [{"id_limbah", "volume", "id_petugas"}], "total_volume",
+            "ditolak": [{"indeks", "id_limbah", "pesan"}]}.
+
+        Raises:
+            ValueError: Jika kendaraan atau tujuan tidak valid.
+        """
+        return self.__angkut_muatan(ids, kendaraan, tujuan)
+
+    def __angkut_muatan(
+        self, ids: Iterable[str], kendaraan: Union[str, Kendaraan], tujuan: str, batas: Optional[int] = None
+    ) -> dict:
+        """
+        Memuat ID limbah satu per satu ke kendaraan dan membuat satu manifest.
+
+        Args:
+            ids (Iterable[str]): ID limbah sesuai urutan muat; dibaca secara lazy.
+            kendaraan (str | Kendaraan): Nama/jenis kendaraan atau objek Kendaraan.
+            tujuan (str): Tujuan pengangkutan.
+            batas (Optional[int]): Jika diisi, berhenti membaca ids setelah
+                `batas` limbah termuat atau kapasitas kendaraan penuh; None
+                untuk memproses seluruh ids.
+
+        Returns:
+            dict: Manifest dengan format angkut_batch.
+
+        Raises:
+            ValueError: Jika kendaraan atau tujuan tidak valid.
+        """
+        diangkut = []
+        ditolak = []
+        total_volume = 0.0
+        terlihat = set()
+        jenis_muatan = None
+        armada = None
+        if isinstance(kendaraan, Kendaraan):
+            armada = kendaraan
+            kendaraan = kendaraan.get_nama()
+        self.__validate_kendaraan(kendaraan)
+        self.__validate_tujuan(tujuan)
+
+        def syarat(limbah: Limbah) -> None:
+            if armada is not None:
+                self.__periksa_muatan(armada, limbah, jenis_muatan, total_volume)
+
+        for indeks, id_limbah in enumerate(ids):
+            if batas is not None and (
+                len(diangkut) >= batas or (armada is not None and total_volume >= armada.get_kapasitas_kg())
+            ):
+                break
+            if isinstance(id_limbah, str) and id_limbah in terlihat:
+                ditolak.append({"indeks": indeks, "id_limbah": id_limbah, "pesan": "ID ganda dalam daftar"})
+                continue
+            try:
+                limbah = self.__pindahkan_ke_diangkut(id_limbah, syarat)
+            except (ValueError, LookupError) as e:
+                ditolak.append({"indeks": indeks, "id_limbah": id_limbah, "pesan": str(e)})
+                continue
+            terlihat.add(id_limbah)
+            jenis_muatan = type(limbah)
+            volume = limbah.get_volume()
+            total_volume += volume
+            diangkut.append({
+                "id_limbah": id_limbah, "volume": volume, "id_petugas": self.__tugaskan_petugas(limbah, None)
+            })
+
+        ts = datetime.now().isoformat()
+        status_baru = StatusLimbah.DIANGKUT.label
+        self.__manifest_repository.save_many([
+            {"timestamp": ts, "id_limbah": item["id_limbah"], "volume": item["volume"],
+             "status_baru": status_baru, "kendaraan": kendaraan, "tujuan": tujuan,
+             "id_petugas": item["id_petugas"]}
+            for item in diangkut
+        ])
+        logger.info(
+            "Pengangkutan batch | diangkut=%d ditolak=%d total_volume=%.2f kendaraan=%s tujuan=%s",
+            len(diangkut), len(ditolak), total_volume, kendaraan, tujuan,
+            extra={"volume": total_volume, "status": status_baru, "kendaraan": kendaraan},
+        )
+        return {
+            "timestamp": ts,
+            "kendaraan": kendaraan,
+            "tujuan": tujuan,
+            "status_baru": status_baru,
+            "diangkut": diangkut,
+            "total_volume": total_volume,
+            "ditolak": ditolak,
+        }
+
+    def angkut_prioritas(
+        self, antrian: AntrianRisiko, jumlah: int, kendaraan: Union[str, Kendaraan], tujuan: str
+    ) -> dict:
+        """
+        Mengangkut limbah berisiko tertinggi yang menunggu di antrian prioritas.
+
+        Menelusuri antrian dari risiko tertinggi dan memuat limbah satu per
+        satu seperti angkut_batch sampai `jumlah` limbah termuat, kapasitas
+        kendaraan penuh, atau antrian habis. Limbah yang ditolak (misalnya
+        jenisnya tidak cocok atau melebihi sisa kapasitas) dilewati sehingga
+        tidak menghalangi limbah berikutnya, dicatat di "ditolak", dan tetap
+        di antrian untuk trip berikutnya. Limbah yang berhasil diangkut
+        keluar dari antrian melalui peristiwa perubahan status.
+
+        Args:
+            antrian (AntrianRisiko): Antrian prioritas di atas repository yang sama.
+            jumlah (int): Jumlah maksimum limbah yang diambil dari antrian.
+            kendaraan (str | Kendaraan): Nama/jenis kendaraan atau objek Kendaraan.
+            tujuan (str): Tujuan pengangkutan.
+
+        Returns:
+            dict: Manifest dengan format yang sama seperti angkut_batch.
+
+        Raises:
+            ValueError: Jika jumlah negatif, kendaraan, atau tujuan tidak valid.
+        """
+        if jumlah < 0:
+            raise ValueError("Jumlah tidak boleh negatif")
+        return self.__angkut_muatan(self.__kandidat_antrian(antrian, jumlah), kendaraan, tujuan, jumlah)
+
+    @staticmethod
+    def __kandidat_antrian(antrian: AntrianRisiko, jumlah: int) -> Iterator[str]:
+        """
+        Menghasilkan ID limbah dari antrian terurut risiko tertinggi, masing-masing sekali.
+
+        Limbah yang sudah diangkut keluar dari antrian, sedangkan yang ditolak
+        tetap di sana; karena itu setiap putaran melihat kembali puncak antrian
+        dengan k yang berlipat dan melewati ID yang sudah dicoba.
+
+        Args:
+            antrian (AntrianRisiko): Antrian prioritas.
+            jumlah (int): Jumlah limbah yang ingin dimuat (ukuran putaran pertama).
+
+        Returns:
+            Iterator[str]: ID limbah yang belum dicoba, terurut risiko tertinggi.
+        """
+        dicoba = set()
+        k = max(jumlah, 1)
+        while True:
+            baru = [id_limbah for id_limbah, _ in antrian.peek_top_k(k) if id_limbah not in dicoba]
+            if not baru:
+                return
+            for id_limbah in baru:
+                dicoba.add(id_limbah)
+                yield id_limbah
+            k = 2 * len(dicoba) + jumlah
+
+    def lacak_limbah(self, id_limbah: str) -> list[dict]:
+        """
+        Mengambil riwayat pengangkutan satu limbah dari manifest.
+
+        Args:
+            id_limbah (str): ID limbah.
+
+        Returns:
+            list[dict]: Catatan pengangkutan terurut waktu; kosong jika belum pernah diangkut.
+
+        Raises:
+            ValueError: Jika ID tidak valid.
+        """
+        self.__validate_id_limbah(id_limbah)
+        return self.__manifest_repository.find_by_limbah(id_limbah)
+
+    def riwayat_pengangkutan(
+        self,
+        kendaraan: Optional[str] = None,
+        tujuan: Optional[str] = None,
+        mulai: Waktu = None,
+        sampai: Waktu = None,
+    ) -> list[dict]:
+        """
+        Mencari catatan pengangkutan berdasarkan kendaraan, tujuan, dan rentang waktu.
+
+        Contoh: semua muatan truk X antara 08:00 dan 12:00 ->
+        riwayat_pengangkutan(kendaraan="X", mulai=..., sampai=...).
+
+        Args:
+            kendaraan (Optional[str]): Nama kendaraan.
+            tujuan (Optional[str]): Tujuan pengangkutan.
+            mulai (str | datetime | None): Batas awal waktu (inklusif).
+            sampai (str | datetime | None): Batas akhir waktu (inklusif).
+
+        Returns:
+            list[dict]: Catatan pengangkutan terurut waktu.
+
+        Raises:
+            ValueError: Jika batas waktu tidak valid.
+        """
+        return self.__manifest_repository.find(kendaraan, tujuan, mulai, sampai)
@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable, Optional
+
+from models.limbah import Limbah
+from repositories.limbah_repository import LimbahRepository
+
+
+class PengisianAwal:
+    """
+    Penyaring peristiwa repository untuk struktur inkremental yang diisi
+    dari iter_all() setelah berlangganan (agregat, index).
+
+    Selama pengisian, peristiwa tidak langsung diterapkan tetapi ditunda
+    bersama versi limbah saat peristiwa terbit, dan pengisian mencatat
+    versi setiap limbah yang dibacanya. Saat pengisian selesai, peristiwa
+    tertunda yang sudah tercermin di hasil pengisian dilewati:
+    - "simpan" untuk limbah yang ikut terbaca pengisian
+    - "status"/"volume" dengan versi <= versi yang dibaca pengisian
+    Sisanya diterapkan sesuai urutan terbit, lalu catatan versi dan
+    peristiwa tertunda dilepas, sehingga memori tambahan O(n) hanya ada
+    selama pengisian berlangsung.
+
+    Perubahan yang sudah ditulis sebelum pengisian membacanya tetapi
+    peristiwanya baru sampai setelah selesai() (thread penerbit tertahan
+    di antara menulis dan memberi tahu) tidak bisa dibedakan dan tetap
+    diterapkan.
+    """
+
+    def __init__(self, terapkan: Callable[..., None]):
+        """
+        Membuat penyaring yang langsung menerapkan peristiwa sampai mulai() dipanggil.
+
+        Args:
+            terapkan (Callable): Fungsi (peristiwa, *argumen) yang menerapkan
+                satu peristiwa ke struktur pemilik; mengambil kunci pemilik sendiri.
+        """
+        self.__terapkan = terapkan
+        self.__kunci = threading.Lock()
+        self.__tertunda: Optional[list[tuple[str, str, int, tuple]]] = None
+        self.__versi_terisi: Optional[dict[str, int]] = None
+
+    def mulai(self) -> None:
+        """
+        Mulai menunda peristiwa; dipanggil sebelum pengisian membaca repository.
+        """
+        with self.__kunci:
+            self.__tertunda = []
+            self.__versi_terisi = {}
+
+    def catat(self, limbah: Limbah) -> None:
+        """
+        Mencatat versi limbah yang dibaca pengisian.
+
+        Args:
+            limbah (Limbah): Limbah yang baru ditambahkan pengisian.
+        """
+        self.__versi_terisi[limbah.get_id()] = limbah.get_versi()
+
+    def selesai(self) -> None:
+        """
+        Menerapkan peristiwa tertunda yang belum tercermin di hasil pengisian,
+        lalu kembali menerapkan peristiwa secara langsung.
+        """
+        with self.__kunci:
+            versi_terisi = self.__versi_terisi
+            for id, peristiwa, versi, argumen in self.__tertunda:
+                versi_dibaca = versi_terisi.get(id)
+                if versi_dibaca is not None and (
+                    peristiwa == LimbahRepository.PERISTIWA_SIMPAN or versi <= versi_dibaca
+                ):
+                    continue
+                self.__terapkan(peristiwa, *argumen)
+            self.__tertunda = None
+            self.__versi_terisi = None
+
+    def terima(self, limbah: Limbah, peristiwa: str, *argumen: Any) -> None:
+        """
+        Menerapkan peristiwa, atau menundanya jika pengisian sedang berjalan.
+
+        Args:
+            limbah (Limbah): Limbah yang terkait peristiwa.
+            peristiwa (str): "simpan", "status", atau "volume".
+            *argumen: Argumen untuk fungsi terapkan setelah peristiwa.
+        """
+        with self.__kunci:
+            if self.__tertunda is None:
+                self.__terapkan(peristiwa, *argumen)
+            else:
+                self.__tertunda.append((limbah.get_id(), peristiwa, limbah.get_versi(), argumen))
@@ -0,0 +1,376 @@
+import heapq
+import itertools
+import logging
+import threading
+from typing import Iterable, Optional
+
+from models.limbah import Limbah
+from models.limbah_b3 import LimbahB3
+from models.limbah_medis import LimbahMedis
+from models.petugas import Petugas
+
+logger = logging.getLogger(__name__)
+
+# Keahlian (huruf kecil) yang wajib dimiliki petugas per jenis limbah;
+# None berarti limbah boleh ditangani petugas dengan keahlian apa pun.
+KEAHLIAN_WAJIB: dict[type, Optional[str]] = {
+    LimbahMedis: "medis",
+    LimbahB3: "b3",
+}
+
+
+def keahlian_wajib(limbah: Limbah) -> Optional[str]:
+    """
+    Mengambil keahlian yang dibutuhkan untuk menangani limbah.
+
+    Args:
+        limbah (Limbah): Objek limbah.
+
+    Returns:
+        Optional[str]: Keahlian (huruf kecil), atau None jika tidak butuh keahlian khusus.
+    """
+    for kelas in type(limbah).__mro__:
+        if kelas in KEAHLIAN_WAJIB:
+            return KEAHLIAN_WAJIB[kelas]
+    return None
+
+
+class PenugasanService:
+    """
+    Service daftar petugas (roster) dan penugasan petugas ke limbah.
+
+    Aturan penugasan:
+    - limbah medis hanya untuk petugas berkeahlian "Medis", limbah B3 hanya
+      untuk petugas berkeahlian "B3" (lihat KEAHLIAN_WAJIB; perbandingan
+      tidak membedakan huruf besar/kecil), limbah lain untuk petugas mana pun
+    - dari petugas yang memenuhi syarat dan tersedia, dipilih yang bebannya
+      (jumlah tugas) paling kecil; seri dipecah berdasarkan urutan daftar
+
+    Keahlian petugas dibaca saat petugas ditambahkan ke roster; setelah
+    set_keahlian, daftarkan ulang petugas (hapus_petugas lalu tambah_petugas).
+
+    Setiap kelompok keahlian dan seluruh roster memiliki min-heap
+    (beban, urutan, versi, id). Perubahan beban atau ketersediaan menambah
+    entri baru dan menandai entri lama usang lewat nomor versi, sehingga
+    satu penugasan O(log n) dan ribuan penugasan selesai dalam milidetik.
+    """
+
+    def __init__(self, daftar_petugas: Iterable[Petugas] = ()):
+        """
+        Inisialisasi roster.
+
+        Args:
+            daftar_petugas (Iterable[Petugas]): Petugas awal.
+
+        Raises:
+            ValueError: Jika ada ID petugas ganda.
+        """
+        self.__kunci = threading.Lock()
+        self.__petugas: dict[str, Petugas] = {}
+        self.__tersedia: dict[str, bool] = {}
+        self.__beban: dict[str, list] = {}
+        self.__urutan: dict[str, int] = {}
+        self.__kelompok: dict[str, str] = {}
+        self.__versi: dict[str, int] = {}
+        self.__heap: dict[Optional[str], list[tuple]] = {None: []}
+        self.__nomor = itertools.count()
+        for petugas in daftar_petugas:
+            self.tambah_petugas(petugas)
+
+    def tambah_petugas(self, petugas: Petugas) -> None:
+        """
+        Menambahkan petugas ke roster dengan beban nol dan status tersedia.
+
+        Args:
+            petugas (Petugas): Petugas baru.
+
+        Raises:
+            ValueError: Jika ID petugas sudah ada di roster.
+        """
+        id = petugas.get_id()
+        with self.__kunci:
+            if id in self.__petugas:
+                raise ValueError(f"Petugas dengan id '{id}' sudah terdaftar")
+            self.__petugas[id] = petugas
+            self.__tersedia[id] = True
+            self.__beban[id] = [0, 0.0]
+            self.__urutan[id] = next(self.__nomor)
+            self.__kelompok[id] = petugas.get_keahlian().lower()
+            self.__dorong(id)
+        logger.info("Petugas ditambahkan ke roster | id=%s keahlian=%s", id, petugas.get_keahlian())
+
+    def hapus_petugas(self, id_petugas: str) -> None:
+        """
+        Menghapus petugas dari roster.
+
+        Args:
+            id_petugas (str): ID petugas.
+
+        Raises:
+            LookupError: Jika petugas tidak ditemukan.
+        """
+        with self.__kunci:
+            self.__ambil(id_petugas)
+            for data in (self.__petugas, self.__tersedia, self.__beban, self.__urutan, self.__kelompok):
+                del data[id_petugas]
+            # Versi tetap disimpan agar entri heap lama tidak hidup lagi
+            # jika ID yang sama didaftarkan ulang.
+            self.__versi[id_petugas] += 1
+
+    def get_petugas(self, id_petugas: str) -> Optional[Petugas]:
+        """
+        Mencari petugas di roster berdasarkan ID.
+
+        Args:
+            id_petugas (str): ID petugas.
+
+        Returns:
+            Optional[Petugas]: Petugas jika ada, jika tidak None.
+        """
+        return self.__petugas.get(id_petugas)
+
+    def set_tersedia(self, id_petugas: str, tersedia: bool) -> None:
+        """
+        Mengatur ketersediaan petugas; petugas tidak tersedia tidak diberi tugas baru.
+
+        Args:
+            id_petugas (str): ID petugas.
+            tersedia (bool): True jika petugas bisa diberi tugas.
+
+        Raises:
+            LookupError: Jika petugas tidak ditemukan.
+        """
+        with self.__kunci:
+            self.__ambil(id_petugas)
+            if self.__tersedia[id_petugas] == tersedia:
+                return
+            self.__tersedia[id_petugas] = tersedia
+            if tersedia:
+                self.__dorong(id_petugas)
+            else:
+                self.__versi[id_petugas] += 1
+
+    def periksa(self, limbah: Limbah, id_petugas: Optional[str] = None) -> None:
+        """
+        Memeriksa apakah limbah bisa ditugaskan tanpa mengubah beban petugas.
+
+        Args:
+            limbah (Limbah): Limbah yang akan ditangani.
+            id_petugas (Optional[str]): Petugas yang dipilih, atau None untuk
+                petugas mana pun yang memenuhi syarat.
+
+        Raises:
+            LookupError: Jika petugas tidak ditemukan atau tidak ada petugas
+                tersedia yang memenuhi syarat.
+            ValueError: Jika petugas pilihan tidak tersedia atau keahliannya tidak sesuai.
+        """
+        with self.__kunci:
+            self.__pilih(limbah, id_petugas)
+
+    def tugaskan(self, limbah: Limbah, id_petugas: Optional[str] = None) -> Petugas:
+        """
+        Menugaskan petugas ke limbah dan menambah beban petugas tersebut.
+
+        Tanpa id_petugas dipilih petugas berbeban terkecil yang memenuhi
+        syarat; dengan id_petugas, keahlian dan ketersediaan petugas itu diperiksa.
+
+        Args:
+            limbah (Limbah): Limbah yang akan ditangani.
+            id_petugas (Optional[str]): Petugas yang dipilih, atau None.
+
+        Returns:
+            Petugas: Petugas yang ditugaskan.
+
+        Raises:
+            LookupError: Jika petugas tidak ditemukan atau tidak ada petugas
+                tersedia yang memenuhi syarat.
+            ValueError: Jika petugas pilihan tidak tersedia atau keahliannya tidak sesuai.
+        """
+        with self.__kunci:
+            return self.__petugas[self.__tugaskan(limbah, id_petugas)]
+
+    def tugaskan_batch(self, daftar_limbah: Iterable[Limbah]) -> dict:
+        """
+        Menugaskan petugas untuk banyak limbah dalam satu pemanggilan.
+
+        Kunci roster dipegang sekali untuk seluruh batch. Limbah tanpa
+        petugas yang memenuhi syarat dicatat tanpa menggagalkan limbah lainnya.
+
+        Args:
+            daftar_limbah (Iterable[Limbah]): Limbah yang akan ditangani.
+
+        Returns:
+            dict: {"penugasan": [{"id_limbah", "id_petugas"}],
+            "gagal": [{"indeks", "id_limbah", "pesan"}]}.
+        """
+        penugasan = []
+        gagal = []
+        with self.__kunci:
+            for indeks, limbah in enumerate(daftar_limbah):
+                try:
+                    id_petugas = self.__tugaskan(limbah, None)
+                except LookupError as e:
+                    gagal.append({"indeks": indeks, "id_limbah": limbah.get_id(), "pesan": str(e)})
+                    continue
+                penugasan.append({"id_limbah": limbah.get_id(), "id_petugas": id_petugas})
+        logger.info("Penugasan batch | berhasil=%d gagal=%d", len(penugasan), len(gagal))
+        return {"penugasan": penugasan, "gagal": gagal}
+
+    def beban(self, id_petugas: str) -> dict:
+        """
+        Mengambil penghitung beban satu petugas.
+
+        Args:
+            id_petugas (str): ID petugas.
+
+        Returns:
+            dict: {"jumlah_tugas", "volume"}.
+
+        Raises:
+            LookupError: Jika petugas tidak ditemukan.
+        """
+        with self.__kunci:
+            self.__ambil(id_petugas)
+            jumlah, volume = self.__beban[id_petugas]
+        return {"jumlah_tugas": jumlah, "volume": volume}
+
+    def ringkasan_beban(self) -> dict[str, dict]:
+        """
+        Mengambil penghitung beban seluruh petugas.
+
+        Returns:
+            dict: ID petugas -> {"jumlah_tugas", "volume", "keahlian", "tersedia"}.
+        """
+        with self.__kunci:
+            return {
+                id: {
+                    "jumlah_tugas": self.__beban[id][0],
+                    "volume": self.__beban[id][1],
+                    "keahlian": petugas.get_keahlian(),
+                    "tersedia": self.__tersedia[id],
+                }
+                for id, petugas in self.__petugas.items()
+            }
+
+    def reset_beban(self) -> None:
+        """
+        Mengosongkan penghitung beban seluruh petugas (misal saat pergantian shift).
+        """
+        with self.__kunci:
+            self.__heap = {None: []}
+            for id in self.__petugas:
+                self.__beban[id] = [0, 0.0]
+                if self.__tersedia[id]:
+                    self.__dorong(id)
+
+    def __ambil(self, id_petugas: str) -> Petugas:
+        """
+        Mengambil petugas dari roster. Pemanggil memegang kunci.
+
+        Args:
+            id_petugas (str): ID petugas.
+
+        Returns:
+            Petugas: Petugas yang diminta.
+
+        Raises:
+            LookupError: Jika petugas tidak ditemukan.
+        """
+        petugas = self.__petugas.get(id_petugas)
+        if petugas is None:
+            raise LookupError(f"Petugas dengan id '{id_petugas}' tidak ditemukan")
+        return petugas
+
+    def __dorong(self, id_petugas: str) -> None:
+        """
+        Menambahkan entri heap terbaru petugas ke heap kelompoknya dan heap
+        seluruh roster. Pemanggil memegang kunci.
+
+        Args:
+            id_petugas (str): ID petugas.
+        """
+        versi = self.__versi.get(id_petugas, 0) + 1
+        self.__versi[id_petugas] = versi
+        entri = (self.__beban[id_petugas][0], self.__urutan[id_petugas], versi, id_petugas)
+        for kunci in (self.__kelompok[id_petugas], None):
+            heap = self.__heap.setdefault(kunci, [])
+            heapq.heappush(heap, entri)
+            if len(heap) > 2 * len(self.__petugas) + 64:
+                self.__heap[kunci] = heap = [e for e in heap if self.__versi.get(e[3]) == e[2]]
+                heapq.heapify(heap)
+
+    def __puncak(self, keahlian: Optional[str]) -> Optional[str]:
+        """
+        Mengambil ID petugas berbeban terkecil di kelompok tanpa mengubah beban.
+        Entri usang di puncak heap dibuang. Pemanggil memegang kunci.
+
+        Args:
+            keahlian (Optional[str]): Kelompok keahlian, atau None untuk seluruh roster.
+
+        Returns:
+            Optional[str]: ID petugas, atau None jika tidak ada yang tersedia.
+        """
+        heap = self.__heap.get(keahlian)
+        while heap:
+            _, _, versi, id_petugas = heap[0]
+            if self.__versi.get(id_petugas) == versi:
+                return id_petugas
+            heapq.heappop(heap)
+        return None
+
+    def __tugaskan(self, limbah: Limbah, id_petugas: Optional[str]) -> str:
+        """
+        Memilih petugas lalu menambah bebannya. Pemanggil memegang kunci.
+
+        Args:
+            limbah (Limbah): Limbah yang akan ditangani.
+            id_petugas (Optional[str]): Petugas yang dipilih, atau None.
+
+        Returns:
+            str: ID petugas yang ditugaskan.
+
+        Raises:
+            LookupError: Jika tidak ada petugas yang memenuhi syarat.
+            ValueError: Jika petugas pilihan tidak boleh menangani limbah.
+        """
+        id_petugas = self.__pilih(limbah, id_petugas)
+        beban = self.__beban[id_petugas]
+        beban[0] += 1
+        beban[1] += limbah.get_volume()
+        self.__dorong(id_petugas)
+        return id_petugas
+
+    def __pilih(self, limbah: Limbah, id_petugas: Optional[str]) -> str:
+        """
+        Menentukan petugas untuk limbah tanpa mengubah beban. Pemanggil memegang kunci.
+
+        Args:
+            limbah (Limbah): Limbah yang akan ditangani.
+            id_petugas (Optional[str]): Petugas yang dipilih, atau None.
+
+        Returns:
+            str: ID petugas terpilih.
+
+        Raises:
+            LookupError: Jika petugas tidak ditemukan atau tidak ada petugas
+                tersedia yang memenuhi syarat.
+            ValueError: Jika petugas pilihan tidak tersedia atau keahliannya tidak sesuai.
+        """
+        keahlian = keahlian_wajib(limbah)
+        if id_petugas is None:
+            id_petugas = self.__puncak(keahlian)
+            if id_petugas is None:
+                raise LookupError(
+                    f"Tidak ada petugas tersedia dengan keahlian '{keahlian or 'apa pun'}' "
+                    f"untuk limbah '{limbah.get_id()}'"
+                )
+            return id_petugas
+        petugas = self.__ambil(id_petugas)
+        if not self.__tersedia[id_petugas]:
+            raise ValueError(f"Petugas '{id_petugas}' sedang tidak tersedia")
+        if keahlian is not None and self.__kelompok[id_petugas] != keahlian:
+            raise ValueError(
+                f"Petugas '{id_petugas}' (keahlian {petugas.get_keahlian()}) tidak boleh menangani "
+                f"{type(limbah).__name__}; dibutuhkan keahlian '{keahlian}'"
+            )
+        return id_petugas
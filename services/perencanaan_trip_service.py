@@ -0,0 +1,99 @@
+import logging
+import math
+
+from models.kendaraan import Kendaraan
+from models.limbah import Limbah
+from models.status_limbah import StatusLimbah
+from repositories.limbah_repository import LimbahRepository
+from utils.bin_packing import METODE
+
+logger = logging.getLogger(__name__)
+
+
+class PerencanaanTripService:
+    """
+    Service perencanaan trip pengangkutan berdasarkan kapasitas kendaraan.
+
+    Seluruh limbah berstatus "Terdaftar" dikemas ke dalam trip sesedikit
+    mungkin memakai heuristik bin packing (lihat utils.bin_packing):
+    - "ffd": First Fit Decreasing (default)
+    - "bfd": Best Fit Decreasing
+    - "nfd": Next Fit Decreasing (paling cepat, trip paling banyak)
+
+    Satu trip hanya membawa satu jenis limbah sehingga limbah medis dan B3
+    tidak pernah bercampur dengan limbah organik. Limbah yang jenisnya
+    tidak diizinkan kendaraan atau volumenya melebihi kapasitas dicatat
+    sebagai ditolak.
+    """
+
+    def __init__(self, limbah_repository: LimbahRepository):
+        """
+        Inisialisasi PerencanaanTripService.
+
+        Args:
+            limbah_repository (LimbahRepository): repository limbah (abstrak).
+        """
+        self.__limbah_repository = limbah_repository
+
+    def rencanakan(self, kendaraan: Kendaraan, metode: str = "ffd") -> dict:
+        """
+        Menyusun rencana trip untuk seluruh limbah yang belum diangkut.
+
+        Args:
+            kendaraan (Kendaraan): Kendaraan yang dipakai untuk semua trip.
+            metode (str): Heuristik bin packing: "ffd", "bfd", atau "nfd".
+
+        Returns:
+            dict: {"metode", "kendaraan", "trip": [{"jenis", "id_limbah", "muatan_kg"}],
+            "jumlah_trip", "batas_bawah", "ditolak": [{"id_limbah", "pesan"}]}.
+            batas_bawah adalah jumlah trip minimum teoretis (total volume per
+            jenis dibagi kapasitas, dibulatkan ke atas).
+
+        Raises:
+            ValueError: Jika metode tidak dikenal.
+        """
+        kemas = METODE.get(metode)
+        if kemas is None:
+            raise ValueError(f"Metode bin packing '{metode}' tidak dikenal")
+
+        kapasitas = kendaraan.get_kapasitas_kg()
+        per_jenis: dict[type, list[Limbah]] = {}
+        ditolak = []
+        for limbah in self.__limbah_repository.find_by_status(StatusLimbah.TERDAFTAR.label):
+            if not kendaraan.bisa_membawa(limbah):
+                ditolak.append({
+                    "id_limbah": limbah.get_id(),
+                    "pesan": f"Jenis {type(limbah).__name__} tidak diizinkan untuk kendaraan {kendaraan.get_id()}",
+                })
+            elif limbah.get_volume() > kapasitas:
+                ditolak.append({
+                    "id_limbah": limbah.get_id(),
+                    "pesan": f"Volume {limbah.get_volume()} kg melebihi kapasitas {kapasitas} kg",
+                })
+            else:
+                per_jenis.setdefault(type(limbah), []).append(limbah)
+
+        trip = []
+        batas_bawah = 0
+        for jenis, daftar_limbah in per_jenis.items():
+            volume = [limbah.get_volume() for limbah in daftar_limbah]
+            batas_bawah += math.ceil(sum(volume) / kapasitas - 1e-9)
+            for isi in kemas(volume, kapasitas):
+                trip.append({
+                    "jenis": jenis.__name__,
+                    "id_limbah": [daftar_limbah[i].get_id() for i in isi],
+                    "muatan_kg": sum(volume[i] for i in isi),
+                })
+
+        logger.info(
+            "Rencana trip | kendaraan=%s metode=%s trip=%d batas_bawah=%d ditolak=%d",
+            kendaraan.get_id(), metode, len(trip), batas_bawah, len(ditolak)
+        )
+        return {
+            "metode": metode,
+            "kendaraan": kendaraan.get_id(),
+            "trip": trip,
+            "jumlah_trip": len(trip),
+            "batas_bawah": batas_bawah,
+            "ditolak": ditolak,
+        }
@@ -0,0 +1,296 @@
+import logging
+import math
+import threading
+from typing import Any
+
+from models.limbah import Limbah
+from repositories.limbah_repository import LimbahRepository
+from services.pengisian_awal import PengisianAwal
+
+logger = logging.getLogger(__name__)
+
+
+class AgregatRisiko:
+    """
+    Agregat risiko yang dipelihara secara inkremental.
+
+    Menyimpan total risiko beserta jumlah, total volume, dan total risiko
+    per jenis (nama kelas limbah) dan per status. Nilai diperbarui dari
+    peristiwa repository:
+    - "simpan": limbah baru ditambahkan ke grup jenis dan statusnya
+    - "status": jumlah, volume, dan risiko dipindahkan dari grup status
+      lama ke status baru
+    - "volume": selisih volume dan risiko ditambahkan; risiko lama dihitung
+      dari risiko baru dikali volume_lama / volume_baru karena seluruh rumus
+      hitung_risiko() linear terhadap volume
+
+    Memori sebanding jumlah grup, bukan jumlah limbah. Pembacaan total()
+    dan subtotal berjalan O(1). verifikasi() membandingkan nilai agregat
+    dengan hitung ulang penuh.
+
+    Pengisian dari iter_all() (awal dan bangun_ulang()) berjalan setelah
+    berlangganan; peristiwa selama pengisian disaring PengisianAwal agar
+    perubahan yang sudah terbaca pengisian tidak dihitung dua kali.
+    """
+
+    def __init__(self, limbah_repository: LimbahRepository):
+        """
+        Inisialisasi agregat, berlangganan peristiwa repository, lalu
+        membangun nilai awal dari data yang sudah tersimpan.
+
+        Args:
+            limbah_repository (LimbahRepository): repository sumber peristiwa.
+        """
+        self.__limbah_repository = limbah_repository
+        self.__kunci = threading.Lock()
+        self.__total = 0.0
+        self.__per_jenis: dict[str, list] = {}
+        self.__per_status: dict[str, list] = {}
+        self.__pengisian = PengisianAwal(self.__terapkan)
+        self.__pengisian.mulai()
+        limbah_repository.tambah_pengamat(self.__on_peristiwa)
+        self.__isi_ulang()
+
+    def total(self) -> float:
+        """
+        Mengambil total risiko seluruh limbah.
+
+        Returns:
+            float: Total risiko.
+        """
+        return self.__total
+
+    def per_jenis(self) -> dict[str, float]:
+        """
+        Mengambil subtotal risiko per jenis limbah.
+
+        Returns:
+            dict[str, float]: Nama kelas limbah -> subtotal risiko.
+        """
+        with self.__kunci:
+            return {jenis: nilai[2] for jenis, nilai in self.__per_jenis.items()}
+
+    def per_status(self) -> dict[str, float]:
+        """
+        Mengambil subtotal risiko per status limbah.
+
+        Returns:
+            dict[str, float]: Status -> subtotal risiko.
+        """
+        with self.__kunci:
+            return {status: nilai[2] for status, nilai in self.__per_status.items()}
+
+    def grup_jenis(self) -> dict[str, dict]:
+        """
+        Mengambil jumlah, total volume, dan total risiko per jenis limbah.
+
+        Returns:
+            dict: Nama kelas limbah -> {"jumlah", "volume", "risiko"}; jenis
+                tanpa limbah tidak disertakan.
+        """
+        with self.__kunci:
+            return self.__ke_grup(self.__per_jenis)
+
+    def grup_status(self) -> dict[str, dict]:
+        """
+        Mengambil jumlah, total volume, dan total risiko per status limbah.
+
+        Returns:
+            dict: Status -> {"jumlah", "volume", "risiko"}; status tanpa
+                limbah tidak disertakan.
+        """
+        with self.__kunci:
+            return self.__ke_grup(self.__per_status)
+
+    def hitung_ulang(self) -> dict:
+        """
+        Menghitung ulang seluruh agregat dari repository tanpa mengubah state.
+
+        Returns:
+            dict: {"total": float, "per_jenis": dict, "per_status": dict,
+                "grup_jenis": dict, "grup_status": dict}.
+        """
+        total = 0.0
+        per_jenis: dict[str, list] = {}
+        per_status: dict[str, list] = {}
+        for limbah in self.__limbah_repository.iter_all():
+            risiko = limbah.hitung_risiko()
+            total += risiko
+            self.__tambah_grup(per_jenis, type(limbah).__name__, 1, limbah.get_volume(), risiko)
+            self.__tambah_grup(per_status, limbah.get_status(), 1, limbah.get_volume(), risiko)
+        return {
+            "total": total,
+            "per_jenis": {jenis: nilai[2] for jenis, nilai in per_jenis.items()},
+            "per_status": {status: nilai[2] for status, nilai in per_status.items()},
+            "grup_jenis": self.__ke_grup(per_jenis),
+            "grup_status": self.__ke_grup(per_status),
+        }
+
+    def verifikasi(self, toleransi: float = 1e-6) -> bool:
+        """
+        Memeriksa konsistensi agregat terhadap hitung ulang penuh.
+
+        Args:
+            toleransi (float): Toleransi relatif perbandingan float.
+
+        Returns:
+            bool: True jika total dan seluruh subtotal sesuai.
+        """
+        acuan = self.hitung_ulang()
+        with self.__kunci:
+            sesuai = (
+                self.__sama(self.__total, acuan["total"], toleransi)
+                and self.__grup_sama(self.__ke_grup(self.__per_jenis), acuan["grup_jenis"], toleransi)
+                and self.__grup_sama(self.__ke_grup(self.__per_status), acuan["grup_status"], toleransi)
+            )
+        if not sesuai:
+            logger.warning("Agregat risiko tidak konsisten | agregat=%.4f acuan=%.4f", self.__total, acuan["total"])
+        return sesuai
+
+    def bangun_ulang(self) -> None:
+        """
+        Membangun ulang agregat dari repository (misal untuk koreksi drift float).
+        """
+        self.__pengisian.mulai()
+        self.__isi_ulang()
+
+    def __isi_ulang(self) -> None:
+        """
+        Mengosongkan agregat lalu mengisinya dari repository. Pemanggil sudah
+        memanggil mulai() pada penyaring pengisian.
+        """
+        with self.__kunci:
+            self.__total = 0.0
+            self.__per_jenis.clear()
+            self.__per_status.clear()
+            for limbah in self.__limbah_repository.iter_all():
+                self.__pengisian.catat(limbah)
+                self.__tambah(type(limbah).__name__, limbah.get_status(), 1, limbah.get_volume(), limbah.hitung_risiko())
+        self.__pengisian.selesai()
+
+    def __tambah(self, jenis: str, status: str, jumlah: int, volume: float, risiko: float) -> None:
+        """
+        Menambahkan (atau mengurangi jika negatif) nilai ke total dan grup.
+
+        Args:
+            jenis (str): Nama kelas limbah.
+            status (str): Status limbah.
+            jumlah (int): Selisih jumlah limbah.
+            volume (float): Selisih volume.
+            risiko (float): Selisih risiko.
+        """
+        self.__total += risiko
+        self.__tambah_grup(self.__per_jenis, jenis, jumlah, volume, risiko)
+        self.__tambah_grup(self.__per_status, status, jumlah, volume, risiko)
+
+    def __on_peristiwa(self, limbah: Limbah, peristiwa: str, lama: Any, baru: Any) -> None:
+        """
+        Memperbarui agregat berdasarkan peristiwa repository.
+
+        Args:
+            limbah (Limbah): Limbah yang terkait peristiwa.
+            peristiwa (str): "simpan", "status", atau "volume".
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+        """
+        self.__pengisian.terima(
+            limbah, peristiwa, type(limbah).__name__, limbah.get_status(), lama, baru,
+            limbah.get_volume(), limbah.hitung_risiko(),
+        )
+
+    def __terapkan(
+        self, peristiwa: str, jenis: str, status: str, lama: Any, baru: Any, volume: float, risiko: float
+    ) -> None:
+        """
+        Menerapkan satu peristiwa ke agregat.
+
+        Args:
+            peristiwa (str): "simpan", "status", atau "volume".
+            jenis (str): Nama kelas limbah.
+            status (str): Status limbah saat peristiwa terbit.
+            lama (Any): Nilai lama.
+            baru (Any): Nilai baru.
+            volume (float): Volume limbah saat peristiwa terbit.
+            risiko (float): Risiko limbah saat peristiwa terbit.
+        """
+        with self.__kunci:
+            if peristiwa == LimbahRepository.PERISTIWA_SIMPAN:
+                self.__tambah(jenis, status, 1, volume, risiko)
+            elif peristiwa == "status":
+                self.__tambah_grup(self.__per_status, lama, -1, -volume, -risiko)
+                self.__tambah_grup(self.__per_status, baru, 1, volume, risiko)
+            elif peristiwa == "volume":
+                self.__tambah(jenis, status, 0, baru - lama, risiko - risiko * lama / baru)
+
+    @staticmethod
+    def __tambah_grup(grup: dict[str, list], kunci: str, jumlah: int, volume: float, risiko: float) -> None:
+        """
+        Menambahkan (atau mengurangi jika negatif) nilai ke satu grup.
+
+        Args:
+            grup (dict[str, list]): Grup tujuan, kunci -> [jumlah, volume, risiko].
+            kunci (str): Kunci grup.
+            jumlah (int): Selisih jumlah limbah.
+            volume (float): Selisih volume.
+            risiko (float): Selisih risiko.
+        """
+        nilai = grup.get(kunci)
+        if nilai is None:
+            nilai = grup[kunci] = [0, 0.0, 0.0]
+        nilai[0] += jumlah
+        nilai[1] += volume
+        nilai[2] += risiko
+
+    @staticmethod
+    def __ke_grup(grup: dict[str, list]) -> dict[str, dict]:
+        """
+        Mengubah grup internal menjadi dict, tanpa grup yang tidak berisi limbah.
+
+        Args:
+            grup (dict[str, list]): Kunci -> [jumlah, volume, risiko].
+
+        Returns:
+            dict: Kunci -> {"jumlah", "volume", "risiko"}.
+        """
+        return {
+            kunci: {"jumlah": nilai[0], "volume": nilai[1], "risiko": nilai[2]}
+            for kunci, nilai in grup.items() if nilai[0]
+        }
+
+    @staticmethod
+    def __sama(a: float, b: float, toleransi: float) -> bool:
+        """
+        Membandingkan dua float dengan toleransi relatif dan absolut.
+
+        Args:
+            a (float): Nilai pertama.
+            b (float): Nilai kedua.
+            toleransi (float): Toleransi perbandingan.
+
+        Returns:
+            bool: True jika kedua nilai dianggap sama.
+        """
+        return math.isclose(a, b, rel_tol=toleransi, abs_tol=toleransi)
+
+    @classmethod
+    def __grup_sama(cls, a: dict[str, dict], b: dict[str, dict], toleransi: float) -> bool:
+        """
+        Membandingkan dua dict grup: kunci dan jumlah harus sama persis,
+        volume dan risiko dengan toleransi.
+
+        Args:
+            a (dict[str, dict]): Grup pertama.
+            b (dict[str, dict]): Grup kedua.
+            toleransi (float): Toleransi perbandingan.
+
+        Returns:
+            bool: True jika seluruh grup dianggap sama.
+        """
+        if set(a) != set(b):
+            return False
+        return all(
+            a[k]["jumlah"] == b[k]["jumlah"]
+            and cls.__sama(a[k]["volume"], b[k]["volume"], toleransi)
+            and cls.__sama(a[k]["risiko"], b[k]["risiko"], toleransi)
+            for k in a
+        )
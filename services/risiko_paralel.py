@@ -0,0 +1,159 @@
+import logging
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Optional
+
+from models.limbah import Limbah
+from repositories.limbah_mapper import JENIS_PER_KODE, KELAS_PER_JENIS, KODE_JENIS, kode_jenis
+from repositories.limbah_repository import LimbahRepository
+
+logger = logging.getLogger(__name__)
+
+# Partial per partisi: satu [risiko, volume, jumlah] untuk setiap kode jenis.
+Partial = list[list[float]]
+
+
+def _agregat_partisi(jenis: array, volume: array, bobot: array) -> Partial:
+    """
+    Menghitung risiko, volume, dan jumlah per kode jenis untuk satu partisi.
+
+    Berjalan di proses pekerja; argumen dan hasilnya kecil untuk dipickle.
+
+    Args:
+        jenis (array): Kode jenis per baris.
+        volume (array): Volume per baris.
+        bobot (array): Bobot risiko per baris (risiko = volume * bobot).
+
+    Returns:
+        Partial: [risiko, volume, jumlah] per kode jenis.
+    """
+    hasil = [[0.0, 0.0, 0] for _ in JENIS_PER_KODE]
+    for kode, v, b in zip(jenis, volume, bobot):
+        baris = hasil[kode]
+        baris[0] += v * b
+        baris[1] += v
+        baris[2] += 1
+    return hasil
+
+
+def _agregat_objek(daftar_limbah: Iterable[Limbah]) -> Partial:
+    """
+    Menghitung risiko, volume, dan jumlah per kode jenis langsung dari objek.
+
+    Dipakai untuk repository berbasis objek: satu kali hitung_risiko() per
+    record tanpa membangun partisi kolom lebih dulu.
+
+    Args:
+        daftar_limbah (Iterable[Limbah]): Limbah yang dijumlahkan.
+
+    Returns:
+        Partial: [risiko, volume, jumlah] per kode jenis.
+    """
+    hasil = [[0.0, 0.0, 0] for _ in JENIS_PER_KODE]
+    baris_per_kelas: dict[type, list] = {}
+    for limbah in daftar_limbah:
+        baris = baris_per_kelas.get(type(limbah))
+        if baris is None:
+            baris = baris_per_kelas[type(limbah)] = hasil[KODE_JENIS[kode_jenis(limbah)]]
+        baris[0] += limbah.hitung_risiko()
+        baris[1] += limbah.get_volume()
+        baris[2] += 1
+    return hasil
+
+
+def _gabung(total: Partial, partial: Partial) -> None:
+    """
+    Menambahkan partial satu partisi ke total.
+
+    Args:
+        total (Partial): Akumulator yang diubah langsung.
+        partial (Partial): Hasil _agregat_partisi().
+    """
+    for akumulator, baris in zip(total, partial):
+        akumulator[0] += baris[0]
+        akumulator[1] += baris[1]
+        akumulator[2] += baris[2]
+
+
+def hitung_agregat_paralel(
+    limbah_repository: LimbahRepository,
+    jumlah_pekerja: Optional[int] = None,
+    ukuran_partisi: int = 100_000,
+) -> dict:
+    """
+    Menghitung total risiko serta risiko, volume, dan jumlah per jenis secara paralel.
+
+    Jalur dipilih dari limbah_repository.partisi_kolom_langsung():
+    - False (repository berbasis objek): hitung_risiko() per record adalah
+      seluruh pekerjaan agregasi dan harus berjalan di proses ini, sehingga
+      limbah dijumlahkan langsung dari iter_all() tanpa pool berapa pun
+      jumlah_pekerja
+    - True (ColumnarLimbahRepository, juga lewat cache): registry dibaca
+      sebagai partisi kolom ringkas (partisi_kolom(): array kode jenis,
+      volume, dan bobot), setiap partisi dihitung di ProcessPoolExecutor,
+      lalu partial-nya digabung. Partisi dikirim bertahap dengan paling
+      banyak 2 * jumlah_pekerja partisi dalam proses, sehingga memori tetap
+      terbatas dan pembacaan partisi berikutnya tumpang tindih dengan
+      perhitungan di pekerja. Dengan jumlah_pekerja=1 partisi dihitung di
+      proses ini tanpa pool.
+
+    Hasil bukan snapshot atomik jika registry berubah selama perhitungan.
+
+    Args:
+        limbah_repository (LimbahRepository): Repository sumber data.
+        jumlah_pekerja (Optional[int]): Jumlah proses pekerja; default os.cpu_count().
+        ukuran_partisi (int): Jumlah baris per partisi.
+
+    Returns:
+        dict: {"total": float, "volume": float, "jumlah": int, "per_jenis": dict},
+        dengan per_jenis berisi nama kelas limbah -> {"risiko", "volume", "jumlah"}
+        untuk jenis yang memiliki data. Pekerja yang benar-benar dipakai
+        dicatat di log.
+
+    Raises:
+        ValueError: Jika jumlah_pekerja atau ukuran_partisi < 1.
+    """
+    if jumlah_pekerja is None:
+        jumlah_pekerja = os.cpu_count() or 1
+    if jumlah_pekerja < 1:
+        raise ValueError("Jumlah pekerja minimal 1")
+    if ukuran_partisi < 1:
+        raise ValueError("Ukuran partisi minimal 1")
+
+    total = [[0.0, 0.0, 0] for _ in JENIS_PER_KODE]
+    jumlah_partisi = 0
+    if not limbah_repository.partisi_kolom_langsung():
+        jumlah_pekerja = 1
+        total = _agregat_objek(limbah_repository.iter_all())
+    elif jumlah_pekerja == 1:
+        for kolom in limbah_repository.partisi_kolom(ukuran_partisi):
+            _gabung(total, _agregat_partisi(*kolom))
+            jumlah_partisi += 1
+    else:
+        with ProcessPoolExecutor(jumlah_pekerja) as executor:
+            berjalan: deque[Future] = deque()
+            for kolom in limbah_repository.partisi_kolom(ukuran_partisi):
+                berjalan.append(executor.submit(_agregat_partisi, *kolom))
+                jumlah_partisi += 1
+                if len(berjalan) >= 2 * jumlah_pekerja:
+                    _gabung(total, berjalan.popleft().result())
+            while berjalan:
+                _gabung(total, berjalan.popleft().result())
+
+    per_jenis = {
+        KELAS_PER_JENIS[jenis].__name__: {"risiko": risiko, "volume": volume, "jumlah": jumlah}
+        for jenis, (risiko, volume, jumlah) in zip(JENIS_PER_KODE, total)
+        if jumlah
+    }
+    logger.info(
+        "Agregat risiko paralel | pekerja=%d partisi=%d jumlah=%d",
+        jumlah_pekerja, jumlah_partisi, sum(baris[2] for baris in total)
+    )
+    return {
+        "total": sum(baris[0] for baris in total),
+        "volume": sum(baris[1] for baris in total),
+        "jumlah": sum(baris[2] for baris in total),
+        "per_jenis": per_jenis,
+    }
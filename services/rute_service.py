@@ -0,0 +1,85 @@
+import logging
+from typing import Optional
+
+from models.lokasi import Lokasi
+from utils.rute import optimasi_rute, proyeksi_km
+
+logger = logging.getLogger(__name__)
+
+
+class RuteService:
+    """
+    Service penyusunan rute penjemputan limbah antar lokasi bencana.
+
+    Rute tertutup (berangkat dan kembali ke lokasi awal) dibangun dengan
+    nearest neighbor lalu diperbaiki dengan 2-opt dan Or-opt sampai tidak
+    ada perbaikan atau anggaran waktu habis (lihat utils.rute). Jarak
+    dihitung pada proyeksi datar koordinat lokasi dalam km.
+    """
+
+    def __init__(self, batas_waktu: float = 1.0, k_tetangga: int = 8):
+        """
+        Inisialisasi RuteService.
+
+        Args:
+            batas_waktu (float): Anggaran waktu perbaikan rute per pemanggilan (detik).
+            k_tetangga (int): Jumlah tetangga terdekat yang dicoba per lokasi.
+
+        Raises:
+            ValueError: Jika batas_waktu < 0 atau k_tetangga < 1.
+        """
+        if batas_waktu < 0:
+            raise ValueError("Batas waktu tidak boleh negatif")
+        if k_tetangga < 1:
+            raise ValueError("Jumlah tetangga minimal 1")
+        self.__batas_waktu = batas_waktu
+        self.__k_tetangga = k_tetangga
+
+    def rencanakan_rute(self, daftar_lokasi: list[Lokasi], id_mulai: Optional[str] = None) -> dict:
+        """
+        Menyusun urutan kunjungan lokasi untuk satu kendaraan.
+
+        Args:
+            daftar_lokasi (list[Lokasi]): Lokasi penjemputan; semuanya wajib berkoordinat.
+            id_mulai (Optional[str]): ID lokasi awal (depot); default lokasi pertama.
+
+        Returns:
+            dict: {"urutan": list[str] ID lokasi diawali lokasi awal,
+            "panjang_km", "panjang_awal_km", "waktu_detik", "jumlah_titik"}.
+
+        Raises:
+            ValueError: Jika daftar kosong, ada ID ganda, atau ada lokasi tanpa koordinat.
+            LookupError: Jika id_mulai tidak ada di daftar.
+        """
+        daftar_lokasi = list(daftar_lokasi)
+        if not daftar_lokasi:
+            raise ValueError("Daftar lokasi tidak boleh kosong")
+        posisi = {}
+        koordinat = []
+        for i, lokasi in enumerate(daftar_lokasi):
+            if lokasi.get_id() in posisi:
+                raise ValueError(f"Lokasi dengan id '{lokasi.get_id()}' ganda")
+            if lokasi.get_koordinat() is None:
+                raise ValueError(f"Lokasi '{lokasi.get_id()}' belum memiliki koordinat")
+            posisi[lokasi.get_id()] = i
+            koordinat.append(lokasi.get_koordinat())
+        mulai = 0
+        if id_mulai is not None:
+            if id_mulai not in posisi:
+                raise LookupError(f"Lokasi awal '{id_mulai}' tidak ditemukan")
+            mulai = posisi[id_mulai]
+
+        hasil = optimasi_rute(proyeksi_km(koordinat), mulai, self.__batas_waktu, self.__k_tetangga)
+
+        logger.info(
+            "Rute disusun | titik=%d panjang_awal=%.2f km panjang=%.2f km waktu=%.3f s",
+            len(daftar_lokasi), hasil["panjang_awal_km"], hasil["panjang_km"],
+            hasil["waktu_detik"]
+        )
+        return {
+            "urutan": [daftar_lokasi[i].get_id() for i in hasil["rute"]],
+            "panjang_km": hasil["panjang_km"],
+            "panjang_awal_km": hasil["panjang_awal_km"],
+            "waktu_detik": hasil["waktu_detik"],
+            "jumlah_titik": len(daftar_lokasi),
+        }
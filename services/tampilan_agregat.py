@@ -0,0 +1,160 @@
+import math
+from typing import Callable, Hashable, Iterable, Optional
+
+from models.limbah import Limbah
+
+KunciGrup = Callable[[Limbah], Hashable]
+
+
+class TampilanAgregat:
+    """
+    Materialized view group-by atas limbah: jumlah, total volume, dan total risiko per grup.
+
+    Setiap limbah dipetakan ke satu grup oleh fungsi kunci. Tampilan
+    menyimpan kontribusi terakhir tiap limbah (grup, volume, risiko)
+    sehingga perubahan apa pun cukup diperbarui dengan mengurangi
+    kontribusi lama dan menambah kontribusi baru, tanpa bergantung pada
+    nilai lama di peristiwa. Grup yang kosong dihapus.
+
+    Class ini tidak thread-safe; sinkronisasi dilakukan pemiliknya
+    (LaporanService).
+    """
+
+    def __init__(self, nama: str, kunci: KunciGrup):
+        """
+        Inisialisasi tampilan kosong.
+
+        Args:
+            nama (str): Nama tampilan.
+            kunci (Callable[[Limbah], Hashable]): Fungsi yang mengembalikan grup limbah.
+        """
+        self.__nama = nama
+        self.__kunci = kunci
+        self.__grup: dict[Hashable, list] = {}
+        self.__anggota: dict[str, tuple[Hashable, float, float]] = {}
+
+    def get_nama(self) -> str:
+        """
+        Mengambil nama tampilan.
+
+        Returns:
+            str: Nama tampilan.
+        """
+        return self.__nama
+
+    def perbarui(self, limbah: Limbah) -> None:
+        """
+        Menyesuaikan kontribusi satu limbah dengan keadaan terbarunya.
+
+        Args:
+            limbah (Limbah): Limbah yang baru disimpan atau berubah.
+        """
+        id = limbah.get_id()
+        lama = self.__anggota.get(id)
+        if lama is not None:
+            self.__tambah(lama[0], -1, -lama[1], -lama[2])
+        baru = (self.__kunci(limbah), limbah.get_volume(), limbah.hitung_risiko())
+        self.__anggota[id] = baru
+        self.__tambah(baru[0], 1, baru[1], baru[2])
+
+    def isi_ulang(self, daftar_limbah: Iterable[Limbah]) -> None:
+        """
+        Mengosongkan tampilan lalu membangunnya dari daftar limbah.
+
+        Args:
+            daftar_limbah (Iterable[Limbah]): Seluruh limbah sumber.
+        """
+        self.__grup.clear()
+        self.__anggota.clear()
+        for limbah in daftar_limbah:
+            self.perbarui(limbah)
+
+    def baca(self) -> dict[Hashable, dict]:
+        """
+        Mengambil salinan seluruh grup.
+
+        Returns:
+            dict: Grup -> {"jumlah", "volume", "risiko"}.
+        """
+        return {grup: self.__ke_dict(nilai) for grup, nilai in self.__grup.items()}
+
+    def baca_grup(self, grup: Hashable) -> Optional[dict]:
+        """
+        Mengambil nilai satu grup dalam O(1).
+
+        Args:
+            grup (Hashable): Kunci grup.
+
+        Returns:
+            Optional[dict]: {"jumlah", "volume", "risiko"}, atau None jika grup kosong.
+        """
+        nilai = self.__grup.get(grup)
+        return None if nilai is None else self.__ke_dict(nilai)
+
+    def hitung_ulang(self, daftar_limbah: Iterable[Limbah]) -> dict[Hashable, dict]:
+        """
+        Menghitung grup dari nol tanpa mengubah state tampilan.
+
+        Args:
+            daftar_limbah (Iterable[Limbah]): Seluruh limbah sumber.
+
+        Returns:
+            dict: Grup -> {"jumlah", "volume", "risiko"}.
+        """
+        acuan = TampilanAgregat(self.__nama, self.__kunci)
+        acuan.isi_ulang(daftar_limbah)
+        return acuan.baca()
+
+    def sama_dengan(self, acuan: dict[Hashable, dict], toleransi: float = 1e-6) -> bool:
+        """
+        Membandingkan isi tampilan dengan hasil hitung ulang.
+
+        Args:
+            acuan (dict): Hasil hitung_ulang().
+            toleransi (float): Toleransi relatif dan absolut untuk volume/risiko.
+
+        Returns:
+            bool: True jika grup dan seluruh nilainya sesuai.
+        """
+        if set(self.__grup) != set(acuan):
+            return False
+        for grup, (jumlah, volume, risiko) in self.__grup.items():
+            nilai = acuan[grup]
+            if jumlah != nilai["jumlah"]:
+                return False
+            for a, b in ((volume, nilai["volume"]), (risiko, nilai["risiko"])):
+                if not math.isclose(a, b, rel_tol=toleransi, abs_tol=toleransi):
+                    return False
+        return True
+
+    def __tambah(self, grup: Hashable, jumlah: int, volume: float, risiko: float) -> None:
+        """
+        Menambahkan (atau mengurangi jika negatif) nilai ke satu grup.
+
+        Args:
+            grup (Hashable): Kunci grup.
+            jumlah (int): Selisih jumlah limbah.
+            volume (float): Selisih volume.
+            risiko (float): Selisih risiko.
+        """
+        nilai = self.__grup.get(grup)
+        if nilai is None:
+            nilai = self.__grup[grup] = [0, 0.0, 0.0]
+        nilai[0] += jumlah
+        nilai[1] += volume
+        nilai[2] += risiko
+        if nilai[0] == 0:
+            del self.__grup[grup]
+
+    @staticmethod
+    def __ke_dict(nilai: list) -> dict:
+        """
+        Mengubah nilai internal grup menjadi dict.
+
+        Args:
+            nilai (list): [jumlah, volume, risiko].
+
+        Returns:
+            dict: {"jumlah", "volume", "risiko"}.
+        """
+        return {"jumlah": nilai[0], "volume": nilai[1], "risiko": nilai[2]}
@@ -5,12 +5,16 @@ Menguji fungsionalitas class Limbah dan turunannya
 (LimbahOrganik, LimbahMedis, LimbahB3, Petugas, Lokasi).
 """
 
+import time
 import unittest
+from datetime import datetime
 from models.limbah_organik import LimbahOrganik
 from models.limbah_medis import LimbahMedis
 from models.limbah_b3 import LimbahB3
 from models.petugas import Petugas
 from models.lokasi import Lokasi
+from models.status_limbah import StatusLimbah
+from models.kendaraan import Kendaraan
 
 
 class TestLimbahOrganik(unittest.TestCase):
@@ -50,6 +54,60 @@ class TestLimbahOrganik(unittest.TestCase):
         with self.assertRaises(ValueError):
             limbah.volume = -10.0
 
+    def test_versi_naik_setiap_perubahan(self):
+        """Test versi naik satu setiap volume atau status berubah, tidak saat gagal."""
+        limbah = LimbahOrganik("L001", 100.0, 5)
+        versi = limbah.get_versi()
+        limbah.volume = 150.0
+        limbah.set_status("Diangkut")
+        self.assertEqual(limbah.get_versi(), versi + 2)
+        with self.assertRaises(ValueError):
+            limbah.set_status("Terdaftar")
+        with self.assertRaises(ValueError):
+            limbah.volume = -1.0
+        self.assertEqual(limbah.get_versi(), versi + 2)
+
+    def test_transisi_status(self):
+        """Test mesin status menerima transisi sah dan menolak yang tidak sah."""
+        limbah = LimbahOrganik("L001", 100.0, 5)
+        limbah.set_status("Diangkut")
+        limbah.set_status(StatusLimbah.DIDAUR_ULANG)
+        self.assertEqual(limbah.get_status(), "Didaur Ulang")
+        self.assertEqual(limbah.get_kode_status(), StatusLimbah.DIDAUR_ULANG)
+        self.assertTrue(limbah.get_kode_status().sudah_diproses)
+
+        with self.assertRaises(ValueError):
+            limbah.set_status("Diangkut")
+        with self.assertRaises(ValueError):
+            LimbahOrganik("L002", 10.0, 1).set_status("Selesai")
+        self.assertEqual(limbah.get_status(), "Didaur Ulang")
+
+    def test_pengamat_dipanggil_saat_perubahan(self):
+        """Test pengamat menerima perubahan status dan volume."""
+        limbah = LimbahOrganik("L001", 100.0, 5)
+        perubahan = []
+        callback = lambda l, atribut, lama, baru: perubahan.append((atribut, lama, baru))
+        limbah.tambah_pengamat(callback)
+
+        limbah.set_status("Diangkut")
+        limbah.volume = 120.0
+        self.assertEqual(perubahan, [("status", "Terdaftar", "Diangkut"), ("volume", 100.0, 120.0)])
+
+        limbah.hapus_pengamat(callback)
+        limbah.set_status("Didaur Ulang")
+        self.assertEqual(len(perubahan), 2)
+
+    def test_waktu_registrasi(self):
+        """Test waktu registrasi default saat ini dan bisa diberikan eksplisit."""
+        sebelum = time.time()
+        limbah = LimbahOrganik("L001", 100.0, 5)
+        self.assertGreaterEqual(limbah.get_detik_dibuat(), sebelum)
+        self.assertLessEqual(limbah.get_detik_dibuat(), time.time())
+
+        waktu = datetime(2024, 5, 1, 8, 30)
+        self.assertEqual(LimbahOrganik("L002", 10.0, 1, dibuat_pada=waktu).get_dibuat_pada(), waktu)
+        self.assertEqual(LimbahB3("L003", 10.0, "Merkuri", waktu.timestamp()).get_dibuat_pada(), waktu)
+
     def test_str_representation(self):
         """Test representasi string limbah organik."""
         limbah = LimbahOrganik("L001", 100.0, 5)
@@ -58,6 +116,20 @@ class TestLimbahOrganik(unittest.TestCase):
         self.assertIn("L001", str_repr)
         self.assertIn("100.0", str_repr)
 
+    def test_layout_slots(self):
+        """Test seluruh model memakai __slots__ tanpa __dict__ per instance."""
+        daftar_objek = [
+            LimbahOrganik("L001", 100.0, 5),
+            LimbahMedis("L002", 50.0, 8),
+            LimbahB3("L003", 30.0, "Merkuri"),
+            Petugas("P001", "Budi", "Medis"),
+            Lokasi("LOK001", "Jakarta Barat", "Banjir"),
+        ]
+        for objek in daftar_objek:
+            self.assertFalse(hasattr(objek, "__dict__"), type(objek).__name__)
+        with self.assertRaises(AttributeError):
+            daftar_objek[0].atribut_baru = 1
+
 
 class TestLimbahMedis(unittest.TestCase):
     """Test case untuk class LimbahMedis."""
@@ -222,6 +294,18 @@ class TestLokasi(unittest.TestCase):
         self.assertEqual(info["nama"], "Jakarta Barat")
         self.assertEqual(info["jenis_bencana"], "Banjir")
 
+    def test_koordinat_opsional(self):
+        """Test koordinat lokasi opsional dan divalidasi."""
+        self.assertIsNone(Lokasi("LOK001", "Jakarta Barat", "Banjir").get_koordinat())
+        lokasi = Lokasi("LOK002", "Bogor", "Longsor", -6.59, 106.8)
+        self.assertEqual(lokasi.get_koordinat(), (-6.59, 106.8))
+        self.assertEqual(lokasi.get_info()["lintang"], -6.59)
+
+        with self.assertRaises(ValueError):
+            Lokasi("LOK003", "Bogor", "Longsor", lintang=-6.59)
+        with self.assertRaises(ValueError):
+            lokasi.set_koordinat(95.0, 106.8)
+
     def test_str_representation(self):
         """Test representasi string lokasi."""
         lokasi = Lokasi("LOK001", "Jakarta Barat", "Banjir")
@@ -231,5 +315,28 @@ class TestLokasi(unittest.TestCase):
         self.assertIn("Jakarta Barat", str_repr)
 
 
+class TestKendaraan(unittest.TestCase):
+    """Test case untuk class Kendaraan."""
+
+    def test_create_kendaraan(self):
+        """Test membuat kendaraan dan memeriksa jenis muatan."""
+        kendaraan = Kendaraan("K001", "Truk Medis", 2000, (LimbahMedis, LimbahB3))
+        self.assertEqual(kendaraan.get_kapasitas_kg(), 2000.0)
+        self.assertTrue(kendaraan.bisa_membawa(LimbahB3("L001", 30.0, "Merkuri")))
+        self.assertFalse(kendaraan.bisa_membawa(LimbahOrganik("L002", 100.0, 5)))
+        self.assertIn("Truk Medis", str(kendaraan))
+
+    def test_kendaraan_invalid(self):
+        """Test kapasitas dan jenis muatan tidak valid ditolak."""
+        with self.assertRaises(ValueError):
+            Kendaraan("K001", "Truk", 0, (LimbahOrganik,))
+        with self.assertRaises(ValueError):
+            Kendaraan("K001", "Truk", 1000, ())
+        with self.assertRaises(ValueError):
+            Kendaraan("K001", "Truk", 1000, (str,))
+        with self.assertRaises(ValueError):
+            Kendaraan("", "Truk", 1000, (LimbahOrganik,))
+
+
 if __name__ == "__main__":
     unittest.main()
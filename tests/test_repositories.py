@@ -4,19 +4,40 @@ Unit test untuk repositories.
 Menguji fungsionalitas repository untuk penyimpanan data limbah.
 """
 
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
 import unittest
 from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from repositories.sqlite_limbah_repository import SqliteLimbahRepository
+from repositories.journal_limbah_repository import JournalLimbahRepository
+from repositories.columnar_limbah_repository import ColumnarLimbahRepository
+from repositories.cached_limbah_repository import CachedLimbahRepository
+from repositories.limbah_repository import KonflikVersiError
+from repositories.in_memory_manifest_repository import InMemoryManifestRepository
+from repositories.sqlite_manifest_repository import SqliteManifestRepository
+from models.limbah import Limbah
 from models.limbah_organik import LimbahOrganik
 from models.limbah_medis import LimbahMedis
 from models.limbah_b3 import LimbahB3
 
 
-class TestInMemoryLimbahRepository(unittest.TestCase):
-    """Test case untuk class InMemoryLimbahRepository."""
+class LimbahRepositoryContractMixin:
+    """
+    Kumpulan test kontrak yang wajib dipenuhi setiap implementasi LimbahRepository.
+
+    Subclass menggabungkan mixin ini dengan unittest.TestCase dan
+    mengimplementasikan buat_repository().
+    """
+
+    def buat_repository(self):
+        """Membuat instance repository baru yang akan diuji."""
+        raise NotImplementedError
 
     def setUp(self):
         """Setup yang dijalankan sebelum setiap test."""
-        self.repository = InMemoryLimbahRepository()
+        self.repository = self.buat_repository()
 
     def test_save_limbah(self):
         """Test menyimpan limbah ke repository."""
@@ -40,12 +61,79 @@ class TestInMemoryLimbahRepository(unittest.TestCase):
         all_limbah = self.repository.get_all()
         self.assertEqual(len(all_limbah), 3)
 
+    def test_save_duplicate_id(self):
+        """Test menyimpan limbah dengan ID yang sudah ada ditolak."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+
+        with self.assertRaises(ValueError):
+            self.repository.save(LimbahMedis("L001", 50.0, 8))
+
+        self.assertEqual(len(self.repository.get_all()), 1)
+        self.assertIsInstance(self.repository.get_by_id("L001"), LimbahOrganik)
+
+    def test_save_many(self):
+        """Test menyimpan banyak limbah sekaligus."""
+        self.repository.save_many([
+            LimbahOrganik("L001", 100.0, 5),
+            LimbahMedis("L002", 50.0, 8),
+            LimbahB3("L003", 30.0, "Merkuri"),
+        ])
+
+        self.assertEqual([l.get_id() for l in self.repository.get_all()], ["L001", "L002", "L003"])
+        self.assertIsInstance(self.repository.get_by_id("L003"), LimbahB3)
+
+    def test_save_many_duplicate_id_tidak_menyimpan_apapun(self):
+        """Test save_many dengan ID ganda tidak menyimpan satupun dari daftar."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+
+        with self.assertRaises(ValueError):
+            self.repository.save_many([LimbahMedis("L002", 50.0, 8), LimbahB3("L001", 30.0, "Merkuri")])
+        with self.assertRaises(ValueError):
+            self.repository.save_many([LimbahMedis("L003", 50.0, 8), LimbahMedis("L003", 5.0, 1)])
+
+        self.assertEqual([l.get_id() for l in self.repository.get_all()], ["L001"])
+
     def test_get_all_empty(self):
         """Test get_all ketika repository kosong."""
         all_limbah = self.repository.get_all()
         self.assertEqual(len(all_limbah), 0)
         self.assertIsInstance(all_limbah, list)
 
+    def test_get_all_bukan_list_internal(self):
+        """Test mengubah hasil get_all tidak mengubah isi repository."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+
+        self.repository.get_all().clear()
+        self.assertEqual(len(self.repository.get_all()), 1)
+
+    def test_iter_all(self):
+        """Test iterasi streaming mengikuti urutan penyimpanan."""
+        for i in range(5):
+            self.repository.save(LimbahOrganik(f"L{i:03d}", 10.0, 1))
+
+        ids = [l.get_id() for l in self.repository.iter_all(ukuran_halaman=2)]
+        self.assertEqual(ids, ["L000", "L001", "L002", "L003", "L004"])
+
+    def test_page_cursor(self):
+        """Test pagination berbasis cursor after_id."""
+        for i in range(5):
+            self.repository.save(LimbahOrganik(f"L{i:03d}", 10.0, 1))
+
+        halaman1 = self.repository.page(limit=2)
+        halaman2 = self.repository.page(halaman1[-1].get_id(), 2)
+        halaman3 = self.repository.page(halaman2[-1].get_id(), 2)
+        self.assertEqual([l.get_id() for l in halaman1], ["L000", "L001"])
+        self.assertEqual([l.get_id() for l in halaman2], ["L002", "L003"])
+        self.assertEqual([l.get_id() for l in halaman3], ["L004"])
+        self.assertEqual(self.repository.page("L004", 2), [])
+
+    def test_page_cursor_tidak_ditemukan(self):
+        """Test pagination dengan cursor yang tidak ada."""
+        with self.assertRaises(LookupError):
+            self.repository.page("L999", 10)
+        with self.assertRaises(ValueError):
+            self.repository.page(None, 0)
+
     def test_get_by_id_found(self):
         """Test mencari limbah berdasarkan ID yang ada."""
         limbah1 = LimbahOrganik("L001", 100.0, 5)
@@ -59,6 +147,14 @@ class TestInMemoryLimbahRepository(unittest.TestCase):
         self.assertEqual(found.get_id(), "L001")
         self.assertIsInstance(found, LimbahOrganik)
 
+    def test_waktu_registrasi_tersimpan(self):
+        """Test waktu registrasi ikut tersimpan dan dimuat kembali."""
+        waktu = datetime(2024, 5, 1, 8, 30, 15)
+        self.repository.save_many([LimbahMedis("L001", 50.0, 8, waktu), LimbahB3("L002", 5.0, "Merkuri", waktu)])
+
+        self.assertEqual(self.repository.get_by_id("L001").get_dibuat_pada(), waktu)
+        self.assertEqual([l.get_dibuat_pada() for l in self.repository.get_all()], [waktu, waktu])
+
     def test_get_by_id_not_found(self):
         """Test mencari limbah berdasarkan ID yang tidak ada."""
         limbah = LimbahOrganik("L001", 100.0, 5)
@@ -72,10 +168,116 @@ class TestInMemoryLimbahRepository(unittest.TestCase):
         found = self.repository.get_by_id("L001")
         self.assertIsNone(found)
 
+    def test_find_by_status(self):
+        """Test mencari limbah berdasarkan status."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+        self.repository.save(LimbahMedis("L002", 50.0, 8))
+
+        terdaftar = self.repository.find_by_status("Terdaftar")
+        self.assertEqual({l.get_id() for l in terdaftar}, {"L001", "L002"})
+        self.assertEqual(self.repository.find_by_status("Diangkut"), [])
+
+    def test_find_by_status_mengikuti_set_status(self):
+        """Test index status tetap konsisten setelah set_status dipanggil."""
+        limbah = LimbahMedis("L001", 50.0, 8)
+        self.repository.save(limbah)
+        self.repository.save(LimbahMedis("L002", 50.0, 8))
+
+        limbah.set_status("Diangkut")
+        self.assertEqual([l.get_id() for l in self.repository.find_by_status("Diangkut")], ["L001"])
+        self.assertEqual([l.get_id() for l in self.repository.find_by_status("Terdaftar")], ["L002"])
+
+        limbah.proses_pengolahan()
+        self.assertEqual(self.repository.find_by_status("Diangkut"), [])
+        self.assertEqual([l.get_id() for l in self.repository.find_by_status("Dimusnahkan")], ["L001"])
+
+    def test_find_by_jenis(self):
+        """Test mencari limbah berdasarkan jenis."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+        self.repository.save(LimbahMedis("L002", 50.0, 8))
+        self.repository.save(LimbahB3("L003", 30.0, "Merkuri"))
+
+        medis = self.repository.find_by_jenis(LimbahMedis)
+        self.assertEqual([l.get_id() for l in medis], ["L002"])
+        self.assertEqual(len(self.repository.find_by_jenis(Limbah)), 3)
+
+    def test_find_by_jenis_dan_status(self):
+        """Test mencari limbah berdasarkan kombinasi jenis dan status."""
+        self.repository.save(LimbahMedis("L001", 50.0, 8))
+        self.repository.save(LimbahMedis("L002", 50.0, 8))
+        self.repository.save(LimbahOrganik("L003", 100.0, 5))
+        self.repository.get_by_id("L002").set_status("Diangkut")
+
+        hasil = self.repository.find_by_jenis(LimbahMedis, status="Terdaftar")
+        self.assertEqual([l.get_id() for l in hasil], ["L001"])
+        hasil = self.repository.find_by_status("Terdaftar", jenis=LimbahMedis)
+        self.assertEqual([l.get_id() for l in hasil], ["L001"])
+
+    def test_compare_and_set_status(self):
+        """Test transisi status hanya berhasil jika status lama sesuai."""
+        self.repository.save(LimbahB3("L001", 30.0, "Merkuri"))
+
+        self.assertTrue(self.repository.compare_and_set_status("L001", "Terdaftar", "Diangkut"))
+        self.assertFalse(self.repository.compare_and_set_status("L001", "Terdaftar", "Diangkut"))
+        self.assertEqual(self.repository.get_by_id("L001").get_status(), "Diangkut")
+        self.assertEqual([l.get_id() for l in self.repository.find_by_status("Diangkut")], ["L001"])
+        with self.assertRaises(LookupError):
+            self.repository.compare_and_set_status("L999", "Terdaftar", "Diangkut")
+
+    def test_compare_and_update(self):
+        """Test perubahan bersyarat versi berhasil sekali dan konflik untuk versi usang."""
+        self.repository.save(LimbahMedis("L001", 30.0, 4))
+        versi = self.repository.get_by_id("L001").get_versi()
+
+        versi_baru = self.repository.compare_and_update("L001", versi, "Diangkut")
+        self.assertEqual(versi_baru, versi + 1)
+        self.assertEqual(self.repository.get_by_id("L001").get_versi(), versi_baru)
+        self.assertEqual([l.get_id() for l in self.repository.find_by_status("Diangkut")], ["L001"])
+        with self.assertRaises(KonflikVersiError) as konteks:
+            self.repository.compare_and_update("L001", versi, "Dimusnahkan")
+        self.assertEqual(konteks.exception.versi_sekarang, versi_baru)
+        self.assertEqual(self.repository.get_by_id("L001").get_status(), "Diangkut")
+        with self.assertRaises(ValueError):
+            self.repository.compare_and_update("L001", versi_baru, "Terdaftar")
+        with self.assertRaises(LookupError):
+            self.repository.compare_and_update("L999", 0, "Diangkut")
+
+    def test_partisi_kolom(self):
+        """Test partisi kolom memuat seluruh baris dengan risiko = volume * bobot."""
+        daftar_limbah = [LimbahOrganik("L001", 100.0, 5), LimbahMedis("L002", 50.0, 8), LimbahB3("L003", 30.0, "Merkuri")]
+        self.repository.save_many(daftar_limbah)
+        self.assertEqual(
+            self.repository.partisi_kolom_langsung(), isinstance(self.repository, ColumnarLimbahRepository)
+        )
+        if not self.repository.partisi_kolom_langsung():
+            with self.assertRaises(NotImplementedError):
+                self.repository.partisi_kolom(ukuran_partisi=2)
+            return
+
+        partisi = list(self.repository.partisi_kolom(ukuran_partisi=2))
+        self.assertEqual([len(jenis) for jenis, _, _ in partisi], [2, 1])
+        volume = [v for _, kolom, _ in partisi for v in kolom]
+        risiko = [v * b for _, kolom_volume, kolom_bobot in partisi for v, b in zip(kolom_volume, kolom_bobot)]
+        self.assertEqual(volume, [100.0, 50.0, 30.0])
+        for hasil, limbah in zip(risiko, daftar_limbah):
+            self.assertAlmostEqual(hasil, limbah.hitung_risiko())
+        with self.assertRaises(ValueError):
+            self.repository.partisi_kolom(ukuran_partisi=0)
+
+    def test_compare_and_set_status_transisi_tidak_sah(self):
+        """Test compare-and-set menolak transisi yang tidak diizinkan."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+        self.repository.compare_and_set_status("L001", "Terdaftar", "Didaur Ulang")
+
+        with self.assertRaises(ValueError):
+            self.repository.compare_and_set_status("L001", "Didaur Ulang", "Diangkut")
+        self.assertEqual(self.repository.get_by_id("L001").get_status(), "Didaur Ulang")
+        self.assertEqual(self.repository.find_by_status("Status Asing"), [])
+
     def test_repository_isolation(self):
         """Test bahwa setiap instance repository terpisah."""
-        repo1 = InMemoryLimbahRepository()
-        repo2 = InMemoryLimbahRepository()
+        repo1 = self.buat_repository()
+        repo2 = self.buat_repository()
 
         limbah = LimbahOrganik("L001", 100.0, 5)
         repo1.save(limbah)
@@ -84,5 +286,450 @@ class TestInMemoryLimbahRepository(unittest.TestCase):
         self.assertEqual(len(repo2.get_all()), 0)
 
 
+    def test_pengamat_sinkron_dan_antrian(self):
+        """Test pengamat sinkron dan antrian menerima peristiwa yang sama sesuai urutan."""
+        sinkron = []
+        antrian = []
+        catat = lambda tujuan: lambda limbah, peristiwa, lama, baru: tujuan.append((limbah.get_id(), peristiwa, baru))
+        self.repository.tambah_pengamat(catat(sinkron))
+        pelanggan = self.repository.tambah_pengamat_antrian(catat(antrian))
+
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+        self.repository.save_many([LimbahMedis("L002", 50.0, 8)])
+        self.repository.get_by_id("L002").set_volume(60.0)
+        self.assertTrue(self.repository.compare_and_set_status("L001", "Terdaftar", "Diangkut"))
+        pelanggan.tunggu()
+
+        self.assertEqual(
+            [(id, peristiwa) for id, peristiwa, _ in sinkron],
+            [("L001", "simpan"), ("L002", "simpan"), ("L002", "volume"), ("L001", "status")],
+        )
+        self.assertEqual(sinkron[2:], [("L002", "volume", 60.0), ("L001", "status", "Diangkut")])
+        self.assertEqual(antrian, sinkron)
+
+        self.repository.hapus_pengamat(pelanggan)
+        self.repository.save(LimbahB3("L003", 5.0, "Merkuri"))
+        self.assertEqual(len(antrian), 4)
+        self.assertEqual(len(sinkron), 5)
+
+
+class TestInMemoryLimbahRepository(LimbahRepositoryContractMixin, unittest.TestCase):
+    """Test case untuk class InMemoryLimbahRepository."""
+
+    def buat_repository(self):
+        """Membuat InMemoryLimbahRepository baru."""
+        return InMemoryLimbahRepository()
+
+
+class TestSqliteLimbahRepository(LimbahRepositoryContractMixin, unittest.TestCase):
+    """Test case untuk class SqliteLimbahRepository."""
+
+    def buat_repository(self):
+        """Membuat SqliteLimbahRepository in-memory baru."""
+        repository = SqliteLimbahRepository(ukuran_batch=2)
+        self.addCleanup(repository.close)
+        return repository
+
+    def test_data_persisten_setelah_dibuka_ulang(self):
+        """Test data dan kolom khusus tiap jenis tetap ada setelah koneksi dibuka ulang."""
+        with tempfile.TemporaryDirectory() as direktori:
+            path = os.path.join(direktori, "limbah.db")
+            repository = SqliteLimbahRepository(path)
+            repository.save(LimbahOrganik("L001", 100.0, 5))
+            repository.save(LimbahMedis("L002", 50.0, 8))
+            limbah_b3 = LimbahB3("L003", 30.0, "Merkuri")
+            repository.save(limbah_b3)
+            limbah_b3.set_status("Diangkut")
+            repository.close()
+
+            repository = SqliteLimbahRepository(path)
+            organik = repository.get_by_id("L001")
+            medis = repository.get_by_id("L002")
+            b3 = repository.get_by_id("L003")
+            repository.close()
+
+        self.assertEqual(organik.get_tingkat_pembusukan(), 5)
+        self.assertEqual(medis.get_tingkat_infeksi(), 8)
+        self.assertEqual(b3.get_kandungan_kimia(), "Merkuri")
+        self.assertEqual(b3.get_status(), "Diangkut")
+
+    def test_perubahan_volume_tersimpan(self):
+        """Test perubahan volume pada objek hasil get_by_id ditulis ke database."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+
+        self.repository.get_by_id("L001").volume = 75.0
+        self.assertEqual(self.repository.get_by_id("L001").get_volume(), 75.0)
+
+    def test_ukuran_batch_invalid(self):
+        """Test ukuran batch kurang dari 1 ditolak."""
+        with self.assertRaises(ValueError):
+            SqliteLimbahRepository(ukuran_batch=0)
+
+    def test_salinan_usang_tidak_menimpa(self):
+        """Test setter pada objek usang ditolak dan tidak menimpa baris yang lebih baru."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+        baru = self.repository.get_by_id("L001")
+        usang = self.repository.get_by_id("L001")
+
+        baru.set_status("Diangkut")
+        with self.assertRaises(KonflikVersiError):
+            usang.volume = 10.0
+        with self.assertRaises(KonflikVersiError):
+            usang.set_status("Didaur Ulang")
+        tersimpan = self.repository.get_by_id("L001")
+        self.assertEqual((tersimpan.get_status(), tersimpan.get_volume()), ("Diangkut", 100.0))
+        self.assertEqual(tersimpan.get_versi(), baru.get_versi())
+
+    def test_migrasi_database_tanpa_waktu_registrasi(self):
+        """Test database format lama mendapat kolom dibuat_pada yang stabil."""
+        with tempfile.TemporaryDirectory() as direktori:
+            path = os.path.join(direktori, "lama.db")
+            conn = sqlite3.connect(path)
+            conn.execute(
+                "CREATE TABLE limbah (seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL UNIQUE, "
+                "jenis TEXT NOT NULL, volume REAL NOT NULL, status TEXT NOT NULL, tingkat_pembusukan INTEGER, "
+                "tingkat_infeksi INTEGER, kandungan_kimia TEXT)"
+            )
+            conn.execute("INSERT INTO limbah (id, jenis, volume, status, tingkat_pembusukan) "
+                         "VALUES ('L001', 'organik', 10.0, 'Terdaftar', 3)")
+            conn.commit()
+            conn.close()
+
+            repository = SqliteLimbahRepository(path)
+            waktu = repository.get_by_id("L001").get_detik_dibuat()
+            repository.close()
+            repository = SqliteLimbahRepository(path)
+            self.assertEqual(repository.get_by_id("L001").get_detik_dibuat(), waktu)
+            self.assertEqual(repository.get_by_id("L001").get_versi(), 0)
+            repository.close()
+
+    def test_konflik_versi_antar_koneksi(self):
+        """Test dua koneksi pada file yang sama saling mendeteksi perubahan lewat versi."""
+        with tempfile.TemporaryDirectory() as direktori:
+            path = os.path.join(direktori, "limbah.db")
+            pertama = SqliteLimbahRepository(path, ukuran_batch=1)
+            kedua = SqliteLimbahRepository(path, ukuran_batch=1)
+            pertama.save(LimbahOrganik("L001", 100.0, 5))
+
+            dibaca_pertama = pertama.get_by_id("L001")
+            dibaca_kedua = kedua.get_by_id("L001")
+            kedua.compare_and_update("L001", dibaca_kedua.get_versi(), "Diangkut")
+            with self.assertRaises(KonflikVersiError):
+                pertama.compare_and_update("L001", dibaca_pertama.get_versi(), "Didaur Ulang")
+            pertama.compare_and_update("L001", pertama.get_by_id("L001").get_versi(), "Didaur Ulang")
+            kedua.close()
+            pertama.close()
+
+            repository = SqliteLimbahRepository(path)
+            limbah = repository.get_by_id("L001")
+            repository.close()
+        self.assertEqual(limbah.get_status(), "Didaur Ulang")
+        self.assertEqual(limbah.get_versi(), dibaca_pertama.get_versi() + 2)
+
+
+class TestColumnarLimbahRepository(LimbahRepositoryContractMixin, unittest.TestCase):
+    """Test case untuk class ColumnarLimbahRepository."""
+
+    def buat_repository(self):
+        """Membuat ColumnarLimbahRepository baru."""
+        return ColumnarLimbahRepository()
+
+    def test_salinan_usang_tidak_menimpa(self):
+        """Test setter pada objek usang ditolak dan tidak menimpa kolom."""
+        self.repository.save(LimbahMedis("L001", 50.0, 4))
+        baru = self.repository.get_by_id("L001")
+        usang = self.repository.get_by_id("L001")
+
+        baru.volume = 40.0
+        with self.assertRaises(KonflikVersiError):
+            usang.set_status("Diangkut")
+        with self.assertRaises(KonflikVersiError):
+            usang.volume = 10.0
+        tersimpan = self.repository.get_by_id("L001")
+        self.assertEqual((tersimpan.get_status(), tersimpan.get_volume()), ("Terdaftar", 40.0))
+        self.assertAlmostEqual(self.repository.total_risiko(), baru.hitung_risiko())
+
+    def test_risk_array_sama_dengan_hitung_risiko(self):
+        """Test risiko vektor sama dengan hitung_risiko() tiap objek."""
+        daftar_limbah = [
+            LimbahOrganik("L001", 100.0, 5),
+            LimbahMedis("L002", 50.0, 8),
+            LimbahB3("L003", 30.0, "Merkuri"),
+        ]
+        self.repository.save_many(daftar_limbah)
+        daftar_limbah[1].volume = 25.0
+
+        risiko = list(self.repository.risk_array())
+        harapan = [limbah.hitung_risiko() for limbah in daftar_limbah]
+        for nilai, nilai_harapan in zip(risiko, harapan):
+            self.assertAlmostEqual(nilai, nilai_harapan)
+        self.assertAlmostEqual(self.repository.total_risiko(), sum(harapan))
+
+    def test_kolom_khusus_jenis_dibangun_ulang(self):
+        """Test objek hasil get_by_id membawa atribut khusus tiap jenis."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+        self.repository.save(LimbahB3("L002", 30.0, "Merkuri"))
+
+        self.assertEqual(self.repository.get_by_id("L001").get_tingkat_pembusukan(), 5)
+        self.assertEqual(self.repository.get_by_id("L002").get_kandungan_kimia(), "Merkuri")
+        self.assertEqual(len(self.repository), 2)
+
+
+class TestCachedLimbahRepository(LimbahRepositoryContractMixin, unittest.TestCase):
+    """Test case untuk class CachedLimbahRepository di atas SQLite."""
+
+    def buat_repository(self):
+        """Membuat CachedLimbahRepository kecil di atas SqliteLimbahRepository."""
+        sqlite = SqliteLimbahRepository()
+        self.addCleanup(sqlite.close)
+        return CachedLimbahRepository(sqlite, kapasitas=2)
+
+    def test_penghitung_hit_miss_eviksi(self):
+        """Test penghitung cache dan pembuangan entri terlama (LRU)."""
+        sqlite = SqliteLimbahRepository()
+        self.addCleanup(sqlite.close)
+        sqlite.save(LimbahOrganik("L001", 100.0, 5))
+        sqlite.save(LimbahMedis("L002", 50.0, 8))
+        sqlite.save(LimbahB3("L003", 30.0, "Merkuri"))
+        repository = CachedLimbahRepository(sqlite, kapasitas=2)
+
+        repository.get_by_id("L001")
+        repository.get_by_id("L002")
+        repository.get_by_id("L001")
+        repository.get_by_id("L003")  # L002 paling lama tidak dipakai
+        repository.get_by_id("L002")
+        self.assertIsNone(repository.get_by_id("L999"))
+
+        self.assertEqual(repository.statistik(), {
+            "hit": 1, "miss": 5, "eviksi": 2, "ukuran": 2, "kapasitas": 2,
+        })
+
+    def test_cache_dibuang_saat_data_berubah_di_bawahnya(self):
+        """Test entri cache tidak usang setelah compare-and-set pada SQLite."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+        self.repository.get_by_id("L001")
+
+        self.repository.compare_and_set_status("L001", "Terdaftar", "Diangkut")
+        self.assertEqual(self.repository.get_by_id("L001").get_status(), "Diangkut")
+
+    def test_kapasitas_invalid(self):
+        """Test kapasitas cache kurang dari 1 ditolak."""
+        with self.assertRaises(ValueError):
+            CachedLimbahRepository(InMemoryLimbahRepository(), kapasitas=0)
+
+
+class TestJournalLimbahRepository(LimbahRepositoryContractMixin, unittest.TestCase):
+    """Test case untuk class JournalLimbahRepository."""
+
+    def buat_repository(self):
+        """Membuat JournalLimbahRepository baru pada direktori sementara."""
+        direktori = tempfile.TemporaryDirectory()
+        self.addCleanup(direktori.cleanup)
+        repository = JournalLimbahRepository(direktori.name)
+        self.addCleanup(repository.close)
+        return repository
+
+    def setUp(self):
+        """Setup direktori sementara untuk test persistensi."""
+        super().setUp()
+        direktori = tempfile.TemporaryDirectory()
+        self.addCleanup(direktori.cleanup)
+        self.direktori = direktori.name
+
+    def test_replay_journal_setelah_dibuka_ulang(self):
+        """Test save dan perubahan status di-replay dari journal."""
+        repository = JournalLimbahRepository(self.direktori)
+        repository.save(LimbahOrganik("L001", 100.0, 5))
+        limbah = LimbahMedis("L002", 50.0, 8)
+        repository.save(limbah)
+        limbah.set_status("Diangkut")
+        limbah.volume = 45.0
+        repository.close()
+
+        repository = JournalLimbahRepository(self.direktori)
+        self.addCleanup(repository.close)
+        medis = repository.get_by_id("L002")
+        self.assertEqual(len(repository.get_all()), 2)
+        self.assertEqual(medis.get_status(), "Diangkut")
+        self.assertEqual(medis.get_volume(), 45.0)
+        self.assertEqual(medis.get_tingkat_infeksi(), 8)
+
+    def test_snapshot_dan_ekor_journal(self):
+        """Test snapshot otomatis dan replay hanya ekor journal setelahnya."""
+        repository = JournalLimbahRepository(self.direktori, snapshot_setiap=3)
+        for i in range(4):
+            repository.save(LimbahB3(f"L{i:03d}", 10.0, "Merkuri"))
+        repository.get_by_id("L000").set_status("Diangkut")
+        repository.close()
+
+        with open(os.path.join(self.direktori, JournalLimbahRepository.NAMA_JOURNAL)) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        repository = JournalLimbahRepository(self.direktori, snapshot_setiap=3)
+        self.addCleanup(repository.close)
+        self.assertEqual(len(repository.get_all()), 4)
+        self.assertEqual(repository.get_by_id("L000").get_status(), "Diangkut")
+
+    def test_save_many_melewati_batas_snapshot(self):
+        """Test batch yang melewati snapshot_setiap tetap bisa dibuka ulang tanpa ID ganda."""
+        repository = JournalLimbahRepository(self.direktori, snapshot_setiap=3)
+        repository.save_many([LimbahOrganik(f"L{i}", 10.0, 2) for i in range(5)])
+        repository.close()
+
+        repository = JournalLimbahRepository(self.direktori, snapshot_setiap=3)
+        self.addCleanup(repository.close)
+        self.assertEqual([l.get_id() for l in repository.get_all()], [f"L{i}" for i in range(5)])
+
+    def test_baris_journal_terpotong_diabaikan(self):
+        """Test baris terakhir journal yang terpotong diabaikan saat replay."""
+        repository = JournalLimbahRepository(self.direktori)
+        repository.save(LimbahOrganik("L001", 100.0, 5))
+        repository.close()
+        with open(os.path.join(self.direktori, JournalLimbahRepository.NAMA_JOURNAL), "a") as f:
+            f.write('[2,"s","L002","org')
+
+        repository = JournalLimbahRepository(self.direktori)
+        repository.save(LimbahOrganik("L002", 10.0, 1))
+        repository.close()
+
+        repository = JournalLimbahRepository(self.direktori)
+        self.addCleanup(repository.close)
+        self.assertEqual([l.get_id() for l in repository.get_all()], ["L001", "L002"])
+
+
+def buat_catatan(
+    jam: str, id_limbah: str, kendaraan: str = "Truk A", tujuan: str = "TPS", id_petugas: str = "P001"
+) -> dict:
+    """Membuat catatan manifest pada tanggal 2024-05-01 jam tertentu."""
+    return {
+        "timestamp": f"2024-05-01T{jam}", "id_limbah": id_limbah, "volume": 10.0,
+        "status_baru": "Diangkut", "kendaraan": kendaraan, "tujuan": tujuan, "id_petugas": id_petugas,
+    }
+
+
+class ManifestRepositoryContractMixin:
+    """
+    Kumpulan test kontrak yang wajib dipenuhi setiap implementasi ManifestRepository.
+    """
+
+    def buat_repository(self):
+        """Membuat instance repository baru yang akan diuji."""
+        raise NotImplementedError
+
+    def setUp(self):
+        """Setup yang dijalankan sebelum setiap test."""
+        self.repository = self.buat_repository()
+        self.repository.save_many([
+            buat_catatan("07:30:00", "L001"),
+            buat_catatan("09:15:00.250000", "L002", tujuan="Insinerator"),
+            buat_catatan("11:00:00", "L003", kendaraan="Truk B"),
+            buat_catatan("12:00:00", "L004"),
+            buat_catatan("12:00:00.500000", "L005"),
+        ])
+        # Catatan datang terlambat (timestamp lebih awal dari catatan terakhir)
+        self.repository.save(buat_catatan("10:00:00", "L001", tujuan="Insinerator"))
+
+    def test_find_by_limbah(self):
+        """Test riwayat satu limbah terurut waktu."""
+        riwayat = self.repository.find_by_limbah("L001")
+        self.assertEqual([c["tujuan"] for c in riwayat], ["TPS", "Insinerator"])
+        self.assertEqual(riwayat[0], buat_catatan("07:30:00", "L001"))
+        self.assertEqual(self.repository.find_by_limbah("X"), [])
+
+    def test_find_kendaraan_rentang_waktu(self):
+        """Test muatan satu kendaraan dalam rentang waktu inklusif."""
+        hasil = self.repository.find(kendaraan="Truk A", mulai="2024-05-01T08:00", sampai=datetime(2024, 5, 1, 12))
+        self.assertEqual([c["id_limbah"] for c in hasil], ["L002", "L001", "L004"])
+
+    def test_find_kombinasi_filter(self):
+        """Test filter tujuan, kendaraan, dan tanpa filter."""
+        self.assertEqual([c["id_limbah"] for c in self.repository.find(tujuan="Insinerator")], ["L002", "L001"])
+        self.assertEqual(self.repository.find(kendaraan="Truk B", tujuan="Insinerator"), [])
+        self.assertEqual(self.repository.find(kendaraan="Truk C"), [])
+        self.assertEqual(len(self.repository.find()), 6)
+        self.assertEqual(len(self.repository.find(mulai="2024-05-01T12:00:00.1")), 1)
+
+    def test_catatan_tidak_valid(self):
+        """Test catatan tidak lengkap atau timestamp salah ditolak tanpa menyimpan batch."""
+        catatan = buat_catatan("13:00:00", "L006")
+        del catatan["tujuan"]
+        with self.assertRaises(ValueError):
+            self.repository.save(catatan)
+        with self.assertRaises(ValueError):
+            self.repository.save_many([buat_catatan("13:00:00", "L006"), dict(catatan, timestamp="kemarin", tujuan="TPS")])
+        with self.assertRaises(ValueError):
+            self.repository.find(mulai="pagi")
+        self.assertEqual(self.repository.find_by_limbah("L006"), [])
+
+    def test_petugas_opsional(self):
+        """Test catatan tanpa id_petugas tersimpan dengan petugas None."""
+        catatan = buat_catatan("13:00:00", "L006")
+        del catatan["id_petugas"]
+        self.repository.save(catatan)
+        self.assertIsNone(self.repository.find_by_limbah("L006")[0]["id_petugas"])
+
+
+class TestInMemoryManifestRepository(ManifestRepositoryContractMixin, unittest.TestCase):
+    """Test case untuk class InMemoryManifestRepository."""
+
+    def buat_repository(self):
+        """Membuat InMemoryManifestRepository baru."""
+        return InMemoryManifestRepository()
+
+
+class TestSqliteManifestRepository(ManifestRepositoryContractMixin, unittest.TestCase):
+    """Test case untuk class SqliteManifestRepository."""
+
+    def buat_repository(self):
+        """Membuat SqliteManifestRepository in-memory baru."""
+        repository = SqliteManifestRepository(ukuran_batch=2)
+        self.addCleanup(repository.close)
+        return repository
+
+    def test_data_persisten_dan_memakai_index(self):
+        """Test catatan tetap ada setelah dibuka ulang dan query rentang memakai index."""
+        with tempfile.TemporaryDirectory() as direktori:
+            path = os.path.join(direktori, "manifest.db")
+            repository = SqliteManifestRepository(path)
+            repository.save(buat_catatan("08:00:00", "L001"))
+            repository.close()
+
+            repository = SqliteManifestRepository(path)
+            self.assertEqual(len(repository), 1)
+            self.assertEqual(repository.find_by_limbah("L001"), [buat_catatan("08:00:00", "L001")])
+            repository.close()
+
+            conn = sqlite3.connect(path)
+            rencana = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM manifest WHERE kendaraan = ? AND timestamp >= ?",
+                ("Truk A", "2024"),
+            ).fetchall()
+            conn.close()
+        self.assertIn("USING INDEX", " ".join(str(baris) for baris in rencana))
+
+    def test_migrasi_kolom_petugas(self):
+        """Test database manifest lama tanpa kolom id_petugas tetap bisa dibuka."""
+        with tempfile.TemporaryDirectory() as direktori:
+            path = os.path.join(direktori, "manifest.db")
+            conn = sqlite3.connect(path)
+            conn.execute(
+                "CREATE TABLE manifest (seq INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+                "id_limbah TEXT NOT NULL, volume REAL NOT NULL, status_baru TEXT NOT NULL, "
+                "kendaraan TEXT NOT NULL, tujuan TEXT NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO manifest (timestamp, id_limbah, volume, status_baru, kendaraan, tujuan) "
+                "VALUES ('2024-05-01T08:00:00', 'L001', 10.0, 'Diangkut', 'Truk A', 'TPS')"
+            )
+            conn.commit()
+            conn.close()
+
+            repository = SqliteManifestRepository(path)
+            repository.save(buat_catatan("09:00:00", "L001"))
+            riwayat = repository.find_by_limbah("L001")
+            repository.close()
+        self.assertEqual(riwayat, [buat_catatan("08:00:00", "L001", id_petugas=None), buat_catatan("09:00:00", "L001")])
+
+
 if __name__ == "__main__":
     unittest.main()
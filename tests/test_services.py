@@ -1,17 +1,59 @@
 """
 Unit test untuk services.
 
-Menguji fungsionalitas business logic di LimbahService dan PengangkutanService.
+Menguji fungsionalitas business logic di LimbahService, PengangkutanService,
+PerencanaanTripService, PenugasanService, dan RuteService.
 """
 
+import threading
+from datetime import datetime, timedelta
 import unittest
 from unittest.mock import Mock
 from repositories.in_memory_limbah_repository import InMemoryLimbahRepository
+from repositories.cached_limbah_repository import CachedLimbahRepository
+from repositories.columnar_limbah_repository import ColumnarLimbahRepository
+from repositories.sqlite_limbah_repository import SqliteLimbahRepository
+from repositories.sqlite_manifest_repository import SqliteManifestRepository
+from repositories.limbah_repository import KonflikVersiError
 from services.limbah_service import LimbahService
 from services.pengangkutan_service import PengangkutanService
+from services.perencanaan_trip_service import PerencanaanTripService
+from services.rute_service import RuteService
+from services.antrian_risiko import AntrianRisiko
+from services.laporan_service import LaporanService
+from services.indeks_registrasi import IndeksRegistrasi
+from services.risiko_agregat import AgregatRisiko
+from services.penugasan_service import PenugasanService
+from services.risiko_paralel import hitung_agregat_paralel
+from models.lokasi import Lokasi
+from models.kendaraan import Kendaraan
 from models.limbah_organik import LimbahOrganik
 from models.limbah_medis import LimbahMedis
 from models.limbah_b3 import LimbahB3
+from models.petugas import Petugas
+
+
+class RepositoryAksiSaatIterasi(InMemoryLimbahRepository):
+    """Repository yang menjalankan satu aksi dari thread lain di tengah iter_all() pertama."""
+
+    def __init__(self):
+        super().__init__()
+        self.aksi = None
+        self.terlihat = None
+        self.thread = None
+
+    def iter_all(self, ukuran_halaman: int = 1000):
+        if self.aksi is not None and self.thread is None:
+            self.thread = threading.Thread(target=self.aksi)
+            self.thread.start()
+            while not self.terlihat():
+                pass
+        return super().iter_all(ukuran_halaman)
+
+    def simpan_saat_iterasi(self, limbah_susulan) -> None:
+        """Menyimpan limbah_susulan di tengah iter_all() pertama."""
+        self.aksi = lambda: self.save(limbah_susulan)
+        self.terlihat = lambda: self.get_by_id(limbah_susulan.get_id()) is not None
 
 
 class TestLimbahService(unittest.TestCase):
@@ -46,6 +88,13 @@ class TestLimbahService(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.service.registrasi_limbah_organik("L001", 100.0, 0)
 
+    def test_registrasi_limbah_duplicate_id(self):
+        """Test registrasi limbah dengan ID yang sudah terdaftar."""
+        self.service.registrasi_limbah_organik("L001", 100.0, 5)
+
+        with self.assertRaises(ValueError):
+            self.service.registrasi_limbah_b3("L001", 30.0, "Merkuri")
+
     def test_registrasi_limbah_medis_success(self):
         """Test registrasi limbah medis berhasil."""
         limbah = self.service.registrasi_limbah_medis("L002", 50.0, 8)
@@ -74,6 +123,37 @@ class TestLimbahService(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.service.registrasi_limbah_b3("L003", 30.0, "")
 
+    def test_registrasi_batch_campuran(self):
+        """Test registrasi batch dengan jenis limbah campuran."""
+        hasil = self.service.registrasi_batch([
+            {"jenis": "organik", "id": "L001", "volume": 100.0, "tingkat_pembusukan": 5},
+            {"jenis": "medis", "id": "L002", "volume": 50.0, "tingkat_infeksi": 8},
+            {"jenis": "b3", "id": "L003", "volume": 30.0, "kandungan_kimia": "Merkuri"},
+        ])
+
+        self.assertEqual([l.get_id() for l in hasil["berhasil"]], ["L001", "L002", "L003"])
+        self.assertEqual(hasil["gagal"], [])
+        self.assertIsInstance(self.repository.get_by_id("L002"), LimbahMedis)
+        self.assertEqual(self.service.hitung_total_risiko(), 400.0 + 600.0 + 60.0)
+
+    def test_registrasi_batch_laporan_gagal_per_baris(self):
+        """Test baris invalid dilaporkan tanpa membatalkan baris lain."""
+        self.service.registrasi_limbah_organik("L000", 10.0, 1)
+
+        hasil = self.service.registrasi_batch([
+            {"jenis": "organik", "id": "L001", "volume": 100.0, "tingkat_pembusukan": 5},
+            {"jenis": "medis", "id": "L002", "volume": -1.0, "tingkat_infeksi": 8},
+            {"jenis": "b3", "id": "L003", "volume": 30.0},
+            {"jenis": "elektronik", "id": "L004", "volume": 1.0},
+            {"jenis": "organik", "id": "L001", "volume": 5.0, "tingkat_pembusukan": 1},
+            {"jenis": "organik", "id": "L000", "volume": 5.0, "tingkat_pembusukan": 1},
+            {"jenis": "b3", "id": "L005", "volume": 30.0, "kandungan_kimia": "Timbal"},
+        ])
+
+        self.assertEqual([l.get_id() for l in hasil["berhasil"]], ["L001", "L005"])
+        self.assertEqual([g["indeks"] for g in hasil["gagal"]], [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.repository.get_all()), 3)
+
     def test_get_semua_limbah_empty(self):
         """Test get semua limbah ketika kosong."""
         semua_limbah = self.service.get_semua_limbah()
@@ -88,6 +168,14 @@ class TestLimbahService(unittest.TestCase):
         semua_limbah = self.service.get_semua_limbah()
         self.assertEqual(len(semua_limbah), 3)
 
+    def test_iter_semua_limbah(self):
+        """Test iterasi streaming seluruh limbah."""
+        self.service.registrasi_limbah_organik("L001", 100.0, 5)
+        self.service.registrasi_limbah_medis("L002", 50.0, 8)
+
+        ids = [l.get_id() for l in self.service.iter_semua_limbah(ukuran_halaman=1)]
+        self.assertEqual(ids, ["L001", "L002"])
+
     def test_cari_limbah_by_id_found(self):
         """Test mencari limbah berdasarkan ID yang ada."""
         self.service.registrasi_limbah_organik("L001", 100.0, 5)
@@ -121,6 +209,126 @@ class TestLimbahService(unittest.TestCase):
         expected = 400.0 + 600.0 + 60.0
         self.assertEqual(total, expected)
 
+    def test_total_risiko_inkremental(self):
+        """Test total dan subtotal risiko mengikuti simpan, volume, dan status."""
+        organik = self.service.registrasi_limbah_organik("L001", 100.0, 5)  # 400
+        self.service.registrasi_limbah_medis("L002", 50.0, 8)               # 600
+        self.repository.save(LimbahB3("L003", 30.0, "Merkuri"))            # 60
+
+        organik.volume = 50.0                                               # 400 -> 200
+        self.service.proses_pengolahan_limbah("L002")
+
+        ringkasan = self.service.ringkasan_risiko()
+        self.assertAlmostEqual(self.service.hitung_total_risiko(), 860.0)
+        self.assertAlmostEqual(ringkasan["per_jenis"]["LimbahOrganik"], 200.0)
+        self.assertAlmostEqual(ringkasan["per_status"]["Dimusnahkan"], 600.0)
+        self.assertAlmostEqual(ringkasan["per_status"]["Terdaftar"], 260.0)
+        self.assertTrue(self.service.verifikasi_total_risiko())
+
+    def test_total_risiko_simpan_saat_pengisian(self):
+        """Test limbah yang disimpan selama pengisian awal tidak dihitung dua kali."""
+        repository = RepositoryAksiSaatIterasi()
+        repository.simpan_saat_iterasi(LimbahMedis("L002", 50.0, 8))  # 600
+        repository.save(LimbahOrganik("L001", 100.0, 5))               # 400
+        service = LimbahService(repository)
+        repository.thread.join()
+
+        self.assertAlmostEqual(service.hitung_total_risiko(), 1000.0)
+        self.assertTrue(service.verifikasi_total_risiko())
+        service.registrasi_limbah_medis("L003", 10.0, 8)               # 120
+        self.assertAlmostEqual(service.hitung_total_risiko(), 1120.0)
+
+    def test_total_risiko_status_berubah_saat_pengisian(self):
+        """Test perubahan status yang sudah terbaca pengisian tidak dipindahkan dua kali."""
+        repository = RepositoryAksiSaatIterasi()
+        limbah = LimbahMedis("L001", 50.0, 8)                          # 600
+        repository.save(limbah)
+        repository.aksi = lambda: limbah.set_status("Diangkut")
+        repository.terlihat = lambda: limbah.get_status() == "Diangkut"
+        agregat = AgregatRisiko(repository)
+        repository.thread.join()
+
+        self.assertEqual(agregat.per_status(), {"Diangkut": 600.0})
+        self.assertTrue(agregat.verifikasi())
+        limbah.set_status("Dimusnahkan")
+        self.assertEqual(agregat.per_status(), {"Diangkut": 0.0, "Dimusnahkan": 600.0})
+
+    def test_service_di_atas_cache(self):
+        """Test service berjalan sama di atas CachedLimbahRepository."""
+        sqlite = SqliteLimbahRepository()
+        self.addCleanup(sqlite.close)
+        repository = CachedLimbahRepository(sqlite, kapasitas=1)
+        service = LimbahService(repository)
+        service.registrasi_limbah_organik("L001", 100.0, 5)
+        service.registrasi_limbah_medis("L002", 50.0, 8)
+
+        service.proses_pengolahan_limbah("L001")
+        self.assertEqual(service.cari_limbah_by_id("L001").get_status(), "Didaur Ulang")
+        self.assertEqual(sqlite.get_by_id("L001").get_status(), "Didaur Ulang")
+        self.assertEqual(service.hitung_total_risiko(), 1000.0)
+        self.assertTrue(service.verifikasi_total_risiko())
+
+    def test_ringkasan_risiko_paralel(self):
+        """Test rekap paralel sama dengan rekap satu proses dan agregat inkremental."""
+        for i in range(30):
+            self.service.registrasi_limbah_organik(f"O{i:03d}", 10.0 + i, 5)
+            self.service.registrasi_limbah_medis(f"M{i:03d}", 5.0 + i, 3)
+        self.repository.save(LimbahB3("B001", 30.0, "Merkuri"))
+
+        with self.assertLogs("services.risiko_paralel") as log:
+            paralel = hitung_agregat_paralel(self.repository, jumlah_pekerja=2, ukuran_partisi=7)
+        self.assertIn("pekerja=1", log.output[0])
+        satu_proses = self.service.ringkasan_risiko_paralel(jumlah_pekerja=1)
+
+        columnar = ColumnarLimbahRepository()
+        columnar.save_many(self.repository.get_all())
+        with self.assertLogs("services.risiko_paralel") as log:
+            dengan_pool = hitung_agregat_paralel(columnar, jumlah_pekerja=2, ukuran_partisi=7)
+        self.assertIn("pekerja=2", log.output[0])
+        self.assertEqual(dengan_pool["per_jenis"], paralel["per_jenis"])
+
+        self.assertAlmostEqual(paralel["total"], self.service.hitung_total_risiko())
+        self.assertEqual(paralel["jumlah"], 61)
+        self.assertEqual(paralel["per_jenis"]["LimbahB3"], {"risiko": 60.0, "volume": 30.0, "jumlah": 1})
+        self.assertEqual(paralel["per_jenis"]["LimbahMedis"]["jumlah"], 30)
+        self.assertAlmostEqual(paralel["per_jenis"]["LimbahOrganik"]["volume"], sum(10.0 + i for i in range(30)))
+        self.assertAlmostEqual(satu_proses["total"], paralel["total"])
+        with self.assertRaises(ValueError):
+            self.service.ringkasan_risiko_paralel(jumlah_pekerja=0)
+
+    def test_total_risiko_data_sudah_ada(self):
+        """Test agregat dibangun dari data yang sudah ada di repository."""
+        self.repository.save(LimbahOrganik("L001", 100.0, 5))
+
+        service = LimbahService(self.repository)
+        self.assertEqual(service.hitung_total_risiko(), 400.0)
+        self.assertTrue(service.verifikasi_total_risiko())
+
+    def test_top_k_risiko(self):
+        """Test top-k risiko dengan dan tanpa filter status/jenis."""
+        self.service.registrasi_limbah_organik("L001", 10.0, 5)    # risiko 40
+        self.service.registrasi_limbah_medis("L002", 20.0, 3)      # risiko 90
+        self.service.registrasi_limbah_b3("L003", 30.0, "Merkuri")  # risiko 60
+        self.service.registrasi_limbah_medis("L004", 10.0, 2)      # risiko 30
+        self.service.proses_pengolahan_limbah("L002")
+
+        self.assertEqual([l.get_id() for l in self.service.top_k_risiko(2)], ["L002", "L003"])
+        self.assertEqual([l.get_id() for l in self.service.top_k_risiko(2, status="Terdaftar")], ["L003", "L001"])
+        self.assertEqual([l.get_id() for l in self.service.top_k_risiko(5, jenis=LimbahMedis)], ["L002", "L004"])
+        self.assertEqual(
+            [l.get_id() for l in self.service.top_k_risiko(5, status="Terdaftar", jenis=LimbahMedis)], ["L004"]
+        )
+        self.assertEqual(self.service.top_k_risiko(0), [])
+
+    def test_top_k_risiko_invalid(self):
+        """Test k negatif, status tidak dikenal, dan jenis bukan Limbah ditolak."""
+        with self.assertRaises(ValueError):
+            self.service.top_k_risiko(-1)
+        with self.assertRaises(ValueError):
+            self.service.top_k_risiko(5, status="Hilang")
+        with self.assertRaises(ValueError):
+            self.service.top_k_risiko(5, jenis=str)
+
     def test_proses_pengolahan_limbah_success(self):
         """Test proses pengolahan limbah berhasil."""
         self.service.registrasi_limbah_organik("L001", 100.0, 5)
@@ -132,6 +340,14 @@ class TestLimbahService(unittest.TestCase):
         limbah = self.service.cari_limbah_by_id("L001")
         self.assertEqual(limbah.get_status(), "Didaur Ulang")
 
+    def test_proses_pengolahan_limbah_sudah_diproses(self):
+        """Test proses pengolahan limbah yang sudah diproses ditolak."""
+        self.service.registrasi_limbah_medis("L001", 50.0, 8)
+        self.service.proses_pengolahan_limbah("L001")
+
+        with self.assertRaises(ValueError):
+            self.service.proses_pengolahan_limbah("L001")
+
     def test_proses_pengolahan_limbah_not_found(self):
         """Test proses pengolahan limbah yang tidak ditemukan."""
         with self.assertRaises(LookupError):
@@ -167,6 +383,118 @@ class TestPengangkutanService(unittest.TestCase):
         limbah = self.repository.get_by_id("L001")
         self.assertEqual(limbah.get_status(), "Dalam Pengangkutan")
 
+    def test_catatan_pengangkutan_tersimpan_di_manifest(self):
+        """Test catatan angkut tunggal dan batch tersimpan dan bisa dicari."""
+        manifest_repository = SqliteManifestRepository()
+        self.addCleanup(manifest_repository.close)
+        service = PengangkutanService(self.repository, manifest_repository)
+        self.limbah_service.registrasi_limbah_organik("L001", 100.0, 5)
+        self.limbah_service.registrasi_limbah_medis("L002", 20.0, 8)
+        self.limbah_service.registrasi_limbah_medis("L003", 30.0, 8)
+
+        catatan = service.angkut_limbah("L001", "Truk A", "TPS")
+        manifest = service.angkut_batch(["L002", "L003", "X"], "Truk B", "Insinerator")
+
+        self.assertEqual(service.lacak_limbah("L001"), [catatan])
+        self.assertEqual(service.lacak_limbah("X"), [])
+        truk_b = service.riwayat_pengangkutan(kendaraan="Truk B", mulai=manifest["timestamp"])
+        self.assertEqual([c["id_limbah"] for c in truk_b], ["L002", "L003"])
+        self.assertEqual({c["tujuan"] for c in truk_b}, {"Insinerator"})
+        self.assertEqual(len(service.riwayat_pengangkutan(sampai=catatan["timestamp"])), 1)
+        with self.assertRaises(ValueError):
+            service.lacak_limbah("")
+
+    def test_petugas_tercatat_di_catatan_pengangkutan(self):
+        """Test petugas dipilih sesuai keahlian dan dicatat di manifest."""
+        penugasan = PenugasanService([Petugas("P001", "Budi", "Medis"), Petugas("P002", "Sari", "Pengangkutan")])
+        service = PengangkutanService(self.repository, penugasan_service=penugasan)
+        self.limbah_service.registrasi_limbah_medis("L001", 20.0, 8)
+        self.limbah_service.registrasi_limbah_medis("L002", 30.0, 8)
+        self.limbah_service.registrasi_limbah_b3("L003", 5.0, "Merkuri")
+        self.limbah_service.registrasi_limbah_organik("L004", 50.0, 5)
+
+        with self.assertRaises(ValueError):
+            service.angkut_limbah("L001", "Truk", "Insinerator", id_petugas="P002")
+        self.assertEqual(self.repository.get_by_id("L001").get_status(), "Terdaftar")
+        catatan = service.angkut_limbah("L001", "Truk", "Insinerator", id_petugas="P001")
+        self.assertEqual(catatan["id_petugas"], "P001")
+
+        manifest = service.angkut_batch(["L002", "L003", "L004"], "Truk", "TPS")
+        self.assertEqual(
+            [(item["id_limbah"], item["id_petugas"]) for item in manifest["diangkut"]],
+            [("L002", "P001"), ("L003", None), ("L004", "P002")],
+        )
+        self.assertEqual(manifest["ditolak"], [])
+        self.assertEqual(self.repository.get_by_id("L003").get_status(), "Diangkut")
+        self.assertEqual(service.lacak_limbah("L004")[0]["id_petugas"], "P002")
+        self.assertEqual(penugasan.beban("P001"), {"jumlah_tugas": 2, "volume": 50.0})
+
+    def test_angkut_tanpa_petugas_tersedia(self):
+        """Test roster kosong tidak menghalangi pengangkutan dengan petugas otomatis."""
+        penugasan = PenugasanService()
+        service = PengangkutanService(self.repository, penugasan_service=penugasan)
+        self.limbah_service.registrasi_limbah_medis("L001", 20.0, 8)
+        self.limbah_service.registrasi_limbah_b3("L002", 5.0, "Merkuri")
+
+        catatan = service.angkut_limbah("L001", "Truk", "Insinerator")
+        self.assertIsNone(catatan["id_petugas"])
+        self.assertEqual(self.repository.get_by_id("L001").get_status(), "Diangkut")
+        manifest = service.angkut_batch(["L002"], "Truk", "TPS")
+        self.assertEqual([item["id_limbah"] for item in manifest["diangkut"]], ["L002"])
+
+        self.limbah_service.registrasi_limbah_medis("L003", 10.0, 8)
+        with self.assertRaises(LookupError):
+            service.angkut_limbah("L003", "Truk", "TPS", id_petugas="P999")
+        self.assertEqual(self.repository.get_by_id("L003").get_status(), "Terdaftar")
+
+    def test_angkut_limbah_memperbarui_index_status(self):
+        """Test index status repository mengikuti pengangkutan limbah."""
+        self.limbah_service.registrasi_limbah_medis("L001", 50.0, 8)
+        self.limbah_service.registrasi_limbah_medis("L002", 50.0, 8)
+
+        self.pengangkutan_service.angkut_limbah("L001", "Truk", "Insinerator")
+
+        diangkut = self.repository.find_by_status("Diangkut", jenis=LimbahMedis)
+        self.assertEqual([l.get_id() for l in diangkut], ["L001"])
+        terdaftar = self.repository.find_by_status("Terdaftar", jenis=LimbahMedis)
+        self.assertEqual([l.get_id() for l in terdaftar], ["L002"])
+
+    def test_angkut_batch(self):
+        """Test angkut batch menghasilkan satu manifest dan alasan penolakan per ID."""
+        self.limbah_service.registrasi_limbah_organik("L001", 100.0, 5)
+        self.limbah_service.registrasi_limbah_medis("L002", 50.0, 8)
+        self.limbah_service.registrasi_limbah_medis("L003", 20.0, 3)
+        self.limbah_service.proses_pengolahan_limbah("L003")
+
+        manifest = self.pengangkutan_service.angkut_batch(
+            ["L001", "L002", "L001", "L003", "L999", ""], "Truk Besar", "TPS Kalibata"
+        )
+
+        self.assertEqual([item["id_limbah"] for item in manifest["diangkut"]], ["L001", "L002"])
+        self.assertEqual(manifest["total_volume"], 150.0)
+        self.assertEqual(manifest["kendaraan"], "Truk Besar")
+        self.assertEqual([item["indeks"] for item in manifest["ditolak"]], [2, 3, 4, 5])
+        self.assertEqual(self.repository.get_by_id("L002").get_status(), "Diangkut")
+        self.assertEqual(self.repository.get_by_id("L003").get_status(), "Dimusnahkan")
+
+    def test_angkut_batch_kendaraan_invalid(self):
+        """Test angkut batch dengan kendaraan kosong ditolak sebelum ada perubahan."""
+        self.limbah_service.registrasi_limbah_organik("L001", 100.0, 5)
+
+        with self.assertRaises(ValueError):
+            self.pengangkutan_service.angkut_batch(["L001"], "", "TPS")
+        self.assertEqual(self.repository.get_by_id("L001").get_status(), "Terdaftar")
+
+    def test_angkut_limbah_memakai_get_by_id(self):
+        """Test pencarian limbah memakai get_by_id repository, bukan get_all."""
+        repository = Mock()
+        repository.get_by_id.return_value = None
+
+        with self.assertRaises(LookupError):
+            PengangkutanService(repository).angkut_limbah("L001", "Truk", "TPS")
+        repository.get_by_id.assert_called_once_with("L001")
+        repository.get_all.assert_not_called()
+
     def test_angkut_limbah_not_found(self):
         """Test angkut limbah yang tidak ditemukan."""
         with self.assertRaises(LookupError):
@@ -208,5 +536,492 @@ class TestPengangkutanService(unittest.TestCase):
             )
 
 
+class TestPerencanaanTripService(unittest.TestCase):
+    """Test case untuk class PerencanaanTripService."""
+
+    def setUp(self):
+        """Setup yang dijalankan sebelum setiap test."""
+        self.repository = InMemoryLimbahRepository()
+        self.limbah_service = LimbahService(self.repository)
+        self.service = PerencanaanTripService(self.repository)
+
+    def test_rencanakan_memisahkan_jenis(self):
+        """Test trip dikemas per jenis dan limbah yang tidak muat ditolak."""
+        self.limbah_service.registrasi_limbah_organik("L001", 600.0, 5)
+        self.limbah_service.registrasi_limbah_organik("L002", 400.0, 5)
+        self.limbah_service.registrasi_limbah_medis("L003", 300.0, 8)
+        self.limbah_service.registrasi_limbah_medis("L004", 1500.0, 8)
+        self.limbah_service.registrasi_limbah_organik("L005", 200.0, 5)
+        self.limbah_service.proses_pengolahan_limbah("L005")
+        kendaraan = Kendaraan("K001", "Truk", 1000, (LimbahOrganik, LimbahMedis))
+
+        rencana = self.service.rencanakan(kendaraan)
+
+        self.assertEqual(rencana["jumlah_trip"], 2)
+        self.assertEqual(rencana["batas_bawah"], 2)
+        trip = {t["jenis"]: sorted(t["id_limbah"]) for t in rencana["trip"]}
+        self.assertEqual(trip, {"LimbahOrganik": ["L001", "L002"], "LimbahMedis": ["L003"]})
+        self.assertEqual([d["id_limbah"] for d in rencana["ditolak"]], ["L004"])
+
+    def test_rencanakan_metode_tidak_dikenal(self):
+        """Test metode bin packing yang tidak dikenal ditolak."""
+        kendaraan = Kendaraan("K001", "Truk", 1000, (LimbahOrganik,))
+        with self.assertRaises(ValueError):
+            self.service.rencanakan(kendaraan, metode="acak")
+
+    def test_angkut_batch_dengan_kendaraan(self):
+        """Test angkut batch dengan Kendaraan membatasi kapasitas dan jenis muatan."""
+        self.limbah_service.registrasi_limbah_medis("L001", 600.0, 8)
+        self.limbah_service.registrasi_limbah_b3("L002", 100.0, "Merkuri")
+        self.limbah_service.registrasi_limbah_medis("L003", 500.0, 8)
+        self.limbah_service.registrasi_limbah_medis("L004", 300.0, 8)
+        self.limbah_service.registrasi_limbah_organik("L005", 10.0, 5)
+        kendaraan = Kendaraan("K001", "Truk Medis", 1000, (LimbahMedis, LimbahB3))
+
+        manifest = PengangkutanService(self.repository).angkut_batch(
+            ["L001", "L002", "L003", "L004", "L005"], kendaraan, "Insinerator"
+        )
+
+        self.assertEqual([item["id_limbah"] for item in manifest["diangkut"]], ["L001", "L004"])
+        self.assertEqual(manifest["kendaraan"], "Truk Medis")
+        self.assertEqual([item["id_limbah"] for item in manifest["ditolak"]], ["L002", "L003", "L005"])
+        self.assertEqual(self.repository.get_by_id("L003").get_status(), "Terdaftar")
+
+
+class TestAntrianRisiko(unittest.TestCase):
+    """Test case untuk class AntrianRisiko."""
+
+    def setUp(self):
+        """Setup yang dijalankan sebelum setiap test."""
+        self.repository = InMemoryLimbahRepository()
+        self.limbah_service = LimbahService(self.repository)
+        self.limbah_service.registrasi_limbah_organik("L001", 10.0, 5)   # risiko 40
+        self.limbah_service.registrasi_limbah_b3("L002", 30.0, "Merkuri")  # risiko 60
+        self.antrian = AntrianRisiko(self.repository)
+        self.limbah_service.registrasi_limbah_medis("L003", 20.0, 3)     # risiko 90
+
+    def test_peek_dan_pop_berurutan_risiko(self):
+        """Test antrian memuat limbah lama dan baru terurut dari risiko tertinggi."""
+        self.assertEqual(len(self.antrian), 3)
+        self.assertEqual(self.antrian.peek_top_k(2), [("L003", 90.0), ("L002", 60.0)])
+        self.assertEqual(self.antrian.pop_berikut(), ("L003", 90.0))
+        self.assertEqual([id for id, _ in self.antrian.peek_top_k(10)], ["L002", "L001"])
+        with self.assertRaises(ValueError):
+            self.antrian.peek_top_k(-1)
+
+    def test_perubahan_volume_dan_status(self):
+        """Test prioritas mengikuti perubahan volume dan limbah keluar setelah diangkut/diproses."""
+        self.repository.get_by_id("L001").set_volume(50.0)  # risiko 200
+        self.assertEqual(self.antrian.peek_top_k(1), [("L001", 200.0)])
+
+        PengangkutanService(self.repository).angkut_limbah("L001", "Truk", "TPS")
+        self.limbah_service.proses_pengolahan_limbah("L002")
+
+        self.assertEqual(len(self.antrian), 1)
+        self.assertEqual(self.antrian.pop_berikut(), ("L003", 90.0))
+        self.assertIsNone(self.antrian.pop_berikut())
+
+    def test_pop_tidak_kembali_saat_volume_berubah(self):
+        """Test limbah yang sudah dikeluarkan tidak masuk lagi karena perubahan volume."""
+        self.assertEqual(self.antrian.pop_berikut(), ("L003", 90.0))
+        self.repository.get_by_id("L003").set_volume(40.0)
+
+        self.assertEqual(len(self.antrian), 2)
+        self.assertEqual([id for id, _ in self.antrian.peek_top_k(10)], ["L002", "L001"])
+
+    def test_pemadatan_entri_usang(self):
+        """Test banyak pembaruan volume tidak mengubah isi antrian."""
+        limbah = self.repository.get_by_id("L001")
+        for i in range(500):
+            limbah.set_volume(1.0 + i)
+        self.assertEqual(len(self.antrian), 3)
+        self.assertEqual(self.antrian.peek_top_k(1), [("L001", 500.0 * 5 * 0.8)])
+
+    def test_angkut_prioritas(self):
+        """Test PengangkutanService mengangkut limbah berisiko tertinggi lebih dulu."""
+        service = PengangkutanService(self.repository)
+        kendaraan = Kendaraan("K001", "Truk", 100, (LimbahOrganik, LimbahMedis, LimbahB3))
+
+        manifest = service.angkut_prioritas(self.antrian, 2, kendaraan, "TPS")
+
+        self.assertEqual([item["id_limbah"] for item in manifest["diangkut"]], ["L003"])
+        self.assertEqual([item["id_limbah"] for item in manifest["ditolak"]], ["L002", "L001"])
+        self.assertEqual([id for id, _ in self.antrian.peek_top_k(10)], ["L002", "L001"])
+        with self.assertRaises(ValueError):
+            service.angkut_prioritas(self.antrian, -1, kendaraan, "TPS")
+
+    def test_angkut_prioritas_lewati_yang_ditolak(self):
+        """Test limbah teratas yang ditolak kendaraan tidak menghalangi limbah di bawahnya."""
+        service = PengangkutanService(self.repository)
+        truk_organik = Kendaraan("K002", "Truk", 100, (LimbahOrganik,))
+        self.limbah_service.registrasi_limbah_organik("L004", 5.0, 5)    # risiko 20
+
+        manifest = service.angkut_prioritas(self.antrian, 2, truk_organik, "TPS")
+
+        self.assertEqual([item["id_limbah"] for item in manifest["diangkut"]], ["L001", "L004"])
+        self.assertEqual([item["id_limbah"] for item in manifest["ditolak"]], ["L003", "L002"])
+        self.assertEqual([id for id, _ in self.antrian.peek_top_k(10)], ["L003", "L002"])
+
+    def test_angkut_prioritas_berhenti_saat_penuh(self):
+        """Test penelusuran antrian berhenti saat kapasitas kendaraan habis."""
+        service = PengangkutanService(self.repository)
+        truk_kecil = Kendaraan("K003", "Truk", 20, (LimbahOrganik, LimbahMedis, LimbahB3))
+
+        manifest = service.angkut_prioritas(self.antrian, 3, truk_kecil, "TPS")
+
+        self.assertEqual([item["id_limbah"] for item in manifest["diangkut"]], ["L003"])
+        self.assertEqual(manifest["ditolak"], [])
+
+
+class TestLaporanService(unittest.TestCase):
+    """Test case untuk class LaporanService."""
+
+    def setUp(self):
+        """Setup yang dijalankan sebelum setiap test."""
+        self.repository = SqliteLimbahRepository()
+        self.addCleanup(self.repository.close)
+        self.limbah_service = LimbahService(self.repository)
+        self.limbah_service.registrasi_limbah_organik("L001", 10.0, 5)   # risiko 40
+        self.lokasi = {"L001": "Posko A", "L002": "Posko B", "L003": "Posko A"}
+        self.laporan = LaporanService(self.repository, self.lokasi.get)
+        self.limbah_service.registrasi_limbah_medis("L002", 20.0, 3)     # risiko 90
+        self.limbah_service.registrasi_limbah_b3("L003", 30.0, "Merkuri")  # risiko 60
+
+    def test_tampilan_bawaan(self):
+        """Test tampilan jenis, status, dan lokasi memuat limbah lama dan baru."""
+        self.assertEqual(self.laporan.daftar_tampilan(), ["jenis", "status", "lokasi"])
+        self.assertEqual(self.laporan.baca_grup("jenis", "LimbahMedis"), {"jumlah": 1, "volume": 20.0, "risiko": 90.0})
+        self.assertEqual(self.laporan.baca_grup("status", "Terdaftar")["jumlah"], 3)
+        self.assertEqual(self.laporan.baca("lokasi"), {
+            "Posko A": {"jumlah": 2, "volume": 40.0, "risiko": 100.0},
+            "Posko B": {"jumlah": 1, "volume": 20.0, "risiko": 90.0},
+        })
+
+    def test_perubahan_status_dan_volume(self):
+        """Test tampilan mengikuti pengangkutan, pengolahan, dan perubahan volume."""
+        PengangkutanService(self.repository).angkut_limbah("L002", "Truk", "Insinerator")
+        self.limbah_service.proses_pengolahan_limbah("L001")
+        self.repository.get_by_id("L003").set_volume(15.0)
+
+        self.assertEqual(self.laporan.baca("status"), {
+            "Diangkut": {"jumlah": 1, "volume": 20.0, "risiko": 90.0},
+            "Didaur Ulang": {"jumlah": 1, "volume": 10.0, "risiko": 40.0},
+            "Terdaftar": {"jumlah": 1, "volume": 15.0, "risiko": 30.0},
+        })
+        self.assertEqual(self.laporan.baca_grup("status", "Dimusnahkan"), {"jumlah": 0, "volume": 0.0, "risiko": 0.0})
+        self.assertTrue(self.laporan.verifikasi())
+
+    def test_tampilan_kustom_dan_segarkan(self):
+        """Test tampilan terdaftar belakangan dan pemetaan lokasi yang berubah."""
+        self.laporan.daftarkan_tampilan("besar", lambda limbah: limbah.get_volume() >= 20)
+        self.assertEqual(self.laporan.baca_grup("besar", True)["jumlah"], 2)
+
+        self.lokasi["L003"] = "Posko B"
+        self.assertFalse(self.laporan.verifikasi())
+        self.laporan.segarkan("L003")
+        self.assertEqual(self.laporan.baca_grup("lokasi", "Posko B")["jumlah"], 2)
+        self.assertTrue(self.laporan.verifikasi())
+
+        with self.assertRaises(ValueError):
+            self.laporan.daftarkan_tampilan("besar", lambda limbah: True)
+        self.laporan.hapus_tampilan("besar")
+        with self.assertRaises(LookupError):
+            self.laporan.baca("besar")
+        with self.assertRaises(LookupError):
+            self.laporan.segarkan("X")
+
+    def test_bangun_ulang(self):
+        """Test bangun ulang menghasilkan nilai yang sama dengan pemeliharaan inkremental."""
+        sebelum = self.laporan.baca("jenis")
+        self.laporan.bangun_ulang()
+        self.assertEqual(self.laporan.baca("jenis"), sebelum)
+
+    def test_tampilan_dari_agregat_risiko(self):
+        """Test tampilan jenis dan status dibaca dari AgregatRisiko milik LimbahService."""
+        agregat = self.limbah_service.get_agregat_risiko()
+        laporan = LaporanService(self.repository, agregat_risiko=agregat)
+        self.limbah_service.proses_pengolahan_limbah("L002")
+
+        self.assertEqual(laporan.daftar_tampilan(), ["jenis", "status"])
+        self.assertEqual(laporan.baca("jenis"), agregat.grup_jenis())
+        self.assertEqual(laporan.baca_grup("status", "Dimusnahkan"), {"jumlah": 1, "volume": 20.0, "risiko": 90.0})
+        self.assertEqual(agregat.per_status()["Terdaftar"], 100.0)
+        self.assertTrue(laporan.verifikasi())
+
+        laporan.hapus_tampilan("status")
+        with self.assertRaises(LookupError):
+            laporan.baca("status")
+        self.assertEqual(laporan.daftar_tampilan(), ["jenis"])
+
+
+class TestIndeksRegistrasi(unittest.TestCase):
+    """Test case untuk class IndeksRegistrasi."""
+
+    def setUp(self):
+        """Setup yang dijalankan sebelum setiap test."""
+        self.awal = datetime(2024, 5, 1, 8, 0)
+        self.repository = InMemoryLimbahRepository()
+        self.repository.save(LimbahMedis("L001", 10.0, 2, self.waktu(0, 30)))      # 08:00:30
+        self.indeks = IndeksRegistrasi(self.repository)
+        self.repository.save_many([
+            LimbahMedis("L002", 20.0, 2, self.waktu(59, 59)),                    # 08:59:59
+            LimbahOrganik("L003", 30.0, 5, self.waktu(61)),                      # 09:01
+            LimbahMedis("L004", 40.0, 2, self.waktu(150)),                       # 10:30
+            LimbahB3("L005", 5.0, "Merkuri", self.waktu(-10)),                   # 07:50, datang terlambat
+        ])
+
+    def waktu(self, menit: int, detik: int = 0) -> datetime:
+        """Membuat waktu relatif terhadap 08:00."""
+        return self.awal + timedelta(minutes=menit, seconds=detik)
+
+    def test_rentang_dan_filter_jenis(self):
+        """Test rentang memakai bucket jam dan menit dengan filter jenis."""
+        semua = self.indeks.rentang(self.waktu(-60), self.waktu(240))
+        self.assertEqual((semua["jumlah"], semua["volume"]), (5, 105.0))
+
+        medis = self.indeks.rentang(self.waktu(0), self.waktu(120), LimbahMedis)
+        self.assertEqual(medis, {"jumlah": 2, "volume": 30.0, "risiko": 90.0})
+
+        sebagian = self.indeks.rentang(self.waktu(0, 45), self.waktu(61, 30))
+        self.assertEqual(sebagian["jumlah"], 3)
+        with self.assertRaises(ValueError):
+            self.indeks.rentang(self.waktu(10), self.waktu(0))
+
+    def test_laju_dan_perubahan_volume(self):
+        """Test jendela bergulir mengikuti perubahan volume."""
+        self.repository.get_by_id("L004").set_volume(60.0)
+
+        laju = self.indeks.laju(3600, LimbahMedis, sekarang=self.waktu(180))
+        self.assertEqual(laju["volume"], 60.0)
+        self.assertEqual(laju["kg_per_jam"], 60.0)
+        self.assertEqual(self.indeks.laju(7200, sekarang=self.waktu(180))["kg_per_jam"], 45.0)
+        self.assertTrue(self.indeks.verifikasi())
+        with self.assertRaises(ValueError):
+            self.indeks.laju(0)
+
+    def test_deret_dan_bangun_ulang(self):
+        """Test deret per jam hanya memuat bucket terisi."""
+        deret = self.indeks.deret(self.waktu(-60), self.waktu(180), IndeksRegistrasi.JAM)
+        self.assertEqual([d["waktu"].hour for d in deret], [7, 8, 9, 10])
+        self.assertEqual([d["jumlah"] for d in deret], [1, 2, 1, 1])
+        with self.assertRaises(ValueError):
+            self.indeks.deret(self.waktu(0), self.waktu(60), resolusi=120)
+
+        self.indeks.bangun_ulang()
+        self.assertEqual(self.indeks.deret(self.waktu(-60), self.waktu(180), IndeksRegistrasi.JAM), deret)
+
+    def test_simpan_saat_pengisian(self):
+        """Test limbah yang disimpan selama pengisian awal tidak dihitung dua kali."""
+        repository = RepositoryAksiSaatIterasi()
+        repository.simpan_saat_iterasi(LimbahMedis("L002", 20.0, 2, self.waktu(5)))
+        repository.save(LimbahMedis("L001", 10.0, 2, self.waktu(0)))
+        indeks = IndeksRegistrasi(repository)
+        repository.thread.join()
+
+        self.assertEqual(indeks.rentang(self.waktu(0), self.waktu(60))["jumlah"], 2)
+        self.assertTrue(indeks.verifikasi())
+
+
+class TestPenugasanService(unittest.TestCase):
+    """Test case untuk class PenugasanService."""
+
+    def setUp(self):
+        """Setup yang dijalankan sebelum setiap test."""
+        self.penugasan = PenugasanService([
+            Petugas("P001", "Budi", "Medis"),
+            Petugas("P002", "Sari", "medis"),
+            Petugas("P003", "Joko", "B3"),
+            Petugas("P004", "Ani", "Pengangkutan"),
+        ])
+
+    def test_keahlian_sesuai_jenis_limbah(self):
+        """Test limbah medis dan B3 hanya untuk petugas berkeahlian sesuai."""
+        self.assertIn(self.penugasan.tugaskan(LimbahMedis("L001", 10.0, 5)).get_id(), {"P001", "P002"})
+        self.assertEqual(self.penugasan.tugaskan(LimbahB3("L002", 5.0, "Merkuri")).get_id(), "P003")
+        with self.assertRaises(ValueError):
+            self.penugasan.tugaskan(LimbahB3("L003", 5.0, "Merkuri"), "P004")
+        with self.assertRaises(LookupError):
+            self.penugasan.tugaskan(LimbahB3("L003", 5.0, "Merkuri"), "P999")
+
+        self.penugasan.set_tersedia("P003", False)
+        with self.assertRaises(LookupError):
+            self.penugasan.periksa(LimbahB3("L003", 5.0, "Merkuri"))
+        with self.assertRaises(ValueError):
+            self.penugasan.tugaskan(LimbahB3("L003", 5.0, "Merkuri"), "P003")
+        self.penugasan.set_tersedia("P003", True)
+        self.assertEqual(self.penugasan.tugaskan(LimbahB3("L003", 5.0, "Merkuri")).get_id(), "P003")
+
+    def test_batch_menyebar_beban(self):
+        """Test penugasan batch memilih petugas berbeban terkecil."""
+        daftar_limbah = [LimbahMedis(f"M{i}", 10.0, 5) for i in range(6)]
+        daftar_limbah += [LimbahOrganik(f"O{i}", 20.0, 3) for i in range(4)]
+        hasil = self.penugasan.tugaskan_batch(daftar_limbah)
+
+        self.assertEqual(hasil["gagal"], [])
+        self.assertEqual([p["id_petugas"] for p in hasil["penugasan"][:6]], ["P001", "P002"] * 3)
+        beban = self.penugasan.ringkasan_beban()
+        self.assertEqual({id: b["jumlah_tugas"] for id, b in beban.items()}, {"P001": 3, "P002": 3, "P003": 2, "P004": 2})
+        self.assertEqual(beban["P004"]["volume"], 40.0)
+
+        self.penugasan.hapus_petugas("P003")
+        hasil = self.penugasan.tugaskan_batch([LimbahB3("B1", 1.0, "Merkuri"), LimbahOrganik("O9", 1.0, 1)])
+        self.assertEqual([g["id_limbah"] for g in hasil["gagal"]], ["B1"])
+        self.assertEqual(hasil["penugasan"], [{"id_limbah": "O9", "id_petugas": "P004"}])
+
+        self.penugasan.reset_beban()
+        self.assertEqual(self.penugasan.beban("P001"), {"jumlah_tugas": 0, "volume": 0.0})
+        with self.assertRaises(LookupError):
+            self.penugasan.beban("P003")
+        with self.assertRaises(ValueError):
+            self.penugasan.tambah_petugas(Petugas("P001", "Dedi", "Medis"))
+
+
+class TestRuteService(unittest.TestCase):
+    """Test case untuk class RuteService."""
+
+    def test_rencanakan_rute(self):
+        """Test rute diawali lokasi awal dan memuat semua lokasi."""
+        daftar_lokasi = [
+            Lokasi("LOK001", "Posko A", "Banjir", -6.20, 106.80),
+            Lokasi("LOK002", "Posko B", "Banjir", -6.21, 106.85),
+            Lokasi("LOK003", "Posko C", "Banjir", -6.25, 106.82),
+            Lokasi("LOK004", "Posko D", "Banjir", -6.22, 106.78),
+        ]
+
+        hasil = RuteService().rencanakan_rute(daftar_lokasi, id_mulai="LOK003")
+
+        self.assertEqual(hasil["urutan"][0], "LOK003")
+        self.assertEqual(sorted(hasil["urutan"]), ["LOK001", "LOK002", "LOK003", "LOK004"])
+        self.assertGreater(hasil["panjang_km"], 0)
+        self.assertIn("waktu_detik", hasil)
+
+    def test_rencanakan_rute_invalid(self):
+        """Test lokasi tanpa koordinat dan lokasi awal tidak dikenal ditolak."""
+        service = RuteService()
+        with self.assertRaises(ValueError):
+            service.rencanakan_rute([Lokasi("LOK001", "Posko A", "Banjir")])
+        with self.assertRaises(ValueError):
+            service.rencanakan_rute([])
+        with self.assertRaises(LookupError):
+            service.rencanakan_rute([Lokasi("LOK001", "Posko A", "Banjir", -6.2, 106.8)], id_mulai="X")
+
+
+class TestKonkurensiService(unittest.TestCase):
+    """Stress test layanan yang dipanggil dari banyak thread sekaligus."""
+
+    JUMLAH_THREAD = 16
+    JUMLAH_LIMBAH = 200
+
+    def setUp(self):
+        """Setup repository berisi limbah yang diperebutkan banyak thread."""
+        self.repository = InMemoryLimbahRepository()
+        self.limbah_service = LimbahService(self.repository)
+        self.pengangkutan_service = PengangkutanService(self.repository)
+        for i in range(self.JUMLAH_LIMBAH):
+            self.limbah_service.registrasi_limbah_medis(f"L{i:04d}", 10.0, 3)
+        self.ids = [f"L{i:04d}" for i in range(self.JUMLAH_LIMBAH)]
+
+    def jalankan_serentak(self, fungsi) -> list:
+        """
+        Menjalankan fungsi(id, nomor_thread) untuk setiap ID dari banyak thread sekaligus.
+
+        Returns:
+            list: ID yang berhasil diproses (boleh berulang jika terjadi race).
+        """
+        berhasil = []
+        kunci = threading.Lock()
+        mulai = threading.Barrier(self.JUMLAH_THREAD)
+
+        def pekerja(nomor_thread):
+            mulai.wait()
+            for id in self.ids:
+                try:
+                    fungsi(id, nomor_thread)
+                except ValueError:
+                    continue
+                with kunci:
+                    berhasil.append(id)
+
+        threads = [threading.Thread(target=pekerja, args=(n,)) for n in range(self.JUMLAH_THREAD)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return berhasil
+
+    def test_angkut_limbah_serentak_tidak_ganda(self):
+        """Test setiap limbah hanya berhasil diangkut satu kali."""
+        berhasil = self.jalankan_serentak(
+            lambda id, _: self.pengangkutan_service.angkut_limbah(id, "Truk", "Insinerator")
+        )
+
+        self.assertEqual(sorted(berhasil), self.ids)
+        self.assertEqual(len(self.repository.find_by_status("Diangkut")), self.JUMLAH_LIMBAH)
+        self.assertEqual(self.repository.find_by_status("Terdaftar"), [])
+
+    def test_angkut_dan_proses_serentak(self):
+        """Test pengangkutan dan pengolahan serentak tidak memproses limbah dua kali."""
+        diproses = []
+
+        def angkut_atau_proses(id, nomor_thread):
+            if nomor_thread % 2:
+                self.pengangkutan_service.angkut_limbah(id, "Truk", "Insinerator")
+            else:
+                self.limbah_service.proses_pengolahan_limbah(id)
+                diproses.append(id)
+
+        self.jalankan_serentak(angkut_atau_proses)
+
+        self.assertEqual(len(diproses), len(set(diproses)))
+        self.assertEqual(len(self.repository.find_by_status("Terdaftar")), 0)
+
+    def sisipkan_penulis_lain(self, jumlah: int) -> None:
+        """
+        Membuat `jumlah` panggilan compare_and_update berikutnya didahului
+        perubahan volume oleh penulis lain, sehingga versi yang dibaca usang.
+        """
+        asli = self.repository.compare_and_update
+        sisa = [jumlah]
+
+        def sela(id, versi_diharapkan, status_baru):
+            if sisa[0]:
+                sisa[0] -= 1
+                limbah = self.repository.get_by_id(id)
+                limbah.volume = limbah.get_volume() + 1.0
+            return asli(id, versi_diharapkan, status_baru)
+
+        self.repository.compare_and_update = sela
+
+    def test_konflik_versi_dicoba_ulang(self):
+        """Test konflik versi dibaca ulang lalu dicoba lagi hingga berhasil."""
+        self.sisipkan_penulis_lain(PengangkutanService.PERCOBAAN_KONFLIK - 1)
+        self.pengangkutan_service.angkut_limbah("L0000", "Truk", "Insinerator")
+        self.sisipkan_penulis_lain(LimbahService.PERCOBAAN_KONFLIK - 1)
+        self.limbah_service.proses_pengolahan_limbah("L0001")
+
+        self.assertEqual(self.repository.get_by_id("L0000").get_status(), "Diangkut")
+        self.assertEqual(self.repository.get_by_id("L0001").get_status(), "Dimusnahkan")
+
+    def test_konflik_versi_berulang_dilempar(self):
+        """Test konflik yang terus terjadi dilempar sebagai KonflikVersiError tanpa mengubah status."""
+        self.sisipkan_penulis_lain(PengangkutanService.PERCOBAAN_KONFLIK)
+        with self.assertRaises(KonflikVersiError):
+            self.pengangkutan_service.angkut_limbah("L0000", "Truk", "Insinerator")
+
+        self.assertEqual(self.repository.get_by_id("L0000").get_status(), "Terdaftar")
+
+    def test_registrasi_serentak_id_sama(self):
+        """Test registrasi ID yang sama dari banyak thread hanya berhasil sekali."""
+        repository = InMemoryLimbahRepository()
+        service = LimbahService(repository)
+        self.ids = [f"B{i:04d}" for i in range(self.JUMLAH_LIMBAH)]
+
+        berhasil = self.jalankan_serentak(lambda id, _: service.registrasi_limbah_organik(id, 5.0, 2))
+
+        self.assertEqual(sorted(berhasil), self.ids)
+        self.assertEqual(len(repository.get_all()), self.JUMLAH_LIMBAH)
+        self.assertEqual(len(repository.find_by_status("Terdaftar")), self.JUMLAH_LIMBAH)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,24 @@
 """
 Unit test untuk utils.
 
-Menguji fungsionalitas utility functions (validator, date_helper).
+Menguji fungsionalitas utility functions (validator, date_helper, bin_packing, rute, event_bus,
+logging_config).
 """
 
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
 import unittest
 from utils.validator import validate_volume, validate_status
-from utils.date_helper import get_current_timestamp
+from datetime import datetime
+from utils.date_helper import get_current_timestamp, ke_iso
+from utils.bin_packing import METODE
+from utils.rute import MatriksJarak, optimasi_rute
+from utils.event_bus import EventBus, PelangganAntrian
+from utils.logging_config import hentikan_logging, setup_logging
 
 
 class TestValidator(unittest.TestCase):
@@ -33,7 +45,7 @@ class TestValidator(unittest.TestCase):
 
     def test_validate_status_valid(self):
         """Test validasi status dengan nilai valid."""
-        valid_statuses = ["TERCATAT", "DALAM_PENGANGKUTAN", "DIPROSES", "SELESAI"]
+        valid_statuses = ["Terdaftar", "Diangkut", "Dimusnahkan", "Didaur Ulang", "Diproses Khusus"]
         for status in valid_statuses:
             try:
                 validate_status(status)
@@ -42,7 +54,7 @@ class TestValidator(unittest.TestCase):
 
     def test_validate_status_invalid(self):
         """Test validasi status dengan nilai invalid."""
-        invalid_statuses = ["PENDING", "CANCEL", "UNKNOWN", ""]
+        invalid_statuses = ["PENDING", "CANCEL", "UNKNOWN", "", "TERCATAT", "SELESAI"]
         for status in invalid_statuses:
             with self.assertRaises(ValueError):
                 validate_status(status)
@@ -91,6 +103,210 @@ class TestDateHelper(unittest.TestCase):
         # Karena format hanya sampai detik, seharusnya berbeda
         self.assertNotEqual(timestamp1, timestamp2)
 
+    def test_ke_iso(self):
+        """Test datetime dan string ISO diseragamkan ke format yang sama."""
+        self.assertEqual(ke_iso(datetime(2024, 5, 1, 8, 0)), "2024-05-01T08:00:00")
+        self.assertEqual(ke_iso("2024-05-01 08:00:00"), "2024-05-01T08:00:00")
+        self.assertIsNone(ke_iso(None))
+        with self.assertRaises(ValueError):
+            ke_iso("bukan waktu")
+
+
+class TestBinPacking(unittest.TestCase):
+    """Test case untuk module bin_packing."""
+
+    def test_semua_item_terkemas_tanpa_melebihi_kapasitas(self):
+        """Test setiap heuristik mengemas semua item tepat sekali dalam kapasitas."""
+        acak = random.Random(7)
+        ukuran = [acak.uniform(1.0, 60.0) for _ in range(500)]
+        for nama, kemas in METODE.items():
+            with self.subTest(metode=nama):
+                bins = kemas(ukuran, 100.0)
+                self.assertEqual(sorted(i for isi in bins for i in isi), list(range(len(ukuran))))
+                for isi in bins:
+                    self.assertLessEqual(sum(ukuran[i] for i in isi), 100.0 + 1e-6)
+
+    def test_ffd_dan_bfd_mengisi_celah(self):
+        """Test FFD dan BFD mengisi celah bin lama, NFD tidak."""
+        ukuran = [60.0, 60.0, 40.0, 40.0]
+        self.assertEqual(len(METODE["ffd"](ukuran, 100.0)), 2)
+        self.assertEqual(len(METODE["bfd"](ukuran, 100.0)), 2)
+        self.assertEqual(len(METODE["nfd"]([60.0, 50.0, 40.0, 30.0], 100.0)), 3)
+
+    def test_item_melebihi_kapasitas(self):
+        """Test item yang lebih besar dari kapasitas ditolak."""
+        for kemas in METODE.values():
+            with self.assertRaises(ValueError):
+                kemas([10.0, 120.0], 100.0)
+            self.assertEqual(kemas([], 100.0), [])
+
+
+class TestRute(unittest.TestCase):
+    """Test case untuk module rute."""
+
+    def test_rute_mengunjungi_semua_titik_dan_membaik(self):
+        """Test rute memuat semua titik, diawali titik mulai, dan tidak lebih panjang dari NN."""
+        acak = random.Random(3)
+        titik = [(acak.uniform(0, 50), acak.uniform(0, 50)) for _ in range(300)]
+
+        hasil = optimasi_rute(titik, mulai=5, batas_waktu=5.0)
+
+        self.assertEqual(sorted(hasil["rute"]), list(range(300)))
+        self.assertEqual(hasil["rute"][0], 5)
+        self.assertLessEqual(hasil["panjang_km"], hasil["panjang_awal_km"])
+        self.assertAlmostEqual(MatriksJarak(titik).panjang_rute(hasil["rute"]), hasil["panjang_km"])
+
+    def test_rute_persegi_optimal(self):
+        """Test rute empat sudut persegi menemukan keliling tanpa sisi silang."""
+        titik = [(0.0, 0.0), (10.0, 10.0), (10.0, 0.0), (0.0, 10.0)]
+        self.assertAlmostEqual(optimasi_rute(titik)["panjang_km"], 40.0)
+
+
+class TestEventBus(unittest.TestCase):
+    """Test case untuk module event_bus."""
+
+    def test_pelanggan_sinkron(self):
+        """Test bus kosong bernilai False dan pelanggan dipanggil sesuai urutan."""
+        bus = EventBus()
+        self.assertFalse(bus)
+        diterima = []
+        pertama = lambda *args: diterima.append(("pertama",) + args)
+        bus.langganan(pertama)
+        bus.langganan(lambda *args: diterima.append(("kedua",) + args))
+        self.assertTrue(bus)
+
+        bus.terbitkan("L001", "status")
+        self.assertEqual(diterima, [("pertama", "L001", "status"), ("kedua", "L001", "status")])
+        bus.berhenti_langganan(pertama)
+        bus.berhenti_langganan(pertama)
+        self.assertEqual(len(bus), 1)
+
+    def test_pelanggan_antrian(self):
+        """Test pelanggan antrian memproses seluruh peristiwa di thread lain dan menahan exception."""
+        bus = EventBus()
+        diterima = []
+
+        def lambat(nilai):
+            if nilai == 3:
+                raise RuntimeError("gagal")
+            diterima.append((nilai, threading.current_thread() is threading.main_thread()))
+
+        pelanggan = bus.langganan_antrian(lambat, ukuran_antrian=2)
+        for nilai in range(10):
+            bus.terbitkan(nilai)
+        pelanggan.tunggu()
+        self.assertEqual([nilai for nilai, _ in diterima], [0, 1, 2, 4, 5, 6, 7, 8, 9])
+        self.assertFalse(any(di_main for _, di_main in diterima))
+        self.assertEqual(pelanggan.jumlah_gagal, 1)
+
+        bus.berhenti_langganan(pelanggan)
+        self.assertFalse(bus)
+        pelanggan(1)
+        self.assertEqual(pelanggan.jumlah_dibuang, 1)
+        self.assertEqual(len(diterima), 9)
+        with self.assertRaises(ValueError):
+            bus.langganan_antrian(lambat, ukuran_antrian=0)
+
+    def test_pelanggan_antrian_dihentikan_saat_terbit(self):
+        """Test setiap peristiwa selama hentikan() diproses atau dibuang tanpa exception."""
+        diproses = []
+        pelanggan = PelangganAntrian(diproses.append, ukuran_antrian=4)
+
+        def terbit(awal):
+            for nilai in range(awal, awal + 500):
+                pelanggan(nilai)
+
+        daftar_thread = [threading.Thread(target=terbit, args=(i * 500,)) for i in range(4)]
+        for thread in daftar_thread:
+            thread.start()
+        pelanggan.hentikan()
+        for thread in daftar_thread:
+            thread.join()
+        self.assertEqual(len(diproses) + pelanggan.jumlah_dibuang, 2000)
+        self.assertEqual(len(set(diproses)), len(diproses))
+
+    def test_callback_terbit_ke_antrian_sendiri(self):
+        """Test callback yang menerbitkan ke antriannya sendiri yang penuh tidak deadlock."""
+        diproses = []
+
+        def gema(nilai):
+            diproses.append(nilai)
+            if nilai < 3:
+                for _ in range(3):
+                    pelanggan(nilai + 1)
+
+        pelanggan = PelangganAntrian(gema, ukuran_antrian=2)
+        pelanggan(0)
+        pelanggan.tunggu()
+        pelanggan.hentikan()
+        self.assertGreater(pelanggan.jumlah_dibuang, 0)
+        self.assertEqual(pelanggan.jumlah_gagal, 0)
+        self.assertEqual(len(diproses) + pelanggan.jumlah_dibuang, 1 + 3 * sum(1 for n in diproses if n < 3))
+
+
+class TestLoggingConfig(unittest.TestCase):
+    """Test case untuk module logging_config."""
+
+    def setUp(self):
+        """Menyimpan level logger root dan memulihkannya setelah test."""
+        root = logging.getLogger()
+        self.addCleanup(root.setLevel, root.level)
+        self.addCleanup(hentikan_logging)
+        direktori = tempfile.TemporaryDirectory()
+        self.addCleanup(direktori.cleanup)
+        self.path = os.path.join(direktori.name, "app.log")
+
+    def test_json_lines_dengan_field_struktur(self):
+        """Test keluaran JSON per baris memuat pesan dan field extra."""
+        setup_logging(json_lines=True, path=self.path)
+        logger = logging.getLogger("test.logging")
+        logger.info("Registrasi | id=%s", "L001", extra={"id": "L001", "volume": 10.0, "status": "Terdaftar"})
+        logger.debug("Tidak tercatat")
+        hentikan_logging()
+
+        with open(self.path, encoding="utf-8") as berkas:
+            baris = [json.loads(teks) for teks in berkas]
+        self.assertEqual(len(baris), 1)
+        self.assertEqual(baris[0]["pesan"], "Registrasi | id=L001")
+        self.assertEqual(baris[0]["level"], "INFO")
+        self.assertEqual((baris[0]["id"], baris[0]["volume"], baris[0]["status"]), ("L001", 10.0, "Terdaftar"))
+        self.assertNotIn("kendaraan", baris[0])
+
+    def test_record_asli_tidak_diubah(self):
+        """Test handler lain setelah handler antrian menerima record dengan msg dan args asli."""
+        class Penampung(logging.Handler):
+            def emit(self, record):
+                self.record = record
+
+        setup_logging(path=self.path)
+        penampung = Penampung()
+        root = logging.getLogger()
+        root.addHandler(penampung)
+        self.addCleanup(root.removeHandler, penampung)
+        logging.getLogger("test.logging").info("Registrasi | id=%s", "L001")
+        hentikan_logging()
+
+        self.assertEqual((penampung.record.msg, penampung.record.args), ("Registrasi | id=%s", ("L001",)))
+        with open(self.path, encoding="utf-8") as berkas:
+            self.assertIn("Registrasi | id=L001", berkas.read())
+
+    def test_setup_ulang_mengganti_handler(self):
+        """Test setup_logging berulang hanya memasang satu handler antrian."""
+        root = logging.getLogger()
+        jumlah_awal = len(root.handlers)
+        setup_logging(path=self.path)
+        setup_logging(level=logging.WARNING, path=self.path)
+        self.assertEqual(len(root.handlers), jumlah_awal + 1)
+
+        logging.getLogger("test.logging").info("Tidak tercatat")
+        logging.getLogger("test.logging").warning("Tercatat")
+        hentikan_logging()
+        self.assertEqual(len(root.handlers), jumlah_awal)
+        with open(self.path, encoding="utf-8") as berkas:
+            isi = berkas.read()
+        self.assertNotIn("Tidak tercatat", isi)
+        self.assertIn("[WARNING] Tercatat", isi)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional, Union
 
 
 def get_current_timestamp() -> str:
@@ -9,3 +10,23 @@ def get_current_timestamp() -> str:
         str: Waktu saat ini (YYYY-MM-DD HH:MM:SS)
     """
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def ke_iso(waktu: Union[str, datetime, None]) -> Optional[str]:
+    """
+    Menyeragamkan waktu menjadi string ISO 8601 yang bisa dibandingkan leksikografis.
+
+    Args:
+        waktu (str | datetime | None): Waktu sebagai datetime atau string ISO.
+
+    Returns:
+        Optional[str]: String ISO, atau None jika waktu None.
+
+    Raises:
+        ValueError: Jika string bukan format ISO yang valid.
+    """
+    if waktu is None:
+        return None
+    if isinstance(waktu, str):
+        waktu = datetime.fromisoformat(waktu)
+    return waktu.isoformat()
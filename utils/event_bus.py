@@ -0,0 +1,223 @@
+import logging
+import queue
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+Pelanggan = Callable[..., None]
+
+# Penanda berhenti untuk thread PelangganAntrian.
+_BERHENTI = object()
+
+
+class PelangganAntrian:
+    """
+    Pelanggan asinkron: peristiwa dimasukkan ke antrian dan diproses satu
+    thread latar sesuai urutan terbit, sehingga penerbit tidak menunggu
+    konsumen yang lambat (misal dashboard, ekspor, notifikasi).
+
+    Argumen peristiwa disalin saat terbit, tetapi objek di dalamnya (misal
+    Limbah) tetap objek hidup yang bisa sudah berubah saat diproses.
+    Jika antrian penuh, penerbit menunggu sampai ada ruang (backpressure).
+    Exception dari callback dicatat ke log dan dihitung, tidak diteruskan.
+
+    Pemeriksaan status berhenti dan put() ke antrian dilakukan di bawah satu
+    kunci yang juga dipegang hentikan() saat memasukkan penanda berhenti,
+    sehingga setiap peristiwa yang diterima pasti diproses sebelum thread
+    berhenti. Peristiwa yang terbit setelah hentikan() dibuang (dicatat di
+    log level DEBUG dan jumlah_dibuang) tanpa exception, karena penerbit
+    biasanya sudah mengubah datanya sebelum memberi tahu pelanggan.
+
+    Callback yang menerbitkan peristiwa ke antriannya sendiri tidak boleh
+    menunggu ruang: thread pemroses adalah satu-satunya konsumen, sehingga
+    put() yang memblok akan deadlock. Dari thread pemroses, peristiwa yang
+    tidak muat dibuang dengan log WARNING dan dihitung di jumlah_dibuang.
+    """
+
+    def __init__(self, callback: Pelanggan, ukuran_antrian: int = 10_000):
+        """
+        Membuat antrian dan menjalankan thread pemroses.
+
+        Args:
+            callback (Callable): Fungsi yang dipanggil dengan argumen peristiwa.
+            ukuran_antrian (int): Kapasitas antrian.
+
+        Raises:
+            ValueError: Jika ukuran_antrian < 1.
+        """
+        if ukuran_antrian < 1:
+            raise ValueError("Ukuran antrian minimal 1")
+        self.__callback = callback
+        self.__antrian: queue.Queue = queue.Queue(ukuran_antrian)
+        self.__gagal = 0
+        self.__dibuang = 0
+        self.__kunci = threading.Lock()
+        self.__berhenti = False
+        self.__thread = threading.Thread(
+            target=self.__jalankan, name=f"pelanggan-{getattr(callback, '__name__', 'antrian')}", daemon=True
+        )
+        self.__thread.start()
+
+    def __call__(self, *args) -> None:
+        """
+        Memasukkan peristiwa ke antrian; dibuang jika pelanggan sudah
+        dihentikan, atau jika antrian penuh saat dipanggil dari thread pemroses.
+        """
+        dari_pemroses = threading.current_thread() is self.__thread
+        with self.__kunci:
+            if self.__berhenti:
+                self.__dibuang += 1
+                logger.debug("Peristiwa dibuang: pelanggan antrian sudah dihentikan")
+                return
+            try:
+                self.__antrian.put(args, block=not dari_pemroses)
+            except queue.Full:
+                self.__dibuang += 1
+                logger.warning("Peristiwa dibuang: callback menerbitkan ke antriannya sendiri yang penuh")
+
+    @property
+    def jumlah_tertunda(self) -> int:
+        """
+        Perkiraan jumlah peristiwa yang belum diproses.
+        """
+        return self.__antrian.qsize()
+
+    @property
+    def jumlah_dibuang(self) -> int:
+        """
+        Jumlah peristiwa yang dibuang tanpa diproses.
+        """
+        return self.__dibuang
+
+    @property
+    def jumlah_gagal(self) -> int:
+        """
+        Jumlah pemanggilan callback yang melempar exception.
+        """
+        return self.__gagal
+
+    def tunggu(self) -> None:
+        """
+        Menunggu sampai seluruh peristiwa yang sudah terbit selesai diproses.
+        """
+        self.__antrian.join()
+
+    def hentikan(self) -> None:
+        """
+        Memproses sisa antrian lalu menghentikan thread pemroses.
+        """
+        with self.__kunci:
+            if not self.__berhenti:
+                self.__berhenti = True
+                self.__antrian.put(_BERHENTI)
+        self.__thread.join()
+
+    def __jalankan(self) -> None:
+        """
+        Loop thread pemroses: mengambil peristiwa dan memanggil callback.
+        """
+        while True:
+            args = self.__antrian.get()
+            try:
+                if args is _BERHENTI:
+                    return
+                self.__callback(*args)
+            except Exception:
+                self.__gagal += 1
+                logger.exception("Pelanggan antrian gagal memproses peristiwa")
+            finally:
+                self.__antrian.task_done()
+
+
+class EventBus:
+    """
+    Event bus in-process sederhana.
+
+    Pelanggan sinkron dipanggil langsung di thread penerbit sesuai urutan
+    pendaftaran (cocok untuk index dan agregat yang harus konsisten segera);
+    pelanggan antrian (PelangganAntrian) untuk konsumen lambat.
+
+    Bus bernilai False jika tidak ada pelanggan, sehingga penerbit cukup
+    menulis `if bus: bus.terbitkan(...)` dan tidak membangun argumen
+    peristiwa sama sekali ketika tidak ada yang mendengarkan.
+    """
+
+    __slots__ = ("__pelanggan", "__kunci")
+
+    def __init__(self):
+        """
+        Membuat bus tanpa pelanggan.
+        """
+        self.__pelanggan: tuple[Pelanggan, ...] = ()
+        self.__kunci = threading.Lock()
+
+    def __bool__(self) -> bool:
+        """
+        True jika ada minimal satu pelanggan.
+        """
+        return bool(self.__pelanggan)
+
+    def __len__(self) -> int:
+        """
+        Jumlah pelanggan terdaftar.
+        """
+        return len(self.__pelanggan)
+
+    def langganan(self, callback: Pelanggan) -> None:
+        """
+        Mendaftarkan pelanggan sinkron.
+
+        Args:
+            callback (Callable): Fungsi yang dipanggil dengan argumen peristiwa.
+        """
+        with self.__kunci:
+            self.__pelanggan += (callback,)
+
+    def langganan_antrian(self, callback: Pelanggan, ukuran_antrian: int = 10_000) -> PelangganAntrian:
+        """
+        Mendaftarkan pelanggan asinkron yang diproses thread latar.
+
+        Args:
+            callback (Callable): Fungsi yang dipanggil dengan argumen peristiwa.
+            ukuran_antrian (int): Kapasitas antrian.
+
+        Returns:
+            PelangganAntrian: Pelanggan terdaftar; dipakai untuk tunggu(),
+            hentikan(), atau berhenti_langganan().
+        """
+        pelanggan = PelangganAntrian(callback, ukuran_antrian)
+        self.langganan(pelanggan)
+        return pelanggan
+
+    def berhenti_langganan(self, callback: Pelanggan) -> None:
+        """
+        Menghapus pelanggan; pelanggan antrian juga dihentikan setelah antriannya habis.
+
+        Args:
+            callback (Callable): Pelanggan yang sebelumnya didaftarkan.
+        """
+        with self.__kunci:
+            if callback not in self.__pelanggan:
+                return
+            daftar = list(self.__pelanggan)
+            daftar.remove(callback)
+            self.__pelanggan = tuple(daftar)
+        if isinstance(callback, PelangganAntrian):
+            callback.hentikan()
+
+    def terbitkan(self, *args) -> None:
+        """
+        Menerbitkan peristiwa ke seluruh pelanggan.
+
+        Daftar pelanggan disimpan sebagai tuple yang diganti utuh saat
+        berubah dan dibaca tanpa kunci. Penerbit yang sedang berjalan saat
+        pelanggan dihapus dari thread lain masih bisa memanggil pelanggan itu
+        sekali lagi; pelanggan antrian yang sudah dihentikan membuang
+        peristiwa tersebut.
+
+        Args:
+            *args: Argumen peristiwa.
+        """
+        for callback in self.__pelanggan:
+            callback(*args)
@@ -1,12 +1,134 @@
+import atexit
+import copy
+import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
+FORMAT_TEKS = "%(asctime)s [%(levelname)s] %(message)s"
+FORMAT_WAKTU = "%Y-%m-%d %H:%M:%S"
 
-def setup_logging() -> None:
+# Field terstruktur yang dikirim service lewat argumen extra= pada log.
+FIELD_STRUKTUR = ("id", "volume", "status", "kendaraan")
+
+
+class _HandlerAntrianRingan(QueueHandler):
+    """
+    QueueHandler untuk antrian di dalam proses yang sama.
+
+    prepare() bawaan menyalin record dan memformatnya penuh di thread
+    pemanggil agar record bisa dipickle. Di sini hanya pesan salinan
+    dangkal record yang diselesaikan (argumen bisa berubah setelah log
+    dipanggil); record asli tetap utuh untuk handler lain, sedangkan format
+    waktu, JSON, dan traceback dikerjakan listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Menyelesaikan pesan salinan record sebelum dimasukkan ke antrian.
+
+        Args:
+            record (logging.LogRecord): Record log; tidak diubah.
+
+        Returns:
+            logging.LogRecord: Salinan dangkal record dengan pesan jadi dan args kosong.
+        """
+        salinan = copy.copy(record)
+        salinan.msg = salinan.getMessage()
+        salinan.args = None
+        return salinan
+
+
+# Handler antrian dan listener yang sedang aktif (hasil setup_logging terakhir).
+_handler_antrian: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+class FormatterJsonLines(logging.Formatter):
+    """
+    Formatter satu objek JSON per baris untuk diolah mesin.
+
+    Setiap baris memuat waktu, level, logger, dan pesan, ditambah field
+    terstruktur (FIELD_STRUKTUR) jika dikirim lewat extra= saat log dipanggil.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Mengubah record log menjadi satu baris JSON.
+
+        Args:
+            record (logging.LogRecord): Record log.
+
+        Returns:
+            str: Baris JSON tanpa newline.
+        """
+        data = {
+            "waktu": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "pesan": record.getMessage(),
+        }
+        for field in FIELD_STRUKTUR:
+            if hasattr(record, field):
+                data[field] = getattr(record, field)
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def setup_logging(level: int = logging.INFO, json_lines: bool = False, path: Optional[str] = None) -> QueueListener:
+    """
+    Mengatur logging aplikasi dengan handler antrian di thread latar.
+
+    Logger root hanya mendapat QueueHandler: pemanggil log cukup menaruh
+    record ke antrian, sedangkan format waktu, JSON, dan penulisan ke
+    stderr/file dilakukan QueueListener di thread latar. Waktu log diambil
+    dari record (asctime), sehingga service tidak perlu menyertakan
+    timestamp sebagai argumen; log di bawah level tidak diformat sama sekali.
+
+    Memanggil ulang fungsi ini mengganti konfigurasi sebelumnya.
+
+    Args:
+        level (int): Level minimum logger root.
+        json_lines (bool): True untuk keluaran JSON per baris, False untuk teks.
+        path (Optional[str]): File tujuan log; default stderr.
+
+    Returns:
+        QueueListener: Listener aktif; dihentikan otomatis saat program keluar
+        atau lewat hentikan_logging().
+    """
+    global _handler_antrian, _listener
+    hentikan_logging()
+
+    tujuan = logging.FileHandler(path, encoding="utf-8") if path else logging.StreamHandler()
+    formatter_kelas = FormatterJsonLines if json_lines else logging.Formatter
+    tujuan.setFormatter(formatter_kelas(FORMAT_TEKS, FORMAT_WAKTU))
+
+    antrian: queue.SimpleQueue = queue.SimpleQueue()
+    _handler_antrian = _HandlerAntrianRingan(antrian)
+    _listener = QueueListener(antrian, tujuan, respect_handler_level=True)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_handler_antrian)
+    _listener.start()
+    return _listener
+
+
+def hentikan_logging() -> None:
     """
-    Mengatur konfigurasi dasar logging aplikasi.
+    Menghentikan listener aktif setelah antriannya habis, lalu melepas
+    handler antrian dari logger root.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    global _handler_antrian, _listener
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_handler_antrian)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _handler_antrian = None
+    _listener = None
+
+
+atexit.register(hentikan_logging)
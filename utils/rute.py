@@ -0,0 +1,383 @@
+import math
+import time
+
+# Jari-jari bumi rata-rata (km) untuk proyeksi equirectangular.
+JARI_JARI_BUMI_KM = 6371.0088
+
+
+def proyeksi_km(koordinat: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """
+    Memproyeksikan (lintang, bujur) ke bidang datar dalam km.
+
+    Memakai proyeksi equirectangular di sekitar lintang rata-rata; galatnya
+    kecil untuk area operasi satu wilayah bencana dan jarak Euclid pada
+    bidang ini jauh lebih murah daripada haversine.
+
+    Args:
+        koordinat (list[tuple[float, float]]): Daftar (lintang, bujur) dalam derajat.
+
+    Returns:
+        list[tuple[float, float]]: Daftar (x, y) dalam km.
+    """
+    if not koordinat:
+        return []
+    lintang_tengah = math.radians(sum(lintang for lintang, _ in koordinat) / len(koordinat))
+    skala_x = JARI_JARI_BUMI_KM * math.cos(lintang_tengah)
+    return [
+        (math.radians(bujur) * skala_x, math.radians(lintang) * JARI_JARI_BUMI_KM)
+        for lintang, bujur in koordinat
+    ]
+
+
+class MatriksJarak:
+    """
+    Matriks jarak antar titik yang di-cache secara lazy dan jarang (sparse).
+
+    Solver hanya menyentuh pasangan titik yang bertetangga atau bersebelahan
+    di rute, jadi matriks penuh n x n tidak pernah dibangun. Jarak sebuah
+    pasangan dihitung sekali saat pertama diminta lalu disimpan untuk kedua
+    arah.
+    """
+
+    def __init__(self, titik: list[tuple[float, float]]):
+        """
+        Inisialisasi matriks jarak.
+
+        Args:
+            titik (list[tuple[float, float]]): Koordinat bidang (x, y) dalam km.
+        """
+        self.__titik = titik
+        self.__cache: list[dict[int, float]] = [{} for _ in titik]
+
+    def __len__(self) -> int:
+        """
+        Mengambil jumlah titik.
+
+        Returns:
+            int: Jumlah titik.
+        """
+        return len(self.__titik)
+
+    def jarak(self, i: int, j: int) -> float:
+        """
+        Mengambil jarak antara dua titik dari cache, menghitungnya jika belum ada.
+
+        Args:
+            i (int): Indeks titik pertama.
+            j (int): Indeks titik kedua.
+
+        Returns:
+            float: Jarak dalam km.
+        """
+        baris = self.__cache[i]
+        d = baris.get(j)
+        if d is None:
+            (xi, yi), (xj, yj) = self.__titik[i], self.__titik[j]
+            d = baris[j] = self.__cache[j][i] = math.hypot(xi - xj, yi - yj)
+        return d
+
+    def jumlah_tersimpan(self) -> int:
+        """
+        Mengambil jumlah pasangan jarak yang sudah di-cache.
+
+        Returns:
+            int: Jumlah pasangan (i, j) unik.
+        """
+        return sum(len(baris) for baris in self.__cache) // 2
+
+    def panjang_rute(self, rute: list[int]) -> float:
+        """
+        Menghitung panjang rute tertutup (kembali ke titik awal).
+
+        Args:
+            rute (list[int]): Urutan indeks titik.
+
+        Returns:
+            float: Panjang rute dalam km.
+        """
+        jarak = self.jarak
+        return sum(jarak(rute[i - 1], rute[i]) for i in range(len(rute))) if len(rute) > 1 else 0.0
+
+
+class _Grid:
+    """
+    Grid spasial sederhana untuk pencarian tetangga terdekat.
+    """
+
+    def __init__(self, titik: list[tuple[float, float]], per_sel: float = 2.0):
+        """
+        Membangun grid dengan rata-rata per_sel titik per sel.
+
+        Args:
+            titik (list[tuple[float, float]]): Koordinat bidang (x, y).
+            per_sel (float): Target rata-rata titik per sel.
+        """
+        self.titik = titik
+        xs = [x for x, _ in titik]
+        ys = [y for _, y in titik]
+        self.x0, self.y0 = min(xs), min(ys)
+        lebar = max(max(xs) - self.x0, max(ys) - self.y0, 1e-9)
+        jumlah_sisi = max(1, int(math.sqrt(len(titik) / per_sel)))
+        self.ukuran_sel = lebar / jumlah_sisi + 1e-12
+        self.sel: dict[tuple[int, int], set[int]] = {}
+        for i, (x, y) in enumerate(titik):
+            self.sel.setdefault(self.kunci(x, y), set()).add(i)
+        self.jumlah_sisi = jumlah_sisi
+
+    def kunci(self, x: float, y: float) -> tuple[int, int]:
+        """
+        Mengambil kunci sel untuk koordinat tertentu.
+        """
+        return (int((x - self.x0) / self.ukuran_sel), int((y - self.y0) / self.ukuran_sel))
+
+    def hapus(self, i: int) -> None:
+        """
+        Menghapus titik dari grid.
+        """
+        kunci = self.kunci(*self.titik[i])
+        isi = self.sel[kunci]
+        isi.discard(i)
+        if not isi:
+            del self.sel[kunci]
+
+    def terdekat(self, x: float, y: float, k: int, kecuali: int = -1) -> list[int]:
+        """
+        Mencari k titik terdekat dari (x, y) yang masih ada di grid.
+
+        Cincin sel diperluas sampai k kandidat ditemukan dan jarak minimum
+        cincin berikutnya melebihi kandidat ke-k.
+        """
+        cx, cy = self.kunci(x, y)
+        kandidat: list[tuple[float, int]] = []
+        batas_cincin = self.jumlah_sisi + 1
+        r = 0
+        while self.sel and r <= batas_cincin:
+            for gx in range(cx - r, cx + r + 1):
+                for gy in ((cy - r, cy + r) if 0 < r and gx not in (cx - r, cx + r) else range(cy - r, cy + r + 1)):
+                    for j in self.sel.get((gx, gy), ()):
+                        if j != kecuali:
+                            jx, jy = self.titik[j]
+                            kandidat.append((math.hypot(jx - x, jy - y), j))
+            if len(kandidat) >= k:
+                kandidat.sort()
+                del kandidat[k:]
+                if kandidat[-1][0] <= r * self.ukuran_sel:
+                    break
+            r += 1
+        kandidat.sort()
+        return [j for _, j in kandidat[:k]]
+
+
+def tetangga_terdekat(titik: list[tuple[float, float]], k: int = 8) -> list[list[int]]:
+    """
+    Menyusun daftar k tetangga terdekat untuk setiap titik, terurut dari yang terdekat.
+
+    Args:
+        titik (list[tuple[float, float]]): Koordinat bidang (x, y).
+        k (int): Jumlah tetangga per titik.
+
+    Returns:
+        list[list[int]]: Indeks tetangga per titik.
+    """
+    if len(titik) < 2:
+        return [[] for _ in titik]
+    grid = _Grid(titik)
+    k = min(k, len(titik) - 1)
+    return [grid.terdekat(x, y, k, kecuali=i) for i, (x, y) in enumerate(titik)]
+
+
+def nearest_neighbor(titik: list[tuple[float, float]], mulai: int = 0) -> list[int]:
+    """
+    Membangun rute awal dengan heuristik nearest neighbor.
+
+    Titik terdekat yang belum dikunjungi dicari melalui grid spasial
+    sehingga setiap langkah tidak memindai seluruh titik.
+
+    Args:
+        titik (list[tuple[float, float]]): Koordinat bidang (x, y).
+        mulai (int): Indeks titik awal.
+
+    Returns:
+        list[int]: Urutan indeks titik, diawali titik mulai.
+    """
+    if not titik:
+        return []
+    grid = _Grid(titik)
+    rute = [mulai]
+    grid.hapus(mulai)
+    for _ in range(len(titik) - 1):
+        berikut = grid.terdekat(*titik[rute[-1]], k=1)[0]
+        grid.hapus(berikut)
+        rute.append(berikut)
+    return rute
+
+
+def _balik(rute: list[int], posisi: list[int], i: int, j: int) -> None:
+    """
+    Membalik segmen rute tertutup dari posisi i sampai j (maju, siklik).
+
+    Jika segmen lebih panjang dari separuh rute, komplemennya yang dibalik
+    (hasilnya setara untuk rute tertutup simetris).
+    """
+    n = len(rute)
+    panjang = (j - i) % n + 1
+    if 2 * panjang > n:
+        i, j = (j + 1) % n, (i - 1) % n
+        panjang = n - panjang
+    for _ in range(panjang // 2):
+        a, b = rute[i], rute[j]
+        rute[i], rute[j] = b, a
+        posisi[b], posisi[a] = i, j
+        i = (i + 1) % n
+        j = (j - 1) % n
+
+
+def two_opt(
+    rute: list[int], matriks: MatriksJarak, tetangga: list[list[int]], tenggat: float
+) -> bool:
+    """
+    Memperbaiki rute tertutup dengan 2-opt berbasis daftar tetangga.
+
+    Untuk setiap sisi (a, b) hanya tetangga terdekat c dari a yang dicoba,
+    sehingga satu lintasan O(n * k).
+
+    Args:
+        rute (list[int]): Rute yang diperbaiki di tempat.
+        matriks (MatriksJarak): Matriks jarak.
+        tetangga (list[list[int]]): Daftar tetangga terdekat per titik.
+        tenggat (float): Batas waktu time.perf_counter().
+
+    Returns:
+        bool: True jika ada perbaikan.
+    """
+    n = len(rute)
+    if n < 4:
+        return False
+    jarak = matriks.jarak
+    posisi = [0] * n
+    for i, titik in enumerate(rute):
+        posisi[titik] = i
+    ada_perbaikan = False
+    membaik = True
+    while membaik and time.perf_counter() < tenggat:
+        membaik = False
+        for a in range(n):
+            i = posisi[a]
+            b = rute[(i + 1) % n]
+            d_ab = jarak(a, b)
+            for c in tetangga[a]:
+                d_ac = jarak(a, c)
+                if d_ac >= d_ab:
+                    break
+                j = posisi[c]
+                d = rute[(j + 1) % n]
+                if c == b or d == a:
+                    continue
+                if d_ab + jarak(c, d) - d_ac - jarak(b, d) > 1e-10:
+                    _balik(rute, posisi, (i + 1) % n, j)
+                    membaik = ada_perbaikan = True
+                    break
+    return ada_perbaikan
+
+
+def or_opt(
+    rute: list[int], matriks: MatriksJarak, tetangga: list[list[int]], tenggat: float
+) -> bool:
+    """
+    Memperbaiki rute tertutup dengan Or-opt: memindahkan segmen 1-3 titik.
+
+    Segmen hanya dicoba disisipkan di samping tetangga terdekat ujung-ujungnya,
+    dalam orientasi asli maupun terbalik.
+
+    Args:
+        rute (list[int]): Rute yang diperbaiki di tempat.
+        matriks (MatriksJarak): Matriks jarak.
+        tetangga (list[list[int]]): Daftar tetangga terdekat per titik.
+        tenggat (float): Batas waktu time.perf_counter().
+
+    Returns:
+        bool: True jika ada perbaikan.
+    """
+    n = len(rute)
+    if n < 5:
+        return False
+    jarak = matriks.jarak
+    posisi = [0] * n
+    for i, titik in enumerate(rute):
+        posisi[titik] = i
+    ada_perbaikan = False
+    membaik = True
+    while membaik and time.perf_counter() < tenggat:
+        membaik = False
+        for panjang in (1, 2, 3):
+            i = 0
+            while i < n and time.perf_counter() < tenggat:
+                segmen = [rute[(i + t) % n] for t in range(panjang)]
+                awal, akhir = segmen[0], segmen[-1]
+                sebelum, sesudah = rute[i - 1], rute[(i + panjang) % n]
+                hemat = jarak(sebelum, awal) + jarak(akhir, sesudah) - jarak(sebelum, sesudah)
+                terbaik = None
+                for ujung in (awal, akhir):
+                    for c in tetangga[ujung]:
+                        if c in segmen:
+                            continue
+                        c_berikut = rute[(posisi[c] + 1) % n]
+                        if c_berikut in segmen:
+                            continue
+                        dasar = jarak(c, c_berikut)
+                        maju = jarak(c, awal) + jarak(akhir, c_berikut) - dasar
+                        mundur = jarak(c, akhir) + jarak(awal, c_berikut) - dasar
+                        biaya, terbalik = (maju, False) if maju <= mundur else (mundur, True)
+                        if hemat - biaya > 1e-10 and (terbaik is None or biaya < terbaik[0]):
+                            terbaik = (biaya, c, terbalik)
+                if terbaik is None:
+                    i += 1
+                    continue
+                _, c, terbalik = terbaik
+                sisa = [t for t in rute if t not in segmen]
+                k = sisa.index(c) + 1
+                rute[:] = sisa[:k] + (segmen[::-1] if terbalik else segmen) + sisa[k:]
+                for j, titik in enumerate(rute):
+                    posisi[titik] = j
+                membaik = ada_perbaikan = True
+                i += 1
+    return ada_perbaikan
+
+
+def optimasi_rute(
+    titik: list[tuple[float, float]], mulai: int = 0, batas_waktu: float = 1.0, k_tetangga: int = 8
+) -> dict:
+    """
+    Menyusun rute tertutup: nearest neighbor lalu 2-opt dan Or-opt bergantian
+    sampai tidak ada perbaikan atau batas waktu habis.
+
+    Args:
+        titik (list[tuple[float, float]]): Koordinat bidang (x, y) dalam km.
+        mulai (int): Indeks titik awal (depot).
+        batas_waktu (float): Anggaran waktu perbaikan (detik).
+        k_tetangga (int): Jumlah tetangga terdekat yang dicoba per titik.
+
+    Returns:
+        dict: {"rute": list[int], "panjang_awal_km", "panjang_km", "waktu_detik"}.
+            Rute diputar sehingga diawali titik mulai.
+    """
+    mulai_waktu = time.perf_counter()
+    tenggat = mulai_waktu + batas_waktu
+    matriks = MatriksJarak(titik)
+    rute = nearest_neighbor(titik, mulai)
+    panjang_awal = matriks.panjang_rute(rute)
+    tetangga = tetangga_terdekat(titik, k_tetangga)
+    while time.perf_counter() < tenggat:
+        membaik = two_opt(rute, matriks, tetangga, tenggat)
+        membaik = or_opt(rute, matriks, tetangga, tenggat) or membaik
+        if not membaik:
+            break
+    if rute:
+        k = rute.index(mulai)
+        rute = rute[k:] + rute[:k]
+    return {
+        "rute": rute,
+        "panjang_awal_km": panjang_awal,
+        "panjang_km": matriks.panjang_rute(rute),
+        "waktu_detik": time.perf_counter() - mulai_waktu,
+    }
@@ -1,3 +1,4 @@
+from models.status_limbah import StatusLimbah
 
 def validate_volume(volume: float) -> None:
     """
@@ -15,16 +16,12 @@ def validate_volume(volume: float) -> None:
 
 def validate_status(status: str) -> None:
     """
-    Validasi status limbah.
+    Validasi status limbah terhadap status yang dikenal StatusLimbah.
 
     Args:
-        status (str): Status limbah.
+        status (str): Label status limbah, misal "Terdaftar".
+
+    Raises:
+        ValueError: Jika status tidak dikenal.
     """
-    allowed_status = [
-        "TERCATAT",
-        "DALAM_PENGANGKUTAN",
-        "DIPROSES",
-        "SELESAI"
-    ]
-    if status not in allowed_status:
-        raise ValueError(f"Status '{status}' tidak valid.")
+    StatusLimbah.dari(status)